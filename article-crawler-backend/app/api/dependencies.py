@@ -218,3 +218,19 @@ async def get_crawler_rerun_service(
 ):
     """Get the crawler rerun service."""
     return service
+
+
+@inject
+async def get_blocking_executor(
+    executor=Depends(Provide[Container.blocking_executor])
+):
+    """Get the executor used to keep blocking work off the event loop."""
+    return executor
+
+
+@inject
+async def get_operation_service(
+    service=Depends(Provide[Container.operation_service])
+):
+    """Get the background operation service."""
+    return service
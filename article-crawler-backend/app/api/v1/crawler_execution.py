@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Body, Depends, HTTPException, Path as PathParam, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path as PathParam, Query
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from typing import List, Optional
+import json
 import logging
 import io
 
@@ -111,7 +113,7 @@ async def start_crawler(
     
     return StartCrawlerResponse(
         job_id=job_id,
-        status="running",
+        status="queued",
         message=f"Crawler job {job_id} started successfully"
     )
 
@@ -158,11 +160,56 @@ async def resume_crawler(
 
     return StartCrawlerResponse(
         job_id=job_id,
-        status="running",
+        status="queued",
         message=status_message,
     )
 
 
+@router.post("/jobs/{job_id}/cancel", response_model=CrawlerStatus)
+async def cancel_crawler(
+    job_id: str = PathParam(..., description="Job ID"),
+    crawler_service = Depends(get_crawler_execution_service),
+):
+    """
+    Cancel a queued, running or paused crawler job.
+
+    A queued job is cancelled immediately. A running crawl stops before its
+    next iteration; either way the job status becomes ``cancelled``.
+    """
+    try:
+        return crawler_service.cancel_job(job_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/jobs/{job_id}/pause", response_model=CrawlerStatus)
+async def pause_crawler(
+    job_id: str = PathParam(..., description="Job ID"),
+    crawler_service = Depends(get_crawler_execution_service),
+):
+    """
+    Pause a running crawler job; the current iteration finishes first.
+    """
+    try:
+        return crawler_service.pause_job(job_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/jobs/{job_id}/continue", response_model=CrawlerStatus)
+async def continue_crawler(
+    job_id: str = PathParam(..., description="Job ID"),
+    crawler_service = Depends(get_crawler_execution_service),
+):
+    """
+    Continue a paused crawler job.
+    """
+    try:
+        return crawler_service.unpause_job(job_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
 @router.get("/jobs", response_model=List[CrawlerStatus])
 async def list_crawler_jobs(
     crawler_service = Depends(get_crawler_execution_service)
@@ -189,7 +236,7 @@ async def get_crawler_status(
     
     Returns:
     - job_id: Job identifier
-    - status: running, completed, or failed
+    - status: queued, running, paused, saving, completed, cancelled, or failed
     - current_iteration: Current iteration number
     - max_iterations: Maximum iterations configured
     - papers_collected: Total papers collected so far
@@ -204,6 +251,43 @@ async def get_crawler_status(
     return status
 
 
+@router.get("/jobs/{job_id}/events")
+async def stream_crawler_events(
+    job_id: str = PathParam(..., description="Job ID"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    crawler_service = Depends(get_crawler_execution_service),
+):
+    """
+    Server-sent events with the status of a crawler job.
+
+    The stream starts with a `snapshot` event holding the full status (same
+    fields as `/status`). After that, `delta` events carry only the fields
+    that changed. Each event's `id` is its sequence number. A client that
+    reconnects with `Last-Event-ID` gets the deltas it missed, if they are
+    still buffered, and otherwise a new snapshot. The stream ends once the job
+    is completed, failed or cancelled.
+    """
+    if not crawler_service.get_job_status(job_id):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    last_seq = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    events = crawler_service.stream_job_events(job_id, last_seq=last_seq)
+
+    async def _encode():
+        async for event in events:
+            if event.kind == "heartbeat":
+                yield ": keep-alive\n\n"
+                continue
+            data = json.dumps(jsonable_encoder(event.data))
+            yield f"id: {event.seq}\nevent: {event.kind}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        _encode(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/jobs/{job_id}/results", response_model=CrawlerResults)
 async def get_crawler_results(
     job_id: str = PathParam(..., description="Job ID"),
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, HTTPException, Path
+
+from app.api.dependencies import get_operation_service
+from app.schemas.operations import OperationStatus
+from app.services.operations.service import OperationService
+
+router = APIRouter()
+
+
+@router.get("/{operation_id}", response_model=OperationStatus)
+async def get_operation_status(
+    operation_id: str = Path(..., description="Operation ID returned when the work was started"),
+    service: OperationService = Depends(get_operation_service),
+) -> OperationStatus:
+    """
+    Poll a background operation.
+
+    Long-running endpoints (PDF extraction, matching, retraction checks) have an
+    ``/operations`` variant that returns immediately with an operation ID; poll
+    this endpoint until ``status`` is ``completed`` or ``failed``.
+    """
+    operation = service.get(operation_id)
+    if operation is None:
+        raise HTTPException(status_code=404, detail=f"Operation {operation_id} not found")
+    return operation
@@ -10,7 +10,10 @@ from app.schemas.pdf_seeds import (
     PDFReviewRequest,
     PDFStageResponse,
 )
+from app.schemas.operations import OperationStatus
 from app.api.dependencies import (
+    get_blocking_executor,
+    get_operation_service,
     get_pdf_seed_service,
     get_seed_session_service,
     get_pdf_seed_workflow_service,
@@ -23,7 +26,8 @@ router = APIRouter()
 async def upload_pdfs(
     session_id: str = Path(..., description="Seed session ID"),
     files: List[UploadFile] = File(..., description="Document files to upload (PDF, DOCX, HTML, XML, LaTeX; max 20 files, 10MB each)"),
-    pdf_service = Depends(get_pdf_seed_service)
+    pdf_service = Depends(get_pdf_seed_service),
+    executor = Depends(get_blocking_executor),
 ):
     """
     Upload document files for seed extraction.
@@ -37,7 +41,7 @@ async def upload_pdfs(
     - upload_id to use for subsequent operations
     - List of uploaded filenames
     """
-    return pdf_service.upload_pdfs(files)
+    return await executor.run("grobid", pdf_service.upload_pdfs, files)
 
 
 @router.get("/{session_id}/pdfs/grobid/status")
@@ -45,12 +49,13 @@ async def grobid_status(
     session_id: str = Path(..., description="Seed session ID"),
     pdf_service = Depends(get_pdf_seed_service),
     session_service = Depends(get_seed_session_service),
+    executor = Depends(get_blocking_executor),
 ):
     """
     Check whether the GROBID service is currently reachable.
     """
     session_service.get_session(session_id)
-    available, message = pdf_service.check_grobid_availability()
+    available, message = await executor.run("grobid", pdf_service.check_grobid_availability)
     return {"available": available, "message": message}
 
 
@@ -58,7 +63,8 @@ async def grobid_status(
 async def extract_pdf_metadata(
     session_id: str = Path(..., description="Seed session ID"),
     upload_id: str = Path(..., description="Upload ID from upload step"),
-    pdf_service = Depends(get_pdf_seed_service)
+    pdf_service = Depends(get_pdf_seed_service),
+    executor = Depends(get_blocking_executor),
 ):
     """
     Extract metadata from uploaded documents (PDF, DOCX, HTML, XML, LaTeX).
@@ -69,7 +75,36 @@ async def extract_pdf_metadata(
     - Extracted metadata for each file (title, authors, year, DOI, venue, abstract)
     - Success/failure status for each file
     """
-    return pdf_service.extract_metadata(upload_id)
+    return await executor.run("grobid", pdf_service.extract_metadata, upload_id)
+
+
+@router.post(
+    "/{session_id}/pdfs/{upload_id}/extract/operations",
+    response_model=OperationStatus,
+    status_code=202,
+)
+async def start_pdf_extraction(
+    session_id: str = Path(..., description="Seed session ID"),
+    upload_id: str = Path(..., description="Upload ID from upload step"),
+    pdf_service = Depends(get_pdf_seed_service),
+    operation_service = Depends(get_operation_service),
+):
+    """
+    Start metadata extraction in the background.
+
+    Poll `/operations/{operation_id}` for per-file progress. Each file's
+    extraction result is appended to `partial_results` as soon as it finishes;
+    the completed operation's `result` has the same shape as the synchronous
+    extract response.
+    """
+    return operation_service.start(
+        "pdf_extraction",
+        pdf_service.extract_metadata,
+        upload_id,
+        category="grobid",
+        report_progress=True,
+        report_partial_results=True,
+    )
 
 
 @router.post("/{session_id}/pdfs/{upload_id}/review")
@@ -98,7 +133,8 @@ async def match_pdf_metadata(
     session_id: str = Path(..., description="Seed session ID"),
     upload_id: str = Path(..., description="Upload ID"),
     api_provider: str = Form(default="openalex", description="API provider (openalex or semantic_scholar)"),
-    pdf_service = Depends(get_pdf_seed_service)
+    pdf_service = Depends(get_pdf_seed_service),
+    executor = Depends(get_blocking_executor),
 ):
     """
     Match reviewed PDF metadata against API.
@@ -111,7 +147,34 @@ async def match_pdf_metadata(
     - Match results with confidence scores
     - Paper metadata for matched papers
     """
-    return pdf_service.match_against_api(upload_id, api_provider)
+    return await executor.run("provider", pdf_service.match_against_api, upload_id, api_provider)
+
+
+@router.post(
+    "/{session_id}/pdfs/{upload_id}/match/operations",
+    response_model=OperationStatus,
+    status_code=202,
+)
+async def start_pdf_matching(
+    session_id: str = Path(..., description="Seed session ID"),
+    upload_id: str = Path(..., description="Upload ID"),
+    api_provider: str = Form(default="openalex", description="API provider (openalex or semantic_scholar)"),
+    pdf_service = Depends(get_pdf_seed_service),
+    operation_service = Depends(get_operation_service),
+):
+    """
+    Start matching reviewed PDF metadata in the background.
+
+    Poll `/operations/{operation_id}`; the completed operation's `result` has the
+    same shape as the synchronous match response.
+    """
+    return operation_service.start(
+        "pdf_matching",
+        pdf_service.match_against_api,
+        upload_id,
+        api_provider,
+        category="provider",
+    )
 
 
 @router.post("/{session_id}/pdfs/{upload_id}/stage", response_model=PDFStageResponse)
@@ -135,6 +198,7 @@ async def confirm_pdf_seeds(
     upload_id: str = Path(..., description="Upload ID"),
     request: PDFConfirmRequest = None,
     workflow_service=Depends(get_pdf_seed_workflow_service),
+    executor=Depends(get_blocking_executor),
 ):
     """
     Confirm which PDF matches to add as seeds.
@@ -152,7 +216,13 @@ async def confirm_pdf_seeds(
     if not request:
         raise HTTPException(status_code=400, detail="Confirmation request payload is required.")
     try:
-        return workflow_service.confirm_matches(session_id, upload_id, request.action)
+        return await executor.run(
+            "provider",
+            workflow_service.confirm_matches,
+            session_id,
+            upload_id,
+            request.action,
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
@@ -14,6 +14,7 @@ from . import (
     author_topic_evolution,
     settings,
     papers,
+    operations,
 )
 
 router = APIRouter()
@@ -95,6 +96,12 @@ router.include_router(
     tags=["Papers"]
 )
 
+router.include_router(
+    operations.router,
+    prefix="/operations",
+    tags=["Operations"]
+)
+
 
 
 @router.get("/health")
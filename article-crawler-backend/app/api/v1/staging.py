@@ -5,11 +5,14 @@ from fastapi.responses import FileResponse
 import mimetypes
 
 from app.api.dependencies import (
+    get_blocking_executor,
+    get_operation_service,
     get_retraction_service,
     get_source_file_service,
     get_staging_service,
     get_staging_route_helper,
 )
+from app.schemas.operations import OperationStatus
 from app.schemas.seed_session import AddSeedsToSessionResponse
 from app.schemas.staging import (
     BulkRemoveRequest,
@@ -103,9 +106,29 @@ async def list_staged_papers(
 async def check_retractions(
     session_id: str,
     service=Depends(get_retraction_service),
+    executor=Depends(get_blocking_executor),
 ):
     """Trigger a Retraction Watch check for all staged papers in a session."""
-    return service.check_session(session_id)
+    return await executor.run("retraction", service.check_session, session_id)
+
+
+@router.post(
+    "/seeds/session/{session_id}/staging/retractions/check/operations",
+    response_model=OperationStatus,
+    status_code=202,
+)
+async def start_retraction_check(
+    session_id: str,
+    service=Depends(get_retraction_service),
+    operation_service=Depends(get_operation_service),
+):
+    """Start a Retraction Watch check in the background and return an operation to poll."""
+    return operation_service.start(
+        "retraction_check",
+        service.check_session,
+        session_id,
+        category="retraction",
+    )
 
 
 @router.post(
@@ -4,7 +4,14 @@ from typing import List
 
 from app.services.zotero.service import ZoteroSeedService
 from app.services.seeds.session_service import SeedSessionService
-from app.api.dependencies import get_zotero_seed_service, get_seed_session_service, get_staging_service
+from app.api.dependencies import (
+    get_blocking_executor,
+    get_operation_service,
+    get_seed_session_service,
+    get_staging_service,
+    get_zotero_seed_service,
+)
+from app.schemas.operations import OperationStatus
 
 from app.schemas.zotero_seeds import (
     ZoteroCollectionsResponse,
@@ -248,7 +255,8 @@ async def match_staged_items(
     session_id: str = Path(..., description="Session ID"),
     request: ZoteroMatchRequest = Body(...),
     session_service: SeedSessionService = Depends(get_seed_session_service),
-    zotero_service: ZoteroSeedService = Depends(get_zotero_seed_service)
+    zotero_service: ZoteroSeedService = Depends(get_zotero_seed_service),
+    executor = Depends(get_blocking_executor),
 ):
     """
     Match all staged items against API provider.
@@ -265,9 +273,11 @@ async def match_staged_items(
     """
     session_service.get_session(session_id)
     
-    results = zotero_service.match_staged_items(
+    results = await executor.run(
+        "provider",
+        zotero_service.match_staged_items,
         session_id,
-        api_provider=request.api_provider
+        api_provider=request.api_provider,
     )
     
     matched_count = sum(1 for r in results if r.matched)
@@ -282,6 +292,32 @@ async def match_staged_items(
     
 
 
+@router.post("/match/operations", response_model=OperationStatus, status_code=202)
+async def start_matching_staged_items(
+    session_id: str = Path(..., description="Session ID"),
+    request: ZoteroMatchRequest = Body(...),
+    session_service: SeedSessionService = Depends(get_seed_session_service),
+    zotero_service: ZoteroSeedService = Depends(get_zotero_seed_service),
+    operation_service = Depends(get_operation_service),
+):
+    """
+    Start matching staged items in the background.
+
+    Poll `/operations/{operation_id}`; the completed operation's `result` is the
+    list of match results, also available afterwards through `/confirm`.
+    """
+    session_service.get_session(session_id)
+
+    return operation_service.start(
+        "zotero_matching",
+        zotero_service.match_staged_items,
+        session_id,
+        category="provider",
+        api_provider=request.api_provider,
+    )
+    
+
+
 @router.post("/review")
 async def review_manual_matches(
     session_id: str = Path(..., description="Session ID"),
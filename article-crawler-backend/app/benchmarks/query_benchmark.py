@@ -0,0 +1,411 @@
+"""
+Latency benchmark for the catalog, staging and results query paths.
+
+Generates a synthetic ``papers.parquet`` catalog and a staging session with
+the same papers, then times ``PaperCatalogService.list_papers``,
+``PaperCatalogService.list_column_options``, ``StagingQueryService.list_rows``
+and ``CrawlerResultAssembler.assemble`` for a fixed set of query shapes
+(search, facet values, custom filters, sorts, deep pagination) and reports the
+p50/p95 latency of each. ``--baseline`` compares the result with a JSON
+baseline and exits with status 1 on a regression; ``--update-baseline``
+rewrites the baseline instead.
+
+    python -m app.benchmarks.query_benchmark --rows 10000 100000 \\
+        --baseline app/benchmarks/baselines/queries.json
+
+Latencies depend on the machine, so baselines are only comparable with runs
+on the machine that recorded them; refresh them there with
+``--update-baseline`` when a change is expected to move the numbers. Row
+counts returned by each case are deterministic for a given size and seed and
+must match exactly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import polars as pl
+
+from app.core.config import settings  # noqa: F401  (puts ArticleCrawler on sys.path)
+from app.repositories.paper_annotation_repository import PaperAnnotationRepository
+from app.repositories.paper_catalog_repository import PaperCatalogRepository
+from app.schemas.staging import ColumnCustomFilter
+from app.services.catalog.service import PaperCatalogService
+from app.services.crawler.result_assembler import CrawlerResultAssembler
+from app.services.staging.query_service import StagingQueryService
+
+JOB_ID = "job_benchmark"
+SESSION_ID = "benchmark-session"
+DEFAULT_SIZES = (10_000, 100_000)
+# Cases faster than this are too noisy to compare.
+MIN_COMPARED_MS = 2.0
+
+WORDS = (
+    "network", "citation", "misinformation", "fake", "news", "detection", "graph",
+    "learning", "social", "media", "analysis", "model", "neural", "language",
+    "credibility", "rumor", "propagation", "twitter", "health", "vaccine", "claims",
+    "fact", "checking", "bias", "political", "deep", "transformer", "dataset",
+    "survey", "framework", "evaluation", "user", "behaviour", "spread", "echo",
+    "chamber", "polarization", "trust", "source", "bot", "account", "campaign",
+    "stance", "retrieval", "evidence", "multimodal", "image", "video", "audit",
+)
+GIVEN_NAMES = ("Ana", "Bo", "Chen", "Dara", "Eli", "Femi", "Gita", "Hugo", "Ines", "Jun", "Kai", "Lena")
+SURNAMES = ("Smith", "Garcia", "Wang", "Muller", "Rossi", "Kim", "Okafor", "Silva", "Novak", "Haddad")
+SOURCES = (("zotero", "Zotero: My Library"), ("pdf", "PDF upload"), ("manual", "Manual entry"))
+MARKS = ("good", "neutral", "bad")
+
+
+def generate_catalog(rows: int, seed: int = 0) -> pl.DataFrame:
+    """Synthetic crawl catalog with the columns the crawler writes to ``papers.parquet``."""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(rows)
+    words = np.asarray(WORDS)[rng.integers(0, len(WORDS), size=(rows, 6))]
+    titles = [" ".join(row).capitalize() for row in words.tolist()]
+
+    author_pool = _author_names(max(50, rows // 4))
+    author_counts = 1 + np.minimum(rng.poisson(2.0, rows), 7)
+    # Cubing a uniform draw skews authorship (and venues below) towards
+    # low indices, like the heavy-tailed productivity of real corpora.
+    author_picks = (rng.random(int(author_counts.sum())) ** 3 * len(author_pool)).astype(np.int64)
+    authors = (
+        pl.DataFrame({"row": np.repeat(ids, author_counts), "author": author_pool.gather(author_picks)})
+        .group_by("row", maintain_order=True)
+        .agg(pl.col("author").alias("authors_display"))
+        .get_column("authors_display")
+    )
+
+    venue_pool = np.asarray(
+        [f"Journal of {WORDS[i % len(WORDS)].capitalize()} Studies {i}" for i in range(min(2000, max(20, rows // 100)))]
+    )
+    venues = venue_pool[(rng.random(rows) ** 3 * len(venue_pool)).astype(np.int64)]
+    has_doi = rng.random(rows) < 0.85
+
+    frame = pl.DataFrame(
+        {
+            "paperId": ids,
+            "title": titles,
+            "authors_display": authors,
+            "venue": venues,
+            "year": (2024 - (rng.random(rows) ** 2 * 35).astype(np.int64)),
+            "doi": np.where(has_doi, ids, -1),
+            "isSeed": rng.random(rows) < 0.001,
+            "retracted": rng.random(rows) < 0.005,
+            "nmf_topic": rng.integers(0, 20, rows),
+            "lda_topic": rng.integers(0, 20, rows),
+            "centrality (in)": rng.pareto(2.0, rows),
+            "centrality (out)": rng.pareto(2.0, rows),
+            "citation_count": rng.pareto(1.5, rows).astype(np.int64),
+        }
+    )
+    paper_id = pl.format("W{}", pl.col("paperId") + 100_000_000)
+    return frame.with_columns(
+        paper_id.alias("paperId"),
+        pl.when(pl.col("doi") >= 0)
+        .then(pl.format("10.{}/bench.{}", pl.col("doi") % 9000 + 1000, pl.col("doi")))
+        .otherwise(None)
+        .alias("doi"),
+        pl.format("https://openalex.org/{}", paper_id).alias("url"),
+    )
+
+
+def generate_staging_rows(catalog: pl.DataFrame) -> List[Dict[str, Any]]:
+    """Staging session rows (as stored in ``session["rows"]``) for the catalog's papers."""
+    rows = []
+    columns = catalog.select("paperId", "title", "authors_display", "venue", "year", "doi", "url", "retracted")
+    for index, (paper_id, title, authors, venue, year, doi, url, retracted) in enumerate(columns.iter_rows()):
+        source_type, source = SOURCES[index % len(SOURCES)]
+        rows.append(
+            {
+                "staging_id": index + 1,
+                "source": source,
+                "source_type": source_type,
+                "title": title,
+                "authors": ", ".join(authors),
+                "venue": venue,
+                "year": year,
+                "doi": doi,
+                "url": url,
+                # Sharing the title string keeps keyword search realistic
+                # without doubling the session's memory.
+                "abstract": title,
+                "is_retracted": retracted,
+                "is_selected": index % 7 == 0,
+                "source_id": paper_id,
+            }
+        )
+    return rows
+
+
+def write_catalog(root: Path, catalog: pl.DataFrame, seed: int = 0) -> None:
+    """Write the catalog and a mark store where the repositories expect them for ``JOB_ID``."""
+    vault = root / "experiments" / f"job_{JOB_ID}" / f"crawler_{JOB_ID}" / "vault"
+    (vault / "parquet").mkdir(parents=True, exist_ok=True)
+    (vault / "annotations").mkdir(parents=True, exist_ok=True)
+    catalog.write_parquet(vault / "parquet" / "papers.parquet")
+
+    rng = np.random.default_rng(seed + 1)
+    marked = catalog.get_column("paperId").sample(fraction=0.01, seed=seed).to_list()
+    marks = {paper_id: MARKS[choice] for paper_id, choice in zip(marked, rng.integers(0, len(MARKS), len(marked)))}
+    (vault / "annotations" / "paper_marks.json").write_text(json.dumps(marks), encoding="utf-8")
+
+
+def build_cases(catalog: pl.DataFrame, workdir: Path) -> List[Tuple[str, Callable[[], int]]]:
+    """
+    Name and callable of every timed case; each callable returns a row count.
+
+    Facet values are the most frequent venue, author and year of the corpus so
+    the filters select a non-trivial slice at every size.
+    """
+    catalog_service = PaperCatalogService(
+        PaperCatalogRepository(str(workdir)),
+        PaperAnnotationRepository(str(workdir)),
+    )
+    staging_service = StagingQueryService()
+    staging_rows = generate_staging_rows(catalog)
+
+    top_venue = _most_frequent(catalog.get_column("venue"))
+    top_year = int(_most_frequent(catalog.get_column("year")))
+    top_author = _most_frequent(catalog.get_column("authors_display").explode())
+    last_catalog_page = max(1, -(-catalog.height // 200))
+    custom_filters = [
+        ColumnCustomFilter(column="title", operator="contains", value="network"),
+        ColumnCustomFilter(column="year", operator="between", value="2010", value_to="2020"),
+    ]
+
+    def catalog_list(**kwargs) -> Callable[[], int]:
+        return lambda: catalog_service.list_papers(JOB_ID, **kwargs).total
+
+    def catalog_options(column: str, **kwargs) -> Callable[[], int]:
+        return lambda: catalog_service.list_column_options(JOB_ID, column, **kwargs).total
+
+    def staging_list(revision: Optional[str] = "r1", **kwargs) -> Callable[[], int]:
+        query = dict(_STAGING_QUERY, **kwargs)
+        return lambda: staging_service.list_rows(SESSION_ID, staging_rows, revision=revision, **query).filtered_rows
+
+    cases = [
+        ("catalog.first_page", catalog_list()),
+        ("catalog.search", catalog_list(query="network")),
+        ("catalog.facets", catalog_list(venue_values=[top_venue], year_values=[top_year], author_values=[top_author])),
+        ("catalog.custom_filters", catalog_list(custom_filters=custom_filters)),
+        ("catalog.flags", catalog_list(doi_filter="with", retraction_filter="without", mark_filters=["good"])),
+        ("catalog.sort_title", catalog_list(sort_by="title", descending=False)),
+        ("catalog.deep_page", catalog_list(page=last_catalog_page, page_size=200)),
+        ("catalog.options_authors", catalog_options("authors", option_query=top_author[:4])),
+        ("catalog.options_venue_filtered", catalog_options("venue", query="network", year_from=2015)),
+        ("staging.first_page", staging_list()),
+        ("staging.search", staging_list(title_search="network", keyword_search="graph")),
+        ("staging.facets", staging_list(venue_values=[top_venue], year_values=[top_year])),
+        ("staging.custom_filters", staging_list(custom_filters=custom_filters)),
+        ("staging.sort_title", staging_list(sort_by="title", sort_dir="desc")),
+        ("staging.deep_page", staging_list(page=-(-len(staging_rows) // 100))),
+        # Without a revision the cached table is rebuilt on every call, as
+        # after any mutation that bypasses the delta hooks.
+        ("staging.rebuild", staging_list(revision=None)),
+        ("results.assemble", _assemble_case(catalog, workdir)),
+    ]
+    return cases
+
+
+def run_query_benchmark(sizes=DEFAULT_SIZES, repeats: int = 15, seed: int = 0,
+                        cases: Optional[List[str]] = None, workdir: Optional[Path] = None) -> Dict:
+    """
+    Time every case at every catalog size and return the measurements.
+
+    Args:
+        sizes: Catalog/session sizes in rows
+        repeats: Timed calls per case, after one untimed warm-up call
+        seed: Seed of the synthetic data
+        cases: Only run cases whose name starts with one of these prefixes
+        workdir: Folder receiving the synthetic catalogs (default: a temporary directory)
+    """
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="query-benchmark-") as scratch:
+        for size in sizes:
+            root = Path(workdir or scratch) / f"rows_{size}"
+            started = time.perf_counter()
+            catalog = generate_catalog(size, seed=seed)
+            write_catalog(root, catalog, seed=seed)
+            size_cases = build_cases(catalog, root)
+            generated = time.perf_counter() - started
+
+            timings: Dict[str, Dict] = {}
+            for name, run in size_cases:
+                if cases and not name.startswith(tuple(cases)):
+                    continue
+                timings[name] = _time_case(run, repeats)
+            results[str(size)] = {"generate_seconds": round(generated, 3), "cases": timings}
+
+    return {
+        "benchmark": "queries",
+        "params": {"sizes": [int(size) for size in sizes], "repeats": repeats, "seed": seed},
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "polars": pl.__version__,
+        },
+        "sizes": results,
+    }
+
+
+def compare_to_baseline(result: Dict, baseline: Dict, tolerance: float = 0.5) -> List[str]:
+    """
+    Regressions of ``result`` against ``baseline``, as readable lines.
+
+    p50 and p95 may exceed the baseline by ``tolerance`` (a fraction); cases
+    missing from either side are skipped. Row counts must match exactly
+    because the synthetic data is deterministic.
+    """
+    problems = []
+    limit = 1.0 + tolerance
+    for size, measured in result["sizes"].items():
+        expected_cases = baseline.get("sizes", {}).get(size, {}).get("cases", {})
+        for name, current in measured["cases"].items():
+            expected = expected_cases.get(name)
+            if expected is None:
+                continue
+            label = f"{size}/{name}"
+            if current["rows"] != expected["rows"]:
+                problems.append(f"{label}: {current['rows']} rows vs baseline {expected['rows']}")
+            for stat in ("p50_ms", "p95_ms"):
+                if expected[stat] >= MIN_COMPARED_MS and current[stat] > expected[stat] * limit:
+                    problems.append(
+                        f"{label} {stat}: {current[stat]:.1f}ms vs baseline {expected[stat]:.1f}ms "
+                        f"(+{current[stat] / expected[stat] - 1:.0%})"
+                    )
+    return problems
+
+
+def _time_case(run: Callable[[], int], repeats: int) -> Dict:
+    rows = run()
+    samples = []
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+    p50, p95 = np.percentile(samples, [50, 95])
+    return {
+        "rows": int(rows),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "min_ms": round(min(samples), 3),
+    }
+
+
+def _assemble_case(catalog: pl.DataFrame, workdir: Path) -> Callable[[], int]:
+    """``assemble`` over a crawler stand-in exposing the attributes the assembler reads."""
+    df_results = catalog.drop("authors_display").to_pandas()
+    summary_folder = workdir / "summary"
+    summary_folder.mkdir(parents=True, exist_ok=True)
+    # Finished crawls carry structured top-author/venue summaries, which the
+    # assembler prefers over recomputing them from the frames.
+    top_authors = [
+        {"author_id": f"A{i}", "author_name": name, "paper_count": 10, "num_citations": 5}
+        for i, name in enumerate(_author_names(50).to_list())
+    ]
+    (summary_folder / "top_authors.json").write_text(json.dumps(top_authors), encoding="utf-8")
+    (summary_folder / "top_venues.json").write_text(
+        json.dumps([{"venue": venue, "total_papers": 1} for venue in catalog.get_column("venue").unique().head(20)]),
+        encoding="utf-8",
+    )
+    frames = SimpleNamespace(df_abstract=None, df_paper_author=None, df_author=None, df_venue_features=None)
+    crawler = SimpleNamespace(
+        text_processor=SimpleNamespace(
+            analysis={"df_merge_meta_centralities_topics": df_results},
+            topicmodeling=SimpleNamespace(results={"NMF": {"top_words": [list(WORDS[i:i + 10]) for i in range(20)]}}),
+        ),
+        text_config=SimpleNamespace(default_topic_model_type="NMF"),
+        storage_config=SimpleNamespace(summary_structured_folder=summary_folder),
+        api_config=SimpleNamespace(provider_type="openalex"),
+        data_coordinator=SimpleNamespace(frames=frames),
+        graph_manager=None,
+    )
+    assembler = CrawlerResultAssembler()
+    return lambda: assembler.assemble(JOB_ID, crawler, {"current_iteration": 3})["network_overview"]["total_papers"]
+
+
+def _author_names(count: int) -> pl.Series:
+    return pl.Series(
+        "author",
+        [f"{GIVEN_NAMES[i % len(GIVEN_NAMES)]} {SURNAMES[(i // len(GIVEN_NAMES)) % len(SURNAMES)]} {i}" for i in range(count)],
+    )
+
+
+def _most_frequent(series: pl.Series):
+    counts = series.value_counts(sort=True)
+    return counts.get_column(series.name)[0]
+
+
+_STAGING_QUERY: Dict[str, Any] = dict(
+    page=1,
+    page_size=100,
+    sort_by=None,
+    sort_dir="asc",
+    source_values=None,
+    year_min=None,
+    year_max=None,
+    title_search=None,
+    venue_search=None,
+    author_search=None,
+    keyword_search=None,
+    doi_presence=None,
+    selected_only=False,
+    retraction_status=None,
+    title_values=None,
+    author_values=None,
+    venue_values=None,
+    year_values=None,
+    identifier_filters=None,
+    custom_filters=None,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="catalog sizes to benchmark (e.g. 10000 100000 1000000)")
+    parser.add_argument("--repeats", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--case", action="append", help="only run cases starting with this prefix")
+    parser.add_argument("--baseline", type=Path, help="JSON baseline to compare with (or to write)")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown as a fraction")
+    parser.add_argument("--output", type=Path, help="write the result JSON here")
+    args = parser.parse_args(argv)
+
+    result = run_query_benchmark(sizes=args.rows, repeats=args.repeats, seed=args.seed, cases=args.case)
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    for size, measured in result["sizes"].items():
+        print(f"{int(size):,} rows (generated in {measured['generate_seconds']:.1f}s)")
+        for name, stats in measured["cases"].items():
+            print(f"  {name:<32}p50 {stats['p50_ms']:9.1f}ms  p95 {stats['p95_ms']:9.1f}ms  rows {stats['rows']}")
+
+    if args.baseline is None:
+        return 0
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(text + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    problems = compare_to_baseline(result, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    if not problems:
+        print(f"Within {args.tolerance:.0%} of {args.baseline}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
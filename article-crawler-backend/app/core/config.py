@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 from app.core.bootstrap import ensure_articlecrawler_path
 
@@ -29,6 +29,36 @@ class Settings(BaseSettings):
     STAGED_FILES_DIR: str = "uploaded_dumps"
     STAGED_FILES_TTL_HOURS: int = 48
     RETRACTION_CACHE_DIR: str = "retraction_cache"
+
+    GROBID_CONCURRENCY: int = 4
+    PROVIDER_CONCURRENCY: int = 4
+    RETRACTION_CONCURRENCY: int = 1
+    BLOCKING_DEFAULT_CONCURRENCY: int = 8
+    PDF_EXTRACTION_WORKERS: int = 8
+    GROBID_CACHE_PATH: str = "data/grobid_cache.db"
+    GROBID_CACHE_MAX_MB: int = 512
+    OPERATION_TTL_MINUTES: int = 60
+
+    CRAWLER_EXECUTOR: str = "process"
+    CRAWLER_MAX_WORKERS: int = 2
+    CRAWLER_MAX_QUEUED_JOBS: int = 8
+    CRAWLER_MEMORY_LIMIT_MB: int = 0
+    CRAWLER_STATUS_BUFFER_SIZE: int = 256
+
+    STAGING_STORE_BACKEND: str = "sqlite"
+    STAGING_STORE_PATH: str = "data/staging_sessions.db"
+    STAGING_SESSION_TTL_MINUTES: int = 2880
+    STAGING_MAX_CACHED_SESSIONS: int = 32
+
+    LOCAL_TITLE_INDEX_ENABLED: bool = True
+    LOCAL_TITLE_INDEX_REFRESH_SECONDS: float = 60.0
+
+    HTTP_TIMEOUT: float = 60.0
+    HTTP_CONNECT_TIMEOUT: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_RETRIES: int = 2
+    HTTP_HTTP2: Optional[bool] = None
     
     class Config:
         env_file = ".env"
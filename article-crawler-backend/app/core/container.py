@@ -4,9 +4,14 @@ import logging
 from app.core.stores.seed_session_store import InMemorySeedSessionStore
 from app.core.stores.pdf_upload_store import InMemoryPdfUploadStore
 from app.core.stores.crawler_job_store import InMemoryCrawlerJobStore
+from app.core.stores.job_status_feed import JobStatusFeed
+from app.core.stores.operation_store import InMemoryOperationStore
 from app.core.storage.file_storage import LocalTempFileStorage
 from app.core.storage.persistent_file_storage import PersistentFileStorage
 from app.core.executors.background import BackgroundJobExecutor
+from app.core.executors.blocking import BlockingTaskExecutor
+from app.core.executors.process import ProcessJobExecutor
+from ArticleCrawler.api.http_transport import HttpTransportConfig
 from app.services.author_topic_evolution_service import AuthorTopicEvolutionService
 from app.services.configuration_service import ConfigurationService
 from app.services.crawler import (
@@ -25,14 +30,16 @@ from app.services.workflows.pdf_helpers import (
     PDFMatchedSeedBuilder,
     PDFStagingRowBuilder,
 )
-from app.services.staging.session_store import StagingSessionStore
+from app.services.staging.session_store import SQLiteStagingSessionStore, StagingSessionStore
 from app.services.staging.query_utils import StagingQueryHelper
 from app.services.staging.repository import StagingRepository
 from app.services.staging.query_service import StagingQueryService
+from app.services.staging.table import StagingTableCache
 from app.services.staging.retraction_updater import StagingRetractionUpdater
 from app.services.staging.row_manager import StagingRowManager
 from app.services.integration_settings_service import IntegrationSettingsService
 from app.services.keyword.service import KeywordService
+from app.services.operations.service import OperationService
 from app.services.library.edit_service import LibraryEditService
 from app.services.library.edit_workflow_service import (
     LibraryEditWorkflowService,
@@ -104,7 +111,7 @@ from app.services.seeds.helpers import (
     PaperMetadataFetcher,
     SeedSessionManager,
 )
-from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory
+from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory, LocalTitleIndexProvider
 from app.services.zotero.helpers import (
     ZoteroClientAdapter,
     ZoteroMetadataExtractorAdapter,
@@ -131,6 +138,16 @@ class Container(containers.DeclarativeContainer):
         "ArticleCrawlerAPI"
     )
     
+    http_transport_config = providers.Singleton(
+        HttpTransportConfig,
+        timeout=settings.HTTP_TIMEOUT,
+        connect_timeout=settings.HTTP_CONNECT_TIMEOUT,
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_connections_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+        retries=settings.HTTP_RETRIES,
+        http2=settings.HTTP_HTTP2,
+    )
+
     # Shared Services
     seed_session_store = providers.Singleton(InMemorySeedSessionStore)
     seed_session_manager = providers.Singleton(SeedSessionManager)
@@ -172,20 +189,82 @@ class Container(containers.DeclarativeContainer):
         ArticleCrawlerAPIProviderFactory,
         logger=logger,
     )
+    local_title_index = providers.Singleton(
+        LocalTitleIndexProvider,
+        articlecrawler_path=settings.ARTICLECRAWLER_PATH,
+        enabled=settings.LOCAL_TITLE_INDEX_ENABLED,
+        refresh_interval=settings.LOCAL_TITLE_INDEX_REFRESH_SECONDS,
+        logger=logger,
+    )
 
     file_storage = providers.Singleton(LocalTempFileStorage)
-    crawler_job_store = providers.Singleton(InMemoryCrawlerJobStore)
-    job_executor = providers.Singleton(BackgroundJobExecutor, max_workers=2)
-
-    staging_session_store = providers.Singleton(StagingSessionStore)
+    crawler_job_store = providers.Singleton(
+        InMemoryCrawlerJobStore,
+        status_feed=providers.Singleton(
+            JobStatusFeed,
+            buffer_size=settings.CRAWLER_STATUS_BUFFER_SIZE,
+        ),
+    )
+    job_executor = providers.Selector(
+        providers.Object(settings.CRAWLER_EXECUTOR),
+        process=providers.Singleton(
+            ProcessJobExecutor,
+            max_workers=settings.CRAWLER_MAX_WORKERS,
+            max_queued=settings.CRAWLER_MAX_QUEUED_JOBS,
+            memory_limit_mb=settings.CRAWLER_MEMORY_LIMIT_MB,
+            http_config=http_transport_config,
+            logger=logger,
+        ),
+        thread=providers.Singleton(
+            BackgroundJobExecutor,
+            max_workers=settings.CRAWLER_MAX_WORKERS,
+            max_queued=settings.CRAWLER_MAX_QUEUED_JOBS,
+        ),
+    )
+    blocking_executor = providers.Singleton(
+        BlockingTaskExecutor,
+        limits={
+            "grobid": settings.GROBID_CONCURRENCY,
+            "provider": settings.PROVIDER_CONCURRENCY,
+            "retraction": settings.RETRACTION_CONCURRENCY,
+            BlockingTaskExecutor.DEFAULT_CATEGORY: settings.BLOCKING_DEFAULT_CONCURRENCY,
+        },
+    )
+    operation_store = providers.Singleton(
+        InMemoryOperationStore,
+        ttl_minutes=settings.OPERATION_TTL_MINUTES,
+    )
+    operation_service = providers.Singleton(
+        OperationService,
+        logger=logger,
+        store=operation_store,
+        executor=blocking_executor,
+    )
+
+    staging_session_store = providers.Selector(
+        providers.Object(settings.STAGING_STORE_BACKEND),
+        memory=providers.Singleton(
+            StagingSessionStore,
+            ttl_minutes=settings.STAGING_SESSION_TTL_MINUTES,
+        ),
+        sqlite=providers.Singleton(
+            SQLiteStagingSessionStore,
+            db_path=settings.STAGING_STORE_PATH,
+            ttl_minutes=settings.STAGING_SESSION_TTL_MINUTES,
+            max_sessions=settings.STAGING_MAX_CACHED_SESSIONS,
+            logger=logger,
+        ),
+    )
     staging_repository = providers.Singleton(
         StagingRepository,
         session_store=staging_session_store,
     )
     staging_query_helper = providers.Singleton(StagingQueryHelper)
+    staging_table_cache = providers.Singleton(StagingTableCache)
     staging_query_service = providers.Singleton(
         StagingQueryService,
         helper=staging_query_helper,
+        table_cache=staging_table_cache,
     )
 
     staging_retraction_updater = providers.Singleton(
@@ -205,6 +284,7 @@ class Container(containers.DeclarativeContainer):
         query_helper=staging_query_helper,
         retraction_updater=staging_retraction_updater,
         row_manager=staging_row_manager,
+        table_cache=staging_table_cache,
     )
     staging_query_parser = providers.Singleton(StagingQueryParser)
     manual_metadata_repository = providers.Singleton(ManualMetadataRepository)
@@ -219,10 +299,13 @@ class Container(containers.DeclarativeContainer):
         repository=manual_metadata_repository,
         lookup_helper=manual_metadata_lookup,
         merger=manual_metadata_merger,
+        executor=blocking_executor,
     )
     metadata_matcher_factory = providers.Singleton(
         APIMetadataMatcherFactory,
         logger=logger,
+        title_index_provider=local_title_index,
+        api_factory=article_api_factory,
     )
 
     staging_match_service = providers.Factory(
@@ -230,6 +313,7 @@ class Container(containers.DeclarativeContainer):
         seed_selection_service=seed_selection_service,
         matcher_factory=metadata_matcher_factory,
         logger=logger,
+        executor=blocking_executor,
     )
 
     retraction_doi_normalizer = providers.Singleton(RetractionDOINormalizer)
@@ -275,8 +359,17 @@ class Container(containers.DeclarativeContainer):
     )
 
     grobid_manager = providers.Singleton(GrobidManagerAdapter, logger=logger)
-    pdf_metadata_extractor = providers.Singleton(MetadataExtractionAdapter, logger=logger)
-    pdf_metadata_matcher = providers.Singleton(PDFMetadataMatcherAdapter, logger=logger)
+    pdf_metadata_extractor = providers.Singleton(
+        MetadataExtractionAdapter,
+        logger=logger,
+        cache_path=settings.GROBID_CACHE_PATH,
+        cache_max_mb=settings.GROBID_CACHE_MAX_MB,
+    )
+    pdf_metadata_matcher = providers.Singleton(
+        PDFMetadataMatcherAdapter,
+        logger=logger,
+        title_index_provider=local_title_index,
+    )
     pdf_match_result_builder = providers.Singleton(PDFMatchResultBuilder, logger=logger)
 
     pdf_seed_service = providers.Singleton(
@@ -290,6 +383,7 @@ class Container(containers.DeclarativeContainer):
         metadata_matcher=pdf_metadata_matcher,
         match_result_builder=pdf_match_result_builder,
         api_factory=article_api_factory,
+        extraction_workers=settings.PDF_EXTRACTION_WORKERS,
     )
 
     pdf_staging_row_builder = providers.Singleton(PDFStagingRowBuilder)
@@ -313,7 +407,11 @@ class Container(containers.DeclarativeContainer):
     
     zotero_client_adapter = providers.Singleton(ZoteroClientAdapter, logger=logger)
     zotero_metadata_extractor = providers.Singleton(ZoteroMetadataExtractorAdapter)
-    zotero_matcher_adapter = providers.Singleton(ZoteroMatcherAdapter, logger=logger)
+    zotero_matcher_adapter = providers.Singleton(
+        ZoteroMatcherAdapter,
+        logger=logger,
+        title_index_provider=local_title_index,
+    )
     zotero_session_store = providers.Singleton(ZoteroSessionStore)
     zotero_match_result_builder = providers.Singleton(ZoteroMatchResultBuilder, logger=logger)
     zotero_seed_enricher = providers.Singleton(
@@ -372,6 +470,7 @@ class Container(containers.DeclarativeContainer):
     crawler_result_assembler = providers.Singleton(
         CrawlerResultAssembler,
         logger=logger,
+        api_factory=article_api_factory,
     )
 
     crawler_execution_service = providers.Singleton(
@@ -461,12 +560,14 @@ class Container(containers.DeclarativeContainer):
 
     author_topic_evolution_service = providers.Singleton(
         AuthorTopicEvolutionService,
-        logger=logger
+        logger=logger,
+        api_factory=article_api_factory,
     )
 
     paper_metadata_service = providers.Singleton(
         PaperMetadataService,
-        logger=logger
+        logger=logger,
+        api_factory=article_api_factory,
     )
 
     paper_catalog_repository = providers.Singleton(
@@ -21,6 +21,11 @@ class CrawlerException(ArticleCrawlerException):
     pass
 
 
+class JobQueueFullException(CrawlerException):
+    """Raised when the crawler job queue has no room for another job."""
+    pass
+
+
 def to_http_exception(exc: Exception) -> HTTPException:
     """Convert domain exceptions to HTTP exceptions."""
     
@@ -36,6 +41,12 @@ def to_http_exception(exc: Exception) -> HTTPException:
             detail=str(exc)
         )
     
+    if isinstance(exc, JobQueueFullException):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc)
+        )
+    
     if isinstance(exc, CrawlerException):
         return HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,18 +1,86 @@
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Callable, Any
+from threading import Lock
+from typing import Callable, Any, Dict, Optional
+
+from ArticleCrawler.crawl_control import CrawlCancelled, CrawlControl
+
+from app.core.exceptions import JobQueueFullException
 
 
 class BackgroundJobExecutor:
-    """Thin wrapper around ThreadPoolExecutor for crawler jobs."""
+    """Thread pool for crawler jobs with a bounded queue and per-job controls.
+
+    ``submit`` schedules the job's supervising call; ``run_job`` runs the crawl
+    itself (in the calling thread here, in a worker process in
+    ``ProcessJobExecutor``) with a ``CrawlControl`` that ``cancel``, ``pause``
+    and ``unpause`` act on between crawl iterations.
+    """
 
-    def __init__(self, max_workers: int = 2):
-        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crawler-job")
+    def __init__(self, max_workers: int = 2, max_queued: Optional[int] = None):
+        self.max_workers = max(1, int(max_workers))
+        self.max_queued = max_queued
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crawler-job")
+        self._lock = Lock()
+        self._pending = 0
+        self._controls: Dict[str, CrawlControl] = {}
 
     def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
-        return self._executor.submit(fn, *args, **kwargs)
+        with self._lock:
+            if self.max_queued is not None and self._pending >= self.max_workers + self.max_queued:
+                raise JobQueueFullException(
+                    f"Crawler job queue is full ({self.max_workers} running, {self.max_queued} queued)"
+                )
+            self._pending += 1
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._release)
+        return future
+
+    def run_job(self, job_id: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``fn(*args, control=..., **kwargs)`` for ``job_id`` and return its result.
+
+        Raises ``CrawlCancelled`` if the job was cancelled before or while running.
+        """
+        control = self.control(job_id)
+        try:
+            if control.cancelled:
+                raise CrawlCancelled(f"Job {job_id} cancelled before it started")
+            return fn(*args, control=control, **kwargs)
+        finally:
+            self._discard_control(job_id)
+
+    def control(self, job_id: str) -> CrawlControl:
+        """The control of ``job_id``, created on first use (also for queued jobs)."""
+        with self._lock:
+            control = self._controls.get(job_id)
+            if control is None:
+                control = self._controls[job_id] = self._new_control()
+            return control
+
+    def cancel(self, job_id: str) -> None:
+        self.control(job_id).cancel()
+
+    def pause(self, job_id: str) -> None:
+        self.control(job_id).pause()
+
+    def unpause(self, job_id: str) -> None:
+        self.control(job_id).resume()
 
     def shutdown(self, wait: bool = False):
-        self._executor.shutdown(wait=wait)
+        with self._lock:
+            controls = list(self._controls.values())
+        for control in controls:
+            control.cancel()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _new_control(self) -> CrawlControl:
+        return CrawlControl()
+
+    def _discard_control(self, job_id: str) -> None:
+        with self._lock:
+            self._controls.pop(job_id, None)
 
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
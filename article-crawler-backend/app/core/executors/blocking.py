@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, Mapping, Optional
+
+
+class BlockingTaskExecutor:
+    """Run blocking service calls off the event loop with per-category limits.
+
+    Each category (``grobid``, ``provider``, ``retraction`` ...) gets its own
+    bounded thread pool so one slow dependency cannot starve the others.
+    Unknown categories share the ``default`` pool.
+    """
+
+    DEFAULT_CATEGORY = "default"
+    DEFAULT_LIMITS: Dict[str, int] = {
+        "grobid": 4,
+        "provider": 4,
+        "retraction": 1,
+        DEFAULT_CATEGORY: 8,
+    }
+
+    def __init__(self, limits: Optional[Mapping[str, int]] = None):
+        merged = dict(self.DEFAULT_LIMITS)
+        merged.update(limits or {})
+        self._limits = {name: max(1, int(value)) for name, value in merged.items()}
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = Lock()
+        self._closed = False
+
+    @property
+    def limits(self) -> Dict[str, int]:
+        return dict(self._limits)
+
+    def submit(self, category: str, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        return self._get_pool(category).submit(fn, *args, **kwargs)
+
+    async def run(self, category: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await ``fn(*args, **kwargs)`` on the pool for ``category``."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        return await loop.run_in_executor(self._get_pool(category), call)
+
+    def shutdown(self, wait: bool = False):
+        with self._lock:
+            self._closed = True
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=wait)
+
+    def _get_pool(self, category: str) -> ThreadPoolExecutor:
+        name = category if category in self._limits else self.DEFAULT_CATEGORY
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Blocking executor has been shut down")
+            pool = self._pools.get(name)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=self._limits[name],
+                    thread_name_prefix=f"blocking-{name}",
+                )
+                self._pools[name] = pool
+            return pool
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import time
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+from ArticleCrawler.api.http_transport import HttpTransportConfig, configure_http_transport
+from ArticleCrawler.crawl_control import CrawlCancelled, CrawlControl
+
+from app.core.exceptions import CrawlerException
+from app.core.executors.background import BackgroundJobExecutor
+
+
+class ProcessJobExecutor(BackgroundJobExecutor):
+    """Run each crawler job in its own worker process.
+
+    Crawls are CPU-heavy (pandas, centrality, topic modeling), so running them
+    on API threads slows every request down through the GIL. Here the pool
+    threads only supervise: each ``run_job`` spawns a process for the crawl,
+    relays its progress snapshots to ``progress_callback`` and returns the
+    unpickled result. ``max_workers`` bounds the concurrent processes and
+    ``max_queued`` the jobs waiting for one. ``memory_limit_mb`` caps the
+    resident memory (RSS) of each worker: the supervising thread samples it
+    every ``poll_interval`` and terminates a worker that goes over (Linux
+    only; 0 or ``None`` disables it). RSS rather than address space, because
+    numpy and torch reserve far more virtual memory than they touch.
+    ``http_config`` configures the shared HTTP transport of each worker, which
+    otherwise reads the ``HTTP_*`` environment variables.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queued: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        http_config: Optional[HttpTransportConfig] = None,
+        start_method: str = "spawn",
+        poll_interval: float = 0.2,
+        logger: Optional[logging.Logger] = None,
+    ):
+        super().__init__(max_workers=max_workers, max_queued=max_queued)
+        self.memory_limit_mb = memory_limit_mb
+        self.http_config = http_config
+        self.poll_interval = poll_interval
+        self._context = multiprocessing.get_context(start_method)
+        self._processes: Dict[str, multiprocessing.process.BaseProcess] = {}
+        self._logger = logger or logging.getLogger(__name__)
+        if memory_limit_mb and _resident_mb(os.getpid()) is None:
+            self._logger.warning("Per-job memory limits are not supported on this platform")
+
+    def run_job(
+        self,
+        job_id: str,
+        fn: Callable[..., Any],
+        *args,
+        progress_callback: Optional[Callable[[Any], None]] = None,
+        **kwargs,
+    ) -> Any:
+        """Run ``fn(*args, progress_callback=..., control=..., **kwargs)`` in a worker process.
+
+        ``fn``, its arguments and its result must be picklable. Raises
+        ``CrawlCancelled`` when the job was cancelled and ``CrawlerException``
+        when the worker failed or died.
+        """
+        control = self.control(job_id)
+        try:
+            if control.cancelled:
+                raise CrawlCancelled(f"Job {job_id} cancelled before it started")
+            messages = self._context.Queue()
+            process = self._context.Process(
+                target=_run_in_worker,
+                args=(fn, args, kwargs, control, messages, self.http_config),
+                name=f"crawler-{job_id}",
+            )
+            process.start()
+            with self._lock:
+                self._processes[job_id] = process
+            try:
+                return self._collect(job_id, process, messages, progress_callback)
+            finally:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+                with self._lock:
+                    self._processes.pop(job_id, None)
+        finally:
+            self._discard_control(job_id)
+
+    def shutdown(self, wait: bool = False):
+        super().shutdown(wait=False)
+        with self._lock:
+            processes = list(self._processes.values())
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        if wait:
+            for process in processes:
+                process.join()
+
+    def _new_control(self) -> CrawlControl:
+        return CrawlControl(self._context.Event(), self._context.Event())
+
+    def _collect(self, job_id, process, messages, progress_callback) -> Any:
+        next_memory_check = 0.0
+        while True:
+            if self.memory_limit_mb and time.monotonic() >= next_memory_check:
+                self._check_memory(job_id, process)
+                next_memory_check = time.monotonic() + self.poll_interval
+            try:
+                kind, payload = messages.get(timeout=self.poll_interval)
+            except queue.Empty:
+                if process.is_alive():
+                    continue
+                # The worker flushes its queue before exiting; give it one last read.
+                try:
+                    kind, payload = messages.get(timeout=1.0)
+                except queue.Empty:
+                    raise CrawlerException(
+                        f"Crawler worker for job {job_id} exited with code {process.exitcode}"
+                    ) from None
+            if kind == "progress":
+                if progress_callback is not None:
+                    progress_callback(payload)
+            elif kind == "result":
+                return pickle.loads(payload)
+            elif kind == "cancelled":
+                raise CrawlCancelled(payload)
+            else:
+                message, remote_traceback = payload
+                self._logger.error("Job %s: crawler worker failed:\n%s", job_id, remote_traceback)
+                raise CrawlerException(message)
+
+    def _check_memory(self, job_id, process) -> None:
+        resident = _resident_mb(process.pid)
+        if resident is None or resident <= self.memory_limit_mb:
+            return
+        process.terminate()
+        raise CrawlerException(
+            f"MemoryError: crawler worker for job {job_id} used {resident:.0f} MB, "
+            f"over the {self.memory_limit_mb} MB limit"
+        )
+
+
+def _run_in_worker(fn, args, kwargs, control, messages, http_config=None) -> None:
+    """Worker process entry point; reports progress and the outcome on ``messages``."""
+    try:
+        if http_config is not None:
+            configure_http_transport(http_config)
+        result = fn(
+            *args,
+            progress_callback=lambda snapshot: messages.put(("progress", snapshot)),
+            control=control,
+            **kwargs,
+        )
+        messages.put(("result", pickle.dumps(result)))
+    except CrawlCancelled as exc:
+        messages.put(("cancelled", str(exc)))
+    except BaseException as exc:
+        messages.put(("error", (f"{type(exc).__name__}: {exc}", traceback.format_exc())))
+
+
+def _resident_mb(pid: Optional[int]) -> Optional[float]:
+    """Resident memory of ``pid`` in MB, or ``None`` where ``/proc`` is unavailable."""
+    try:
+        with open(f"/proc/{pid}/statm") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
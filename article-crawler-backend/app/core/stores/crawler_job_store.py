@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from threading import RLock
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
 
-from ArticleCrawler.crawler import Crawler
+from app.core.stores.job_status_feed import JobStatusEvent, JobStatusFeed
+
+if TYPE_CHECKING:
+    from ArticleCrawler.crawler import Crawler
 
 
 class CrawlerJobStore(ABC):
     """Storage abstraction for crawler jobs and their results."""
 
+    # Job fields kept out of status payloads and status events.
+    PRIVATE_FIELDS = frozenset({"session_data", "config_snapshot"})
+    # How often the default ``subscribe_status`` re-reads a job's status.
+    STATUS_POLL_INTERVAL = 0.5
+
     @abstractmethod
     def create_job(self, job_id: str, data: Dict) -> Dict:
         raise NotImplementedError
@@ -39,24 +49,80 @@ class CrawlerJobStore(ABC):
     def get_crawler(self, job_id: str) -> Optional[Crawler]:
         raise NotImplementedError
 
+    def get_status(self, job_id: str) -> Optional[Dict]:
+        """Public status fields of a job (read-only)."""
+        job = self.get_job(job_id)
+        return self._public_fields(job) if job else None
+
+    def list_statuses(self) -> List[Dict]:
+        return [self._public_fields(job) for job in self.list_jobs()]
+
+    def subscribe_status(
+        self,
+        job_id: str,
+        last_seq: Optional[int] = None,
+        heartbeat: Optional[float] = None,
+    ) -> AsyncIterator[JobStatusEvent]:
+        """Async stream of status events for a job (see ``JobStatusFeed.subscribe``).
+
+        This default polls ``get_status`` every ``STATUS_POLL_INTERVAL``
+        seconds and yields the changed fields as deltas. It keeps no buffer,
+        so ``last_seq`` is ignored and every subscription starts with a
+        snapshot. Stores with a ``JobStatusFeed`` override it to push events.
+        """
+        return self._poll_status(job_id, heartbeat)
+
+    async def _poll_status(self, job_id: str, heartbeat: Optional[float]) -> AsyncIterator[JobStatusEvent]:
+        status = self.get_status(job_id)
+        if status is None:
+            return
+        seq = 0
+        yield JobStatusEvent(job_id, seq, "snapshot", status)
+        idle_since = time.monotonic()
+        while status.get("status") not in JobStatusFeed.TERMINAL_STATUSES:
+            await asyncio.sleep(self.STATUS_POLL_INTERVAL)
+            current = self.get_status(job_id)
+            if current is None:
+                return
+            changed = {key: value for key, value in current.items() if status.get(key) != value}
+            status = current
+            if changed:
+                seq += 1
+                idle_since = time.monotonic()
+                yield JobStatusEvent(job_id, seq, "delta", changed)
+            elif heartbeat is not None and time.monotonic() - idle_since >= heartbeat:
+                idle_since = time.monotonic()
+                yield JobStatusEvent(job_id, seq, "heartbeat", {})
+
+    @classmethod
+    def _public_fields(cls, job: Dict) -> Dict:
+        return {key: value for key, value in job.items() if key not in cls.PRIVATE_FIELDS}
+
 
 class InMemoryCrawlerJobStore(CrawlerJobStore):
-    """Thread-safe in-memory implementation of crawler job storage."""
+    """Thread-safe in-memory implementation of crawler job storage.
 
-    def __init__(self):
+    Every write is mirrored into a ``JobStatusFeed``, so status reads and
+    status streams are served from the feed without copying the job dicts.
+    """
+
+    def __init__(self, status_feed: Optional[JobStatusFeed] = None):
         self._jobs: Dict[str, Dict] = {}
         self._crawlers: Dict[str, Crawler] = {}
         self._lock = RLock()
+        self.status_feed = status_feed or JobStatusFeed()
 
     def create_job(self, job_id: str, data: Dict) -> Dict:
         with self._lock:
-            self._jobs[job_id] = deepcopy(data)
+            job = self._jobs[job_id] = deepcopy(data)
+            self.status_feed.publish(job_id, self._public_fields(job), reset=True)
         return data
 
     def update_job(self, job_id: str, **updates) -> None:
         with self._lock:
             if job_id in self._jobs:
                 self._jobs[job_id].update(updates)
+                self.status_feed.publish(job_id, self._public_fields(updates))
 
     def get_job(self, job_id: str) -> Optional[Dict]:
         with self._lock:
@@ -71,6 +137,7 @@ class InMemoryCrawlerJobStore(CrawlerJobStore):
         with self._lock:
             self._jobs.pop(job_id, None)
             self._crawlers.pop(job_id, None)
+            self.status_feed.discard(job_id)
 
     def store_crawler(self, job_id: str, crawler: Crawler) -> None:
         with self._lock:
@@ -80,3 +147,16 @@ class InMemoryCrawlerJobStore(CrawlerJobStore):
         with self._lock:
             return self._crawlers.get(job_id)
 
+    def get_status(self, job_id: str) -> Optional[Dict]:
+        return self.status_feed.get(job_id)
+
+    def list_statuses(self) -> List[Dict]:
+        return self.status_feed.list()
+
+    def subscribe_status(
+        self,
+        job_id: str,
+        last_seq: Optional[int] = None,
+        heartbeat: Optional[float] = None,
+    ) -> AsyncIterator[JobStatusEvent]:
+        return self.status_feed.subscribe(job_id, last_seq=last_seq, heartbeat=heartbeat)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, AsyncIterator, Deque, Dict, List, Mapping, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class JobStatusEvent:
+    """One entry of a job's status stream.
+
+    ``kind`` is ``"snapshot"`` (``data`` is the full status), ``"delta"``
+    (``data`` holds only the fields that changed) or ``"heartbeat"`` (no
+    data). ``seq`` increases by one per published delta and is used as the
+    SSE event id.
+    """
+
+    job_id: str
+    seq: int
+    kind: str
+    data: Mapping[str, Any]
+
+
+class JobStatusFeed:
+    """Latest status per job plus a ring buffer of recent deltas.
+
+    Writers call ``publish`` from any thread. ``get`` returns the current
+    status dict without copying: every publish replaces the dict instead of
+    mutating it, so callers must treat it as read-only. ``subscribe`` yields
+    the events of one job to async consumers. A reconnecting subscriber whose
+    last seen ``seq`` is still buffered gets the missed deltas; everyone else
+    starts from a fresh snapshot.
+    """
+
+    TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+    def __init__(self, buffer_size: int = 256):
+        self._buffer_size = buffer_size
+        self._lock = Lock()
+        self._status: Dict[str, Dict[str, Any]] = {}
+        self._seq: Dict[str, int] = {}
+        self._buffers: Dict[str, Deque[JobStatusEvent]] = {}
+        self._subscribers: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        # A dict lookup is atomic and published dicts are never mutated, so
+        # readers skip the lock.
+        return self._status.get(job_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        return list(self._status.values())
+
+    def publish(self, job_id: str, fields: Mapping[str, Any], *, reset: bool = False) -> Optional[JobStatusEvent]:
+        """Merge ``fields`` into the job's status and notify subscribers of the change.
+
+        ``reset`` replaces the status instead of merging (used when a job is
+        created). Returns the delta event, or ``None`` when nothing changed.
+        """
+        with self._lock:
+            current = {} if reset else self._status.get(job_id, {})
+            changed = {key: value for key, value in fields.items() if key not in current or current[key] != value}
+            if not changed and not reset:
+                return None
+            self._status[job_id] = {**current, **fields}
+            seq = self._seq.get(job_id, 0) + 1
+            self._seq[job_id] = seq
+            event = JobStatusEvent(job_id, seq, "delta", changed)
+            buffer = self._buffers.get(job_id)
+            if buffer is None:
+                buffer = self._buffers[job_id] = deque(maxlen=self._buffer_size)
+            buffer.append(event)
+            subscribers = list(self._subscribers.get(job_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:  # subscriber's loop already closed
+                pass
+        return event
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            self._status.pop(job_id, None)
+            self._seq.pop(job_id, None)
+            self._buffers.pop(job_id, None)
+
+    async def subscribe(
+        self,
+        job_id: str,
+        last_seq: Optional[int] = None,
+        heartbeat: Optional[float] = None,
+    ) -> AsyncIterator[JobStatusEvent]:
+        """Yield the job's events until it reaches a terminal status.
+
+        Args:
+            job_id: Job to follow
+            last_seq: ``seq`` of the last event the client saw (SSE ``Last-Event-ID``)
+            heartbeat: Seconds without events after which a heartbeat event is yielded
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        subscriber = (loop, queue)
+        with self._lock:
+            status = self._status.get(job_id)
+            if status is None:
+                return
+            seq = self._seq.get(job_id, 0)
+            buffer = self._buffers.get(job_id, ())
+            if last_seq is not None and last_seq <= seq and buffer and buffer[0].seq <= last_seq + 1:
+                backlog = [event for event in buffer if event.seq > last_seq]
+            else:
+                backlog = [JobStatusEvent(job_id, seq, "snapshot", status)]
+            self._subscribers.setdefault(job_id, set()).add(subscriber)
+
+        try:
+            for event in backlog:
+                yield event
+            if status.get("status") in self.TERMINAL_STATUSES:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield JobStatusEvent(job_id, seq, "heartbeat", {})
+                    continue
+                if event.seq <= seq:
+                    continue
+                seq = event.seq
+                yield event
+                if event.data.get("status") in self.TERMINAL_STATUSES:
+                    return
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id)
+                if subscribers is not None:
+                    subscribers.discard(subscriber)
+                    if not subscribers:
+                        del self._subscribers[job_id]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from datetime import datetime, timedelta
+from threading import RLock
+from typing import Dict, List, Optional
+
+
+class OperationStore(ABC):
+    """Storage abstraction for long-running API operations."""
+
+    @abstractmethod
+    def create(self, operation_id: str, data: Dict) -> Dict:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, operation_id: str, **updates) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def append(self, operation_id: str, field: str, item) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, operation_id: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list(self) -> List[Dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, operation_id: str) -> None:
+        raise NotImplementedError
+
+
+class InMemoryOperationStore(OperationStore):
+    """Thread-safe in-memory store that forgets finished operations after a TTL."""
+
+    FINISHED_STATUSES = {"completed", "failed"}
+
+    def __init__(self, ttl_minutes: int = 60):
+        self._operations: Dict[str, Dict] = {}
+        self._ttl = timedelta(minutes=ttl_minutes)
+        self._lock = RLock()
+
+    def create(self, operation_id: str, data: Dict) -> Dict:
+        with self._lock:
+            self._prune_expired()
+            self._operations[operation_id] = deepcopy(data)
+        return data
+
+    def update(self, operation_id: str, **updates) -> None:
+        with self._lock:
+            if operation_id in self._operations:
+                self._operations[operation_id].update(updates)
+
+    def append(self, operation_id: str, field: str, item) -> None:
+        with self._lock:
+            operation = self._operations.get(operation_id)
+            if operation is not None:
+                operation.setdefault(field, []).append(item)
+
+    def get(self, operation_id: str) -> Optional[Dict]:
+        with self._lock:
+            operation = self._operations.get(operation_id)
+            return deepcopy(operation) if operation else None
+
+    def list(self) -> List[Dict]:
+        with self._lock:
+            return [deepcopy(op) for op in self._operations.values()]
+
+    def delete(self, operation_id: str) -> None:
+        with self._lock:
+            self._operations.pop(operation_id, None)
+
+    def _prune_expired(self) -> None:
+        cutoff = datetime.utcnow() - self._ttl
+        expired = [
+            operation_id
+            for operation_id, op in self._operations.items()
+            if op.get("status") in self.FINISHED_STATUSES
+            and op.get("completed_at") is not None
+            and op["completed_at"] < cutoff
+        ]
+        for operation_id in expired:
+            self._operations.pop(operation_id, None)
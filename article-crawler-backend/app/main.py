@@ -8,6 +8,7 @@ from app.core.config import settings
 from app.core.container import Container
 from app.api.v1 import router as api_v1_router
 from app.core.exceptions import ArticleCrawlerException, to_http_exception
+from ArticleCrawler.api.http_transport import close_http_transport, configure_http_transport
 
 
 logging.basicConfig(
@@ -15,6 +16,9 @@ logging.basicConfig(
     format=settings.LOG_FORMAT
 )
 
+# httpx logs every request at INFO; outbound API calls go through it.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 logger = logging.getLogger("ArticleCrawlerAPI")
 
 
@@ -43,10 +47,12 @@ async def lifespan(app: FastAPI):
         "app.api.v1.crawler_execution",
         "app.api.v1.library",
         "app.api.v1.author_topic_evolution",
+        "app.api.v1.operations",
         "app.api.dependencies",
     ])
     
     app.state.container = container
+    configure_http_transport(container.http_transport_config())
 
     # Cleanup stale staged file sessions on startup
     staged_file_service = container.source_file_service()
@@ -61,6 +67,9 @@ async def lifespan(app: FastAPI):
     finally:
         executor = container.job_executor()
         executor.shutdown(wait=False)
+        container.blocking_executor().shutdown(wait=False)
+        container.staging_session_store().close()
+        close_http_transport()
     
     logger.info("Shutting down ArticleCrawler API...")
     container.unwire()
@@ -44,7 +44,9 @@ class ResumeCrawlerRequest(BaseModel):
 class CrawlerStatus(BaseModel):
     """Status information for a running or completed crawler job."""
     job_id: str = Field(..., description="Unique job identifier")
-    status: str = Field(..., description="Job status: running, completed, failed")
+    status: str = Field(
+        ..., description="Job status: queued, running, paused, saving, completed, cancelled, failed"
+    )
     current_iteration: int = Field(default=0, description="Current iteration number")
     max_iterations: int = Field(..., description="Maximum iterations configured")
     papers_collected: int = Field(default=0, description="Total papers collected so far")
@@ -61,6 +63,13 @@ class CrawlerStatus(BaseModel):
     last_progress_at: Optional[datetime] = Field(
         None, description="Timestamp of the latest progress update"
     )
+    stage_timings: Optional[Dict[str, float]] = Field(
+        None, description="Seconds spent per crawl stage in the last finished iteration"
+    )
+    iteration_seconds: Optional[float] = Field(
+        None, description="Wall time of the last finished iteration in seconds"
+    )
+    peak_rss_mb: Optional[float] = Field(None, description="Peak memory of the crawl process in MB")
     error_message: Optional[str] = Field(None, description="Error message if failed")
     
     class Config:
@@ -80,6 +89,9 @@ class CrawlerStatus(BaseModel):
                 "started_at": "2025-10-29T10:30:00",
                 "completed_at": None,
                 "last_progress_at": "2025-10-29T10:35:00",
+                "stage_timings": {"sampling": 1.2, "centrality": 4.8, "api_fetch": 12.5},
+                "iteration_seconds": 21.3,
+                "peak_rss_mb": 812.4,
                 "error_message": None
             }
         }
@@ -88,14 +100,14 @@ class CrawlerStatus(BaseModel):
 class StartCrawlerResponse(BaseModel):
     """Response after starting the crawler."""
     job_id: str = Field(..., description="Unique job identifier for tracking")
-    status: str = Field(..., description="Initial status: running")
+    status: str = Field(..., description="Initial status: queued")
     message: str = Field(..., description="Status message")
     
     class Config:
         json_schema_extra = {
             "example": {
                 "job_id": "job_123456",
-                "status": "running",
+                "status": "queued",
                 "message": "Crawler started successfully"
             }
         }
@@ -0,0 +1,34 @@
+"""
+Pydantic schemas for long-running API operations.
+"""
+
+from datetime import datetime
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class OperationProgress(BaseModel):
+    """Incremental progress reported by an operation."""
+    completed: int = Field(0, description="Work units finished so far")
+    total: Optional[int] = Field(None, description="Total work units, when known")
+    message: Optional[str] = Field(None, description="Last progress message")
+
+
+class OperationStatus(BaseModel):
+    """Status of a background operation started from an API handler."""
+    operation_id: str = Field(..., description="Unique operation identifier")
+    kind: str = Field(..., description="Operation type, e.g. pdf_extraction")
+    status: Literal["queued", "running", "completed", "failed"] = Field(
+        ..., description="Lifecycle state of the operation"
+    )
+    progress: OperationProgress = Field(default_factory=OperationProgress)
+    partial_results: List[Any] = Field(
+        default_factory=list,
+        description="Per-item results published while the operation is still running",
+    )
+    result: Optional[Any] = Field(None, description="JSON result once the operation completed")
+    error: Optional[str] = Field(None, description="Error message when the operation failed")
+    created_at: datetime = Field(..., description="When the operation was queued")
+    started_at: Optional[datetime] = Field(None, description="When a worker picked it up")
+    completed_at: Optional[datetime] = Field(None, description="When the operation finished")
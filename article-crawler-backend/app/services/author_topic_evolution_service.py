@@ -4,14 +4,20 @@ from typing import Optional, List, Dict
 from pathlib import Path
 import tempfile
 
+from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory
+
 
 class AuthorTopicEvolutionService:
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        api_factory: Optional[ArticleCrawlerAPIProviderFactory] = None,
+    ):
         self.logger = logger or logging.getLogger(__name__)
+        self._api_factory = api_factory or ArticleCrawlerAPIProviderFactory(logger=self.logger)
 
     def _api(self, provider: str):
-        from ArticleCrawler.api import create_api_provider
-        return create_api_provider(provider, logger=self.logger)
+        return self._api_factory.get_provider(provider)
 
     def search_authors(self, query: str, limit: int = 10, api_provider: str = "openalex") -> List[Dict]:
         api = self._api(api_provider)
@@ -50,6 +50,7 @@ class CrawlerConfigBuilder:
             keywords=keywords,
             max_iterations=config_dict.get("max_iterations", 1),
             papers_per_iteration=config_dict.get("papers_per_iteration", 1),
+            pipelined_crawl=config_dict.get("pipelined_crawl", False),
             api_provider=config_dict.get("api_provider", "openalex"),
             api_retries=config_dict.get("api_retries", 3),
             no_keyword_lambda=config_dict.get("no_keyword_lambda", 0.2),
@@ -59,6 +60,9 @@ class CrawlerConfigBuilder:
             ignored_venues=config_dict.get(
                 "ignored_venues", ["", "ArXiv", "medRxiv", "WWW"]
             ),
+            sampling_relevance_mode=config_dict.get(
+                "sampling_relevance_mode", "keywords"
+            ),
             min_abstract_length=config_dict.get("min_abstract_length", 120),
             num_topics=config_dict.get("num_topics", 20),
             topic_model=config_dict.get("topic_model", "NMF"),
@@ -70,6 +74,7 @@ class CrawlerConfigBuilder:
             max_centrality_iterations=config_dict.get(
                 "max_centrality_iterations", 1000
             ),
+            graph_backend=config_dict.get("graph_backend", "networkx"),
             enable_retraction_watch=config_dict.get("enable_retraction_watch", True),
             avoid_retraction_in_sampler=config_dict.get(
                 "avoid_retraction_in_sampler", False
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from ArticleCrawler.api.base_api import BaseAPIProvider
-from ArticleCrawler.crawler import Crawler
 from ArticleCrawler.utils.url_builder import PaperURLBuilder
 
+if TYPE_CHECKING:
+    from ArticleCrawler.crawler import Crawler
+
 
 RemotePaperEntryBuilder = Callable[
     [str, Dict, str, PaperURLBuilder],
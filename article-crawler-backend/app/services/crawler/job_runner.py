@@ -3,16 +3,17 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
-from ArticleCrawler.DataManagement.markdown_writer import MarkdownFileGenerator
-from ArticleCrawler.crawler import Crawler
 from ArticleCrawler.cli.utils.config_loader import save_config
 from ArticleCrawler.checkpoint import CheckpointManager
 
 from .config_builder import CrawlerRunInputs
 from .progress import CrawlerProgressSnapshot
 
+if TYPE_CHECKING:
+    from ArticleCrawler.crawler import Crawler
+
 
 @dataclass(frozen=True)
 class CrawlerRunResult:
@@ -35,7 +36,13 @@ class CrawlerJobRunner:
         *,
         progress_callback: Optional[Callable[[CrawlerProgressSnapshot], None]] = None,
         resume: Optional[Dict[str, Any]] = None,
+        control: Optional[Any] = None,
     ) -> CrawlerRunResult:
+        # The crawler pulls in the text-processing stack; import it per job so the
+        # API process starts without it.
+        from ArticleCrawler.DataManagement.markdown_writer import MarkdownFileGenerator
+        from ArticleCrawler.crawler import Crawler
+
         crawler_configs = inputs.experiment_config.to_crawler_configs()
 
         api_config = crawler_configs["api_config"]
@@ -45,6 +52,7 @@ class CrawlerJobRunner:
         graph_config = crawler_configs["graph_config"]
         retraction_config = crawler_configs["retraction_config"]
         stopping_config = crawler_configs["stopping_config"]
+        pipeline_config = crawler_configs.get("pipeline_config")
 
         storage_config.root_folder.mkdir(parents=True, exist_ok=True)
         self._persist_configuration(
@@ -84,6 +92,8 @@ class CrawlerJobRunner:
             ),
             checkpoint_manager=checkpoint_manager,
             resume_state=resume_state_obj,
+            pipeline_config=pipeline_config,
+            control=control,
         )
 
         self._logger.info("Job %s: Starting crawl process", job_id)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 @dataclass(frozen=True)
@@ -17,6 +17,9 @@ class CrawlerProgressSnapshot:
     references_collected: int
     papers_added_this_iteration: int
     last_update: datetime
+    stage_timings: Optional[Dict[str, float]] = None
+    iteration_seconds: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
 
     @classmethod
     def from_payload(cls, payload: Dict[str, Any]) -> "CrawlerProgressSnapshot":
@@ -32,6 +35,9 @@ class CrawlerProgressSnapshot:
             last_update=payload.get("timestamp")
             if isinstance(payload.get("timestamp"), datetime)
             else datetime.utcnow(),
+            stage_timings=payload.get("stage_timings"),
+            iteration_seconds=payload.get("iteration_seconds"),
+            peak_rss_mb=payload.get("peak_rss_mb"),
         )
 
     def as_job_updates(self) -> Dict[str, Any]:
@@ -48,4 +54,7 @@ class CrawlerProgressSnapshot:
             "references_collected": self.references_collected,
             "papers_added_this_iteration": self.papers_added_this_iteration,
             "last_progress_at": self.last_update,
+            "stage_timings": self.stage_timings,
+            "iteration_seconds": self.iteration_seconds,
+            "peak_rss_mb": self.peak_rss_mb,
         }
@@ -3,24 +3,30 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 import pandas as pd
 
-from ArticleCrawler.api.api_factory import create_api_provider
 from ArticleCrawler.api.base_api import BaseAPIProvider
-from ArticleCrawler.crawler import Crawler
 from ArticleCrawler.library.models import PaperData
 from ArticleCrawler.utils.url_builder import PaperURLBuilder
 from app.services.crawler.entity_papers_builder import RemoteEntityPapersBuilder
+from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory
+
+if TYPE_CHECKING:
+    from ArticleCrawler.crawler import Crawler
 
 
 class CrawlerResultAssembler:
     """Create API-friendly payloads from ArticleCrawler instances."""
 
-    def __init__(self, logger: Optional[logging.Logger] = None) -> None:
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        api_factory: Optional[ArticleCrawlerAPIProviderFactory] = None,
+    ) -> None:
         self.logger = logger or logging.getLogger(__name__)
-        self._api_clients: Dict[str, BaseAPIProvider] = {}
+        self._api_factory = api_factory or ArticleCrawlerAPIProviderFactory(logger=self.logger)
         self._entity_papers_builder = RemoteEntityPapersBuilder(
             self.logger,
             self._get_api_client,
@@ -71,19 +77,17 @@ class CrawlerResultAssembler:
         else:
             top_venues = self._compute_top_venues(crawler.data_coordinator)
 
-        DG = crawler.graph_manager.DG if hasattr(crawler, "graph_manager") else None
-        total_nodes = len(DG.nodes()) if DG is not None else 0
-        total_edges = len(DG.edges()) if DG is not None else 0
+        graph_manager = getattr(crawler, "graph_manager", None)
+        total_nodes = 0
+        total_edges = 0
         paper_nodes = 0
         author_nodes = 0
-        if DG is not None:
+        if graph_manager is not None:
+            total_nodes, total_edges = graph_manager.get_graph_info()
             try:
-                paper_nodes = sum(
-                    1 for _, data in DG.nodes(data=True) if data.get("ntype") == "paper"
-                )
-                author_nodes = sum(
-                    1 for _, data in DG.nodes(data=True) if data.get("ntype") == "author"
-                )
+                node_counts = graph_manager.get_node_type_counts()
+                paper_nodes = node_counts["paper"]
+                author_nodes = node_counts["author"]
             except Exception:
                 pass
 
@@ -571,12 +575,8 @@ class CrawlerResultAssembler:
 
     def _get_api_client(self, provider_type: str) -> Optional[BaseAPIProvider]:
         provider = (provider_type or "openalex").lower()
-        if provider in self._api_clients:
-            return self._api_clients[provider]
         try:
-            client = create_api_provider(provider, logger=self.logger)
-            self._api_clients[provider] = client
-            return client
+            return self._api_factory.get_provider(provider)
         except Exception as exc:
             self.logger.error("Unable to initialize API provider %s: %s", provider, exc)
             return None
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import logging
+import threading
 import uuid
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+from ArticleCrawler.crawl_control import CrawlCancelled
+
+from app.core.exceptions import JobQueueFullException
 from app.core.executors.background import BackgroundJobExecutor
 from app.core.stores.crawler_job_store import (
     CrawlerJobStore,
     InMemoryCrawlerJobStore,
 )
+from app.core.stores.job_status_feed import JobStatusEvent
 from app.services.crawler import (
     CrawlerConfigBuilder,
     CrawlerJobRunner,
@@ -25,6 +30,8 @@ from app.services.crawler import (
 class CrawlerExecutionService:
     """Coordinate crawler jobs and expose their results to the API layer."""
 
+    EVENT_HEARTBEAT_SECONDS = 15.0
+
     def __init__(
         self,
         logger: Optional[logging.Logger] = None,
@@ -39,6 +46,8 @@ class CrawlerExecutionService:
 
         self._job_store = job_store or InMemoryCrawlerJobStore()
         self._executor = job_executor or BackgroundJobExecutor()
+        # Serializes the queued -> running/cancelled transitions.
+        self._status_lock = threading.Lock()
 
         self.articlecrawler_path: Optional[Path] = (
             Path(articlecrawler_path) if articlecrawler_path else None
@@ -73,7 +82,7 @@ class CrawlerExecutionService:
         job_data = {
             "job_id": job_id,
             "session_id": session_id,
-            "status": "running",
+            "status": "queued",
             "current_iteration": 0,
             "max_iterations": run_inputs.max_iterations,
             "papers_collected": 0,
@@ -93,12 +102,16 @@ class CrawlerExecutionService:
         }
         self._job_store.create_job(job_id, job_data)
 
-        self._executor.submit(
-            self._run_crawler,
-            job_id,
-            run_inputs,
-            None,
-        )
+        try:
+            self._executor.submit(
+                self._run_crawler,
+                job_id,
+                run_inputs,
+                None,
+            )
+        except JobQueueFullException:
+            self._job_store.delete_job(job_id)
+            raise
 
         return job_id
 
@@ -109,16 +122,29 @@ class CrawlerExecutionService:
         resume_payload: Optional[Dict] = None,
     ) -> None:
         try:
+            self._mark_started(job_id)
             run_kwargs = {
                 "progress_callback": self._build_progress_handler(job_id),
             }
             if resume_payload is not None:
                 run_kwargs["resume"] = resume_payload
-            run_result = self._job_runner.run(
-                job_id,
-                run_inputs,
-                **run_kwargs,
-            )
+            # Executors with ``run_job`` isolate the crawl and give it a
+            # cancel/pause control; plain executors run it in this thread.
+            run_job = getattr(self._executor, "run_job", None)
+            if run_job is not None:
+                run_result = run_job(
+                    job_id,
+                    self._job_runner.run,
+                    job_id,
+                    run_inputs,
+                    **run_kwargs,
+                )
+            else:
+                run_result = self._job_runner.run(
+                    job_id,
+                    run_inputs,
+                    **run_kwargs,
+                )
             self._job_store.update_job(
                 job_id,
                 status="saving",
@@ -126,6 +152,13 @@ class CrawlerExecutionService:
             )
             self._record_success(job_id, run_inputs, run_result)
             self.logger.info("Job %s: Completed successfully", job_id)
+        except CrawlCancelled:
+            self.logger.info("Job %s: Cancelled", job_id)
+            self._job_store.update_job(
+                job_id,
+                status="cancelled",
+                completed_at=datetime.utcnow(),
+            )
         except Exception as exc:
             logging.LoggerAdapter(self.logger, {"job_id": job_id}).error(
                 "Job %s: Failed with error: %s", job_id, exc, exc_info=True
@@ -137,6 +170,21 @@ class CrawlerExecutionService:
                 completed_at=datetime.utcnow(),
             )
 
+    def _mark_started(self, job_id: str) -> None:
+        """Move a queued job to ``running`` once a worker picks it up.
+
+        A job cancelled while queued keeps its ``cancelled`` status; the
+        executor then refuses to start it.
+        """
+        with self._status_lock:
+            job = self._job_store.get_status(job_id)
+            if job and job.get("status") == "queued":
+                self._job_store.update_job(
+                    job_id,
+                    status="running",
+                    last_progress_at=datetime.utcnow(),
+                )
+
     def _build_progress_handler(self, job_id: str):
         def _handle(snapshot: CrawlerProgressSnapshot) -> None:
             try:
@@ -235,12 +283,23 @@ class CrawlerExecutionService:
         )
 
     def list_jobs(self) -> List[Dict]:
-        jobs = self._job_store.list_jobs()
-        return [self._sanitize_job_payload(job) for job in jobs]
+        return self._job_store.list_statuses()
 
     def get_job_status(self, job_id: str) -> Optional[Dict]:
-        job = self._job_store.get_job(job_id)
-        return self._sanitize_job_payload(job)
+        """Latest public status of a job; the returned dict is shared and read-only."""
+        return self._job_store.get_status(job_id)
+
+    def stream_job_events(
+        self,
+        job_id: str,
+        last_seq: Optional[int] = None,
+    ) -> AsyncIterator[JobStatusEvent]:
+        """Status snapshot and deltas for a job, ending when it finishes."""
+        return self._job_store.subscribe_status(
+            job_id,
+            last_seq=last_seq,
+            heartbeat=self.EVENT_HEARTBEAT_SECONDS,
+        )
 
     def get_results(self, job_id: str) -> Optional[Dict]:
         job = self._job_store.get_job(job_id)
@@ -261,7 +320,7 @@ class CrawlerExecutionService:
         page: int = 1,
         page_size: int = 20,
     ) -> Optional[Dict]:
-        job = self._job_store.get_job(job_id)
+        job = self._job_store.get_status(job_id)
         if not job or job.get("status") != "completed":
             return None
 
@@ -284,7 +343,7 @@ class CrawlerExecutionService:
         page: int = 1,
         page_size: int = 20,
     ) -> Optional[Dict]:
-        job = self._job_store.get_job(job_id)
+        job = self._job_store.get_status(job_id)
         if not job or job.get("status") != "completed":
             return None
 
@@ -336,7 +395,7 @@ class CrawlerExecutionService:
         now = datetime.utcnow()
         self._job_store.update_job(
             job_id,
-            status="running",
+            status="queued",
             completed_at=None,
             error_message=None,
             last_progress_at=now,
@@ -346,20 +405,62 @@ class CrawlerExecutionService:
         )
 
         resume_payload = {"manual_frontier": manual_frontier or None}
-        self._executor.submit(
-            self._run_crawler,
-            job_id,
-            run_inputs,
-            resume_payload,
-        )
+        try:
+            self._executor.submit(
+                self._run_crawler,
+                job_id,
+                run_inputs,
+                resume_payload,
+            )
+        except JobQueueFullException:
+            self._job_store.update_job(job_id, **job)
+            raise
         return job_id
 
-    def _sanitize_job_payload(self, job: Optional[Dict]) -> Optional[Dict]:
+    def cancel_job(self, job_id: str) -> Dict:
+        """Cancel a queued, running or paused job.
+
+        A queued job is marked ``cancelled`` right away and never starts. A
+        running crawl stops before its next iteration; the job then moves to
+        ``cancelled``.
+        """
+        with self._status_lock:
+            job = self._require_active_job(job_id)
+            self._executor.cancel(job_id)
+            if job.get("status") == "queued":
+                self._job_store.update_job(
+                    job_id,
+                    status="cancelled",
+                    completed_at=datetime.utcnow(),
+                )
+        self.logger.info("Job %s: Cancellation requested", job_id)
+        return self.get_job_status(job_id)
+
+    def pause_job(self, job_id: str) -> Dict:
+        """Pause a running job before its next iteration."""
+        job = self._require_active_job(job_id)
+        if job.get("status") != "running":
+            raise ValueError("Only running jobs can be paused")
+        self._executor.pause(job_id)
+        self._job_store.update_job(job_id, status="paused")
+        return self.get_job_status(job_id)
+
+    def unpause_job(self, job_id: str) -> Dict:
+        """Continue a paused job."""
+        job = self._require_active_job(job_id)
+        if job.get("status") != "paused":
+            raise ValueError("Only paused jobs can be continued")
+        self._executor.unpause(job_id)
+        self._job_store.update_job(job_id, status="running")
+        return self.get_job_status(job_id)
+
+    def _require_active_job(self, job_id: str) -> Dict:
+        job = self._job_store.get_status(job_id)
         if not job:
-            return None
-        cleaned = dict(job)
-        cleaned.pop("session_data", None)
-        return cleaned
+            raise ValueError(f"Job {job_id} not found")
+        if job.get("status") not in ("queued", "running", "paused"):
+            raise ValueError(f"Job {job_id} is not queued or running")
+        return job
 
     def get_venue_papers(
         self,
@@ -369,7 +470,7 @@ class CrawlerExecutionService:
         page: int = 1,
         page_size: int = 20,
     ) -> Optional[Dict]:
-        job = self._job_store.get_job(job_id)
+        job = self._job_store.get_status(job_id)
         if not job or job.get("status") != "completed":
             return None
 
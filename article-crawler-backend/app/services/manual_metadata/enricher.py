@@ -1,5 +1,6 @@
 from typing import List, Optional, Tuple
 
+from app.core.executors.blocking import BlockingTaskExecutor
 from app.schemas.staging import StagingPaperCreate
 from app.services.manual_metadata.helpers import (
     ManualMetadataLookup,
@@ -18,7 +19,9 @@ class ManualMetadataEnricher:
         repository: Optional[ManualMetadataRepository] = None,
         lookup_helper: Optional[ManualMetadataLookup] = None,
         merger: Optional[ManualMetadataMerger] = None,
+        executor: Optional[BlockingTaskExecutor] = None,
     ):
+        self._executor = executor
         self._repository = repository or ManualMetadataRepository()
         self._lookup = lookup_helper or ManualMetadataLookup(seed_selection_service)
         self._merger = merger or ManualMetadataMerger()
@@ -43,7 +46,10 @@ class ManualMetadataEnricher:
                 continue
 
             try:
-                seed = self._lookup.lookup(identifier)
+                if self._executor is None:
+                    seed = self._lookup.lookup(identifier)
+                else:
+                    seed = await self._executor.run("provider", self._lookup.lookup, identifier)
             except Exception:
                 seed = None
 
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+
+from app.core.executors.blocking import BlockingTaskExecutor
+from app.core.stores.operation_store import InMemoryOperationStore, OperationStore
+from app.schemas.operations import OperationStatus
+
+
+class OperationService:
+    """Run slow service calls in the background and expose their progress for polling."""
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        store: Optional[OperationStore] = None,
+        executor: Optional[BlockingTaskExecutor] = None,
+    ):
+        self.logger = logger or logging.getLogger(__name__)
+        self._store = store or InMemoryOperationStore()
+        self._executor = executor or BlockingTaskExecutor()
+
+    def start(
+        self,
+        kind: str,
+        fn: Callable[..., Any],
+        *args,
+        category: str = BlockingTaskExecutor.DEFAULT_CATEGORY,
+        report_progress: bool = False,
+        report_partial_results: bool = False,
+        **kwargs,
+    ) -> OperationStatus:
+        """Queue ``fn`` on the blocking executor and return its initial status.
+
+        When ``report_progress`` is set, ``fn`` receives a ``progress_callback``
+        keyword accepting ``(completed, total, message)``. When
+        ``report_partial_results`` is set, it also receives a ``result_callback``
+        whose arguments are appended to ``partial_results`` as they arrive.
+        """
+        operation_id = f"op_{uuid.uuid4().hex[:12]}"
+        data = {
+            "operation_id": operation_id,
+            "kind": kind,
+            "status": "queued",
+            "progress": {"completed": 0, "total": None, "message": None},
+            "partial_results": [],
+            "result": None,
+            "error": None,
+            "created_at": datetime.utcnow(),
+            "started_at": None,
+            "completed_at": None,
+        }
+        self._store.create(operation_id, data)
+
+        if report_progress:
+            kwargs["progress_callback"] = self._build_progress_handler(operation_id)
+        if report_partial_results:
+            kwargs["result_callback"] = self._build_result_handler(operation_id)
+        self._executor.submit(category, self._run, operation_id, fn, args, kwargs)
+        return OperationStatus(**data)
+
+    def get(self, operation_id: str) -> Optional[OperationStatus]:
+        data = self._store.get(operation_id)
+        return OperationStatus(**data) if data else None
+
+    def _run(self, operation_id: str, fn: Callable[..., Any], args, kwargs) -> None:
+        self._store.update(operation_id, status="running", started_at=datetime.utcnow())
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as exc:
+            self.logger.error("Operation %s failed: %s", operation_id, exc, exc_info=True)
+            message = exc.detail if isinstance(exc, HTTPException) else str(exc)
+            self._store.update(
+                operation_id,
+                status="failed",
+                error=message,
+                completed_at=datetime.utcnow(),
+            )
+            return
+
+        self._store.update(
+            operation_id,
+            status="completed",
+            result=jsonable_encoder(result),
+            completed_at=datetime.utcnow(),
+        )
+
+    def _build_progress_handler(self, operation_id: str):
+        def _handler(completed: int, total: Optional[int] = None, message: Optional[str] = None) -> None:
+            self._store.update(
+                operation_id,
+                progress={"completed": completed, "total": total, "message": message},
+            )
+
+        return _handler
+
+    def _build_result_handler(self, operation_id: str):
+        def _handler(item: Any) -> None:
+            self._store.append(operation_id, "partial_results", jsonable_encoder(item))
+
+        return _handler
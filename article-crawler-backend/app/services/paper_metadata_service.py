@@ -1,20 +1,25 @@
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
-from ArticleCrawler.api.api_factory import create_api_provider
 from ArticleCrawler.api.base_api import BaseAPIProvider
 
 from app.core.exceptions import InvalidInputException
 from app.schemas.papers import PaperDetail
+from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory
 
 
 class PaperMetadataService:
     """Fetch full metadata for a paper from the configured API provider."""
 
-    def __init__(self, provider: str = "openalex", logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        provider: str = "openalex",
+        logger: Optional[logging.Logger] = None,
+        api_factory: Optional[ArticleCrawlerAPIProviderFactory] = None,
+    ):
         self._provider_name = provider
         self._logger = logger or logging.getLogger(__name__)
-        self._api: Optional[BaseAPIProvider] = None
+        self._api_factory = api_factory or ArticleCrawlerAPIProviderFactory(logger=self._logger)
 
     def get_paper_details(self, paper_id: str) -> PaperDetail:
         """Fetch and normalize paper metadata."""
@@ -139,9 +144,7 @@ class PaperMetadataService:
         return identifier
 
     def _get_api(self) -> BaseAPIProvider:
-        if not self._api:
-            self._api = create_api_provider(self._provider_name, logger=self._logger)
-        return self._api
+        return self._api_factory.get_provider(self._provider_name)
 
     def _ensure_dict(self, metadata: Any) -> Dict[str, Any]:
         if isinstance(metadata, dict):
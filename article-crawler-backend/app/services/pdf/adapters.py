@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 from ArticleCrawler.pdf_processing.docker_manager import DockerManager
 from ArticleCrawler.pdf_processing.api_matcher import APIMetadataMatcher
-from ArticleCrawler.metadata_extraction import MetadataDispatcher
+from ArticleCrawler.pdf_processing.result_cache import GrobidResultCache
+from ArticleCrawler.metadata_extraction import ExtractorFactory, MetadataDispatcher
+from ArticleCrawler.metadata_extraction.extractors import PdfExtractor
 
 from app.schemas.pdf_seeds import PDFMetadata, PDFMatchResult
+from app.services.providers.article_crawler import LocalTitleIndexProvider
 
 
 class GrobidManagerAdapter:
@@ -23,15 +27,43 @@ class GrobidManagerAdapter:
 
 
 class MetadataExtractionAdapter:
-    """Adapter around MetadataDispatcher."""
-
-    def __init__(self, logger: Optional[logging.Logger] = None, dispatcher: Optional[MetadataDispatcher] = None):
+    """Adapter around MetadataDispatcher, sharing a GROBID result cache with its PDF extractor."""
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        dispatcher: Optional[MetadataDispatcher] = None,
+        result_cache: Optional[GrobidResultCache] = None,
+        cache_path: Optional[str] = None,
+        cache_max_mb: Optional[int] = None,
+    ):
         self._logger = logger or logging.getLogger(__name__)
-        self._dispatcher = dispatcher or MetadataDispatcher(logger=self._logger)
+        if result_cache is None and cache_path:
+            max_bytes = cache_max_mb * 1024 * 1024 if cache_max_mb else GrobidResultCache.DEFAULT_MAX_BYTES
+            result_cache = GrobidResultCache(cache_path, max_bytes=max_bytes, logger=self._logger)
+        self._result_cache = result_cache
+        if dispatcher is None:
+            factory = None
+            if result_cache is not None:
+                factory = ExtractorFactory(
+                    extractors={"application/pdf": PdfExtractor(logger=self._logger, result_cache=result_cache)}
+                )
+            dispatcher = MetadataDispatcher(factory=factory, logger=self._logger)
+        self._dispatcher = dispatcher
+
+    def is_cached(self, file_path: str) -> bool:
+        """Return True when metadata for this file's bytes is already cached."""
+        if self._result_cache is None:
+            return False
+        return self._result_cache.get_metadata(Path(file_path)) is not None
 
     def extract(self, file_path: str):
         return self._dispatcher.extract(file_path)
 
+    def extract_many(self, file_paths: Iterable[str], max_workers: int = 4):
+        """Yield ``(file_path, metadata, error)`` as each file finishes."""
+        return self._dispatcher.extract_many(file_paths, max_workers=max_workers)
+
 
 @dataclass
 class _FallbackMatchResult:
@@ -45,11 +77,17 @@ class _FallbackMatchResult:
 class PDFMetadataMatcherAdapter:
     """Wrapper that performs metadata matching and handles bulk fallback."""
 
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        title_index_provider: Optional[LocalTitleIndexProvider] = None,
+    ):
         self._logger = logger or logging.getLogger(__name__)
+        self._title_index_provider = title_index_provider
 
     def match(self, api_provider, metadata_list: Sequence[Any]) -> List[Any]:
-        matcher = APIMetadataMatcher(api_provider, logger=self._logger)
+        local_index = self._title_index_provider.get_index() if self._title_index_provider else None
+        matcher = APIMetadataMatcher(api_provider, logger=self._logger, local_index=local_index)
         try:
             return matcher.match_metadata(metadata_list)
         except Exception as exc:
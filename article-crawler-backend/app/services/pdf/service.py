@@ -1,6 +1,6 @@
 import logging
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 
 from fastapi import UploadFile
@@ -50,6 +50,7 @@ class PDFSeedService:
         metadata_matcher: Optional[PDFMetadataMatcherAdapter] = None,
         match_result_builder: Optional[PDFMatchResultBuilder] = None,
         api_factory: Optional[ArticleCrawlerAPIProviderFactory] = None,
+        extraction_workers: int = 4,
     ):
         self.logger = logger
         self._store = upload_store or InMemoryPdfUploadStore()
@@ -60,6 +61,7 @@ class PDFSeedService:
         self._metadata_matcher = metadata_matcher or PDFMetadataMatcherAdapter(logger=logger)
         self._match_result_builder = match_result_builder or PDFMatchResultBuilder(logger=logger)
         self._api_factory = api_factory or ArticleCrawlerAPIProviderFactory(logger=logger)
+        self._extraction_workers = max(1, extraction_workers)
     
     def check_grobid_availability(self) -> tuple[bool, Optional[str]]:
 
@@ -116,19 +118,64 @@ class PDFSeedService:
             created_at=session.created_at
         )
     
-    def extract_metadata(self, upload_id: str) -> PDFExtractionResponse:
+    def extract_metadata(
+        self,
+        upload_id: str,
+        progress_callback: Optional[Callable[[int, Optional[int], Optional[str]], None]] = None,
+        result_callback: Optional[Callable[[PDFExtractionResult], None]] = None,
+    ) -> PDFExtractionResponse:
+        """Extract metadata for every uploaded file.
+
+        PDFs already in the GROBID result cache are served without GROBID;
+        availability is checked once for the rest, which are sent with
+        bounded concurrency. ``result_callback`` receives each file's result as
+        soon as it is ready; the response keeps upload order.
+        """
         session = self._get_session(upload_id)
         
-        self.logger.info(f"Extracting metadata from {len(session.pdf_paths)} PDFs")
+        total_files = len(session.pdf_paths)
+        self.logger.info(f"Extracting metadata from {total_files} PDFs")
         
-        extraction_results = []
-        successful_count = 0
-        
-        for file_path in session.pdf_paths:
-            result = self._extract_file_metadata(file_path)
-            extraction_results.append(result)
-            if result.success:
-                successful_count += 1
+        results_by_path: Dict[str, PDFExtractionResult] = {}
+
+        def _record(result: PDFExtractionResult, file_path: Path) -> None:
+            results_by_path[str(file_path)] = result
+            if progress_callback:
+                progress_callback(len(results_by_path), total_files, result.filename)
+            if result_callback:
+                result_callback(result)
+
+        to_extract: List[Path] = list(session.pdf_paths)
+        needs_grobid = [
+            path for path in to_extract
+            if self._is_pdf(path.name) and not self._metadata_extractor.is_cached(str(path))
+        ]
+        if needs_grobid:
+            is_available, error_msg = self.check_grobid_availability()
+            if not is_available:
+                for file_path in needs_grobid:
+                    _record(
+                        PDFExtractionResult(filename=file_path.name, success=False, error=error_msg),
+                        file_path,
+                    )
+                skipped = set(needs_grobid)
+                to_extract = [path for path in to_extract if path not in skipped]
+
+        if to_extract:
+            extracted = self._metadata_extractor.extract_many(
+                [str(path) for path in to_extract],
+                max_workers=self._extraction_workers,
+            )
+            for file_path, metadata, error in extracted:
+                file_path = Path(file_path)
+                _record(self._build_extraction_result(file_path.name, metadata, error), file_path)
+
+        extraction_results = [
+            results_by_path.get(str(file_path))
+            or PDFExtractionResult(filename=file_path.name, success=False, error="No metadata extracted")
+            for file_path in session.pdf_paths
+        ]
+        successful_count = sum(1 for result in extraction_results if result.success)
         
         session.extraction_results = extraction_results
         self._store.save(session)
@@ -142,26 +189,18 @@ class PDFSeedService:
             failed_count=len(extraction_results) - successful_count
         )
     
-    def _extract_file_metadata(self, file_path: Path) -> PDFExtractionResult:
-        filename = file_path.name
-        
-        if self._is_pdf(filename):
-            is_available, error_msg = self.check_grobid_availability()
-            if not is_available:
-                return PDFExtractionResult(
-                    filename=filename,
-                    success=False,
-                    error=error_msg
-                )
-        
-        try:
-            metadata = self._metadata_extractor.extract(str(file_path))
-        except Exception as exc:
-            self.logger.error(f"Failed to extract metadata from {filename}: {exc}")
+    def _build_extraction_result(
+        self,
+        filename: str,
+        metadata: Optional[Any],
+        error: Optional[Exception],
+    ) -> PDFExtractionResult:
+        if error is not None:
+            self.logger.error(f"Failed to extract metadata from {filename}: {error}")
             return PDFExtractionResult(
                 filename=filename,
                 success=False,
-                error=str(exc)
+                error=str(error)
             )
         
         pdf_metadata = self._to_schema_metadata(filename, metadata)
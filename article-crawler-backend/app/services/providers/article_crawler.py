@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from ArticleCrawler.api.api_factory import create_api_provider
 
@@ -11,8 +14,68 @@ class ArticleCrawlerAPIProviderFactory:
 
     def __init__(self, logger: Optional[logging.Logger] = None):
         self._logger = logger or logging.getLogger(__name__)
+        self._cache: Dict[str, object] = {}
+        self._lock = threading.Lock()
 
     def get_provider(self, provider: str = "openalex"):
+        """Return the shared provider instance, so its session and rate limiter are reused."""
         normalized = (provider or "openalex").lower()
-        self._logger.debug("Creating API provider for %s", normalized)
-        return create_api_provider(normalized)
+        with self._lock:
+            if normalized not in self._cache:
+                self._logger.debug("Creating API provider for %s", normalized)
+                self._cache[normalized] = create_api_provider(normalized)
+            return self._cache[normalized]
+
+
+class LocalTitleIndexProvider:
+    """Lazily build and refresh the shared local title index used by matchers.
+
+    Refreshing discovers libraries and stats every catalog and note, so it
+    runs at most once per ``refresh_interval`` seconds; matchers created in
+    between share the index as it is.
+    """
+
+    def __init__(
+        self,
+        articlecrawler_path: str,
+        enabled: bool = True,
+        refresh_interval: float = 60.0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self._experiments_root = Path(articlecrawler_path) / "experiments"
+        self._enabled = enabled
+        self._refresh_interval = refresh_interval
+        self._logger = logger or logging.getLogger(__name__)
+        self._index = None
+        self._refreshed_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get_index(self):
+        """Return the index, refreshed if it is older than the interval; None when disabled or unavailable."""
+        if not self._enabled:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            if self._refreshed_at is not None and now - self._refreshed_at < self._refresh_interval:
+                return self._index
+            try:
+                if self._index is None:
+                    from ArticleCrawler.library.title_index import LocalTitleIndex
+
+                    self._index = LocalTitleIndex(
+                        experiments_roots=[self._experiments_root],
+                        id_prefix="W",
+                        logger=self._logger,
+                    )
+                self._index.library_roots = self._library_roots()
+                self._index.refresh()
+                self._refreshed_at = now
+            except Exception as exc:
+                self._logger.warning("Local title index unavailable, matching remotely only: %s", exc)
+                return None
+            return self._index
+
+    def _library_roots(self) -> List[Path]:
+        from ArticleCrawler.cli.utils.library_discovery import LibraryDiscovery
+
+        return [Path(library["path"]) for library in LibraryDiscovery(logger=self._logger).find_libraries()]
@@ -1,8 +1,9 @@
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ArticleCrawler.pdf_processing.models import PDFMetadata
 
+from app.core.executors.blocking import BlockingTaskExecutor
 from app.schemas.seeds import MatchedSeed
 from app.schemas.staging import StagingMatchRow, StagingPaper
 from app.services.seeds.selection_service import SeedSelectionService
@@ -22,10 +23,12 @@ class StagingMatchService:
         seed_selection_service: SeedSelectionService,
         matcher_factory: IMetadataMatcherFactory,
         logger: logging.Logger,
+        executor: Optional[BlockingTaskExecutor] = None,
     ):
         self._seed_selection_service = seed_selection_service
         self._matcher_factory = matcher_factory
         self._logger = logger
+        self._executor = executor
 
     async def match_rows(
         self,
@@ -73,7 +76,10 @@ class StagingMatchService:
 
         if rows_needing_metadata:
             matcher = self._matcher_factory.create(api_provider)
-            metadata_results = matcher.match_metadata([meta for _, meta in rows_needing_metadata])
+            metadata_results = await self._run_blocking(
+                matcher.match_metadata,
+                [meta for _, meta in rows_needing_metadata],
+            )
 
             for (row, meta), result in zip(rows_needing_metadata, metadata_results):
                 if result.matched and result.paper_id:
@@ -90,7 +96,11 @@ class StagingMatchService:
         unmatched_errors: Dict[str, str] = {}
 
         if unique_ids:
-            match_result = self._seed_selection_service.match_paper_ids(unique_ids, api_provider)
+            match_result = await self._run_blocking(
+                self._seed_selection_service.match_paper_ids,
+                unique_ids,
+                api_provider,
+            )
             matched_seeds_by_id = {seed.paper_id: seed for seed in match_result.matched_seeds}
             unmatched_errors = {item.input_id: item.error for item in match_result.unmatched_seeds}
 
@@ -127,3 +137,8 @@ class StagingMatchService:
                 )
 
         return match_rows
+
+    async def _run_blocking(self, fn, *args):
+        if self._executor is None:
+            return fn(*args)
+        return await self._executor.run("provider", fn, *args)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Protocol
+from typing import List, Optional, Protocol
 
-from ArticleCrawler.api.api_factory import create_api_provider
 from ArticleCrawler.pdf_processing.api_matcher import APIMetadataMatcher
 from ArticleCrawler.pdf_processing.models import PDFMetadata
 
+from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory, LocalTitleIndexProvider
+
 
 class IMetadataMatcher(Protocol):
     """Expected behavior for metadata matching helpers."""
@@ -35,10 +36,18 @@ class APIMetadataMatcherAdapter(IMetadataMatcher):
 class APIMetadataMatcherFactory(IMetadataMatcherFactory):
     """Factory returning APIMetadataMatcher adapters per provider."""
 
-    def __init__(self, logger: logging.Logger):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        title_index_provider: Optional[LocalTitleIndexProvider] = None,
+        api_factory: Optional[ArticleCrawlerAPIProviderFactory] = None,
+    ):
         self._logger = logger
+        self._title_index_provider = title_index_provider
+        self._api_factory = api_factory or ArticleCrawlerAPIProviderFactory(logger=logger)
 
     def create(self, provider: str) -> IMetadataMatcher:
-        api = create_api_provider(provider)
-        matcher = APIMetadataMatcher(api, logger=self._logger)
+        api = self._api_factory.get_provider(provider)
+        local_index = self._title_index_provider.get_index() if self._title_index_provider else None
+        matcher = APIMetadataMatcher(api, logger=self._logger, local_index=local_index)
         return APIMetadataMatcherAdapter(matcher)
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
 from app.schemas.staging import ColumnCustomFilter, StagingListResponse, StagingPaper
 from app.services.staging.query_utils import StagingQueryHelper
+from app.services.staging.table import StagingTableCache
 
 
 class StagingQueryService:
-    """Compose filtering, sorting, and pagination logic for staging rows."""
+    """Compose filtering, sorting, and pagination logic for staging rows.
 
-    def __init__(self, helper: Optional[StagingQueryHelper] = None):
+    Rows are queried through a per-session Polars ``StagingTable`` so filters,
+    sorts and facet counts run vectorized; only the requested page is read back
+    from the session's row dicts.
+    """
+
+    def __init__(
+        self,
+        helper: Optional[StagingQueryHelper] = None,
+        table_cache: Optional[StagingTableCache] = None,
+    ):
         self._helper = helper or StagingQueryHelper()
+        self._tables = table_cache or StagingTableCache()
 
     def list_rows(
         self,
@@ -37,13 +48,13 @@ class StagingQueryService:
         year_values: Optional[List[int]],
         identifier_filters: Optional[List[Dict[str, str]]],
         custom_filters: Optional[List[ColumnCustomFilter]],
+        revision: Optional[str] = None,
     ) -> StagingListResponse:
-        selected_count = sum(1 for row in rows if row.get("is_selected"))
+        table = self._tables.get(session_id, rows, revision)
+        frame = table.frame
         normalized_identifier_filters = self._helper.normalize_identifier_filters(identifier_filters)
         text_custom_filters, number_custom_filters = self._helper.normalize_custom_filters(custom_filters)
-
-        filtered = self._helper.filter_rows(
-            rows,
+        filter_kwargs = dict(
             source_values=source_values,
             year_min=year_min,
             year_max=year_max,
@@ -63,16 +74,17 @@ class StagingQueryService:
             number_custom_filters=number_custom_filters,
         )
 
-        sorted_rows = self._helper.apply_sort(filtered, sort_by=sort_by, sort_dir=sort_dir)
+        filtered = self._helper.filter_frame(frame, **filter_kwargs)
+        sorted_frame = self._helper.sort_frame(filtered, sort_by=sort_by, sort_dir=sort_dir)
 
         current_page, size, total_pages = self._helper.paginate(
-            len(filtered),
+            filtered.height,
             max(1, page or 1),
             max(1, page_size),
         )
         start = (current_page - 1) * size
-        end = start + size
-        paged_rows = sorted_rows[start:end]
+        positions = sorted_frame.get_column("position").slice(start, size).to_list()
+        paged_rows = [rows[position] for position in positions]
         selected_column_values = self._helper.accumulate_selected_filters(
             title_values,
             author_values,
@@ -80,17 +92,28 @@ class StagingQueryService:
             year_values,
             identifier_filters,
         )
-        column_options = self._helper.build_column_options(filtered, selected_column_values)
+        column_options = table.cached_facets(
+            _freeze({**filter_kwargs, "selected": selected_column_values}),
+            lambda: self._helper.build_column_options(filtered, selected_column_values),
+        )
 
         return StagingListResponse(
             session_id=session_id,
             rows=[StagingPaper(**row) for row in paged_rows],
-            total_rows=len(rows),
-            filtered_rows=len(filtered),
-            selected_count=selected_count,
-            retracted_count=sum(1 for row in rows if row.get("is_retracted")),
+            total_rows=frame.height,
+            filtered_rows=filtered.height,
+            selected_count=int(frame.get_column("is_selected").sum()),
+            retracted_count=int(frame.get_column("is_retracted").sum()),
             page=current_page,
             page_size=size,
             total_pages=total_pages,
             column_options=column_options,
         )
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
@@ -3,6 +3,8 @@ from __future__ import annotations
 from math import ceil
 from typing import Any, Dict, List, Optional, Tuple
 
+import polars as pl
+
 from app.schemas.staging import (
     ColumnCustomFilter,
     ColumnFilterOption,
@@ -18,9 +20,11 @@ class StagingQueryHelper:
 
     IDENTIFIER_FIELDS = {"doi", "url"}
 
-    def filter_rows(
+    SORT_FIELDS = {"title", "year", "venue", "source", "source_type", "authors", "selected"}
+
+    def filter_frame(
         self,
-        rows: List[Dict],
+        frame: pl.DataFrame,
         *,
         source_values: Optional[List[str]],
         year_min: Optional[int],
@@ -39,161 +43,114 @@ class StagingQueryHelper:
         identifier_filters: Optional[List[Tuple[str, str]]],
         text_custom_filters: Optional[List[Dict]] = None,
         number_custom_filters: Optional[List[Dict]] = None,
-    ) -> List[Dict]:
-        values = {value.lower() for value in source_values or []}
+    ) -> pl.DataFrame:
+        values = sorted({value.lower() for value in source_values or []})
         title_q = (title_search or "").strip().lower()
         venue_q = (venue_search or "").strip().lower()
         author_q = (author_search or "").strip().lower()
         keyword_q = (keyword_search or "").strip().lower()
         doi_filter = (doi_presence or "").strip().lower()
-        title_exact = {self._normalize_string(value) for value in title_values or [] if self._normalize_string(value)}
-        author_exact = {self._normalize_string(value) for value in author_values or [] if self._normalize_string(value)}
-        venue_exact = {self._normalize_string(value) for value in venue_values or [] if self._normalize_string(value)}
-        year_exact = {int(value) for value in year_values or [] if isinstance(value, int)}
+        title_exact = self._exact_values(title_values)
+        author_exact = self._exact_values(author_values)
+        venue_exact = self._exact_values(venue_values)
+        year_exact = sorted({int(value) for value in year_values or [] if isinstance(value, int)})
         identifier_rules = identifier_filters or []
 
-        filtered = []
-        for row in rows:
-            if values:
-                source = (row.get("source") or "").lower()
-                source_type = (row.get("source_type") or "").lower()
-                if source not in values and source_type not in values:
-                    continue
-            year = row.get("year")
-            if year_min is not None and year is not None and year < year_min:
-                continue
-            if year_max is not None and year is not None and year > year_max:
-                continue
-            if title_q and title_q not in (row.get("title") or "").lower():
-                continue
-            if venue_q and venue_q not in (row.get("venue") or "").lower():
-                continue
-            if author_q and author_q not in (row.get("authors") or "").lower():
-                continue
-            if keyword_q:
-                title = (row.get("title") or "").lower()
-                abstract = (row.get("abstract") or "").lower()
-                if keyword_q not in title and keyword_q not in abstract:
-                    continue
-            if doi_filter == "with" and not row.get("doi"):
-                continue
-            if doi_filter == "without" and row.get("doi"):
-                continue
-            if selected_only and not row.get("is_selected"):
-                continue
-            if retraction_status == "retracted" and not row.get("is_retracted"):
-                continue
-            if retraction_status == "not_retracted" and row.get("is_retracted"):
-                continue
-            if title_exact and self._normalize_string(row.get("title")) not in title_exact:
-                continue
-            if author_exact and self._normalize_string(row.get("authors")) not in author_exact:
-                continue
-            if venue_exact and self._normalize_string(row.get("venue")) not in venue_exact:
-                continue
-            if year_exact:
-                year_val = row.get("year")
-                if year_val is None or year_val not in year_exact:
-                    continue
-            if identifier_rules:
-                matched_identifier = False
-                for field, expected in identifier_rules:
-                    candidate = self._normalize_string(row.get(field))
-                    if candidate and candidate == expected:
-                        matched_identifier = True
-                        break
-                if not matched_identifier:
-                    continue
-            if (text_custom_filters or number_custom_filters) and not self.matches_custom_filters(
-                row,
-                text_custom_filters,
-                number_custom_filters,
-            ):
-                continue
-            filtered.append(row)
-        return filtered
-
-    def apply_sort(self, rows: List[Dict], *, sort_by: Optional[str], sort_dir: str) -> List[Dict]:
-        if not sort_by:
-            return list(rows)
-
-        valid_fields = {
-            "title",
-            "year",
-            "venue",
-            "source",
-            "source_type",
-            "authors",
-            "selected",
-        }
-        if sort_by not in valid_fields:
-            return list(rows)
-
-        reverse = (sort_dir or "asc").lower() == "desc"
-        sort_field = "is_selected" if sort_by == "selected" else sort_by
-
-        def is_empty(row: Dict) -> bool:
-            value = row.get(sort_field)
-            if sort_field == "year":
-                return value is None
-            if sort_field == "is_selected":
-                return value is None
-            if isinstance(value, str):
-                return not value.strip()
-            return value is None
-
-        def value_key(row: Dict):
-            value = row.get(sort_field)
-            if sort_field == "year":
-                try:
-                    return int(value)
-                except (TypeError, ValueError):
-                    return 0
-            if sort_field == "is_selected":
-                return bool(value)
-            if isinstance(value, str):
-                return value.strip().lower()
-            return value
-
-        non_empty_rows = [row for row in rows if not is_empty(row)]
-        empty_rows = [row for row in rows if is_empty(row)]
-        sorted_non_empty = sorted(non_empty_rows, key=value_key, reverse=reverse)
-        return sorted_non_empty + empty_rows
+        year = pl.col("year")
+        doi = pl.col("doi")
+        predicates: List[pl.Expr] = []
+        if values:
+            predicates.append(pl.col("source_lc").is_in(values) | pl.col("source_type_lc").is_in(values))
+        if year_min is not None:
+            predicates.append(year.is_null() | (year >= year_min))
+        if year_max is not None:
+            predicates.append(year.is_null() | (year <= year_max))
+        if title_q:
+            predicates.append(pl.col("title_lc").str.contains(title_q, literal=True))
+        if venue_q:
+            predicates.append(pl.col("venue_lc").str.contains(venue_q, literal=True))
+        if author_q:
+            predicates.append(pl.col("authors_lc").str.contains(author_q, literal=True))
+        if keyword_q:
+            predicates.append(
+                pl.col("title_lc").str.contains(keyword_q, literal=True)
+                | pl.col("abstract_lc").str.contains(keyword_q, literal=True)
+            )
+        if doi_filter == "with":
+            predicates.append(doi.is_not_null() & (doi != ""))
+        if doi_filter == "without":
+            predicates.append(doi.is_null() | (doi == ""))
+        if selected_only:
+            predicates.append(pl.col("is_selected"))
+        if retraction_status == "retracted":
+            predicates.append(pl.col("is_retracted"))
+        if retraction_status == "not_retracted":
+            predicates.append(~pl.col("is_retracted"))
+        if title_exact:
+            predicates.append(pl.col("title_norm").is_in(title_exact))
+        if author_exact:
+            predicates.append(pl.col("authors_norm").is_in(author_exact))
+        if venue_exact:
+            predicates.append(pl.col("venue_norm").is_in(venue_exact))
+        if year_exact:
+            predicates.append(year.is_not_null() & year.is_in(year_exact))
+        if identifier_rules:
+            predicates.append(
+                pl.any_horizontal(
+                    [pl.col(f"{field}_norm") == expected for field, expected in identifier_rules]
+                )
+            )
+        for rule in text_custom_filters or []:
+            predicates.append(self._text_rule_expr(rule))
+        for rule in number_custom_filters or []:
+            predicates.append(self._number_rule_expr(rule))
+
+        if not predicates:
+            return frame
+        return frame.filter(pl.all_horizontal(predicates).fill_null(False))
+
+    def sort_frame(self, frame: pl.DataFrame, *, sort_by: Optional[str], sort_dir: str) -> pl.DataFrame:
+        """Stable sort with empty values last regardless of direction."""
+        if not sort_by or sort_by not in self.SORT_FIELDS:
+            return frame
+
+        descending = (sort_dir or "asc").lower() == "desc"
+        if sort_by == "year":
+            key, empty = "year", pl.col("year").is_null()
+        elif sort_by == "selected":
+            key, empty = "is_selected", pl.col("is_selected").is_null()
+        else:
+            key, empty = f"{sort_by}_norm", pl.col(f"{sort_by}_trim") == ""
+
+        non_empty = frame.filter(~empty).sort(key, descending=descending, maintain_order=True)
+        return pl.concat([non_empty, frame.filter(empty)], how="vertical")
 
     def build_column_options(
         self,
-        rows: List[Dict],
+        frame: pl.DataFrame,
         selected_filters: Dict[str, List[str]],
     ) -> Dict[str, List[ColumnFilterOption]]:
         buckets: Dict[str, Dict[str, Dict]] = {
-            "title": {},
-            "authors": {},
-            "venue": {},
-            "year": {},
+            "title": self._count_values(frame, "title_trim"),
+            "authors": self._count_values(frame, "authors_trim"),
+            "venue": self._count_values(frame, "venue_trim"),
+            "year": self._count_values(
+                frame.filter(pl.col("year").is_not_null()).select(
+                    pl.col("year").cast(pl.Utf8).alias("year_text")
+                ),
+                "year_text",
+            ),
             "identifier": {},
         }
-
-        for row in rows:
-            self._accumulate_option(buckets["title"], row.get("title"))
-            self._accumulate_option(buckets["authors"], row.get("authors"))
-            self._accumulate_option(buckets["venue"], row.get("venue"))
-            year_value = row.get("year")
-            if year_value is not None:
-                self._accumulate_option(buckets["year"], str(year_value))
-            for field in self.IDENTIFIER_FIELDS:
-                value = row.get(field)
-                if not value:
-                    continue
-                trimmed = str(value).strip()
-                if not trimmed:
-                    continue
+        for field in sorted(self.IDENTIFIER_FIELDS):
+            for trimmed, entry in self._count_values(frame, f"{field}_trim").items():
                 key = f"{field}::{trimmed}"
-                label = f"{field.upper()} · {trimmed}"
-                entry = buckets["identifier"].setdefault(
-                    key,
-                    {"value": key, "label": label, "count": 0, "meta": {"type": field}},
-                )
-                entry["count"] += 1
+                buckets["identifier"][key] = {
+                    "value": key,
+                    "label": f"{field.upper()} · {trimmed}",
+                    "count": entry["count"],
+                    "meta": {"type": field},
+                }
 
         for column, values in (selected_filters or {}).items():
             bucket = buckets.get(column)
@@ -323,17 +280,17 @@ class StagingQueryHelper:
         total_pages = ceil(total / size) if total else 1
         return current_page, size, total_pages
 
-    def _accumulate_option(self, bucket: Dict[str, Dict], raw_value: Optional[str]) -> None:
-        if raw_value is None:
-            return
-        value_str = str(raw_value).strip()
-        if not value_str:
-            return
-        entry = bucket.setdefault(
-            value_str,
-            {"value": value_str, "label": value_str, "count": 0},
+    @staticmethod
+    def _count_values(frame: pl.DataFrame, column: str) -> Dict[str, Dict]:
+        counts = (
+            frame.filter(pl.col(column).is_not_null() & (pl.col(column) != ""))
+            .group_by(column, maintain_order=True)
+            .len()
         )
-        entry["count"] += 1
+        return {
+            value: {"value": value, "label": value, "count": count}
+            for value, count in counts.iter_rows()
+        }
 
     def _format_column_options(
         self,
@@ -371,36 +328,21 @@ class StagingQueryHelper:
     def _normalize_string(value: Optional[str]) -> str:
         return (value or "").strip().lower()
 
-    def matches_custom_filters(
-        self,
-        row: Dict,
-        text_filters: Optional[List[Dict[str, Any]]],
-        number_filters: Optional[List[Dict[str, Any]]],
-    ) -> bool:
-        for rule in text_filters or []:
-            candidate = self._extract_text_value(row, rule["column"])
-            if not self._evaluate_text_rule(candidate, rule):
-                return False
-        for rule in number_filters or []:
-            candidate = row.get(rule["column"])
-            if not self._evaluate_number_rule(candidate, rule):
-                return False
-        return True
-
-    def _extract_text_value(self, row: Dict, column: str) -> str:
+    def _exact_values(self, values: Optional[List[str]]) -> List[str]:
+        return sorted({self._normalize_string(value) for value in values or [] if self._normalize_string(value)})
+
+    def _text_rule_expr(self, rule: Dict[str, Any]) -> pl.Expr:
+        column = rule["column"]
         if column == "identifier":
-            parts = []
-            doi = (row.get("doi") or "").strip()
-            if doi:
-                parts.append(doi)
-            url = (row.get("url") or "").strip()
-            if url:
-                parts.append(url)
-            return " ".join(parts)
-        return (row.get(column) or "").strip()
-
-    def _evaluate_text_rule(self, value: str, rule: Dict[str, Any]) -> bool:
-        text_value = (value or "").lower()
+            doi, url = pl.col("doi_trim"), pl.col("url_trim")
+            text_value = (
+                pl.when((doi != "") & (url != ""))
+                .then(pl.concat_str([doi, url], separator=" "))
+                .otherwise(pl.concat_str([doi, url]))
+                .str.to_lowercase()
+            )
+        else:
+            text_value = pl.col(f"{column}_norm")
         target = rule.get("value") or ""
         operator = rule.get("operator")
         if operator == "equals":
@@ -408,46 +350,45 @@ class StagingQueryHelper:
         if operator == "not_equals":
             return text_value != target
         if operator == "begins_with":
-            return text_value.startswith(target)
+            return text_value.str.starts_with(target)
         if operator == "not_begins_with":
-            return not text_value.startswith(target)
+            return ~text_value.str.starts_with(target)
         if operator == "ends_with":
-            return text_value.endswith(target)
+            return text_value.str.ends_with(target)
         if operator == "not_ends_with":
-            return not text_value.endswith(target)
+            return ~text_value.str.ends_with(target)
         if operator == "contains":
-            return target in text_value
+            return text_value.str.contains(target, literal=True)
         if operator == "not_contains":
-            return target not in text_value
-        return True
+            return ~text_value.str.contains(target, literal=True)
+        return pl.lit(True)
 
-    def _evaluate_number_rule(self, value: Optional[int], rule: Dict[str, Any]) -> bool:
-        if value is None:
-            return False
+    def _number_rule_expr(self, rule: Dict[str, Any]) -> pl.Expr:
+        value = pl.col(rule["column"])
         operator = rule.get("operator")
         rule_value = rule.get("value")
         rule_value_to = rule.get("value_to")
         if operator == "equals":
-            return value == rule_value
-        if operator == "not_equals":
-            return value != rule_value
-        if operator == "greater_than":
-            return value > rule_value
-        if operator == "greater_than_or_equal":
-            return value >= rule_value
-        if operator == "less_than":
-            return value < rule_value
-        if operator == "less_than_or_equal":
-            return value <= rule_value
-        if operator == "between":
+            condition = value == rule_value
+        elif operator == "not_equals":
+            condition = value != rule_value
+        elif operator == "greater_than":
+            condition = value > rule_value
+        elif operator == "greater_than_or_equal":
+            condition = value >= rule_value
+        elif operator == "less_than":
+            condition = value < rule_value
+        elif operator == "less_than_or_equal":
+            condition = value <= rule_value
+        elif operator in {"between", "not_between"}:
             if rule_value_to is None:
-                return False
-            return rule_value <= value <= rule_value_to
-        if operator == "not_between":
-            if rule_value_to is None:
-                return False
-            return value < rule_value or value > rule_value_to
-        return True
+                return pl.lit(False)
+            condition = value.is_between(rule_value, rule_value_to)
+            if operator == "not_between":
+                condition = ~condition
+        else:
+            condition = pl.lit(True)
+        return value.is_not_null() & condition
 
     @staticmethod
     def _parse_int(value: Optional[str]) -> Optional[int]:
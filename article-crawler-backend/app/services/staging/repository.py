@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import uuid
+from contextlib import AbstractContextManager
 from typing import Dict, Optional
 
 from app.services.staging.session_store import StagingSessionStore
@@ -11,10 +13,17 @@ class StagingRepository:
     def __init__(self, session_store: Optional[StagingSessionStore] = None):
         self._session_store = session_store or StagingSessionStore()
 
+    def lock(self, session_id: str) -> AbstractContextManager:
+        """Serialize read-modify-save sequences on one session."""
+        return self._session_store.lock(session_id)
+
     def get_session(self, session_id: str) -> Dict:
         return self._session_store.get(session_id)
 
     def save_session(self, session_id: str, session: Dict) -> Dict:
+        # Revisions are unique across sessions and restarts so a recreated or
+        # reloaded session never matches a StagingTable built for another state.
+        session["revision"] = uuid.uuid4().hex
         self._session_store.save(session_id, session)
         return session
 
@@ -15,6 +15,7 @@ from app.services.staging.repository import StagingRepository
 from app.services.staging.retraction_updater import StagingRetractionUpdater
 from app.services.staging.row_manager import StagingRowManager
 from app.services.staging.session_store import StagingSessionStore
+from app.services.staging.table import StagingTableCache
 
 
 class StagingService:
@@ -32,11 +33,13 @@ class StagingService:
         query_helper: Optional[StagingQueryHelper] = None,
         retraction_updater: Optional[StagingRetractionUpdater] = None,
         row_manager: Optional[StagingRowManager] = None,
+        table_cache: Optional[StagingTableCache] = None,
     ):
         self.logger = logger
         self._repository = repository or StagingRepository(session_store=session_store)
         helper = query_helper or StagingQueryHelper()
-        self._query_service = query_service or StagingQueryService(helper)
+        self._tables = table_cache or StagingTableCache()
+        self._query_service = query_service or StagingQueryService(helper, table_cache=self._tables)
         self._retraction_updater = retraction_updater or StagingRetractionUpdater(
             repository=self._repository,
             query_helper=helper,
@@ -49,39 +52,65 @@ class StagingService:
         return self._row_manager.get_row(session, staging_id)
 
     def add_rows(self, session_id: str, rows: List[StagingPaperCreate]) -> List[StagingPaper]:
-        session = self._repository.get_session(session_id)
-        created = self._row_manager.add_rows(session, rows)
-        if created:
-            self._repository.save_session(session_id, session)
-        return created
+        with self._repository.lock(session_id):
+            session = self._repository.get_session(session_id)
+            previous_revision = session.get("revision")
+            created = self._row_manager.add_rows(session, rows)
+            if created:
+                self._repository.save_session(session_id, session)
+                appended = session["rows"][-len(created):]
+                self._tables.apply(
+                    session_id, previous_revision, session["revision"], lambda table: table.append(appended)
+                )
+            return created
 
     def update_row(self, session_id: str, staging_id: int, updates: StagingPaperUpdate) -> StagingPaper:
-        session = self._repository.get_session(session_id)
-        updated = self._row_manager.update_row(session, staging_id, updates)
-        self._repository.save_session(session_id, session)
-        return updated
+        with self._repository.lock(session_id):
+            session = self._repository.get_session(session_id)
+            previous_revision = session.get("revision")
+            updated = self._row_manager.update_row(session, staging_id, updates)
+            self._repository.save_session(session_id, session)
+            self._tables.apply(
+                session_id, previous_revision, session["revision"], lambda table: table.upsert([updated.dict()])
+            )
+            return updated
 
     def set_selection(self, session_id: str, staging_ids: List[int], is_selected: bool) -> int:
-        session = self._repository.get_session(session_id)
-        updated = self._row_manager.set_selection(session, staging_ids, is_selected)
-        if updated:
-            self._repository.save_session(session_id, session)
-        return updated
+        with self._repository.lock(session_id):
+            session = self._repository.get_session(session_id)
+            previous_revision = session.get("revision")
+            updated = self._row_manager.set_selection(session, staging_ids, is_selected)
+            if updated:
+                self._repository.save_session(session_id, session)
+                self._tables.apply(
+                    session_id,
+                    previous_revision,
+                    session["revision"],
+                    lambda table: table.set_selection(staging_ids, is_selected),
+                )
+            return updated
 
     def remove_rows(self, session_id: str, staging_ids: List[int]) -> int:
-        session = self._repository.get_session(session_id)
-        removed = self._row_manager.remove_rows(session, staging_ids)
-        if removed:
-            self._repository.save_session(session_id, session)
-        return removed
+        with self._repository.lock(session_id):
+            session = self._repository.get_session(session_id)
+            previous_revision = session.get("revision")
+            removed = self._row_manager.remove_rows(session, staging_ids)
+            if removed:
+                self._repository.save_session(session_id, session)
+                self._tables.apply(
+                    session_id, previous_revision, session["revision"], lambda table: table.remove(staging_ids)
+                )
+            return removed
 
     def clear_session(self, session_id: str) -> None:
-        session = self._repository.get_session(session_id)
-        if session.get("rows") or session.get("match_rows"):
-            self._repository.delete_session(session_id)
-            self.logger.info(f"Cleared staging rows for session {session_id}")
-        else:
-            self.logger.info(f"Clear staging requested for empty session {session_id}")
+        with self._repository.lock(session_id):
+            session = self._repository.get_session(session_id)
+            if session.get("rows") or session.get("match_rows"):
+                self._repository.delete_session(session_id)
+                self._tables.drop(session_id)
+                self.logger.info(f"Cleared staging rows for session {session_id}")
+            else:
+                self.logger.info(f"Clear staging requested for empty session {session_id}")
 
     def list_rows(
         self,
@@ -108,36 +137,38 @@ class StagingService:
         identifier_filters: Optional[List[Dict[str, str]]] = None,
         custom_filters: Optional[List[ColumnCustomFilter]] = None,
     ) -> StagingListResponse:
-        session = self._repository.get_session(session_id)
-        rows = session["rows"]
-        requested_size = page_size or self.DEFAULT_PAGE_SIZE
-        limited_size = max(1, min(requested_size, self.MAX_PAGE_SIZE))
-        requested_page = max(1, page or 1)
-
-        return self._query_service.list_rows(
-            session_id,
-            rows,
-            page=requested_page,
-            page_size=limited_size,
-            sort_by=sort_by,
-            sort_dir=sort_dir,
-            source_values=source_values,
-            year_min=year_min,
-            year_max=year_max,
-            title_search=title_search,
-            venue_search=venue_search,
-            author_search=author_search,
-            keyword_search=keyword_search,
-            doi_presence=doi_presence,
-            selected_only=selected_only,
-            retraction_status=retraction_status,
-            title_values=title_values,
-            author_values=author_values,
-            venue_values=venue_values,
-            year_values=year_values,
-            identifier_filters=identifier_filters,
-            custom_filters=custom_filters,
-        )
+        with self._repository.lock(session_id):
+            session = self._repository.get_session(session_id)
+            rows = session["rows"]
+            requested_size = page_size or self.DEFAULT_PAGE_SIZE
+            limited_size = max(1, min(requested_size, self.MAX_PAGE_SIZE))
+            requested_page = max(1, page or 1)
+
+            return self._query_service.list_rows(
+                session_id,
+                rows,
+                page=requested_page,
+                page_size=limited_size,
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+                source_values=source_values,
+                year_min=year_min,
+                year_max=year_max,
+                title_search=title_search,
+                venue_search=venue_search,
+                author_search=author_search,
+                keyword_search=keyword_search,
+                doi_presence=doi_presence,
+                selected_only=selected_only,
+                retraction_status=retraction_status,
+                title_values=title_values,
+                author_values=author_values,
+                venue_values=venue_values,
+                year_values=year_values,
+                identifier_filters=identifier_filters,
+                custom_filters=custom_filters,
+                revision=session.get("revision"),
+            )
 
     def apply_retraction_results(
         self,
@@ -165,9 +196,10 @@ class StagingService:
         return [StagingPaper(**row) for row in session["rows"]]
 
     def store_match_rows(self, session_id: str, rows: List[StagingMatchRow]) -> None:
-        session = self._repository.get_session(session_id)
-        self._row_manager.store_match_rows(session, rows)
-        self._repository.save_session(session_id, session)
+        with self._repository.lock(session_id):
+            session = self._repository.get_session(session_id)
+            self._row_manager.store_match_rows(session, rows)
+            self._repository.save_session(session_id, session)
 
     def get_match_rows(self, session_id: str) -> List[StagingMatchRow]:
         session = self._repository.get_session(session_id)
@@ -1,26 +1,270 @@
 from __future__ import annotations
 
-from typing import Dict
+import logging
+import pickle
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from threading import RLock
+from typing import Dict, Iterator, List, Optional
+
+
+def _empty_session() -> Dict:
+    return {
+        "rows": [],
+        "next_id": 1,
+        "match_rows": [],
+    }
 
 
 class StagingSessionStore:
-    """In-memory persistence for staging sessions."""
+    """Thread-safe in-memory persistence for staging sessions.
+
+    Sessions idle for longer than ``ttl_minutes`` are dropped, and once more
+    than ``max_sessions`` are held the least recently used one is evicted.
+    Callers that read, mutate and save a session should hold ``lock(session_id)``
+    for the whole sequence. The store-wide lock only guards the cache
+    bookkeeping; loading and persisting a session happen under its own lock,
+    so slow sessions never hold up the others.
+    """
+
+    def __init__(self, ttl_minutes: Optional[int] = None, max_sessions: Optional[int] = None):
+        self._sessions: "OrderedDict[str, Dict]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self._ttl_seconds = ttl_minutes * 60 if ttl_minutes else None
+        self._max_sessions = max_sessions
+        self._lock = RLock()
+        self._session_locks: Dict[str, RLock] = {}
 
-    def __init__(self):
-        self._sessions: Dict[str, Dict] = {}
+    @contextmanager
+    def lock(self, session_id: str) -> Iterator[None]:
+        with self._lock:
+            session_lock = self._session_locks.setdefault(session_id, RLock())
+        with session_lock:
+            yield
 
     def get(self, session_id: str) -> Dict:
-        if session_id not in self._sessions:
-            self._sessions[session_id] = {
-                "rows": [],
-                "next_id": 1,
-                "match_rows": [],
-            }
-        return self._sessions[session_id]
+        with self._lock:
+            self._prune_expired()
+            session = self._cached(session_id)
+        if session is None:
+            with self.lock(session_id):
+                with self._lock:
+                    session = self._cached(session_id)
+                if session is None:
+                    session = self._load(session_id) or _empty_session()
+                    with self._lock:
+                        self._cache(session_id, session)
+                        self._touched[session_id] = time.monotonic()
+        self._touch(session_id)
+        return session
 
     def save(self, session_id: str, session: Dict) -> Dict:
-        self._sessions[session_id] = session
-        return self._sessions[session_id]
+        with self.lock(session_id):
+            self._persist(session_id, session)
+            with self._lock:
+                self._cache(session_id, session)
+                self._touched[session_id] = time.monotonic()
+        return session
 
     def remove(self, session_id: str) -> None:
+        with self._lock:
+            self._forget(session_id)
+            self._delete(session_id)
+
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            self._prune_expired()
+            return list(self._sessions.keys())
+
+    def close(self) -> None:
+        return None
+
+    def _cached(self, session_id: str) -> Optional[Dict]:
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+            self._touched[session_id] = time.monotonic()
+        return session
+
+    def _cache(self, session_id: str, session: Dict) -> None:
+        self._sessions[session_id] = session
+        self._sessions.move_to_end(session_id)
+        while self._max_sessions and len(self._sessions) > self._max_sessions:
+            evicted_id, _ = self._sessions.popitem(last=False)
+            self._evict(evicted_id)
+
+    def _prune_expired(self) -> None:
+        if not self._ttl_seconds:
+            return
+        cutoff = time.monotonic() - self._ttl_seconds
+        for session_id in [sid for sid, touched in self._touched.items() if touched < cutoff]:
+            self._forget(session_id)
+            self._delete(session_id)
+
+    def _forget(self, session_id: str) -> None:
         self._sessions.pop(session_id, None)
+        self._touched.pop(session_id, None)
+        self._session_locks.pop(session_id, None)
+
+    def _evict(self, session_id: str) -> None:
+        """Called when a session falls out of the LRU; in memory it is gone for good."""
+        self._forget(session_id)
+
+    # Persistence hooks; the in-memory store keeps nothing beyond ``_sessions``.
+    # ``_load`` and ``_persist`` run under the session's lock, not the store's.
+    def _load(self, session_id: str) -> Optional[Dict]:
+        return None
+
+    def _touch(self, session_id: str) -> None:
+        return None
+
+    def _persist(self, session_id: str, session: Dict) -> None:
+        return None
+
+    def _delete(self, session_id: str) -> None:
+        return None
+
+
+class SQLiteStagingSessionStore(StagingSessionStore):
+    """Staging sessions persisted to a SQLite database in WAL mode.
+
+    Only recently used sessions stay deserialized in memory (``max_sessions``);
+    others are loaded lazily from disk on first access, so large sessions
+    survive restarts without pinning RAM while idle. ``updated_at`` records
+    the last access (refreshed at most every ``touch_interval`` seconds on
+    reads), and sessions that are not cached expire once it is older than
+    the TTL.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_minutes: Optional[int] = None,
+        max_sessions: Optional[int] = 32,
+        logger: Optional[logging.Logger] = None,
+        touch_interval: float = 60.0,
+    ):
+        super().__init__(ttl_minutes=ttl_minutes, max_sessions=max_sessions)
+        self._logger = logger or logging.getLogger(__name__)
+        self._touch_interval = touch_interval
+        self._row_touched: Dict[str, float] = {}
+        # Serializes statements on the shared connection; held only for SQL.
+        self._db_lock = RLock()
+        path = Path(db_path)
+        if path.parent and not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS staging_sessions (
+                session_id TEXT PRIMARY KEY,
+                payload BLOB NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_staging_sessions_updated_at ON staging_sessions (updated_at)"
+        )
+        self._delete_expired_rows()
+
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            self._prune_expired()
+            with self._db_lock:
+                cursor = self._conn.execute("SELECT session_id FROM staging_sessions ORDER BY updated_at")
+                stored = [row[0] for row in cursor.fetchall()]
+            cached = [session_id for session_id in self._sessions if session_id not in stored]
+            return stored + cached
+
+    def close(self) -> None:
+        with self._lock, self._db_lock:
+            self._conn.close()
+
+    def _evict(self, session_id: str) -> None:
+        # The payload is already on disk; just release the deserialized copy.
+        self._touched.pop(session_id, None)
+
+    def _prune_expired(self) -> None:
+        super()._prune_expired()
+        self._delete_expired_rows()
+
+    def _forget(self, session_id: str) -> None:
+        super()._forget(session_id)
+        self._row_touched.pop(session_id, None)
+
+    def _load(self, session_id: str) -> Optional[Dict]:
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT payload FROM staging_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        self._row_touched[session_id] = 0.0
+        try:
+            return pickle.loads(row[0])
+        except Exception as exc:
+            self._logger.warning("Discarding unreadable staging session %s: %s", session_id, exc)
+            self._delete(session_id)
+            return None
+
+    def _persist(self, session_id: str, session: Dict) -> None:
+        payload = pickle.dumps(session, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute(
+                """
+                INSERT INTO staging_sessions (session_id, payload, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    payload = excluded.payload,
+                    updated_at = excluded.updated_at
+                """,
+                (session_id, sqlite3.Binary(payload), now),
+            )
+        self._row_touched[session_id] = now
+
+    def _touch(self, session_id: str) -> None:
+        """Refresh the row's access time so a session that is read but not saved does not expire."""
+        now = time.time()
+        if now - self._row_touched.get(session_id, now) < self._touch_interval:
+            return
+        with self._db_lock:
+            self._conn.execute(
+                "UPDATE staging_sessions SET updated_at = ? WHERE session_id = ?",
+                (now, session_id),
+            )
+        self._row_touched[session_id] = now
+
+    def _delete(self, session_id: str) -> None:
+        with self._db_lock:
+            self._conn.execute("DELETE FROM staging_sessions WHERE session_id = ?", (session_id,))
+
+    def _delete_expired_rows(self) -> None:
+        if not self._ttl_seconds:
+            return
+        cutoff = time.time() - self._ttl_seconds
+        with self._db_lock:
+            expired = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT session_id FROM staging_sessions WHERE updated_at < ?",
+                    (cutoff,),
+                ).fetchall()
+                if row[0] not in self._sessions
+            ]
+            if expired:
+                self._conn.executemany(
+                    "DELETE FROM staging_sessions WHERE session_id = ?",
+                    [(session_id,) for session_id in expired],
+                )
+        for session_id in expired:
+            self._row_touched.pop(session_id, None)
+        if expired:
+            self._logger.info("Expired %d idle staging sessions", len(expired))
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+import polars as pl
+
+
+STAGING_FRAME_SCHEMA: Dict[str, pl.DataType] = {
+    "staging_id": pl.Int64,
+    "source": pl.Utf8,
+    "source_type": pl.Utf8,
+    "title": pl.Utf8,
+    "authors": pl.Utf8,
+    "venue": pl.Utf8,
+    "year": pl.Int64,
+    "doi": pl.Utf8,
+    "url": pl.Utf8,
+    "abstract": pl.Utf8,
+    "is_selected": pl.Boolean,
+    "is_retracted": pl.Boolean,
+}
+
+_TEXT_COLUMNS = ("source", "source_type", "title", "authors", "venue", "doi", "url", "abstract")
+
+
+def build_staging_frame(rows: Iterable[Dict], start: int = 0) -> pl.DataFrame:
+    """Project staging row dicts onto the columns used for filtering and sorting.
+
+    Alongside the raw values the frame carries ``<column>_lc`` (lowercased),
+    ``<column>_trim`` (stripped) and ``<column>_norm`` (stripped + lowercased)
+    helpers so queries do not redo per-row normalization. ``position`` is the
+    row's index in ``session["rows"]``, starting at ``start``.
+    """
+    columns: Dict[str, List[Any]] = {name: [] for name in STAGING_FRAME_SCHEMA}
+    for row in rows:
+        for name in STAGING_FRAME_SCHEMA:
+            value = row.get(name)
+            if name in ("is_selected", "is_retracted"):
+                value = bool(value)
+            elif name == "year" and value is not None:
+                try:
+                    value = int(value)
+                except (TypeError, ValueError):
+                    value = None
+            columns[name].append(value)
+
+    frame = pl.DataFrame(columns, schema=STAGING_FRAME_SCHEMA)
+    derived = [(pl.int_range(pl.len(), dtype=pl.Int64) + start).alias("position")]
+    for name in _TEXT_COLUMNS:
+        text = pl.col(name).fill_null("")
+        derived.append(text.str.to_lowercase().alias(f"{name}_lc"))
+        derived.append(text.str.strip_chars().alias(f"{name}_trim"))
+    frame = frame.with_columns(derived)
+    return frame.with_columns(
+        [pl.col(f"{name}_trim").str.to_lowercase().alias(f"{name}_norm") for name in _TEXT_COLUMNS]
+    )
+
+
+class StagingTable:
+    """Columnar snapshot of a staging session with cached facet counts."""
+
+    MAX_CACHED_FACETS = 16
+
+    def __init__(self, frame: pl.DataFrame, revision: Optional[str]):
+        self.frame = frame
+        self.revision = revision
+        self._facets: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    @property
+    def height(self) -> int:
+        return self.frame.height
+
+    def cached_facets(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        if key in self._facets:
+            self._facets.move_to_end(key)
+            return self._facets[key]
+        value = compute()
+        self._facets[key] = value
+        if len(self._facets) > self.MAX_CACHED_FACETS:
+            self._facets.popitem(last=False)
+        return value
+
+    def append(self, rows: List[Dict]) -> None:
+        if rows:
+            appended = build_staging_frame(rows, start=self.height)
+            self._replace(pl.concat([self.frame, appended], how="vertical"))
+
+    def upsert(self, rows: List[Dict]) -> None:
+        """Replace existing rows in place, keeping their positions."""
+        if not rows:
+            return
+        ids = [row.get("staging_id") for row in rows]
+        replacement = (
+            build_staging_frame(rows)
+            .drop("position")
+            .join(self.frame.select("staging_id", "position"), on="staging_id", how="inner")
+            .select(self.frame.columns)
+        )
+        kept = self.frame.filter(~pl.col("staging_id").is_in(ids))
+        self._replace(pl.concat([kept, replacement], how="vertical").sort("position"))
+
+    def set_selection(self, staging_ids: Iterable[int], is_selected: bool) -> None:
+        ids = list(staging_ids or [])
+        if not ids:
+            return
+        self._replace(
+            self.frame.with_columns(
+                pl.when(pl.col("staging_id").is_in(ids))
+                .then(pl.lit(bool(is_selected)))
+                .otherwise(pl.col("is_selected"))
+                .alias("is_selected")
+            )
+        )
+
+    def remove(self, staging_ids: Iterable[int]) -> None:
+        ids = list(staging_ids or [])
+        if ids:
+            remaining = self.frame.filter(~pl.col("staging_id").is_in(ids))
+            self._replace(
+                remaining.with_columns(pl.int_range(pl.len(), dtype=pl.Int64).alias("position"))
+            )
+
+    def _replace(self, frame: pl.DataFrame) -> None:
+        self.frame = frame
+        self._facets.clear()
+
+
+class StagingTableCache:
+    """Keep one ``StagingTable`` per session, refreshed through small deltas.
+
+    Sessions carry a ``revision`` counter bumped on every save; a cached table is
+    reused only while its revision matches, so mutations that bypass the delta
+    hooks simply trigger a rebuild on the next read.
+    """
+
+    def __init__(self):
+        self._tables: Dict[str, StagingTable] = {}
+        self._lock = RLock()
+
+    def get(self, session_id: str, rows: List[Dict], revision: Optional[str] = None) -> StagingTable:
+        with self._lock:
+            table = self._tables.get(session_id)
+            if (
+                revision is not None
+                and table is not None
+                and table.revision == revision
+                and table.height == len(rows)
+            ):
+                return table
+            table = StagingTable(build_staging_frame(rows), revision)
+            self._tables[session_id] = table
+            return table
+
+    def apply(
+        self,
+        session_id: str,
+        previous_revision: Optional[str],
+        revision: Optional[str],
+        delta: Callable[[StagingTable], None],
+    ) -> None:
+        """Apply ``delta`` when the cached table is at ``previous_revision``, else drop it."""
+        with self._lock:
+            table = self._tables.get(session_id)
+            if table is None:
+                return
+            if table.revision != previous_revision:
+                self._tables.pop(session_id, None)
+                return
+            delta(table)
+            table.revision = revision
+
+    def drop(self, session_id: str) -> None:
+        with self._lock:
+            self._tables.pop(session_id, None)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
@@ -16,7 +18,7 @@ from app.schemas.zotero_seeds import (
     ZoteroMatchResult,
 )
 from app.schemas.seeds import MatchedSeed
-from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory
+from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory, LocalTitleIndexProvider
 
 
 class ZoteroClientAdapter:
@@ -24,9 +26,20 @@ class ZoteroClientAdapter:
 
     def __init__(self, logger: Optional[logging.Logger] = None):
         self._logger = logger or logging.getLogger(__name__)
+        self._client: Optional[ZoteroClient] = None
+        self._lock = threading.Lock()
 
     def get_client(self) -> ZoteroClient:
-        return ZoteroClient(logger=self._logger)
+        """Return a client for the configured library, reusing it (and its connections) until the credentials change."""
+        with self._lock:
+            client = self._client
+            if client is None or (client.library_id, client.library_type, client.api_key) != (
+                os.getenv("ZOTERO_LIBRARY_ID"),
+                os.getenv("ZOTERO_LIBRARY_TYPE", "user"),
+                os.getenv("ZOTERO_API_KEY"),
+            ):
+                client = self._client = ZoteroClient(logger=self._logger)
+            return client
 
 
 class ZoteroMetadataExtractorAdapter:
@@ -42,11 +55,17 @@ class ZoteroMetadataExtractorAdapter:
 class ZoteroMatcherAdapter:
     """Adapter around the ArticleCrawler matcher."""
 
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        title_index_provider: Optional[LocalTitleIndexProvider] = None,
+    ):
         self._logger = logger or logging.getLogger(__name__)
+        self._title_index_provider = title_index_provider
 
     def match_items(self, api_provider, items_metadata: Sequence[Dict]) -> List[MatchResult]:
-        matcher = ZoteroMatcher(api_provider, logger=self._logger)
+        local_index = self._title_index_provider.get_index() if self._title_index_provider else None
+        matcher = ZoteroMatcher(api_provider, logger=self._logger, local_index=local_index)
         return matcher.match_items(items_metadata)
 
 
@@ -1,3 +1,10 @@
+import os
+
+# Settings are read when app.main is imported. Keep staging sessions in memory
+# so test runs never share state through data/staging_sessions.db; the SQLite
+# store is exercised directly against tmp_path.
+os.environ.setdefault("STAGING_STORE_BACKEND", "memory")
+
 
 import pytest
 from fastapi.testclient import TestClient
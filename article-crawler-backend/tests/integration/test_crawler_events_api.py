@@ -0,0 +1,56 @@
+from app.core.stores.crawler_job_store import InMemoryCrawlerJobStore
+
+
+def _use_store(service, store):
+    service.get_job_status.side_effect = store.get_status
+    service.stream_job_events.side_effect = (
+        lambda job_id, last_seq=None: store.subscribe_status(job_id, last_seq=last_seq)
+    )
+
+
+def _events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append(fields)
+    return events
+
+
+def test_job_events_stream_snapshot_of_finished_job(app_client, mock_crawler_execution_service):
+    store = InMemoryCrawlerJobStore()
+    store.create_job("job_sse", {"job_id": "job_sse", "status": "running", "session_data": {}})
+    store.update_job("job_sse", status="completed", papers_collected=42)
+    _use_store(mock_crawler_execution_service, store)
+
+    response = app_client.get("/api/v1/crawler/jobs/job_sse/events")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert [(e["id"], e["event"]) for e in events] == [("2", "snapshot")]
+    assert '"papers_collected": 42' in events[0]["data"]
+    assert "session_data" not in events[0]["data"]
+
+
+def test_job_events_resume_from_last_event_id(app_client, mock_crawler_execution_service):
+    store = InMemoryCrawlerJobStore()
+    store.create_job("job_sse", {"job_id": "job_sse", "status": "running"})
+    store.update_job("job_sse", iterations_completed=1)
+    store.update_job("job_sse", status="completed", iterations_completed=2)
+    _use_store(mock_crawler_execution_service, store)
+
+    response = app_client.get(
+        "/api/v1/crawler/jobs/job_sse/events", headers={"Last-Event-ID": "2"}
+    )
+
+    events = _events(response.text)
+    assert [(e["id"], e["event"]) for e in events] == [("3", "delta")]
+    assert '"status": "completed"' in events[0]["data"]
+
+
+def test_job_events_unknown_job_returns_404(app_client, mock_crawler_execution_service):
+    mock_crawler_execution_service.get_job_status.return_value = None
+
+    response = app_client.get("/api/v1/crawler/jobs/missing/events")
+
+    assert response.status_code == 404
@@ -36,6 +36,31 @@ class TestPDFWorkflow:
         
         assert response.status_code in [200, 400, 404, 422, 500]
 
+    def test_pdf_extract_operation_can_be_polled(self, app_client, test_session_id, mock_pdf_service):
+        import time
+
+        response = app_client.post(
+            f"/api/v1/seeds/session/{test_session_id}/pdfs/pdf-upload-123/extract/operations"
+        )
+        assert response.status_code == 202
+        operation_id = response.json()["operation_id"]
+
+        status = None
+        for _ in range(50):
+            status = app_client.get(f"/api/v1/operations/{operation_id}").json()
+            if status["status"] in ("completed", "failed"):
+                break
+            time.sleep(0.05)
+
+        assert status["status"] == "completed"
+        assert status["result"]["successful_count"] == 1
+        mock_pdf_service.extract_metadata.assert_called_once()
+
+    def test_unknown_operation_returns_404(self, app_client):
+        response = app_client.get("/api/v1/operations/op_missing")
+
+        assert response.status_code == 404
+
 
 class TestEndToEndSimple:
     
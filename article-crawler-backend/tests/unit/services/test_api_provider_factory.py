@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from app.services.crawler.result_assembler import CrawlerResultAssembler
+from app.services.paper_metadata_service import PaperMetadataService
+from app.services.providers import article_crawler
+from app.services.providers.article_crawler import ArticleCrawlerAPIProviderFactory, LocalTitleIndexProvider
+
+
+def test_factory_shares_one_provider_per_name(monkeypatch):
+    created = []
+    monkeypatch.setattr(
+        article_crawler,
+        "create_api_provider",
+        lambda name: created.append(name) or Mock(name=name),
+    )
+    factory = ArticleCrawlerAPIProviderFactory()
+
+    first = factory.get_provider("OpenAlex")
+
+    assert factory.get_provider("openalex") is first
+    assert factory.get_provider(None) is first
+    assert factory.get_provider("semantic_scholar") is not first
+    assert created == ["openalex", "semantic_scholar"]
+
+
+def test_services_take_providers_from_the_shared_factory():
+    provider = Mock()
+    factory = Mock(spec=ArticleCrawlerAPIProviderFactory)
+    factory.get_provider.return_value = provider
+
+    assert CrawlerResultAssembler(api_factory=factory)._get_api_client("OPENALEX") is provider
+    assert PaperMetadataService(api_factory=factory)._get_api() is provider
+    factory.get_provider.assert_called_with("openalex")
+
+
+def test_title_index_refreshes_at_most_once_per_interval(monkeypatch, tmp_path):
+    import ArticleCrawler.library.title_index as title_index
+
+    refreshes = []
+
+    class _Index:
+        def __init__(self, **kwargs):
+            self.library_roots = []
+
+        def refresh(self):
+            refreshes.append(list(self.library_roots))
+
+    clock = [100.0]
+    monkeypatch.setattr(title_index, "LocalTitleIndex", _Index)
+    monkeypatch.setattr(article_crawler.time, "monotonic", lambda: clock[0])
+    provider = LocalTitleIndexProvider(str(tmp_path), refresh_interval=30.0)
+    discoveries = []
+    monkeypatch.setattr(provider, "_library_roots", lambda: discoveries.append(1) or [tmp_path])
+
+    index = provider.get_index()
+    clock[0] += 10.0
+    assert provider.get_index() is index
+    assert len(refreshes) == 1 and len(discoveries) == 1
+
+    clock[0] += 25.0
+    assert provider.get_index() is index
+    assert len(refreshes) == 2 and len(discoveries) == 2
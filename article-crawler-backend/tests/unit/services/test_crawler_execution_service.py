@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import logging
+import threading
 from types import SimpleNamespace
 from unittest.mock import Mock, ANY
 
+import pytest
+
+from app.core.exceptions import JobQueueFullException
+from app.core.executors.background import BackgroundJobExecutor
 from app.core.stores.crawler_job_store import InMemoryCrawlerJobStore
 from app.services.crawler import (
     CrawlerConfigBuilder,
     CrawlerJobRunner,
+    CrawlerProgressSnapshot,
     CrawlerResultAssembler,
     CrawlerRunInputs,
     CrawlerRunResult,
@@ -114,3 +120,134 @@ def test_get_results_uses_result_assembler(monkeypatch):
 
     assembler.assemble.assert_called_once_with(job_id, crawler_obj, store.get_job(job_id))
     assert payload == {"job_id": job_id}
+
+
+def _build_service(store, executor, runner):
+    builder = Mock(spec=CrawlerConfigBuilder)
+    builder.build.return_value = CrawlerRunInputs(
+        experiment_config=DummyConfig(),
+        crawler_parameters=DummyConfig(),
+        keywords=["ai"],
+        max_iterations=2,
+    )
+    return CrawlerExecutionService(
+        logger=logging.getLogger("test"),
+        articlecrawler_path="/tmp",
+        job_store=store,
+        job_executor=executor,
+        config_builder=builder,
+        job_runner=runner,
+        result_assembler=Mock(spec=CrawlerResultAssembler),
+    )
+
+
+def test_cancelled_job_is_marked_cancelled():
+    store = InMemoryCrawlerJobStore()
+    executor = BackgroundJobExecutor(max_workers=1)
+    started = threading.Event()
+
+    def _run(job_id, inputs, *, progress_callback=None, control=None):
+        started.set()
+        for iteration in range(500):
+            control.checkpoint(iteration=iteration)
+            threading.Event().wait(0.01)
+        return CrawlerRunResult(crawler=DummyCrawler(), papers_collected=1)
+
+    runner = Mock(spec=CrawlerJobRunner)
+    runner.run.side_effect = _run
+    service = _build_service(store, executor, runner)
+
+    job_id = service.start_crawler("session-1", {"configuration": {"max_iterations": 2}})
+    assert started.wait(timeout=5)
+    assert service.pause_job(job_id)["status"] == "paused"
+    assert service.unpause_job(job_id)["status"] == "running"
+    service.cancel_job(job_id)
+    executor.shutdown(wait=True)
+
+    stored = store.get_job(job_id)
+    assert stored["status"] == "cancelled"
+    assert stored["completed_at"] is not None
+
+
+def test_cancel_rejects_finished_jobs():
+    store = InMemoryCrawlerJobStore()
+    store.create_job("job_done", {"job_id": "job_done", "status": "completed"})
+    service = _build_service(store, ImmediateExecutor(), Mock())
+
+    with pytest.raises(ValueError, match="not queued or running"):
+        service.cancel_job("job_done")
+
+
+def test_queued_job_can_be_cancelled_before_it_starts():
+    store = InMemoryCrawlerJobStore()
+    executor = BackgroundJobExecutor(max_workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def _run(job_id, inputs, *, progress_callback=None, control=None):
+        started.set()
+        release.wait(timeout=5)
+        return CrawlerRunResult(crawler=DummyCrawler(), papers_collected=1)
+
+    runner = Mock(spec=CrawlerJobRunner)
+    runner.run.side_effect = _run
+    service = _build_service(store, executor, runner)
+
+    first = service.start_crawler("session-1", {"configuration": {"max_iterations": 2}})
+    assert started.wait(timeout=5)
+    second = service.start_crawler("session-2", {"configuration": {"max_iterations": 2}})
+
+    assert store.get_status(first)["status"] == "running"
+    assert store.get_status(second)["status"] == "queued"
+    with pytest.raises(ValueError, match="Only running jobs can be paused"):
+        service.pause_job(second)
+    assert service.cancel_job(second)["status"] == "cancelled"
+
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert store.get_job(first)["status"] == "completed"
+    assert store.get_job(second)["status"] == "cancelled"
+    assert runner.run.call_count == 1
+
+
+def test_start_crawler_drops_job_when_queue_is_full():
+    store = InMemoryCrawlerJobStore()
+    executor = Mock()
+    executor.submit.side_effect = JobQueueFullException("full")
+    service = _build_service(store, executor, Mock())
+
+    with pytest.raises(JobQueueFullException):
+        service.start_crawler("session-1", {"configuration": {"max_iterations": 2}})
+
+    assert store.list_jobs() == []
+
+
+def test_progress_stage_timings_reach_job_status():
+    store = InMemoryCrawlerJobStore()
+
+    def _run(job_id, inputs, *, progress_callback=None):
+        progress_callback(
+            CrawlerProgressSnapshot.from_payload(
+                {
+                    "iterations_completed": 1,
+                    "iterations_total": 2,
+                    "papers_collected": 12,
+                    "stage_timings": {"sampling": 0.4, "api_fetch": 2.5},
+                    "iteration_seconds": 3.1,
+                    "peak_rss_mb": 256.0,
+                }
+            )
+        )
+        return CrawlerRunResult(crawler=DummyCrawler(), papers_collected=12)
+
+    runner = Mock(spec=CrawlerJobRunner)
+    runner.run.side_effect = _run
+    service = _build_service(store, ImmediateExecutor(), runner)
+
+    job_id = service.start_crawler("session-1", {"configuration": {"max_iterations": 2}})
+
+    status = service.get_job_status(job_id)
+    assert status["stage_timings"] == {"sampling": 0.4, "api_fetch": 2.5}
+    assert status["iteration_seconds"] == 3.1
+    assert status["peak_rss_mb"] == 256.0
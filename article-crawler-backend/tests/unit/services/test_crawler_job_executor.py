@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+from ArticleCrawler.api.http_transport import HttpTransportConfig
+from ArticleCrawler.crawl_control import CrawlCancelled
+
+from app.core.exceptions import CrawlerException, JobQueueFullException
+from app.core.executors.background import BackgroundJobExecutor
+from app.core.executors.process import ProcessJobExecutor, _resident_mb
+
+
+# Worker targets live at module level so spawned processes can import them.
+def _report_and_return(value, *, progress_callback=None, control=None):
+    for step in range(3):
+        progress_callback({"step": step})
+    return {"value": value, "control": type(control).__name__}
+
+
+def _fail(*, progress_callback=None, control=None):
+    raise RuntimeError("boom")
+
+
+def _crawl_until_cancelled(*, progress_callback=None, control=None):
+    for iteration in range(500):
+        control.checkpoint(iteration=iteration)
+        progress_callback(iteration)
+        time.sleep(0.01)
+    return "finished"
+
+
+def _allocate(megabytes, *, progress_callback=None, control=None):
+    chunks = []
+    for _ in range(megabytes // 16):
+        chunks.append(bytearray(16 * 1024 * 1024))
+        time.sleep(0.01)
+    return len(chunks)
+
+
+def _reserve(megabytes, *, progress_callback=None, control=None):
+    import mmap
+
+    # Anonymous mappings count towards the address space but stay out of RSS
+    # until touched, like the arenas numpy and torch reserve up front.
+    with mmap.mmap(-1, megabytes * 1024 * 1024) as reserved:
+        return len(reserved)
+
+
+def _http_settings(*, progress_callback=None, control=None):
+    from ArticleCrawler.api.http_transport import get_http_transport
+
+    config = get_http_transport().config
+    return config.retries, config.max_connections_per_host
+
+
+def test_background_executor_rejects_jobs_beyond_queue_limit():
+    executor = BackgroundJobExecutor(max_workers=1, max_queued=1)
+    release = threading.Event()
+    try:
+        executor.submit(release.wait)
+        executor.submit(release.wait)
+        with pytest.raises(JobQueueFullException):
+            executor.submit(release.wait)
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
+
+
+def test_background_executor_cancels_queued_job_before_it_starts():
+    executor = BackgroundJobExecutor(max_workers=1)
+    calls = []
+    executor.cancel("job_1")
+
+    with pytest.raises(CrawlCancelled):
+        executor.run_job("job_1", lambda **kwargs: calls.append(kwargs))
+
+    assert calls == []
+    executor.shutdown(wait=True)
+
+
+def test_background_executor_passes_control_to_job():
+    executor = BackgroundJobExecutor(max_workers=1)
+    seen = {}
+
+    def _job(value, *, control=None):
+        seen["paused"] = control.paused
+        return value
+
+    executor.pause("job_1")
+    executor.unpause("job_1")
+    assert executor.run_job("job_1", _job, 7) == 7
+    assert seen == {"paused": False}
+    executor.shutdown(wait=True)
+
+
+def test_process_executor_relays_progress_and_result():
+    executor = ProcessJobExecutor(max_workers=1)
+    progress = []
+    try:
+        result = executor.run_job("job_1", _report_and_return, 5, progress_callback=progress.append)
+    finally:
+        executor.shutdown(wait=True)
+
+    assert result == {"value": 5, "control": "CrawlControl"}
+    assert progress == [{"step": 0}, {"step": 1}, {"step": 2}]
+
+
+def test_process_executor_surfaces_worker_errors():
+    executor = ProcessJobExecutor(max_workers=1)
+    try:
+        with pytest.raises(CrawlerException, match="RuntimeError: boom"):
+            executor.run_job("job_1", _fail)
+    finally:
+        executor.shutdown(wait=True)
+
+
+def test_process_executor_cancels_between_iterations():
+    executor = ProcessJobExecutor(max_workers=1)
+    started = threading.Event()
+
+    def _on_progress(iteration):
+        started.set()
+
+    def _cancel_when_started():
+        started.wait(timeout=30)
+        executor.cancel("job_1")
+
+    canceller = threading.Thread(target=_cancel_when_started)
+    canceller.start()
+    try:
+        with pytest.raises(CrawlCancelled):
+            executor.run_job("job_1", _crawl_until_cancelled, progress_callback=_on_progress)
+    finally:
+        canceller.join()
+        executor.shutdown(wait=True)
+
+
+def test_process_executor_enforces_memory_limit():
+    if _resident_mb(os.getpid()) is None:
+        pytest.skip("resident memory is not readable on this platform")
+    executor = ProcessJobExecutor(max_workers=1, memory_limit_mb=512, poll_interval=0.05)
+    try:
+        with pytest.raises(CrawlerException, match="MemoryError"):
+            executor.run_job("job_1", _allocate, 2048)
+    finally:
+        executor.shutdown(wait=True)
+
+
+def test_process_executor_memory_limit_ignores_reserved_address_space():
+    if _resident_mb(os.getpid()) is None:
+        pytest.skip("resident memory is not readable on this platform")
+    executor = ProcessJobExecutor(max_workers=1, memory_limit_mb=512, poll_interval=0.05)
+    try:
+        assert executor.run_job("job_1", _reserve, 2048) == 2048 * 1024 * 1024
+    finally:
+        executor.shutdown(wait=True)
+
+
+def test_process_executor_configures_worker_http_transport():
+    config = HttpTransportConfig(retries=0, max_connections_per_host=3, http2=False)
+    executor = ProcessJobExecutor(max_workers=1, http_config=config)
+    try:
+        assert executor.run_job("job_1", _http_settings) == (0, 3)
+    finally:
+        executor.shutdown(wait=True)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from app.core.stores.crawler_job_store import CrawlerJobStore, InMemoryCrawlerJobStore
+from app.core.stores.job_status_feed import JobStatusFeed
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+class _DictJobStore(CrawlerJobStore):
+    """Minimal store without a status feed, to exercise the polling default."""
+
+    STATUS_POLL_INTERVAL = 0.01
+
+    def __init__(self):
+        self.jobs = {}
+
+    def create_job(self, job_id, data):
+        self.jobs[job_id] = dict(data)
+        return data
+
+    def update_job(self, job_id, **updates):
+        self.jobs[job_id] = {**self.jobs[job_id], **updates}
+
+    def get_job(self, job_id):
+        return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        return list(self.jobs.values())
+
+    def delete_job(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def store_crawler(self, job_id, crawler):
+        pass
+
+    def get_crawler(self, job_id):
+        return None
+
+
+def test_publish_emits_only_changed_fields():
+    feed = JobStatusFeed()
+    feed.publish("job_1", {"status": "running", "papers_collected": 0}, reset=True)
+
+    event = feed.publish("job_1", {"status": "running", "papers_collected": 12})
+
+    assert event.kind == "delta"
+    assert event.seq == 2
+    assert dict(event.data) == {"papers_collected": 12}
+    assert feed.publish("job_1", {"papers_collected": 12}) is None
+
+
+def test_status_reads_are_not_copied_and_not_mutated():
+    feed = JobStatusFeed()
+    feed.publish("job_1", {"status": "running"}, reset=True)
+    first = feed.get("job_1")
+
+    assert feed.get("job_1") is first
+    feed.publish("job_1", {"status": "completed"})
+
+    assert first == {"status": "running"}
+    assert feed.get("job_1") == {"status": "completed"}
+
+
+def test_subscriber_gets_snapshot_then_live_deltas_until_terminal():
+    feed = JobStatusFeed()
+    feed.publish("job_1", {"status": "running", "iterations_completed": 0}, reset=True)
+
+    async def _run():
+        stream = feed.subscribe("job_1")
+        snapshot = await stream.__anext__()
+
+        def _progress():
+            feed.publish("job_1", {"iterations_completed": 1})
+            feed.publish("job_1", {"status": "completed", "iterations_completed": 2})
+
+        threading.Thread(target=_progress).start()
+        return snapshot, await _collect(stream)
+
+    snapshot, events = asyncio.run(_run())
+
+    assert snapshot.kind == "snapshot"
+    assert snapshot.data == {"status": "running", "iterations_completed": 0}
+    assert [(e.kind, dict(e.data)) for e in events] == [
+        ("delta", {"iterations_completed": 1}),
+        ("delta", {"status": "completed", "iterations_completed": 2}),
+    ]
+
+
+def test_reconnect_replays_buffered_deltas_or_falls_back_to_snapshot():
+    feed = JobStatusFeed(buffer_size=3)
+    feed.publish("job_1", {"status": "running", "iterations_completed": 0}, reset=True)
+    for iteration in range(1, 5):
+        feed.publish("job_1", {"iterations_completed": iteration})
+    feed.publish("job_1", {"status": "completed"})
+
+    replayed = asyncio.run(_collect(feed.subscribe("job_1", last_seq=4)))
+    assert [e.seq for e in replayed] == [5, 6]
+
+    too_old = asyncio.run(_collect(feed.subscribe("job_1", last_seq=1)))
+    assert [(e.kind, e.seq) for e in too_old] == [("snapshot", 6)]
+    assert too_old[0].data["iterations_completed"] == 4
+
+
+def test_heartbeat_is_sent_while_idle():
+    feed = JobStatusFeed()
+    feed.publish("job_1", {"status": "running"}, reset=True)
+
+    async def _run():
+        stream = feed.subscribe("job_1", heartbeat=0.01)
+        await stream.__anext__()
+        event = await stream.__anext__()
+        await stream.aclose()
+        return event
+
+    assert asyncio.run(_run()).kind == "heartbeat"
+
+
+def test_job_store_mirrors_public_fields_into_feed():
+    store = InMemoryCrawlerJobStore()
+    store.create_job(
+        "job_1",
+        {"job_id": "job_1", "status": "running", "session_data": {"seeds": []}, "config_snapshot": {}},
+    )
+    store.update_job("job_1", papers_collected=3, session_data={"seeds": ["W1"]})
+
+    assert store.get_status("job_1") == {"job_id": "job_1", "status": "running", "papers_collected": 3}
+    assert store.list_statuses() == [store.get_status("job_1")]
+    assert store.get_job("job_1")["session_data"] == {"seeds": ["W1"]}
+
+    store.delete_job("job_1")
+    assert store.get_status("job_1") is None
+    assert "job_1" not in store.status_feed._seq
+
+
+def test_default_subscribe_status_polls_the_store():
+    store = _DictJobStore()
+    store.create_job("job_1", {"status": "running", "session_data": {}})
+
+    async def _run():
+        stream = store.subscribe_status("job_1", heartbeat=0.02)
+        events = [await stream.__anext__(), await stream.__anext__()]
+        store.update_job("job_1", papers_collected=4)
+        events.append(await stream.__anext__())
+        store.update_job("job_1", status="completed")
+        events.extend([event async for event in stream])
+        return events
+
+    events = asyncio.run(_run())
+
+    assert [event.kind for event in events] == ["snapshot", "heartbeat", "delta", "delta"]
+    assert events[0].data == {"status": "running"}
+    assert events[2].data == {"papers_collected": 4}
+    assert events[3].data == {"status": "completed"}
+    assert asyncio.run(_collect(store.subscribe_status("missing"))) == []
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+
+from app.core.executors.blocking import BlockingTaskExecutor
+from app.core.stores.operation_store import InMemoryOperationStore
+from app.services.operations.service import OperationService
+
+
+def _wait_until_finished(service: OperationService, operation_id: str):
+    for _ in range(100):
+        status = service.get(operation_id)
+        if status.status in ("completed", "failed"):
+            return status
+        threading.Event().wait(0.02)
+    raise AssertionError("operation did not finish")
+
+
+def test_blocking_executor_runs_off_event_loop_thread():
+    executor = BlockingTaskExecutor(limits={"grobid": 1})
+    loop_thread = threading.get_ident()
+
+    async def _run():
+        return await executor.run("grobid", threading.get_ident)
+
+    try:
+        worker_thread = asyncio.run(_run())
+    finally:
+        executor.shutdown(wait=True)
+
+    assert worker_thread != loop_thread
+
+
+def test_blocking_executor_enforces_category_limit():
+    executor = BlockingTaskExecutor(limits={"grobid": 2})
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _task():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.02)
+        with lock:
+            active -= 1
+
+    futures = [executor.submit("grobid", _task) for _ in range(6)]
+    for future in futures:
+        future.result()
+    executor.shutdown(wait=True)
+
+    assert peak <= 2
+    assert executor.limits["grobid"] == 2
+
+
+def test_operation_service_records_progress_and_result():
+    service = OperationService(
+        logger=logging.getLogger("test"),
+        store=InMemoryOperationStore(),
+        executor=BlockingTaskExecutor(),
+    )
+
+    def _work(count, progress_callback=None):
+        for idx in range(count):
+            progress_callback(idx + 1, count, f"item-{idx}")
+        return {"processed": count}
+
+    started = service.start("demo", _work, 3, report_progress=True)
+    status = _wait_until_finished(service, started.operation_id)
+
+    assert status.status == "completed"
+    assert status.result == {"processed": 3}
+    assert status.progress.completed == 3
+    assert status.progress.total == 3
+
+
+def test_operation_service_publishes_partial_results():
+    service = OperationService(logger=logging.getLogger("test"))
+
+    def _work(items, result_callback=None):
+        for item in items:
+            result_callback({"item": item})
+        return len(items)
+
+    started = service.start("demo", _work, ["a", "b"], report_partial_results=True)
+    status = _wait_until_finished(service, started.operation_id)
+
+    assert status.result == 2
+    assert status.partial_results == [{"item": "a"}, {"item": "b"}]
+
+
+def test_operation_service_records_failures():
+    service = OperationService(logger=logging.getLogger("test"))
+
+    def _boom():
+        raise ValueError("no GROBID")
+
+    started = service.start("demo", _boom)
+    status = _wait_until_finished(service, started.operation_id)
+
+    assert status.status == "failed"
+    assert status.error == "no GROBID"
+    assert service.get("op_missing") is None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+
+from app.core.stores.pdf_upload_store import InMemoryPdfUploadStore
+from app.models.pdf_upload_session import PDFUploadSession
+from app.services.pdf.service import PDFSeedService
+
+
+class _GrobidManager:
+    def __init__(self, running: bool = True):
+        self.running = running
+        self.calls = 0
+
+    def is_running(self) -> bool:
+        self.calls += 1
+        return self.running
+
+
+class _Extractor:
+    def __init__(self, cached=()):
+        self.batches = []
+        self.cached = set(cached)
+
+    def is_cached(self, file_path):
+        return file_path.rsplit("/", 1)[-1] in self.cached
+
+    def extract_many(self, file_paths, max_workers=4):
+        self.batches.append((list(file_paths), max_workers))
+        for path in reversed(file_paths):
+            if path.endswith("broken.pdf"):
+                yield path, None, ValueError("bad pdf")
+            else:
+                name = path.rsplit("/", 1)[-1]
+                yield path, SimpleNamespace(
+                    title=f"Title {name}", authors=["Doe"], year="2021", doi=None, venue=None
+                ), None
+
+
+def _service(tmp_path, grobid_manager, extractor):
+    store = InMemoryPdfUploadStore()
+    session = PDFUploadSession("upload-1", tmp_path)
+    for name in ["a.pdf", "broken.pdf", "c.docx"]:
+        path = tmp_path / name
+        path.write_bytes(b"x")
+        session.pdf_paths.append(path)
+    store.create(session)
+    service = PDFSeedService(
+        logger=logging.getLogger("test"),
+        upload_store=store,
+        grobid_manager=grobid_manager,
+        metadata_extractor=extractor,
+        extraction_workers=3,
+    )
+    return service
+
+
+def test_extract_metadata_checks_grobid_once_and_keeps_upload_order(tmp_path):
+    grobid = _GrobidManager()
+    extractor = _Extractor()
+    service = _service(tmp_path, grobid, extractor)
+    streamed = []
+    progress = []
+
+    response = service.extract_metadata(
+        "upload-1",
+        progress_callback=lambda done, total, name: progress.append((done, total)),
+        result_callback=streamed.append,
+    )
+
+    assert grobid.calls == 1
+    assert len(extractor.batches) == 1
+    assert extractor.batches[0][1] == 3
+    assert [result.filename for result in response.results] == ["a.pdf", "broken.pdf", "c.docx"]
+    assert [result.filename for result in streamed] == ["c.docx", "broken.pdf", "a.pdf"]
+    assert progress[-1] == (3, 3)
+    assert response.successful_count == 2
+    assert response.results[0].metadata.year == 2021
+    assert response.results[1].error == "bad pdf"
+
+
+def test_extract_metadata_skips_pdfs_when_grobid_is_down(tmp_path):
+    extractor = _Extractor()
+    service = _service(tmp_path, _GrobidManager(running=False), extractor)
+
+    response = service.extract_metadata("upload-1")
+
+    assert extractor.batches[0][0] == [str(tmp_path / "c.docx")]
+    assert response.successful_count == 1
+    assert "GROBID service is not running" in response.results[0].error
+
+
+def test_extract_metadata_serves_cached_pdfs_without_grobid(tmp_path):
+    grobid = _GrobidManager(running=False)
+    extractor = _Extractor(cached={"a.pdf", "broken.pdf"})
+    service = _service(tmp_path, grobid, extractor)
+
+    response = service.extract_metadata("upload-1")
+
+    assert grobid.calls == 0
+    assert len(extractor.batches[0][0]) == 3
+    assert response.results[0].success
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from app.benchmarks.query_benchmark import (
+    compare_to_baseline,
+    generate_catalog,
+    generate_staging_rows,
+    run_query_benchmark,
+)
+
+
+def test_synthetic_catalog_is_reproducible():
+    first = generate_catalog(300, seed=4)
+    second = generate_catalog(300, seed=4)
+
+    assert first.equals(second)
+    assert first.get_column("paperId").n_unique() == 300
+    assert {"authors_display", "venue", "year", "doi", "centrality (out)"} <= set(first.columns)
+
+    rows = generate_staging_rows(first)
+    assert [row["staging_id"] for row in rows[:3]] == [1, 2, 3]
+    assert rows[0]["authors"] == ", ".join(first.get_column("authors_display")[0])
+
+
+def test_small_run_times_every_case(tmp_path):
+    result = run_query_benchmark(sizes=[400], repeats=2, workdir=tmp_path)
+
+    cases = result["sizes"]["400"]["cases"]
+    assert {"catalog.search", "catalog.options_authors", "staging.deep_page", "results.assemble"} <= set(cases)
+    assert cases["catalog.first_page"]["rows"] == 400
+    assert cases["staging.first_page"]["rows"] == 400
+    assert 0 < cases["catalog.facets"]["rows"] < 400
+    assert cases["catalog.custom_filters"]["rows"] == cases["staging.custom_filters"]["rows"]
+    assert all(stats["p95_ms"] >= stats["p50_ms"] > 0 for stats in cases.values())
+    assert compare_to_baseline(result, result) == []
+
+
+def test_compare_flags_slower_percentiles_and_changed_counts():
+    baseline = {"sizes": {"1000": {"cases": {
+        "catalog.search": {"rows": 10, "p50_ms": 10.0, "p95_ms": 20.0},
+        "staging.search": {"rows": 5, "p50_ms": 0.5, "p95_ms": 0.9},
+    }}}}
+    result = {"sizes": {"1000": {"cases": {
+        "catalog.search": {"rows": 10, "p50_ms": 12.0, "p95_ms": 40.0},
+        "staging.search": {"rows": 6, "p50_ms": 5.0, "p95_ms": 9.0},
+        "staging.sort_title": {"rows": 1000, "p50_ms": 50.0, "p95_ms": 60.0},
+    }}}}
+
+    problems = compare_to_baseline(result, baseline, tolerance=0.5)
+
+    assert [problem.split(":")[0] for problem in problems] == [
+        "1000/catalog.search p95_ms",
+        "1000/staging.search",
+    ]
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-from app.schemas.staging import StagingMatchRow, StagingPaperCreate, StagingPaperUpdate
+from app.schemas.staging import ColumnCustomFilter, StagingMatchRow, StagingPaperCreate, StagingPaperUpdate
 from app.services.staging.query_service import StagingQueryService
 from app.services.staging.query_utils import StagingQueryHelper
 from app.services.staging.repository import StagingRepository
 from app.services.staging.retraction_updater import StagingRetractionUpdater
 from app.services.staging.row_manager import StagingRowManager
-from app.services.staging.session_store import StagingSessionStore
+from app.services.staging.service import StagingService
+from app.services.staging.session_store import SQLiteStagingSessionStore, StagingSessionStore
 
 
 def _base_session():
@@ -38,6 +41,113 @@ def test_staging_repository_persists_sessions():
     assert reset["next_id"] == 1
 
 
+def test_sqlite_session_store_survives_restart_and_evicts(tmp_path):
+    db_path = tmp_path / "staging.db"
+    store = SQLiteStagingSessionStore(str(db_path), max_sessions=1)
+    repository = StagingRepository(store)
+
+    first = repository.get_session("first")
+    first["rows"].append({"staging_id": 1, "title": "Paper", "retraction_checked_at": datetime.now(timezone.utc)})
+    repository.save_session("first", first)
+    repository.save_session("second", repository.get_session("second"))
+
+    # "first" was evicted from memory by the LRU but is reloaded from disk.
+    assert repository.get_session("first")["rows"][0]["title"] == "Paper"
+    assert sorted(store.session_ids()) == ["first", "second"]
+    store.close()
+
+    reopened = StagingRepository(SQLiteStagingSessionStore(str(db_path)))
+    restored = reopened.get_session("first")
+    assert restored["rows"][0]["title"] == "Paper"
+    assert restored["revision"] == first["revision"]
+
+    reopened.delete_session("first")
+    assert reopened.get_session("first")["rows"] == []
+
+
+def test_session_store_expires_idle_sessions(tmp_path):
+    store = SQLiteStagingSessionStore(str(tmp_path / "staging.db"), ttl_minutes=1)
+    session = store.get("idle")
+    session["rows"].append({"staging_id": 1})
+    store.save("idle", session)
+
+    store._touched["idle"] -= 120
+    store._conn.execute("UPDATE staging_sessions SET updated_at = updated_at - 120")
+
+    assert store.get("idle")["rows"] == []
+
+
+class _SlowPickle:
+    """Pickles only once ``release`` is set, to hold one session's save open."""
+
+    def __init__(self, started: threading.Event, release: threading.Event):
+        self.started = started
+        self.release = release
+
+    def __reduce__(self):
+        self.started.set()
+        self.release.wait(timeout=10)
+        return (dict, ())
+
+
+def test_sqlite_session_store_reads_keep_sessions_alive(tmp_path):
+    store = SQLiteStagingSessionStore(str(tmp_path / "staging.db"), ttl_minutes=1, max_sessions=1, touch_interval=0)
+    session = store.get("busy")
+    session["rows"].append({"staging_id": 1})
+    store.save("busy", session)
+    store._conn.execute("UPDATE staging_sessions SET updated_at = updated_at - 50")
+
+    # Reading refreshes the access time, so the row outlives its last save by more than the TTL.
+    store.get("busy")
+    store._conn.execute("UPDATE staging_sessions SET updated_at = updated_at - 50")
+    store.save("other", store.get("other"))  # evicts "busy" from the cache
+
+    assert store.get("busy")["rows"] == [{"staging_id": 1}]
+
+
+def test_sqlite_session_store_saves_outside_the_store_lock(tmp_path):
+    store = SQLiteStagingSessionStore(str(tmp_path / "staging.db"))
+    started, release = threading.Event(), threading.Event()
+    slow = store.get("slow")
+    slow["rows"].append(_SlowPickle(started, release))
+    saver = threading.Thread(target=store.save, args=("slow", slow))
+    saver.start()
+    def _save_other():
+        other = store.get("other")
+        other["rows"].append({"staging_id": 1})
+        store.save("other", other)
+
+    try:
+        assert started.wait(timeout=10)
+        # Another session is read and saved while "slow" is still being pickled.
+        other_saver = threading.Thread(target=_save_other)
+        other_saver.start()
+        other_saver.join(timeout=5)
+        assert not other_saver.is_alive()
+    finally:
+        release.set()
+        saver.join()
+
+    assert store.get("other")["rows"] == [{"staging_id": 1}]
+    store.close()
+
+
+def test_staging_service_serializes_concurrent_writes():
+    service = StagingService(logger=logging.getLogger("test"))
+
+    def _add(index: int):
+        return service.add_rows(
+            "session-concurrent",
+            [StagingPaperCreate(source="Manual", source_type="manual", title=f"Paper {index}")],
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_add, range(40)))
+
+    rows = service.get_all_rows("session-concurrent")
+    assert sorted(row.staging_id for row in rows) == list(range(1, 41))
+
+
 def test_row_manager_adds_updates_and_removes_rows():
     manager = StagingRowManager(logger=logging.getLogger("test"))
     session = _base_session()
@@ -200,3 +310,121 @@ def test_retraction_updater_marks_retracted_rows():
     second_row = updated_session["rows"][1]
     assert second_row["is_retracted"] is False
     assert second_row["retraction_reason"] is None
+
+
+def _list_all(query_service, rows, **overrides):
+    params = dict(
+        page=1,
+        page_size=50,
+        sort_by=None,
+        sort_dir="asc",
+        source_values=None,
+        year_min=None,
+        year_max=None,
+        title_search=None,
+        venue_search=None,
+        author_search=None,
+        keyword_search=None,
+        doi_presence=None,
+        selected_only=False,
+        retraction_status=None,
+        title_values=None,
+        author_values=None,
+        venue_values=None,
+        year_values=None,
+        identifier_filters=None,
+        custom_filters=None,
+    )
+    params.update(overrides)
+    return query_service.list_rows("session-frame", rows, **params)
+
+
+def test_query_service_sorts_empty_last_and_counts_facets():
+    query_service = StagingQueryService(StagingQueryHelper())
+    rows = [
+        {"staging_id": 1, "source": "Zotero", "source_type": "zotero", "title": " beta ", "year": None,
+         "doi": "10.1/a", "url": None, "is_selected": False, "is_retracted": False},
+        {"staging_id": 2, "source": "Manual", "source_type": "manual", "title": "", "year": 2019,
+         "doi": "", "url": "https://x.org", "is_selected": True, "is_retracted": True},
+        {"staging_id": 3, "source": "Manual", "source_type": "manual", "title": "Alpha", "year": 2021,
+         "doi": None, "url": None, "is_selected": False, "is_retracted": False},
+        {"staging_id": 4, "source": "Manual", "source_type": "manual", "title": "alpha", "year": 2020,
+         "doi": "10.1/A ", "url": None, "is_selected": False, "is_retracted": False},
+    ]
+
+    by_title = _list_all(query_service, rows, sort_by="title", sort_dir="desc")
+    assert [row.staging_id for row in by_title.rows] == [1, 3, 4, 2]
+    assert by_title.selected_count == 1
+    assert by_title.retracted_count == 1
+    assert [(option.value, option.count) for option in by_title.column_options["title"]] == [
+        ("Alpha", 1),
+        ("alpha", 1),
+        ("beta", 1),
+    ]
+    assert [option.value for option in by_title.column_options["identifier"]] == [
+        "doi::10.1/a",
+        "doi::10.1/A",
+        "url::https://x.org",
+    ]
+
+    by_year = _list_all(query_service, rows, sort_by="year", year_min=2020)
+    assert [row.staging_id for row in by_year.rows] == [4, 3, 1]
+
+    with_doi = _list_all(
+        query_service,
+        rows,
+        doi_presence="with",
+        identifier_filters=[{"field": "doi", "value": "10.1/a"}],
+        year_values=[2020],
+    )
+    assert [row.staging_id for row in with_doi.rows] == [4]
+    assert [option.count for option in with_doi.column_options["year"]] == [1]
+
+    custom = _list_all(
+        query_service,
+        rows,
+        custom_filters=[
+            ColumnCustomFilter(column="identifier", operator="begins_with", value="HTTPS"),
+            ColumnCustomFilter(column="year", operator="not_between", value="2020", value_to="2021"),
+        ],
+    )
+    assert [row.staging_id for row in custom.rows] == [2]
+
+
+def test_staging_service_keeps_table_in_sync_with_mutations():
+    service = StagingService(logger=logging.getLogger("test"))
+    service.add_rows(
+        "session-sync",
+        [
+            StagingPaperCreate(source="Manual", source_type="manual", title="Gamma", doi="10.1/g"),
+            StagingPaperCreate(source="Manual", source_type="manual", title="Alpha", doi="10.1/a"),
+        ],
+    )
+    assert service.list_rows("session-sync").filtered_rows == 2
+
+    service.add_rows(
+        "session-sync",
+        [StagingPaperCreate(source="Manual", source_type="manual", title="Beta", doi="10.1/b")],
+    )
+    service.set_selection("session-sync", [1, 3], True)
+    service.update_row("session-sync", 2, StagingPaperUpdate(title="Delta"))
+
+    listing = service.list_rows("session-sync", sort_by="title")
+    assert [row.title for row in listing.rows] == ["Beta", "Delta", "Gamma"]
+    assert listing.selected_count == 2
+    assert service.list_rows("session-sync", title_search="delta").rows[0].staging_id == 2
+
+    service.remove_rows("session-sync", [1])
+    remaining = service.list_rows("session-sync", selected_only=True)
+    assert [row.title for row in remaining.rows] == ["Beta"]
+
+    service.apply_retraction_results(
+        "session-sync",
+        retracted_dois={"10.1/b"},
+        checked_at=datetime.now(timezone.utc),
+        reason="Test",
+    )
+    assert service.list_rows("session-sync", retraction_status="retracted").rows[0].title == "Beta"
+
+    service.clear_session("session-sync")
+    assert service.list_rows("session-sync").total_rows == 0
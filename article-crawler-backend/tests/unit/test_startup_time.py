@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+HEAVY_MODULES = ("torch", "sentence_transformers", "sklearn")
+
+# Cold-import budget for the FastAPI app in seconds; scale it on slow machines
+# with ARTICLECRAWLER_IMPORT_BUDGET_SCALE.
+APP_IMPORT_BUDGET = 5.0
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _cold_import_app() -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES)],
+        cwd=BACKEND_ROOT,
+        env=dict(os.environ),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_app_import_skips_heavy_dependencies():
+    assert _cold_import_app()["loaded"] == []
+
+
+def test_app_cold_import_within_budget():
+    budget = APP_IMPORT_BUDGET * float(os.getenv("ARTICLECRAWLER_IMPORT_BUDGET_SCALE", "1"))
+
+    best = min(_cold_import_app()["elapsed"] for _ in range(3))
+
+    assert best <= budget, f"import app.main took {best:.2f}s (budget {budget:.2f}s)"
@@ -1,16 +1,23 @@
-from .data_storage import DataStorage
-from .json_manager import JsonConverter
-from .markdown_writer import MarkdownFileGenerator
+from .._lazy import attach
 
-from ..data import FrameManager, DataManager
-from ..graph import GraphManager, GraphProcessing
+__getattr__, __dir__ = attach(__name__, {
+    'DataStorage': '.data_storage',
+    'BackgroundWriter': '.background_writer',
+    'JsonConverter': '.json_manager',
+    'MarkdownFileGenerator': '.markdown_writer',
+    'FrameManager': '..data.frame_manager',
+    'DataManager': '..data.data_manager',
+    'GraphManager': '..graph.graph_manager',
+    'GraphProcessing': '..graph.graph_processing',
+})
 
 __all__ = [
     'DataStorage',
+    'BackgroundWriter',
     'JsonConverter',
     'MarkdownFileGenerator',
     'FrameManager',
     'DataManager', 
     'GraphManager',
     'GraphProcessing'
-]
\ No newline at end of file
+]
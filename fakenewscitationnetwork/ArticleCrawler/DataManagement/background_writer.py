@@ -0,0 +1,58 @@
+"""
+Background persistence for the pipelined crawl loop.
+
+``BackgroundWriter`` runs write jobs (intermediate pickles, checkpoints) on a
+single worker thread, in submission order, so the crawl can continue while the
+previous iteration is written to disk. Jobs must only touch data snapshotted
+at submission time.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundWriter:
+    """
+    FIFO write queue with a bounded number of pending jobs.
+
+    ``submit`` blocks while ``max_pending`` jobs are still queued, which bounds
+    the number of snapshots held in memory. Errors raised by a job are re-raised
+    by the ``submit``, ``wait`` or ``close`` call that collects it.
+    """
+
+    def __init__(self, max_pending: int = 2, logger=None):
+        """
+        Args:
+            max_pending: Maximum jobs queued or running at once
+            logger: Optional logger instance
+        """
+        self.max_pending = max_pending
+        self.logger = logger or logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crawl-writer")
+        self._pending = deque()
+
+    def submit(self, fn, *args, **kwargs) -> None:
+        """Queue ``fn(*args, **kwargs)``, first waiting for room in the queue."""
+        while len(self._pending) >= self.max_pending:
+            self._pending.popleft().result()
+        self._pending.append(self._executor.submit(fn, *args, **kwargs))
+
+    def wait(self) -> None:
+        """Block until every queued job has finished."""
+        while self._pending:
+            self._pending.popleft().result()
+
+    def close(self) -> None:
+        """Finish the queued jobs and stop the worker."""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
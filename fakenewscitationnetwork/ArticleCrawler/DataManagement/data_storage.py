@@ -15,20 +15,34 @@ class DataStorage:
         
 
     def save_intermediate_file(self, obj, iteration):
+        filepath = self._intermediate_filepath(iteration)
+
+        # Save the object to the intermediate file using pickle
+        with open(filepath, 'wb') as file:
+            pickle.dump(obj, file)
+
+        self._intermediate_file_saved(filepath)
+
+    def write_intermediate_file(self, payload: bytes, iteration):
+        """Write an object pickled beforehand (e.g. by the pipelined crawl loop) as the intermediate file."""
+        filepath = self._intermediate_filepath(iteration)
+        with open(filepath, 'wb') as file:
+            file.write(payload)
+
+        self._intermediate_file_saved(filepath)
+
+    def _intermediate_filepath(self, iteration):
         # Create the temp folder if it doesn't exist
         os.makedirs(self.temp_folder, exist_ok=True)
 
         # Generate the file name for the intermediate file
         timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
         filename = f'intermediate_{iteration}_{timestamp}.pkl'
-        filepath = os.path.join(self.temp_folder, filename)
-
-        # Save the object to the intermediate file using pickle
-        with open(filepath, 'wb') as file:
-            pickle.dump(obj, file)
+        return os.path.join(self.temp_folder, filename)
 
+    def _intermediate_file_saved(self, filepath):
         # Log the filename
-        self.logger.info(f'Saved intermediate file: {filename}')
+        self.logger.info(f'Saved intermediate file: {os.path.basename(filepath)}')
 
         # Remove the previous intermediate files
         self.remove_previous_intermediate_files()
@@ -617,7 +617,8 @@ class MarkdownFileGenerator:
     def create_paper_markdown_with_openalex_metadata(
         self, 
         paper_data: 'PaperData',
-        output_path: Path
+        output_path: Path,
+        skip_unchanged: bool = True
     ) -> Path:
         """
         Create markdown file for a paper with OpenAlex metadata in YAML frontmatter.
@@ -628,24 +629,43 @@ class MarkdownFileGenerator:
         Args:
             paper_data: PaperData object with all metadata
             output_path: Path where to save the markdown file
+            skip_unchanged: Leave an existing file untouched when its content
+                already matches (keeps its mtime, so manifests stay warm)
             
         Returns:
             Path to created markdown file
         """
-        frontmatter = self._create_openalex_frontmatter(paper_data)
-        
-        body = self._create_paper_body_with_openalex(paper_data)
-        
-        content = f"---\n{frontmatter}---\n\n{body}"
+        content = self.render_paper_markdown_with_openalex_metadata(paper_data).encode('utf-8')
         
         output_path = Path(output_path)
+        if skip_unchanged and self._file_matches(output_path, content):
+            return output_path
+        
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'wb') as f:
             f.write(content)
         
         return output_path
     
+    def render_paper_markdown_with_openalex_metadata(self, paper_data: 'PaperData') -> str:
+        """Render the markdown written by create_paper_markdown_with_openalex_metadata."""
+        frontmatter = self._create_openalex_frontmatter(paper_data)
+        
+        body = self._create_paper_body_with_openalex(paper_data)
+        
+        return f"---\n{frontmatter}---\n\n{body}"
+    
+    @staticmethod
+    def _file_matches(path: Path, content: bytes) -> bool:
+        """Whether ``path`` already holds exactly ``content`` (size is checked before reading)."""
+        try:
+            if path.stat().st_size != len(content):
+                return False
+            return path.read_bytes() == content
+        except OSError:
+            return False
+    
     def _create_openalex_frontmatter(self, paper_data: 'PaperData') -> str:
         """
         Create YAML frontmatter with OpenAlex metadata.
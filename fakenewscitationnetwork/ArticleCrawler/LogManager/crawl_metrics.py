@@ -0,0 +1,187 @@
+"""
+Per-iteration crawl instrumentation.
+
+``CrawlMetrics`` times the stages of every crawl iteration (sampling, graph
+update, centrality, keyword filter, API fetch, parsing, feature computation,
+retraction check, persistence), adds the API call counters of the iteration,
+the process's peak RSS and the memory of each data frame, and appends one JSON
+record per iteration to a metrics file in the experiment's log folder.
+
+Stage times are exclusive: a stage nested in another (centrality inside
+sampling) is subtracted from its parent, so the stages of an iteration add up
+to its wall time minus ``other``.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+STAGES = (
+    'sampling',
+    'graph_update',
+    'centrality',
+    'keyword_filter',
+    'api_fetch',
+    'parsing',
+    'features',
+    'retraction_check',
+    'persistence',
+)
+
+
+@dataclass
+class ApiCallStats:
+    """Thread-safe counters kept by an API provider."""
+    requests: int = 0
+    retries: int = 0
+    bytes_received: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def record_bytes(self, size: int) -> None:
+        with self._lock:
+            self.bytes_received += int(size or 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {'requests': self.requests, 'retries': self.retries, 'bytes_received': self.bytes_received}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class CrawlMetrics:
+    """Collects stage timings and resource usage for each crawl iteration."""
+
+    def __init__(self, metrics_file: Optional[Path] = None, deep_memory: bool = False,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            metrics_file: JSON Lines file receiving one record per iteration (None: keep in memory only)
+            deep_memory: Measure object columns with ``memory_usage(deep=True)`` (slower on large frames)
+            clock: Monotonic clock, replaceable in tests
+        """
+        self.metrics_file = Path(metrics_file) if metrics_file else None
+        self.deep_memory = deep_memory
+        self._clock = clock
+        self.records: List[Dict] = []
+        self._iteration: Optional[int] = None
+        self._started = 0.0
+        self._stages: Dict[str, float] = {}
+        self._stack: List[list] = []
+        self._api_start: Dict[str, int] = {}
+
+    @property
+    def last(self) -> Optional[Dict]:
+        return self.records[-1] if self.records else None
+
+    def start_iteration(self, iteration: int, api_stats: Optional[ApiCallStats] = None) -> None:
+        self._iteration = iteration
+        self._started = self._clock()
+        self._stages = {}
+        self._stack = []
+        self._api_start = api_stats.as_dict() if api_stats is not None else {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as stage ``name`` of the current iteration."""
+        frame = [name, self._clock(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = self._clock() - frame[1]
+            self._stages[name] = self._stages.get(name, 0.0) + elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def finish_iteration(self, frames=None, api_stats: Optional[ApiCallStats] = None) -> Optional[Dict]:
+        """
+        Close the current iteration, write its record and return it.
+
+        Args:
+            frames: Optional FrameManager whose DataFrames are measured
+            api_stats: Provider counters; the record holds their change over the iteration
+        """
+        if self._iteration is None:
+            return None
+        total = self._clock() - self._started
+        stages = {name: round(seconds, 6) for name, seconds in self._stages.items()}
+        record = {
+            'iteration': self._iteration,
+            'timestamp': datetime.utcnow().isoformat(),
+            'total_seconds': round(total, 6),
+            'stages': stages,
+            'other_seconds': round(max(total - sum(self._stages.values()), 0.0), 6),
+            'api': self._api_delta(api_stats),
+            'peak_rss_mb': peak_rss_mb(),
+            'frame_memory_mb': self._frame_memory(frames),
+        }
+        self.records.append(record)
+        self._iteration = None
+        self._write(record)
+        return record
+
+    def summary(self) -> Dict[str, float]:
+        """Seconds per stage summed over all recorded iterations."""
+        totals: Dict[str, float] = {}
+        for record in self.records:
+            for name, seconds in record['stages'].items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        return {name: round(seconds, 6) for name, seconds in totals.items()}
+
+    def _api_delta(self, api_stats: Optional[ApiCallStats]) -> Dict[str, int]:
+        if api_stats is None:
+            return {}
+        current = api_stats.as_dict()
+        return {key: value - self._api_start.get(key, 0) for key, value in current.items()}
+
+    def _frame_memory(self, frames) -> Dict[str, float]:
+        if frames is None:
+            return {}
+        store = getattr(frames, 'store', frames)
+        memory = {}
+        for name, value in vars(store).items():
+            if name.startswith('df_') and hasattr(value, 'memory_usage'):
+                size = value.memory_usage(index=True, deep=self.deep_memory).sum()
+                memory[name] = round(float(size) / 2 ** 20, 3)
+        return memory
+
+    def _write(self, record: Dict) -> None:
+        if self.metrics_file is None:
+            return
+        self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.metrics_file, 'a', encoding='utf-8') as handle:
+            handle.write(json.dumps(record) + '\n')
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where ``resource`` is unavailable)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return round(peak * scale / 2 ** 20, 1)
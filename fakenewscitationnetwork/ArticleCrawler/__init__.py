@@ -1,31 +1,52 @@
 
-from .api import create_api_provider, BaseAPIProvider
-from .data import DataManager, DataCoordinator, FrameManager
-from .config import (
-    APIConfig, SamplingConfig, TextProcessingConfig,
-    StorageAndLoggingConfig, GraphConfig, RetractionConfig, StoppingConfig,
-    SamplingOptions, TextOptions, StorageAndLoggingOptions,
-    GraphOptions, RetractionOptions, StoppingOptions
-)
-from .text_processing import TextAnalysisManager
-from .sampling import Sampler
-from .crawler import Crawler
-from .graph import GraphManager, GraphProcessing
-from .pdf_processing import (
-    PDFProcessor,
-    PDFMetadataExtractor,
-    APIMetadataMatcher,
-    DockerManager,
-    PDFMetadata,
-    PDFProcessingResult,
-    APIMatchResult
-)
-from .LogManager.crawler_logger import CrawlerLogger
-from .DataManagement.data_storage import DataStorage
-from .papervalidation.retraction_watch_manager import RetractionWatchManager
-from .usecases.author_investigation import AuthorInvestigation
-from .usecases.title_similarity_usecase import TitleSimilarityEngine
-from .usecases.recommender import PaperRecommender, RecommenderEmbeddingModel
+# Public names resolve on first access so ``import ArticleCrawler`` does not pull
+# in torch, sentence-transformers or scikit-learn until they are needed.
+from ._lazy import attach
+
+_EXPORTS = {
+    'create_api_provider': '.api.api_factory',
+    'BaseAPIProvider': '.api.base_api',
+    'DataManager': '.data.data_manager',
+    'DataCoordinator': '.data.data_coordinator',
+    'FrameManager': '.data.frame_manager',
+    'APIConfig': '.config.api_config',
+    'SamplingConfig': '.config.sampling_config',
+    'TextProcessingConfig': '.config.text_config',
+    'StorageAndLoggingConfig': '.config.storage_config',
+    'GraphConfig': '.config.graph_config',
+    'RetractionConfig': '.config.retraction_config',
+    'StoppingConfig': '.config.stopping_config',
+    'PipelineConfig': '.config.pipeline_config',
+    'SamplingOptions': '.config.sampling_config',
+    'TextOptions': '.config.text_config',
+    'StorageAndLoggingOptions': '.config.storage_config',
+    'GraphOptions': '.config.graph_config',
+    'RetractionOptions': '.config.retraction_config',
+    'StoppingOptions': '.config.stopping_config',
+    'TextAnalysisManager': '.text_processing.text_analyzer',
+    'Sampler': '.sampling.sampler',
+    'Crawler': '.crawler',
+    'CrawlControl': '.crawl_control',
+    'CrawlCancelled': '.crawl_control',
+    'GraphManager': '.graph.graph_manager',
+    'GraphProcessing': '.graph.graph_processing',
+    'PDFProcessor': '.pdf_processing.pdf_processor',
+    'PDFMetadataExtractor': '.pdf_processing.metadata_extractor',
+    'APIMetadataMatcher': '.pdf_processing.api_matcher',
+    'DockerManager': '.pdf_processing.docker_manager',
+    'PDFMetadata': '.pdf_processing.models',
+    'PDFProcessingResult': '.pdf_processing.models',
+    'APIMatchResult': '.pdf_processing.models',
+    'CrawlerLogger': '.LogManager.crawler_logger',
+    'DataStorage': '.DataManagement.data_storage',
+    'RetractionWatchManager': '.papervalidation.retraction_watch_manager',
+    'AuthorInvestigation': '.usecases.author_investigation',
+    'TitleSimilarityEngine': '.usecases.title_similarity_usecase',
+    'PaperRecommender': '.usecases.recommender',
+    'RecommenderEmbeddingModel': '.usecases.recommender',
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
 
 __all__ = [
     'create_api_provider',
@@ -40,9 +61,12 @@ __all__ = [
     'GraphConfig',
     'RetractionConfig',
     'StoppingConfig',
+    'PipelineConfig',
     'TextAnalysisManager',
     'Sampler',
     'Crawler',
+    'CrawlControl',
+    'CrawlCancelled',
     'GraphManager',
     'GraphProcessing',
     'PDFProcessor',
@@ -65,4 +89,4 @@ __all__ = [
     'TitleSimilarityEngine',
     'PaperRecommender',
     'RecommenderEmbeddingModel'
-]
\ No newline at end of file
+]
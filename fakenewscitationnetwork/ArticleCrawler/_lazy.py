@@ -0,0 +1,27 @@
+"""Deferred attribute loading for package ``__init__`` modules (PEP 562)."""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def attach(package_name: str, exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Return ``__getattr__``/``__dir__`` hooks that import exports on first access.
+
+    ``exports`` maps each public name to the (relative) module defining it. The
+    first lookup imports that module and stores the value on the package, so
+    later accesses are plain attribute reads.
+    """
+
+    def __getattr__(name: str) -> object:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package_name), name)
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
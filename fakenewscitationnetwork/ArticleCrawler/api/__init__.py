@@ -1,12 +1,35 @@
-from .base_api import BaseAPIProvider
-from .semantic_scholar_api import SemanticScholarAPIProvider
-from .openalex_api import OpenAlexAPIProvider
-from .api_factory import create_api_provider, get_available_providers
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(__name__, {
+    'BaseAPIProvider': '.base_api',
+    'SemanticScholarAPIProvider': '.semantic_scholar_api',
+    'OpenAlexAPIProvider': '.openalex_api',
+    'create_api_provider': '.api_factory',
+    'get_available_providers': '.api_factory',
+    'OpenAlexDOIResolver': '.doi_resolver',
+    'PaperRecord': '.paper_records',
+    'AuthorRecord': '.paper_records',
+    'HttpTransport': '.http_transport',
+    'HttpTransportConfig': '.http_transport',
+    'get_http_transport': '.http_transport',
+    'configure_http_transport': '.http_transport',
+    'close_http_transport': '.http_transport',
+    'http_session': '.http_transport',
+})
 
 __all__ = [
     'BaseAPIProvider',
     'SemanticScholarAPIProvider', 
     'OpenAlexAPIProvider',
     'create_api_provider',
-    'get_available_providers'
-]
\ No newline at end of file
+    'get_available_providers',
+    'OpenAlexDOIResolver',
+    'PaperRecord',
+    'AuthorRecord',
+    'HttpTransport',
+    'HttpTransportConfig',
+    'get_http_transport',
+    'configure_http_transport',
+    'close_http_transport',
+    'http_session',
+]
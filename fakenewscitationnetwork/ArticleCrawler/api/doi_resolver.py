@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+
+_DOI_PREFIXES = (
+    'https://doi.org/',
+    'http://doi.org/',
+    'https://dx.doi.org/',
+    'http://dx.doi.org/',
+    'doi:',
+)
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Return ``doi`` lowercased and stripped of URL/``doi:`` prefixes, or None if empty."""
+    if not doi:
+        return None
+    value = doi.strip().lower()
+    for prefix in _DOI_PREFIXES:
+        if value.startswith(prefix):
+            value = value[len(prefix):]
+            break
+    return value or None
+
+
+class OpenAlexDOIResolver:
+    """
+    Resolve many DOIs against OpenAlex with ``doi:`` OR-filters.
+
+    DOIs are grouped into batches of up to 50 (the OpenAlex limit for OR
+    filters) and the batches are fetched from a small thread pool sharing one
+    rate limit, so a few hundred DOIs resolve in a handful of requests.
+    """
+
+    MAX_BATCH_SIZE = 50
+    SELECT_FIELDS = ['id', 'doi', 'title']
+
+    def __init__(
+        self,
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 3,
+        min_delay: float = 0.1,
+        max_retries: int = 3,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+        self.max_workers = max(1, max_workers)
+        self.min_delay = min_delay
+        self.max_retries = max_retries
+        self.logger = logger or logging.getLogger(__name__)
+        self.last_request_time = 0.0
+        self._rate_lock = threading.Lock()
+
+    def resolve(self, dois: Iterable[Optional[str]]) -> Dict[str, Optional[Dict]]:
+        """
+        Look up ``dois`` in batches.
+
+        Returns:
+            Mapping of every queried DOI (normalized) to its OpenAlex work, or None
+            when OpenAlex has no record. DOIs that cannot be expressed in an OR
+            filter, or whose batch kept failing, are left out so callers can fall
+            back to per-item lookups.
+        """
+        unique: List[str] = []
+        seen = set()
+        for doi in dois:
+            key = normalize_doi(doi)
+            # ',' and '|' are filter separators, so such DOIs cannot be batched.
+            if key and key not in seen and ',' not in key and '|' not in key:
+                seen.add(key)
+                unique.append(key)
+        if not unique:
+            return {}
+
+        batches = [unique[i:i + self.batch_size] for i in range(0, len(unique), self.batch_size)]
+        resolved: Dict[str, Optional[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            for batch_result in pool.map(self._fetch_batch, batches):
+                resolved.update(batch_result)
+
+        found = sum(1 for work in resolved.values() if work)
+        self.logger.info(
+            f"Resolved {found}/{len(unique)} DOIs in {len(batches)} batched request(s)"
+        )
+        return resolved
+
+    def _fetch_batch(self, batch: List[str]) -> Dict[str, Optional[Dict]]:
+        from pyalex import Works
+
+        for attempt in range(self.max_retries):
+            try:
+                self._rate_limit()
+                works = Works().filter(doi='|'.join(batch)).select(self.SELECT_FIELDS).get(per_page=len(batch))
+            except Exception as e:
+                error_str = str(e)
+                if ('429' in error_str or 'too many' in error_str.lower()) and attempt < self.max_retries - 1:
+                    wait_time = (2 ** attempt) * 2
+                    self.logger.warning(
+                        f"Rate limited on DOI batch (attempt {attempt + 1}/{self.max_retries}), waiting {wait_time}s"
+                    )
+                    time.sleep(wait_time)
+                    continue
+                self.logger.warning(f"DOI batch of {len(batch)} failed: {e}")
+                return {}
+
+            result: Dict[str, Optional[Dict]] = dict.fromkeys(batch)
+            for work in works or []:
+                key = normalize_doi(work.get('doi'))
+                if key in result and result[key] is None:
+                    result[key] = work
+            return result
+        return {}
+
+    def _rate_limit(self):
+        """Space request starts by ``min_delay`` across all worker threads."""
+        with self._rate_lock:
+            now = time.time()
+            wait = self.last_request_time + self.min_delay - now
+            self.last_request_time = now + max(wait, 0.0)
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,333 @@
+"""
+Process-wide HTTP transport shared by all outbound API clients.
+
+One pooled ``httpx.Client`` keeps connections alive across requests, providers
+and jobs (HTTP/2 when the ``h2`` package is installed), with a connection
+limit per host and a common timeout and retry policy. Code written against
+``requests`` (pyalex, the Semantic Scholar lookups, the Retraction Watch
+download) uses it through ``HttpTransport.session()``, a ``requests.Session``
+whose adapter sends through the pooled client.
+
+The transport is created lazily per process from ``HTTP_*`` environment
+variables (see ``HttpTransportConfig.from_env``); ``configure_http_transport``
+replaces it, e.g. with application settings. A process forked after the
+transport was created builds its own instead of sharing sockets with its
+parent.
+"""
+
+import importlib.util
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ..LogManager.crawl_metrics import ApiCallStats
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+@dataclass
+class HttpTransportConfig:
+    """
+    Pool, timeout and retry settings of the shared transport.
+
+    Attributes:
+        timeout: Read/write/pool timeout in seconds for requests that set none
+        connect_timeout: Connect timeout in seconds for requests that set none
+        max_connections: Open connections across all hosts
+        max_connections_per_host: Requests in flight per host; further requests wait
+        max_keepalive_connections: Idle connections kept open for reuse
+        keepalive_expiry: Seconds an idle connection stays open
+        retries: Retries of idempotent requests after a connection error or a retryable status
+        backoff_factor: Retry delays are ``backoff_factor * 2 ** attempt`` seconds
+        retry_statuses: Statuses retried (``Retry-After`` is honoured, up to ``max_retry_wait``)
+        max_retry_wait: Upper bound in seconds of a single retry delay
+        http2: Negotiate HTTP/2; None enables it when ``h2`` is installed
+    """
+    timeout: float = 60.0
+    connect_timeout: float = 10.0
+    max_connections: int = 100
+    max_connections_per_host: int = 10
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    retries: int = 2
+    backoff_factor: float = 0.5
+    retry_statuses: Tuple[int, ...] = (429, 502, 503, 504)
+    max_retry_wait: float = 30.0
+    http2: Optional[bool] = None
+
+    @classmethod
+    def from_env(cls) -> 'HttpTransportConfig':
+        """Build a config from ``HTTP_*`` environment variables, defaulting the rest."""
+        config = cls()
+        for name, field_type in (
+            ('timeout', float), ('connect_timeout', float), ('max_connections', int),
+            ('max_connections_per_host', int), ('max_keepalive_connections', int),
+            ('keepalive_expiry', float), ('retries', int), ('backoff_factor', float),
+        ):
+            value = os.getenv(f'HTTP_{name.upper()}')
+            if value:
+                setattr(config, name, field_type(value))
+        http2 = os.getenv('HTTP_HTTP2')
+        if http2:
+            config.http2 = http2.strip().lower() in ('1', 'true', 'yes', 'on')
+        return config
+
+    @property
+    def use_http2(self) -> bool:
+        if self.http2 is None:
+            return importlib.util.find_spec('h2') is not None
+        return self.http2
+
+
+class HttpTransport:
+    """Pooled ``httpx.Client`` plus the ``requests`` adapter that sends through it."""
+
+    def __init__(self, config: Optional[HttpTransportConfig] = None,
+                 transport: Optional[httpx.BaseTransport] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            config: Pool, timeout and retry settings (default: ``HttpTransportConfig.from_env()``)
+            transport: httpx transport to send through (default: a pooled ``httpx.HTTPTransport``)
+            logger: Logger instance
+        """
+        self.config = config or HttpTransportConfig.from_env()
+        self.logger = logger or logging.getLogger(__name__)
+        self.pid = os.getpid()
+        self.http2 = self.config.use_http2
+        if self.http2 and importlib.util.find_spec('h2') is None:
+            self.logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+            self.http2 = False
+        self.client = httpx.Client(
+            http2=self.http2,
+            transport=transport,
+            timeout=httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+            # requests resolves redirects itself, so the adapter must see them.
+            follow_redirects=False,
+        )
+        self.adapter = HttpxAdapter(self)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_stats: Dict[str, ApiCallStats] = {}
+        self._lock = threading.Lock()
+        self.logger.debug("HTTP transport ready (http2=%s, %s connections per host)",
+                          self.http2, self.config.max_connections_per_host)
+
+    def session(self) -> requests.Session:
+        """
+        A ``requests.Session`` sending through the shared pool.
+
+        Sessions are cheap; give each consumer its own so hooks or headers set
+        on one never leak into another.
+        """
+        session = requests.Session()
+        session.mount('https://', self.adapter)
+        session.mount('http://', self.adapter)
+        return session
+
+    def host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.config.max_connections_per_host)
+            return slot
+
+    def host_stats(self, host: str) -> ApiCallStats:
+        with self._lock:
+            stats = self._host_stats.get(host)
+            if stats is None:
+                stats = self._host_stats[host] = ApiCallStats()
+            return stats
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Requests, retries and bytes received per host since the transport was created."""
+        with self._lock:
+            hosts = dict(self._host_stats)
+        return {host: stats.as_dict() for host, stats in hosts.items()}
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class HttpxAdapter(BaseAdapter):
+    """``requests`` transport adapter that sends through ``HttpTransport.client``.
+
+    Per-request ``verify``, ``cert`` and ``proxies`` are not applied: TLS and
+    proxy settings belong to the shared client (which honours the usual proxy
+    environment variables).
+    """
+
+    def __init__(self, transport: HttpTransport):
+        super().__init__()
+        self.transport = transport
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        config = self.transport.config
+        host = httpx.URL(request.url).host
+        stats = self.transport.host_stats(host)
+        retries = config.retries if request.method in IDEMPOTENT_METHODS else 0
+        outgoing = self.transport.client.build_request(
+            request.method,
+            request.url,
+            headers=dict(request.headers),
+            content=request.body.encode('utf-8') if isinstance(request.body, str) else request.body,
+            timeout=self._timeout(timeout),
+        )
+
+        attempt = 0
+        while True:
+            stats.record_request()
+            try:
+                with self.transport.host_slot(host):
+                    response = self.transport.client.send(outgoing)
+                    response.read()
+            except httpx.TransportError as exc:
+                if attempt >= retries:
+                    raise self._requests_error(exc, request) from exc
+                delay = config.backoff_factor * 2 ** attempt
+            else:
+                if response.status_code not in config.retry_statuses or attempt >= retries:
+                    stats.record_bytes(len(response.content))
+                    return self._build_response(request, response)
+                delay = self._retry_after(response) or config.backoff_factor * 2 ** attempt
+            stats.record_retry()
+            attempt += 1
+            time.sleep(min(delay, config.max_retry_wait))
+
+    def close(self):
+        # The pool outlives any one session; HttpTransport.close() releases it.
+        pass
+
+    def __reduce__(self):
+        # Sessions are pickled along with the objects holding them (crawler
+        # checkpoints); they reattach to the transport of the loading process.
+        return _shared_adapter, ()
+
+    def _timeout(self, timeout) -> httpx.Timeout:
+        config = self.transport.config
+        if timeout is None:
+            return httpx.Timeout(config.timeout, connect=config.connect_timeout)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _build_response(self, request, source: httpx.Response) -> requests.Response:
+        response = requests.Response()
+        response.status_code = source.status_code
+        response.reason = source.reason_phrase
+        response.headers = CaseInsensitiveDict(source.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = source.content
+        response._content_consumed = True
+        return response
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _requests_error(exc: httpx.TransportError, request) -> requests.RequestException:
+        if isinstance(exc, httpx.ConnectTimeout):
+            return requests.ConnectTimeout(str(exc), request=request)
+        if isinstance(exc, httpx.TimeoutException):
+            return requests.ReadTimeout(str(exc), request=request)
+        if isinstance(exc, (httpx.ConnectError, httpx.RemoteProtocolError)):
+            return requests.ConnectionError(str(exc), request=request)
+        return requests.RequestException(str(exc), request=request)
+
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+_pyalex_hook_missing = False
+
+
+def get_http_transport() -> HttpTransport:
+    """The process-wide transport, created on first use."""
+    global _transport
+    transport = _transport
+    if transport is not None and transport.pid == os.getpid():
+        return transport
+    with _transport_lock:
+        if _transport is None or _transport.pid != os.getpid():
+            _transport = HttpTransport()
+        return _transport
+
+
+def configure_http_transport(config: Optional[HttpTransportConfig] = None,
+                             transport: Optional[httpx.BaseTransport] = None) -> HttpTransport:
+    """Replace the process-wide transport (closing the previous one) and return it."""
+    global _transport
+    with _transport_lock:
+        previous, _transport = _transport, HttpTransport(config, transport=transport)
+    if previous is not None and previous.pid == os.getpid():
+        previous.close()
+    return _transport
+
+
+def close_http_transport() -> None:
+    """Close the process-wide transport; the next use creates a new one."""
+    global _transport
+    with _transport_lock:
+        previous, _transport = _transport, None
+    if previous is not None and previous.pid == os.getpid():
+        previous.close()
+
+
+def _shared_adapter() -> HttpxAdapter:
+    return get_http_transport().adapter
+
+
+def http_session() -> requests.Session:
+    """Shortcut for ``get_http_transport().session()``."""
+    return get_http_transport().session()
+
+
+def install_pyalex_session() -> None:
+    """Make pyalex send its requests through the shared transport.
+
+    pyalex otherwise builds a new ``requests.Session`` (and connection) for
+    every query and every paginator. Its own retry settings are replaced by
+    the transport's policy. The hook is private to pyalex (the version is
+    pinned in requirements); if a release drops it, pyalex keeps its own
+    sessions and a warning is logged once.
+    """
+    global _pyalex_hook_missing
+    import pyalex.api
+
+    if not hasattr(pyalex.api, '_get_requests_session'):
+        if not _pyalex_hook_missing:
+            _pyalex_hook_missing = True
+            logging.getLogger(__name__).warning(
+                "pyalex %s has no _get_requests_session; its requests bypass the shared HTTP transport",
+                getattr(pyalex, '__version__', '?'),
+            )
+        return
+    pyalex.api._get_requests_session = http_session
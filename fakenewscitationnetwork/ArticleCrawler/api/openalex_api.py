@@ -1,29 +1,86 @@
 import logging
 import os
+import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pyalex
-import requests
 from dotenv import load_dotenv
 from pyalex import Authors, Works, Sources
 
 from ..library.models import PaperData, AuthorInfo
+from ..LogManager.crawl_metrics import ApiCallStats
 from .base_api import BaseAPIProvider
+from .http_transport import http_session, install_pyalex_session
+from .paper_records import AuthorRecord, PaperRecord
+
+# A provider may live as long as the process (the backend shares one per
+# name), so its bookkeeping is bounded: failed/inconsistent IDs keep the most
+# recent entries and venue lookups are cached least-recently-used.
+MAX_TRACKED_PAPER_IDS = 10_000
+VENUE_LOOKUP_CACHE_SIZE = 4_096
+
+
+def reconstruct_abstract(inverted_index: Optional[Dict[str, List[int]]]) -> Optional[str]:
+    """
+    Rebuild abstract text from an OpenAlex ``abstract_inverted_index``.
+
+    Words are written into a list preallocated to the number of positions
+    (sized by the largest position if positions have gaps) and joined once.
+
+    Returns:
+        The abstract, or None when the index is missing or empty
+    """
+    if not inverted_index or not isinstance(inverted_index, dict):
+        return None
+    try:
+        try:
+            tokens = [None] * sum(map(len, inverted_index.values()))
+            for word, positions in inverted_index.items():
+                for pos in positions:
+                    tokens[pos] = word
+        except IndexError:
+            tokens = [None] * (max(max(positions) for positions in inverted_index.values() if positions) + 1)
+            for word, positions in inverted_index.items():
+                for pos in positions:
+                    tokens[pos] = word
+        if None in tokens:
+            tokens = [token for token in tokens if token is not None]
+        text = ' '.join(tokens).strip()
+    except (TypeError, ValueError):
+        return None
+    return text or None
+
+
+def reconstruct_abstracts(works: Iterable[Dict]) -> List[Optional[str]]:
+    """Abstract of each work, reconstructed from its inverted index unless already present."""
+    return [work.get('abstract') or reconstruct_abstract(work.get('abstract_inverted_index')) for work in works]
+
 
 class OpenAlexAPIProvider(BaseAPIProvider):
     
-    def __init__(self, wait=None, retries=3, logger=None):
+    def __init__(self, wait=None, retries=3, logger=None, email=None, requests_per_second=2):
+        """
+        Args:
+            wait: Unused; kept for the common provider signature
+            retries: Retries per request
+            logger: Logger instance
+            email: Contact address for the polite pool (defaults to OPENALEX_EMAIL)
+            requests_per_second: Request pacing; 0 or None disables it (offline stand-ins)
+        """
         load_dotenv()
-        email = os.getenv('OPENALEX_EMAIL')
+        email = email or os.getenv('OPENALEX_EMAIL')
         if not email:
             raise ValueError("OPENALEX_EMAIL must be set in .env file")
         
         pyalex.config.email = email
+        install_pyalex_session()
         
-        self.requests_per_second = 2
-        self.min_delay = 1.0 / self.requests_per_second
+        self.requests_per_second = requests_per_second
+        self.min_delay = 1.0 / requests_per_second if requests_per_second else 0.0
         self.last_request_time = 0
+        self._rate_lock = threading.Lock()
         
         self.retries = retries
         self._failed_paper_ids = []
@@ -31,9 +88,11 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         self.logger = logger or logging.getLogger(__name__)
         self._api_base_url = "https://api.openalex.org"
         self._mailto = email
-        self._venue_lookup_cache: Dict[str, Optional[str]] = {}
+        self._venue_lookup_cache: 'OrderedDict[str, Optional[str]]' = OrderedDict()
+        self.call_stats = ApiCallStats()
+        self._session = http_session()
 
-        self.logger.info("OpenAlex API initialized with rate limiting at 2 req/sec")
+        self.logger.info("OpenAlex API initialized with rate limiting at %s req/sec", requests_per_second or "unlimited")
 
     @property
     def failed_paper_ids(self) -> List[str]:
@@ -44,10 +103,51 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         return self._inconsistent_api_response_paper_ids
 
     def _rate_limit(self):
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
-        self.last_request_time = time.time()
+        """Enforce request pacing (safe to call from several threads)."""
+        self.call_stats.record_request()
+        if not self.min_delay:
+            return
+        with self._rate_lock:
+            now = time.time()
+            wait = self.last_request_time + self.min_delay - now
+            self.last_request_time = now + max(wait, 0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _record_failed(self, paper_id: str) -> None:
+        self._failed_paper_ids.append(paper_id)
+        if len(self._failed_paper_ids) > MAX_TRACKED_PAPER_IDS:
+            del self._failed_paper_ids[:-MAX_TRACKED_PAPER_IDS]
+
+    def _record_inconsistent(self, paper_id: str, returned_id: str) -> None:
+        self._inconsistent_api_response_paper_ids.append((paper_id, returned_id))
+        if len(self._inconsistent_api_response_paper_ids) > MAX_TRACKED_PAPER_IDS:
+            del self._inconsistent_api_response_paper_ids[:-MAX_TRACKED_PAPER_IDS]
+
+    def _cache_venue(self, key: str, venue_id: Optional[str]) -> None:
+        self._venue_lookup_cache[key] = venue_id
+        self._venue_lookup_cache.move_to_end(key)
+        while len(self._venue_lookup_cache) > VENUE_LOOKUP_CACHE_SIZE:
+            self._venue_lookup_cache.popitem(last=False)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_rate_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rate_lock = threading.Lock()
+        # Checkpoints written before the cache was bounded hold a plain dict.
+        self._venue_lookup_cache = OrderedDict(state.get('_venue_lookup_cache', {}))
+
+    def _track_response_bytes(self, pager) -> None:
+        """Count the bytes of the responses a pyalex paginator downloads."""
+        session = getattr(pager, '_session', None)
+        if session is not None:
+            session.hooks['response'].append(
+                lambda response, *args, **kwargs: self.call_stats.record_bytes(len(response.content))
+            )
 
     def _normalize_paper_id(self, paper_id: str) -> str:
         paper_id = paper_id.strip()
@@ -90,6 +190,7 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         if not key:
             return None
         if key in self._venue_lookup_cache:
+            self._venue_lookup_cache.move_to_end(key)
             return self._venue_lookup_cache[key]
         try:
             self._rate_limit()
@@ -98,11 +199,11 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                 first = results[0]
                 venue_id = first.get("id")
                 if venue_id:
-                    self._venue_lookup_cache[key] = venue_id
+                    self._cache_venue(key, venue_id)
                     return venue_id
         except Exception as exc:
             self.logger.warning("Unable to resolve venue id for %s: %s", venue_name, exc)
-        self._venue_lookup_cache[key] = None
+        self._cache_venue(key, None)
         return None
 
     def _fetch_paginated_works(
@@ -124,12 +225,13 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         for attempt in range(self.retries + 1):
             try:
                 self._rate_limit()
-                response = requests.get(
+                response = self._session.get(
                     f"{self._api_base_url}/works",
                     params=params,
                     timeout=60,
                 )
                 response.raise_for_status()
+                self.call_stats.record_bytes(len(response.content))
                 payload = response.json()
                 results = payload.get("results", [])
                 total = payload.get("meta", {}).get("count")
@@ -150,6 +252,7 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                     self.retries + 1,
                     exc,
                 )
+                self.call_stats.record_retry()
                 time.sleep(wait_time)
         return [], None
 
@@ -163,10 +266,11 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         works, total = self._fetch_paginated_works(filter_query, page, page_size)
         papers: List = []
         paper_ids: List[str] = []
-        for work in works:
+        for work, abstract in zip(works, reconstruct_abstracts(works)):
             try:
-                paper_dict = self._convert_openalex_to_s2_format(work)
-                papers.append(self._dict_to_object(paper_dict))
+                record = self._convert_openalex_to_record(work, include_abstract=False)
+                record.abstract = abstract
+                papers.append(record)
                 pid = self._clean_id(work.get("id", ""))
                 if pid:
                     paper_ids.append(pid)
@@ -189,20 +293,21 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                 requested_id = self._clean_id(paper_id).lstrip('W')
                 
                 if returned_id != f"W{requested_id}" and returned_id.lstrip('W') != requested_id:
-                    self._inconsistent_api_response_paper_ids.append((paper_id, returned_id))
+                    self._record_inconsistent(paper_id, returned_id)
                     self.logger.warning(f"ID mismatch: requested {paper_id}, got {returned_id}")
                 
                 s2_paper = self._convert_to_s2_format_with_enrichment(paper)
                 
-                time.sleep(0.5)
+                time.sleep(self.min_delay)
                 
                 return s2_paper
                 
             except Exception as e:
                 if attempt == self.retries:
-                    self._failed_paper_ids.append(paper_id)
+                    self._record_failed(paper_id)
                     self.logger.error(f"Failed to get paper {paper_id}: {e}")
                     return None
+                self.call_stats.record_retry()
                 time.sleep(2 ** attempt)
 
     def get_paper_metadata_only(self, paper_id: str) -> Optional[Dict]:
@@ -227,16 +332,17 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                 requested_id = self._clean_id(paper_id).lstrip('W')
                 
                 if returned_id != f"W{requested_id}" and returned_id.lstrip('W') != requested_id:
-                    self._inconsistent_api_response_paper_ids.append((paper_id, returned_id))
+                    self._record_inconsistent(paper_id, returned_id)
                     self.logger.warning(f"ID mismatch: requested {paper_id}, got {returned_id}")
                 
                 return work
                 
             except Exception as e:
                 if attempt == self.retries:
-                    self._failed_paper_ids.append(paper_id)
+                    self._record_failed(paper_id)
                     self.logger.error(f"Failed to get paper {paper_id}: {e}")
                     return None
+                self.call_stats.record_retry()
                 time.sleep(2 ** attempt)
         
         return None
@@ -285,10 +391,11 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                     if attempt == self.retries:
                         self.logger.error(f"Failed to fetch batch {i//batch_size + 1} after {self.retries + 1} attempts: {e}")
                         break
+                    self.call_stats.record_retry()
                     time.sleep(2 ** attempt)
             
             if i + batch_size < len(paper_ids):
-                time.sleep(0.5)
+                time.sleep(self.min_delay)
         
         self.logger.info(f"Total fetched: {len(all_works)}/{len(paper_ids)} papers")
         return all_works
@@ -367,9 +474,7 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         else:
             venue_id = None
         
-        abstract = work.get('abstract')
-        if not abstract and work.get('abstract_inverted_index'):
-            abstract = self._reconstruct_abstract(work['abstract_inverted_index'])
+        abstract = work.get('abstract') or reconstruct_abstract(work.get('abstract_inverted_index'))
         
         authors = []
         for authorship in work.get('authorships', []):
@@ -479,18 +584,7 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         Returns:
             Reconstructed abstract text
         """
-        if not inverted_index:
-            return ""
-        
-        max_pos = max(max(positions) for positions in inverted_index.values())
-        
-        words = [''] * (max_pos + 1)
-        
-        for word, positions in inverted_index.items():
-            for pos in positions:
-                words[pos] = word
-        
-        return ' '.join(words)
+        return reconstruct_abstract(inverted_index) or ""
 
     def get_papers(self, paper_id_list: List[str]):
         results = []
@@ -499,23 +593,21 @@ class OpenAlexAPIProvider(BaseAPIProvider):
             results.append(paper)
         return results
 
-    def _convert_to_s2_format_with_enrichment(self, openalex_work: Dict):
+    def _convert_to_s2_format_with_enrichment(self, openalex_work: Dict) -> PaperRecord:
         paper_id = self._clean_id(openalex_work['id'])
         
-        s2_paper = self._convert_openalex_to_s2_format(openalex_work)
+        record = self._convert_openalex_to_record(openalex_work)
         
         if openalex_work.get('referenced_works'):
             self.logger.info(f"Enriching {len(openalex_work['referenced_works'])} references for paper {paper_id}")
-            enriched_refs = self._get_references_with_metadata(openalex_work['referenced_works'])
-            s2_paper['references'] = enriched_refs
+            record.references = self._get_references_with_metadata(openalex_work['referenced_works'])
         
         self.logger.info(f"Fetching citations for paper {paper_id}")
-        citations = self._get_citations_for_paper(paper_id)
-        s2_paper['citations'] = citations
+        record.citations = self._get_citations_for_paper(paper_id)
         
-        return self._dict_to_object(s2_paper)
+        return record
 
-    def _get_references_with_metadata(self, reference_ids: List[str]) -> List[Dict]:
+    def _get_references_with_metadata(self, reference_ids: List[str]) -> List[PaperRecord]:
         if not reference_ids:
             return []
         
@@ -532,9 +624,10 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                     
                     batch_works = Works().filter(openalex_id='|'.join(clean_ids)).get()
                     
-                    for work in batch_works:
-                        ref_paper = self._convert_openalex_to_s2_format(work)
-                        enriched_refs.append(ref_paper)
+                    # Reference abstracts are never stored, so skip reconstructing them.
+                    enriched_refs.extend(
+                        self._convert_openalex_to_record(work, include_abstract=False) for work in batch_works
+                    )
                     
                     self.logger.info(f"Enriched batch {i//batch_size + 1}: {len(batch_works)} references")
                     
@@ -544,17 +637,18 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                     if "429" in str(e) and retry < 2:
                         wait_time = (2 ** retry) * 2
                         self.logger.warning(f"Rate limited on batch {i//batch_size + 1}, waiting {wait_time}s (retry {retry + 1}/3)")
+                        self.call_stats.record_retry()
                         time.sleep(wait_time)
                     else:
                         self.logger.error(f"Error enriching reference batch after {retry + 1} attempts: {e}")
                         break
             
             if i + batch_size < len(reference_ids):
-                time.sleep(0.5)
+                time.sleep(self.min_delay)
         
         return enriched_refs
 
-    def _get_citations_for_paper(self, paper_id: str) -> List[Dict]:
+    def _get_citations_for_paper(self, paper_id: str) -> List[PaperRecord]:
         for retry in range(3):
             try:
                 self._rate_limit()
@@ -562,6 +656,7 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                 
                 citing_works = []
                 pager = Works().filter(cites=clean_id).paginate(per_page=200)
+                self._track_response_bytes(pager)
                 
                 for page_num, page in enumerate(pager):
                     citing_works.extend(page)
@@ -571,7 +666,9 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                     
                     self._rate_limit()
                 
-                citations = [self._convert_openalex_to_s2_format(work) for work in citing_works]
+                citations = [
+                    self._convert_openalex_to_record(work, include_abstract=False) for work in citing_works
+                ]
                 self.logger.info(f"Retrieved {len(citations)} citations for paper {paper_id}")
                 return citations
                 
@@ -579,6 +676,7 @@ class OpenAlexAPIProvider(BaseAPIProvider):
                 if "429" in str(e) and retry < 2:
                     wait_time = (2 ** retry) * 2
                     self.logger.warning(f"Rate limited fetching citations for {paper_id}, waiting {wait_time}s (retry {retry + 1}/3)")
+                    self.call_stats.record_retry()
                     time.sleep(wait_time)
                 else:
                     self.logger.error(f"Error getting citations for {paper_id}: {e}")
@@ -608,13 +706,23 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         filter_query = f"primary_location.source.id:{normalized_id}"
         return self._get_paginated_entity_papers(filter_query, page=page, page_size=page_size)
 
-    def _convert_openalex_to_s2_format(self, openalex_work: Dict) -> Dict:
+    def _convert_openalex_to_s2_format(self, openalex_work: Dict, include_abstract: bool = True) -> Dict:
+        """Convert an OpenAlex work to an S2-style dict (see ``_convert_openalex_to_record``)."""
+        return self._convert_openalex_to_record(openalex_work, include_abstract=include_abstract).to_dict()
+
+    def _convert_openalex_to_record(self, openalex_work: Dict, include_abstract: bool = True) -> PaperRecord:
+        """
+        Convert an OpenAlex work to the ``PaperRecord`` used by the crawler.
+
+        ``include_abstract=False`` leaves ``abstract`` as None; used for citation
+        and reference stubs, whose abstracts are never stored.
+        """
         paper_id = self._clean_id(openalex_work['id'])
         
-        abstract = openalex_work.get('abstract')
-        if not abstract and openalex_work.get('abstract_inverted_index'):
-            abstract = self._reconstruct_abstract_from_inverted_index(
-                openalex_work['abstract_inverted_index']
+        abstract = None
+        if include_abstract:
+            abstract = openalex_work.get('abstract') or reconstruct_abstract(
+                openalex_work.get('abstract_inverted_index')
             )
         
         venue = self._extract_venue_with_fallbacks(openalex_work)
@@ -640,43 +748,25 @@ class OpenAlexAPIProvider(BaseAPIProvider):
             })
         hierarchy = self._extract_hierarchy_from_concepts(concepts)
         
-        return {
-            'paperId': paper_id,
-            'title': openalex_work.get('title', ''),
-            'abstract': abstract,
-            'venue': venue,
-            'venue_id': venue_id,
-            'year': openalex_work.get('publication_year'),
-            'doi': self._clean_doi(openalex_work.get('doi', '')),
-            'url': f"https://openalex.org/{paper_id}",
-            'concepts': concepts,
-            'topics': hierarchy.get('topics', []),
-            'subfields': hierarchy.get('subfields', []),
-            'fields': hierarchy.get('fields', []),
-            'domains': hierarchy.get('domains', []),
-            'authors': authors,
-            'references': [],
-            'citations': []
-        }
+        return PaperRecord(
+            paperId=paper_id,
+            title=openalex_work.get('title', ''),
+            abstract=abstract,
+            venue=venue,
+            venue_id=venue_id,
+            year=openalex_work.get('publication_year'),
+            doi=self._clean_doi(openalex_work.get('doi', '')),
+            url=f"https://openalex.org/{paper_id}",
+            concepts=concepts,
+            topics=hierarchy.get('topics', []),
+            subfields=hierarchy.get('subfields', []),
+            fields=hierarchy.get('fields', []),
+            domains=hierarchy.get('domains', []),
+            authors=authors,
+        )
 
     def _reconstruct_abstract_from_inverted_index(self, inverted_index):
-        if not inverted_index or not isinstance(inverted_index, dict):
-            return None
-        
-        try:
-            word_positions = []
-            for word, positions in inverted_index.items():
-                for pos in positions:
-                    word_positions.append((pos, word))
-            
-            word_positions.sort(key=lambda x: x[0])
-            abstract = ' '.join([word for pos, word in word_positions])
-            
-            return abstract.strip() if abstract.strip() else None
-            
-        except Exception as e:
-            self.logger.warning(f"Error reconstructing abstract: {e}")
-            return None
+        return reconstruct_abstract(inverted_index)
 
     def _extract_venue_with_fallbacks(self, work: Dict) -> str:
         if (work.get('primary_location') and 
@@ -696,14 +786,14 @@ class OpenAlexAPIProvider(BaseAPIProvider):
         
         return ''
 
-    def _convert_authorships_to_s2_authors(self, authorships: List[Dict]) -> List[Dict]:
+    def _convert_authorships_to_s2_authors(self, authorships: List[Dict]) -> List[AuthorRecord]:
         authors = []
         for authorship in authorships:
             author = authorship.get('author', {})
-            authors.append({
-                'authorId': self._clean_id(author.get('id', '')),
-                'name': author.get('display_name', '')
-            })
+            authors.append(AuthorRecord(
+                authorId=self._clean_id(author.get('id', '')),
+                name=author.get('display_name', '')
+            ))
         return authors
 
     def _clean_doi(self, doi: str) -> str:
@@ -711,18 +801,8 @@ class OpenAlexAPIProvider(BaseAPIProvider):
             return ''
         return doi.replace('https://doi.org/', '') if doi.startswith('https://doi.org/') else doi
 
-    def _dict_to_object(self, data: Dict):
-        class PaperObject:
-            def __init__(self, data_dict):
-                for key, value in data_dict.items():
-                    if isinstance(value, list) and value and isinstance(value[0], dict):
-                        setattr(self, key, [PaperObject(item) if isinstance(item, dict) else item for item in value])
-                    elif isinstance(value, dict):
-                        setattr(self, key, PaperObject(value))
-                    else:
-                        setattr(self, key, value)
-        
-        return PaperObject(data)
+    def _dict_to_object(self, data: Dict) -> PaperRecord:
+        return PaperRecord.from_dict(data)
 
     def get_failed_and_inconsistent_papers(self) -> Dict:
         return {
@@ -0,0 +1,67 @@
+"""
+Compact records for papers returned by API providers.
+
+``PaperRecord`` and ``AuthorRecord`` use ``__slots__`` so that the thousands of
+citation and reference stubs converted per crawled paper carry no per-instance
+``__dict__``. Field names follow the S2-style keys the data layer already uses
+(``paperId``, ``authors[].authorId`` ...), so records are read by attribute
+exactly like the dynamic objects they replace.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(slots=True)
+class AuthorRecord:
+    """Author of a paper (S2-style keys)."""
+    authorId: str
+    name: str = ''
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'authorId': self.authorId, 'name': self.name}
+
+
+@dataclass(slots=True)
+class PaperRecord:
+    """Paper metadata plus its (stub) references and citations."""
+    paperId: str
+    title: str = ''
+    abstract: Optional[str] = None
+    venue: str = ''
+    venue_id: Optional[str] = None
+    year: Optional[int] = None
+    doi: str = ''
+    url: str = ''
+    concepts: List[Dict[str, Any]] = field(default_factory=list)
+    topics: List[Dict[str, Any]] = field(default_factory=list)
+    subfields: List[Dict[str, Any]] = field(default_factory=list)
+    fields: List[Dict[str, Any]] = field(default_factory=list)
+    domains: List[Dict[str, Any]] = field(default_factory=list)
+    authors: List[AuthorRecord] = field(default_factory=list)
+    references: List['PaperRecord'] = field(default_factory=list)
+    citations: List['PaperRecord'] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form (authors, references and citations converted recursively)."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data['authors'] = [author.to_dict() for author in self.authors]
+        data['references'] = [ref.to_dict() for ref in self.references]
+        data['citations'] = [cit.to_dict() for cit in self.citations]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PaperRecord':
+        """Build a record from an S2-style dict; unknown keys are ignored."""
+        values = {name: data[name] for name in cls.__slots__ if name in data}
+        values['authors'] = [
+            author if isinstance(author, AuthorRecord) else AuthorRecord(author.get('authorId', ''), author.get('name', ''))
+            for author in data.get('authors') or []
+        ]
+        values['references'] = [_as_record(item) for item in data.get('references') or []]
+        values['citations'] = [_as_record(item) for item in data.get('citations') or []]
+        return cls(**values)
+
+
+def _as_record(item) -> PaperRecord:
+    return item if isinstance(item, PaperRecord) else PaperRecord.from_dict(item)
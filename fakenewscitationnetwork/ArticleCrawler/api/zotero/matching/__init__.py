@@ -4,6 +4,7 @@ from .strategies import (
     TitleMatchStrategy,
     OpenAlexTitleMatchStrategy,
     SemanticScholarTitleMatchStrategy,
+    LocalFirstTitleMatchStrategy,
     TitleSimilarityCalculator
 )
 
@@ -14,5 +15,6 @@ __all__ = [
     'TitleMatchStrategy',
     'OpenAlexTitleMatchStrategy',
     'SemanticScholarTitleMatchStrategy',
+    'LocalFirstTitleMatchStrategy',
     'TitleSimilarityCalculator',
 ]
\ No newline at end of file
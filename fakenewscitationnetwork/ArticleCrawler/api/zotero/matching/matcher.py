@@ -4,10 +4,20 @@ Single Responsibility: Coordinate matching process.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
 from ...base_api import BaseAPIProvider
-from .strategies import TitleMatchStrategy, OpenAlexTitleMatchStrategy, SemanticScholarTitleMatchStrategy, TitleSimilarityCalculator
+from ...doi_resolver import OpenAlexDOIResolver, normalize_doi
+from ...http_transport import http_session
+from .strategies import (
+    TitleMatchStrategy,
+    OpenAlexTitleMatchStrategy,
+    SemanticScholarTitleMatchStrategy,
+    LocalFirstTitleMatchStrategy,
+    TitleSimilarityCalculator,
+)
 import time
 
 
@@ -48,7 +58,10 @@ class ZoteroMatcher:
         self, 
         api_provider: BaseAPIProvider,
         title_strategy: Optional[TitleMatchStrategy] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        doi_resolver: Optional[OpenAlexDOIResolver] = None,
+        title_search_workers: int = 4,
+        local_index=None
     ):
         """
         Initialize matcher with API provider and optional strategy.
@@ -57,12 +70,15 @@ class ZoteroMatcher:
             api_provider: API provider for DOI lookups
             title_strategy: Optional custom title matching strategy
             logger: Optional logger instance
+            doi_resolver: Optional batch DOI resolver (OpenAlex only)
+            title_search_workers: Maximum concurrent title searches in match_items
+            local_index: Optional LocalTitleIndex consulted before remote title searches (OpenAlex only)
         """
         self.api = api_provider
         self.logger = logger or logging.getLogger(__name__)
+        api_type = self._detect_api_type()
         
         if title_strategy is None:
-            api_type = self._detect_api_type()
             if api_type == 'openalex':
                 self.title_strategy = OpenAlexTitleMatchStrategy()
             elif api_type == 'semantic_scholar':
@@ -72,10 +88,24 @@ class ZoteroMatcher:
         else:
             self.title_strategy = title_strategy
         
+        if local_index is not None and api_type == 'openalex':
+            self.title_strategy = LocalFirstTitleMatchStrategy(
+                local_index,
+                self.title_strategy,
+                min_local_similarity=self.MIN_AUTO_MATCH_SIMILARITY
+            )
+        
         self.similarity_calculator = TitleSimilarityCalculator()
         
+        if doi_resolver is None and api_type == 'openalex':
+            doi_resolver = OpenAlexDOIResolver(logger=self.logger)
+        self.doi_resolver = doi_resolver
+        self.title_search_workers = max(1, title_search_workers)
+        
         self.last_request_time = 0
         self.min_delay = 0.6
+        self._rate_lock = threading.Lock()
+        self._session = http_session()
     
     def _detect_api_type(self) -> str:
         """Detect which API provider is being used."""
@@ -88,28 +118,54 @@ class ZoteroMatcher:
             return 'unknown'
     
     def _rate_limit(self):
-        """Enforce rate limiting."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
-        self.last_request_time = time.time()
+        """Enforce rate limiting (safe to call from several threads)."""
+        with self._rate_lock:
+            now = time.time()
+            wait = self.last_request_time + self.min_delay - now
+            self.last_request_time = now + max(wait, 0)
+        if wait > 0:
+            time.sleep(wait)
     
     def match_items(self, items_metadata: List[Dict]) -> List[MatchResult]:
         """
         Match multiple Zotero items to paper IDs.
         
+        All DOIs are first resolved together through the batch resolver; only
+        items left unmatched are sent to title search, which runs on a bounded
+        thread pool.
+        
         Args:
             items_metadata: List of metadata dictionaries
             
         Returns:
-            List of MatchResult objects
+            List of MatchResult objects (same order as ``items_metadata``)
         """
-        results = []
+        results: List[Optional[MatchResult]] = [None] * len(items_metadata)
+        resolved = self._resolve_dois(items_metadata)
+        
+        leftovers = []
+        for index, metadata in enumerate(items_metadata):
+            doi_key = normalize_doi(metadata.get('doi'))
+            if doi_key in resolved:
+                work = resolved[doi_key]
+                paper_id = (work or {}).get('id', '').replace('https://openalex.org/', '')
+                if paper_id:
+                    results[index] = self._doi_match(metadata, paper_id)
+                    continue
+                leftovers.append((index, self._match_by_title))
+            else:
+                leftovers.append((index, self.match_single_item))
         
-        for i, metadata in enumerate(items_metadata, 1):
-            self.logger.info(f"Matching paper {i}/{len(items_metadata)}: {metadata['title'][:60]}...")
-            result = self.match_single_item(metadata)
-            results.append(result)
+        if leftovers:
+            self.logger.info(f"Searching {len(leftovers)}/{len(items_metadata)} Zotero items by title")
+            workers = min(self.title_search_workers, len(leftovers))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    (index, pool.submit(match, items_metadata[index]))
+                    for index, match in leftovers
+                ]
+                for index, future in futures:
+                    results[index] = future.result()
         
         matched_count = sum(1 for r in results if r.matched)
         self.logger.info(f"Matched {matched_count}/{len(results)} Zotero items")
@@ -137,6 +193,30 @@ class ZoteroMatcher:
         
         return self._match_by_title(metadata)
     
+    def _resolve_dois(self, items_metadata: List[Dict]) -> Dict[str, Optional[Dict]]:
+        """Batch-resolve all DOIs; an empty result sends every item down the single-item path."""
+        if self.doi_resolver is None:
+            return {}
+        dois = [metadata.get('doi') for metadata in items_metadata if metadata.get('doi')]
+        if not dois:
+            return {}
+        try:
+            return self.doi_resolver.resolve(dois)
+        except Exception as e:
+            self.logger.warning(f"Batch DOI resolution failed, falling back to per-item lookups: {e}")
+            return {}
+    
+    def _doi_match(self, metadata: Dict, paper_id: str) -> MatchResult:
+        self.logger.info(f"DOI match: {metadata['doi']} -> {paper_id}")
+        return MatchResult(
+            zotero_key=metadata['zotero_key'],
+            title=metadata['title'],
+            matched=True,
+            paper_id=paper_id,
+            confidence=1.0,
+            match_method='doi'
+        )
+    
     def _match_by_doi(self, metadata: Dict) -> MatchResult:
         """Match by DOI lookup."""
         doi = metadata['doi']
@@ -168,11 +248,10 @@ class ZoteroMatcher:
                         )
             
             elif api_type == 'semantic_scholar':
-                import requests
                 url = f"https://api.semanticscholar.org/graph/v1/paper/DOI:{doi}"
                 params = {'fields': 'paperId,title'}
                 
-                response = requests.get(url, params=params, timeout=10)
+                response = self._session.get(url, params=params, timeout=10)
                 
                 if response.status_code == 200:
                     paper = response.json()
@@ -218,10 +297,11 @@ class ZoteroMatcher:
             candidates = []
             best_similarity = 0.0
             auto_match = None
+            similarities = self.similarity_calculator.calculate_many(
+                title, [result['title'] for result in search_results]
+            )
             
-            for result in search_results:
-                similarity = self.similarity_calculator.calculate(title, result['title'])
-                
+            for result, similarity in zip(search_results, similarities):
                 if similarity >= self.MIN_CANDIDATE_SIMILARITY:
                     candidate = MatchCandidate(
                         paper_id=result['paper_id'],
@@ -4,13 +4,21 @@ Strategy Pattern for different matching approaches.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
+import threading
 import time
 from difflib import SequenceMatcher
 import re
 
+from ArticleCrawler.api.http_transport import http_session, install_pyalex_session
 from ArticleCrawler.normalization import normalize_venue
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - falls back to difflib
+    fuzz = None
+    process = None
+
 class TitleMatchStrategy(ABC):
     """Abstract base for title matching strategies."""
     
@@ -31,13 +39,17 @@ class OpenAlexTitleMatchStrategy(TitleMatchStrategy):
     def __init__(self):
         self.last_request_time = 0
         self.min_delay = 0.6
+        self._rate_lock = threading.Lock()
+        install_pyalex_session()
     
     def _rate_limit(self):
-        """Enforce rate limiting."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
-        self.last_request_time = time.time()
+        """Enforce rate limiting (safe to call from several threads)."""
+        with self._rate_lock:
+            now = time.time()
+            wait = self.last_request_time + self.min_delay - now
+            self.last_request_time = now + max(wait, 0)
+        if wait > 0:
+            time.sleep(wait)
     
     def search(self, title: str, max_results: int = 10) -> List[Dict]:
         """Search OpenAlex for papers by title."""
@@ -90,18 +102,20 @@ class SemanticScholarTitleMatchStrategy(TitleMatchStrategy):
     def __init__(self):
         self.last_request_time = 0
         self.min_delay = 0.6
+        self._rate_lock = threading.Lock()
+        self._session = http_session()
     
     def _rate_limit(self):
-        """Enforce rate limiting."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_delay:
-            time.sleep(self.min_delay - elapsed)
-        self.last_request_time = time.time()
+        """Enforce rate limiting (safe to call from several threads)."""
+        with self._rate_lock:
+            now = time.time()
+            wait = self.last_request_time + self.min_delay - now
+            self.last_request_time = now + max(wait, 0)
+        if wait > 0:
+            time.sleep(wait)
     
     def search(self, title: str, max_results: int = 10) -> List[Dict]:
         """Search Semantic Scholar for papers by title."""
-        import requests
-        
         self._rate_limit()
         
         url = "https://api.semanticscholar.org/graph/v1/paper/search"
@@ -111,7 +125,7 @@ class SemanticScholarTitleMatchStrategy(TitleMatchStrategy):
             'fields': 'paperId,title,year,venue'
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = self._session.get(url, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
@@ -137,6 +151,27 @@ class SemanticScholarTitleMatchStrategy(TitleMatchStrategy):
         return results
 
 
+class LocalFirstTitleMatchStrategy(TitleMatchStrategy):
+    """
+    Consult a local title index before falling back to a remote strategy.
+    
+    The remote search only runs when no local paper reaches
+    ``min_local_similarity``.
+    """
+    
+    def __init__(self, local_index, remote_strategy: TitleMatchStrategy, min_local_similarity: float = 0.85):
+        self.local_index = local_index
+        self.remote_strategy = remote_strategy
+        self.min_local_similarity = min_local_similarity
+    
+    def search(self, title: str, max_results: int = 10) -> List[Dict]:
+        """Return local hits when one is good enough, else the remote results."""
+        local_results = self.local_index.search(title, max_results=max_results)
+        if local_results and local_results[0]['similarity'] >= self.min_local_similarity:
+            return local_results
+        return self.remote_strategy.search(title, max_results=max_results)
+
+
 class TitleSimilarityCalculator:
     """Calculates similarity between titles."""
     
@@ -154,8 +189,31 @@ class TitleSimilarityCalculator:
         norm1 = TitleSimilarityCalculator._normalize(title1)
         norm2 = TitleSimilarityCalculator._normalize(title2)
         
+        if fuzz is not None:
+            return fuzz.ratio(norm1, norm2) / 100.0
         return SequenceMatcher(None, norm1, norm2).ratio()
     
+    @staticmethod
+    def calculate_many(title: str, candidates: Sequence[Optional[str]]) -> List[float]:
+        """
+        Score ``title`` against every candidate title in one vectorized pass.
+        
+        Returns:
+            Similarity scores between 0 and 1, aligned with ``candidates``
+        """
+        if not title or not candidates:
+            return [0.0] * len(candidates)
+        if process is None:
+            return [TitleSimilarityCalculator.calculate(title, candidate) for candidate in candidates]
+        
+        query = TitleSimilarityCalculator._normalize(title)
+        normalized = [TitleSimilarityCalculator._normalize(c) if c else "" for c in candidates]
+        scores = process.cdist([query], normalized, scorer=fuzz.ratio, workers=1)[0]
+        return [
+            float(score) / 100.0 if candidate else 0.0
+            for score, candidate in zip(scores, normalized)
+        ]
+    
     @staticmethod
     def _normalize(title: str) -> str:
         """Normalize title for comparison."""
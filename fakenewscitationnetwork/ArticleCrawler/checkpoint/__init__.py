@@ -1,3 +1,3 @@
-from .manager import CheckpointManager, ResumeState
+from .manager import CheckpointManager, CheckpointSnapshot, ResumeState
 
-__all__ = ["CheckpointManager", "ResumeState"]
+__all__ = ["CheckpointManager", "CheckpointSnapshot", "ResumeState"]
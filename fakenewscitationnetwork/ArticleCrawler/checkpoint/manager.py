@@ -29,6 +29,17 @@ class ResumeState:
     sampler_flags: Dict[str, object] = field(default_factory=dict)
 
 
+@dataclass
+class CheckpointSnapshot:
+    """Crawler state copied at the end of an iteration, ready to be written."""
+
+    iteration: int
+    total_papers: int
+    max_iterations: int
+    frames: Dict[str, Optional[pd.DataFrame]]
+    sampler_flags: Dict[str, bool] = field(default_factory=dict)
+
+
 class CheckpointManager:
     """
     Handle checkpoint persistence for ArticleCrawler runs.
@@ -73,7 +84,7 @@ class CheckpointManager:
         except Exception:
             self._logger.warning("Unable to create checkpoint root at %s", self._root, exc_info=True)
 
-    def save(self, crawler, iteration_idx: int, total_papers: Optional[int] = None) -> None:
+    def save(self, crawler, iteration_idx: int, total_papers: Optional[int] = None, writer=None) -> None:
         """
         Persist the crawler state after an iteration completes.
 
@@ -81,45 +92,82 @@ class CheckpointManager:
             crawler: Active crawler instance
             iteration_idx: Iteration count that has just completed
             total_papers: Optional explicit paper count
+            writer: Optional BackgroundWriter; the state is copied now and written by it
         """
         if not self._root.exists():
             # Storage config might not allow writing; skip silently.
             return
+        try:
+            snapshot = self.snapshot(crawler, iteration_idx, total_papers)
+        except Exception:
+            self._logger.error("Failed to save checkpoint at iteration %s", iteration_idx, exc_info=True)
+            return
+        if writer is not None:
+            writer.submit(self.save_snapshot, snapshot)
+        else:
+            self.save_snapshot(snapshot)
+
+    def snapshot(self, crawler, iteration_idx: int, total_papers: Optional[int] = None) -> CheckpointSnapshot:
+        """
+        Copy the state ``save`` persists, so it can be written while the crawl goes on.
 
+        Args:
+            crawler: Active crawler instance
+            iteration_idx: Iteration count that has just completed
+            total_papers: Optional explicit paper count
+        """
+        frames = crawler.data_coordinator.frames
         total = total_papers
         if total is None:
-            total = getattr(crawler.data_coordinator.frames, "df_paper_metadata", pd.DataFrame()).shape[0]
+            total = getattr(frames, "df_paper_metadata", pd.DataFrame()).shape[0]
+
+        copied = {}
+        for attr in self._FRAME_ARTIFACTS:
+            dataframe = getattr(frames, attr, None)
+            copied[attr] = None if dataframe is None else self._normalize_frame(attr, dataframe)
+
+        return CheckpointSnapshot(
+            iteration=int(iteration_idx),
+            total_papers=int(total),
+            max_iterations=int(getattr(crawler.stopping_config, "max_iter", 0)),
+            frames=copied,
+            sampler_flags={
+                "no_papers_available": bool(getattr(crawler.sampler, "no_papers_available", False)),
+                "data_retrieval_empty": bool(getattr(crawler.data_coordinator, "no_papers_retrieved", False)),
+            },
+        )
+
+    def save_snapshot(self, snapshot: CheckpointSnapshot) -> None:
+        """Write a snapshot as the latest checkpoint (errors are logged, not raised)."""
+        if not self._root.exists():
+            return
 
         try:
             if self._tmp_path.exists():
                 shutil.rmtree(self._tmp_path)
             self._tmp_path.mkdir(parents=True, exist_ok=True)
 
-            self._write_frames(crawler, self._tmp_path)
+            self._write_frames(snapshot.frames, self._tmp_path)
             control_state = {
-                "iteration": int(iteration_idx),
-                "total_papers": int(total),
-                "max_iterations": int(getattr(crawler.stopping_config, "max_iter", 0)),
+                "iteration": snapshot.iteration,
+                "total_papers": snapshot.total_papers,
+                "max_iterations": snapshot.max_iterations,
                 "timestamp": datetime.utcnow().isoformat(),
             }
             self._write_json(control_state, self._tmp_path / self._CONTROL_STATE_FILE)
 
-            sampler_state = {
-                "no_papers_available": bool(getattr(crawler.sampler, "no_papers_available", False)),
-                "data_retrieval_empty": bool(getattr(crawler.data_coordinator, "no_papers_retrieved", False)),
-            }
-            self._write_json(sampler_state, self._tmp_path / self._SAMPLER_STATE_FILE)
+            self._write_json(snapshot.sampler_flags, self._tmp_path / self._SAMPLER_STATE_FILE)
 
             resume_meta = {
                 "schema_version": self._SCHEMA_VERSION,
                 "created_at": datetime.utcnow().isoformat(),
-                "iteration": int(iteration_idx),
+                "iteration": snapshot.iteration,
             }
             self._write_json(resume_meta, self._tmp_path / self._META_FILE)
 
             self._replace_directory(self._tmp_path, self._latest_path)
         except Exception:
-            self._logger.error("Failed to save checkpoint at iteration %s", iteration_idx, exc_info=True)
+            self._logger.error("Failed to save checkpoint at iteration %s", snapshot.iteration, exc_info=True)
 
     def promote_final(self) -> None:
         """Persist the latest checkpoint as the canonical final snapshot."""
@@ -172,17 +220,15 @@ class CheckpointManager:
         except Exception:
             self._logger.warning("Unable to persist manual frontier selection", exc_info=True)
 
-    def _write_frames(self, crawler, target_dir: Path) -> None:
-        frames = crawler.data_coordinator.frames
+    def _write_frames(self, frames: Dict[str, Optional[pd.DataFrame]], target_dir: Path) -> None:
         for attr, filename in self._FRAME_ARTIFACTS.items():
-            dataframe = getattr(frames, attr, None)
+            dataframe = frames.get(attr)
             path = target_dir / filename
             if dataframe is None:
                 if path.exists():
                     path.unlink()
                 continue
-            normalized = self._normalize_frame(attr, dataframe)
-            normalized.to_parquet(path, index=False)
+            dataframe.to_parquet(path, index=False)
 
     def _read_frames(self, source: Path) -> Dict[str, pd.DataFrame]:
         frames: Dict[str, pd.DataFrame] = {}
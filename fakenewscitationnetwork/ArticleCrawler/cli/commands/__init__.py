@@ -3,9 +3,13 @@ CLI Commands Module
 
 Contains all command implementations for the CLI.
 """
-from .library_create import library_create_command
-from .topic_modeling_cmd import topic_modeling_command
-from .wizard import WizardCommand
-from .run import RunCommand
+from ..._lazy import attach
 
-__all__ = ["WizardCommand", "RunCommand", 'library_create_command', 'topic_modeling_command']
\ No newline at end of file
+__getattr__, __dir__ = attach(__name__, {
+    'library_create_command': '.library_create',
+    'topic_modeling_command': '.topic_modeling_cmd',
+    'WizardCommand': '.wizard',
+    'RunCommand': '.run',
+})
+
+__all__ = ["WizardCommand", "RunCommand", 'library_create_command', 'topic_modeling_command']
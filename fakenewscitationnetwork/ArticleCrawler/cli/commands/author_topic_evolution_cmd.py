@@ -9,23 +9,12 @@ from questionary import Style
 import tempfile
 import sys
 
-from ArticleCrawler.usecases.author_topic_evolution_usecase import AuthorTopicEvolutionUseCase
-from ArticleCrawler.library.author_search_service import AuthorSearchService
-from ArticleCrawler.library.library_manager import LibraryManager
-from ArticleCrawler.DataManagement.markdown_writer import MarkdownFileGenerator
-from ArticleCrawler.usecases.topic_modeling_usecase import TopicModelingOrchestrator
-from ArticleCrawler.library.temporal_analysis_service import TemporalAnalysisService
-from ArticleCrawler.visualization.topic_evolution_visualizer import (
-    LineChartVisualizer,
-    HeatmapVisualizer,
-    StackedAreaVisualizer
-)
-from ArticleCrawler.utils.library_temp_manager import TempLibraryManager
 from ArticleCrawler.config.text_config import TextProcessingConfig
 from ArticleCrawler.config.temporal_config import TemporalAnalysisConfig
 from ArticleCrawler.visualization.visualization_config import VisualizationConfig
 from ArticleCrawler.api import create_api_provider
 from ArticleCrawler.LogManager.crawler_logger import CrawlerLogger
+from ArticleCrawler.library.author_search_service import AuthorSearchService
 from ArticleCrawler.library.models import AuthorInfo
 
 console = Console()
@@ -389,6 +378,18 @@ def _run_analysis(author, config, logger, api_provider):
         config['library_path'] = author_library_path
         console.print(f"[cyan]Library will be saved to:[/cyan] {author_library_path}\n")
     
+    from ArticleCrawler.usecases.author_topic_evolution_usecase import AuthorTopicEvolutionUseCase
+    from ArticleCrawler.library.library_manager import LibraryManager
+    from ArticleCrawler.DataManagement.markdown_writer import MarkdownFileGenerator
+    from ArticleCrawler.usecases.topic_modeling_usecase import TopicModelingOrchestrator
+    from ArticleCrawler.library.temporal_analysis_service import TemporalAnalysisService
+    from ArticleCrawler.visualization.topic_evolution_visualizer import (
+        LineChartVisualizer,
+        HeatmapVisualizer,
+        StackedAreaVisualizer
+    )
+    from ArticleCrawler.utils.library_temp_manager import TempLibraryManager
+
     library_manager = LibraryManager(logger=logger)
     temp_library_manager = TempLibraryManager(logger=logger)
     
@@ -4,14 +4,7 @@ from rich.console import Console
 from rich.panel import Panel
 from typing import List, Optional
 
-from ...usecases.library_creation import LibraryCreationOrchestrator
 from ..ui.prompts import RichPrompter
-from ..ui.seed_providers import (
-    ManualSeedProvider,
-    FileSeedProvider,
-    PDFSeedProvider,
-    ZoteroSeedProvider
-)
 
 console = Console()
 
@@ -96,6 +89,8 @@ def library_create_command(
         return None
     
     try:
+        from ...usecases.library_creation import LibraryCreationOrchestrator
+
         orchestrator = LibraryCreationOrchestrator(api_provider=api_provider)
         
         console.print("\n" + "=" * 70)
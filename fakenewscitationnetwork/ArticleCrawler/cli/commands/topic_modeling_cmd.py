@@ -6,7 +6,6 @@ from rich.table import Table
 from typing import Optional
 import logging
 
-from ...usecases.topic_modeling_usecase import TopicModelingOrchestrator
 from ...config.text_config import TextProcessingConfig
 from ..ui.prompts import RichPrompter
 from .library_create import library_create_command
@@ -86,6 +85,8 @@ def topic_modeling_command(
         return
     
     try:
+        from ...usecases.topic_modeling_usecase import TopicModelingOrchestrator
+
         topic_config = TextProcessingConfig(
             num_topics=num_topics,
             default_topic_model_type=model_type
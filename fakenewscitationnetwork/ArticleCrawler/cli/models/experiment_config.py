@@ -26,6 +26,10 @@ class ExperimentConfig(BaseModel):
     # Crawling settings
     max_iterations: int = Field(default=1, ge=1, description="Maximum crawler iterations")
     papers_per_iteration: int = Field(default=1, ge=1, description="Papers to sample per iteration")
+    pipelined_crawl: bool = Field(
+        default=False,
+        description="Fetch papers in the background while parsing, and write checkpoints in the background"
+    )
     
     # API settings
     api_provider: str = Field(default="openalex", description="API provider (openalex or semantic_scholar)")
@@ -41,6 +45,10 @@ class ExperimentConfig(BaseModel):
         default_factory=lambda: ["", "ArXiv", "medRxiv", "WWW"],
         description="Venues to ignore in sampling"
     )
+    sampling_relevance_mode: str = Field(
+        default="keywords",
+        description="Sampling relevance mode (keywords or embedding: weight candidates by seed similarity)"
+    )
     
     # Text processing configuration
     min_abstract_length: int = Field(default=120, ge=0, description="Minimum abstract length")
@@ -54,6 +62,10 @@ class ExperimentConfig(BaseModel):
     # Graph configuration
     include_author_nodes: bool = Field(default=False, description="Include author nodes in graph")
     max_centrality_iterations: int = Field(default=1000, ge=1, description="Max iterations for centrality calculation")
+    graph_backend: str = Field(
+        default="networkx",
+        description="Graph storage backend (networkx or compact: array/CSR graph for large crawls)"
+    )
     
     # Retraction configuration
     enable_retraction_watch: bool = Field(default=True, description="Enable retraction watch")
@@ -78,6 +90,24 @@ class ExperimentConfig(BaseModel):
             raise ValueError(f"api_provider must be one of {valid_providers}")
         return v.lower()
     
+    @field_validator('sampling_relevance_mode')
+    @classmethod
+    def validate_sampling_relevance_mode(cls, v):
+        """Validate sampling relevance mode."""
+        valid_modes = ['keywords', 'embedding']
+        if v.lower() not in valid_modes:
+            raise ValueError(f"sampling_relevance_mode must be one of {valid_modes}")
+        return v.lower()
+    
+    @field_validator('graph_backend')
+    @classmethod
+    def validate_graph_backend(cls, v):
+        """Validate graph backend choice."""
+        valid_backends = ['networkx', 'compact']
+        if v.lower() not in valid_backends:
+            raise ValueError(f"graph_backend must be one of {valid_backends}")
+        return v.lower()
+    
     @field_validator('topic_model')
     @classmethod
     def validate_topic_model(cls, v):
@@ -96,7 +126,7 @@ class ExperimentConfig(BaseModel):
         """
         from ArticleCrawler.config import (
             APIConfig, SamplingConfig, TextProcessingConfig,
-            StorageAndLoggingConfig, GraphConfig, RetractionConfig, StoppingConfig
+            StorageAndLoggingConfig, GraphConfig, RetractionConfig, StoppingConfig, PipelineConfig
         )
         
         # Determine root folder
@@ -114,7 +144,8 @@ class ExperimentConfig(BaseModel):
                 num_papers=self.papers_per_iteration,
                 no_key_word_lambda=self.no_keyword_lambda,
                 hyper_params=self.sampling_hyperparams,
-                ignored_venues=self.ignored_venues
+                ignored_venues=self.ignored_venues,
+                relevance_mode=self.sampling_relevance_mode
             ),
             "text_config": TextProcessingConfig(
                 abstract_min_length=self.min_abstract_length,
@@ -134,7 +165,8 @@ class ExperimentConfig(BaseModel):
             "graph_config": GraphConfig(
                 ignored_venues=self.ignored_venues,
                 include_author_nodes=self.include_author_nodes,
-                max_centrality_iterations=self.max_centrality_iterations
+                max_centrality_iterations=self.max_centrality_iterations,
+                backend=self.graph_backend
             ),
             "retraction_config": RetractionConfig(
                 enable_retraction_watch=self.enable_retraction_watch,
@@ -144,6 +176,9 @@ class ExperimentConfig(BaseModel):
             "stopping_config": StoppingConfig(
                 max_iter=self.max_iterations,
                 max_df_size=1E9
+            ),
+            "pipeline_config": PipelineConfig(
+                enabled=self.pipelined_crawl
             )
         }
     
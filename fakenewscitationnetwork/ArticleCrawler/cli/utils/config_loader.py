@@ -88,12 +88,14 @@ def _flatten_config(nested_dict: dict) -> dict:
         flat['papers_per_iteration'] = crawl.get('papers_per_iteration', 1)
         flat['api_provider'] = crawl.get('api_provider', 'openalex')
         flat['api_retries'] = crawl.get('api_retries', 3)
+        flat['pipelined_crawl'] = crawl.get('pipelined', False)
     
     if 'sampling' in nested_dict and isinstance(nested_dict['sampling'], dict):
         samp = nested_dict['sampling']
         flat['no_keyword_lambda'] = samp.get('no_keyword_lambda', 0.2)
         flat['sampling_hyperparams'] = samp.get('hyperparams', {'year': 0.3, 'centrality': 1.0})
         flat['ignored_venues'] = samp.get('ignored_venues', ['', 'ArXiv', 'medRxiv', 'WWW'])
+        flat['sampling_relevance_mode'] = samp.get('relevance_mode', 'keywords')
     
     if 'text_processing' in nested_dict and isinstance(nested_dict['text_processing'], dict):
         text = nested_dict['text_processing']
@@ -109,6 +111,7 @@ def _flatten_config(nested_dict: dict) -> dict:
         graph = nested_dict['graph']
         flat['include_author_nodes'] = graph.get('include_author_nodes', False)
         flat['max_centrality_iterations'] = graph.get('max_centrality_iterations', 1000)
+        flat['graph_backend'] = graph.get('backend', 'networkx')
     
     if 'retraction' in nested_dict and isinstance(nested_dict['retraction'], dict):
         retr = nested_dict['retraction']
@@ -140,12 +143,14 @@ def _structure_config(flat_dict: dict) -> dict:
             'max_iterations': flat_dict.get('max_iterations', 1),
             'papers_per_iteration': flat_dict.get('papers_per_iteration', 1),
             'api_provider': flat_dict.get('api_provider', 'openalex'),
-            'api_retries': flat_dict.get('api_retries', 3)
+            'api_retries': flat_dict.get('api_retries', 3),
+            'pipelined': flat_dict.get('pipelined_crawl', False)
         },
         'sampling': {
             'no_keyword_lambda': flat_dict.get('no_keyword_lambda', 0.2),
             'hyperparams': flat_dict.get('sampling_hyperparams', {'year': 0.3, 'centrality': 1.0}),
-            'ignored_venues': flat_dict.get('ignored_venues', ['', 'ArXiv', 'medRxiv', 'WWW'])
+            'ignored_venues': flat_dict.get('ignored_venues', ['', 'ArXiv', 'medRxiv', 'WWW']),
+            'relevance_mode': flat_dict.get('sampling_relevance_mode', 'keywords')
         },
         'text_processing': {
             'min_abstract_length': flat_dict.get('min_abstract_length', 120),
@@ -158,7 +163,8 @@ def _structure_config(flat_dict: dict) -> dict:
         },
         'graph': {
             'include_author_nodes': flat_dict.get('include_author_nodes', False),
-            'max_centrality_iterations': flat_dict.get('max_centrality_iterations', 1000)
+            'max_centrality_iterations': flat_dict.get('max_centrality_iterations', 1000),
+            'backend': flat_dict.get('graph_backend', 'networkx')
         },
         'retraction': {
             'enable': flat_dict.get('enable_retraction_watch', True),
@@ -5,6 +5,7 @@ from .storage_config import StorageAndLoggingConfig, StorageAndLoggingOptions
 from .graph_config import GraphConfig, GraphOptions
 from .retraction_config import RetractionConfig, RetractionOptions
 from .stopping_config import StoppingConfig, StoppingOptions
+from .pipeline_config import PipelineConfig
 
 __all__ = [
     # New config classes
@@ -17,6 +18,7 @@ __all__ = [
     'GraphConfig',
     'RetractionConfig',
     'StoppingConfig',
+    'PipelineConfig',
     # Backward compatibility aliases
     'SamplingOptions',
     'TextOptions',
@@ -7,12 +7,15 @@ class GraphConfig:
     This class handles all graph-related settings including node types,
     venue filtering, and centrality calculation options.
     """
+
+    BACKENDS = ('networkx', 'compact')
     
     def __init__(self,
                  ignored_venues: Optional[List[str]] = None,
                  include_author_nodes: bool = False,
                  include_venue_nodes: bool = True,
-                 max_centrality_iterations: int = 1000):
+                 max_centrality_iterations: int = 1000,
+                 backend: str = 'networkx'):
         """
         Initialize graph configuration.
         
@@ -21,14 +24,19 @@ class GraphConfig:
             include_author_nodes (bool): Whether to include author nodes in graph
             include_venue_nodes (bool): Whether to include venue nodes in graph  
             max_centrality_iterations (int): Maximum iterations for centrality calculations
+            backend (str): Graph storage: 'networkx' (networkx.DiGraph) or 'compact'
+                (array/CSR graph over interned node IDs, for large crawls)
         """
         self.ignored_venues = ignored_venues or []
         self.include_author_nodes = include_author_nodes
         self.include_venue_nodes = include_venue_nodes
         self.max_centrality_iterations = max_centrality_iterations
+        self.backend = backend
         
         if max_centrality_iterations <= 0:
             raise ValueError("max_centrality_iterations must be positive")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}")
     
     def copy(self):
         """Create a copy of this configuration."""
@@ -36,7 +44,8 @@ class GraphConfig:
             ignored_venues=self.ignored_venues.copy(),
             include_author_nodes=self.include_author_nodes,
             include_venue_nodes=self.include_venue_nodes,
-            max_centrality_iterations=self.max_centrality_iterations
+            max_centrality_iterations=self.max_centrality_iterations,
+            backend=self.backend
         )
 
 class GraphOptions(GraphConfig):
@@ -0,0 +1,48 @@
+class PipelineConfig:
+    """
+    Configuration for the pipelined crawl loop.
+    
+    When enabled, papers selected in an iteration are fetched by a background
+    worker and parsed in batches while the remaining papers download, and
+    intermediate files and checkpoints are written by a background writer
+    while the next iteration runs.
+    """
+    
+    def __init__(self,
+                 enabled: bool = False,
+                 chunk_size: int = 1,
+                 queue_size: int = 4,
+                 background_persistence: bool = True,
+                 parse_batch_size: int = 25):
+        """
+        Initialize pipeline configuration.
+        
+        Args:
+            enabled (bool): Use the pipelined crawl loop
+            chunk_size (int): Papers fetched per request to the API provider
+            queue_size (int): Maximum fetched chunks waiting to be parsed
+            background_persistence (bool): Write intermediate files and checkpoints in the background
+            parse_batch_size (int): Fetched papers collected before they are parsed into the frames
+        """
+        self.enabled = enabled
+        self.chunk_size = chunk_size
+        self.queue_size = queue_size
+        self.background_persistence = background_persistence
+        self.parse_batch_size = parse_batch_size
+        
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if queue_size <= 0:
+            raise ValueError("queue_size must be positive")
+        if parse_batch_size <= 0:
+            raise ValueError("parse_batch_size must be positive")
+    
+    def copy(self):
+        """Create a copy of this configuration."""
+        return PipelineConfig(
+            enabled=self.enabled,
+            chunk_size=self.chunk_size,
+            queue_size=self.queue_size,
+            background_persistence=self.background_persistence,
+            parse_batch_size=self.parse_batch_size
+        )
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Dict, List, Optional, Union
 import numpy as np
 
@@ -8,12 +9,17 @@ class SamplingConfig:
     This class handles all sampling-related settings including the number of papers
     to sample, hyperparameters for probability calculations, and venue filtering.
     """
+
+    RELEVANCE_MODES = ('keywords', 'embedding')
     
     def __init__(self, 
                  num_papers: int,
                  hyper_params: Optional[Dict[str, float]] = None,
                  ignored_venues: Optional[List[str]] = None,
-                 no_key_word_lambda: float = 1.0):
+                 no_key_word_lambda: float = 1.0,
+                 relevance_mode: str = 'keywords',
+                 embedding_model: str = 'all-MiniLM-L6-v2',
+                 embedding_store_dir: Optional[Union[str, Path]] = None):
         """
         Initialize sampling configuration.
         
@@ -22,17 +28,26 @@ class SamplingConfig:
             hyper_params (Dict[str, float], optional): Hyperparameters for sampling probability
             ignored_venues (List[str], optional): Venues to exclude from sampling
             no_key_word_lambda (float): Lambda parameter for exponential decay in keyword-less sampling
+            relevance_mode (str): 'keywords' (year and centrality only) or 'embedding', which also
+                weights candidates by similarity to the seed papers (``hyper_params['relevance']``)
+            embedding_model (str): SentenceTransformer model used in 'embedding' mode
+            embedding_store_dir (str | Path, optional): Directory persisting embeddings across crawls
         """
         self.num_papers = num_papers
         self.hyper_params = hyper_params or {'year': 0.1, 'centrality': 1.0}
         self.ignored_venues = ignored_venues or []
         self.no_key_word_lambda = no_key_word_lambda
+        self.relevance_mode = relevance_mode
+        self.embedding_model = embedding_model
+        self.embedding_store_dir = Path(embedding_store_dir) if embedding_store_dir else None
         
         # Validate inputs
         if num_papers <= 0:
             raise ValueError("num_papers must be positive")
         if no_key_word_lambda < 0:
             raise ValueError("no_key_word_lambda must be non-negative")
+        if relevance_mode not in self.RELEVANCE_MODES:
+            raise ValueError(f"relevance_mode must be one of {self.RELEVANCE_MODES}")
     
     def copy(self):
         """Create a copy of this configuration."""
@@ -40,7 +55,10 @@ class SamplingConfig:
             num_papers=self.num_papers,
             hyper_params=self.hyper_params.copy(),
             ignored_venues=self.ignored_venues.copy(),
-            no_key_word_lambda=self.no_key_word_lambda
+            no_key_word_lambda=self.no_key_word_lambda,
+            relevance_mode=self.relevance_mode,
+            embedding_model=self.embedding_model,
+            embedding_store_dir=self.embedding_store_dir
         )
 
 class SamplingOptions(SamplingConfig):
@@ -0,0 +1,68 @@
+"""
+Cooperative cancellation and pausing for crawl runs.
+
+``Crawler`` checks its ``CrawlControl`` before every iteration: a paused run
+waits there until it is resumed, and a cancelled run stops with
+``CrawlCancelled``. The control only wraps two event objects, so it works with
+``threading.Event`` for in-process runs and with ``multiprocessing`` events when
+the crawl runs in a worker process.
+"""
+
+import threading
+from typing import Optional
+
+
+class CrawlCancelled(Exception):
+    """Raised by ``Crawler.crawl`` when its run was cancelled."""
+
+
+class CrawlControl:
+    """Cancel / pause flags checked by the crawler between iterations."""
+
+    def __init__(self, cancel_event=None, pause_event=None, poll_interval: float = 0.5):
+        """
+        Args:
+            cancel_event: Event set to cancel the run (``threading.Event`` by default)
+            pause_event: Event set while the run should stay paused
+            poll_interval: Seconds between cancel checks while paused
+        """
+        self._cancel = cancel_event if cancel_event is not None else threading.Event()
+        self._pause = pause_event if pause_event is not None else threading.Event()
+        self.poll_interval = poll_interval
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return self._pause.is_set()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def pause(self) -> None:
+        self._pause.set()
+
+    def resume(self) -> None:
+        self._pause.clear()
+
+    def checkpoint(self, logger=None, iteration: Optional[int] = None) -> None:
+        """
+        Block while paused, then raise ``CrawlCancelled`` if the run was cancelled.
+
+        Args:
+            logger: Optional logger for pause/cancel messages
+            iteration: Iteration about to start, used in the log messages
+        """
+        if self.paused and not self.cancelled:
+            if logger:
+                logger.info("Crawl paused before iteration %s.", iteration)
+            while self.paused and not self.cancelled:
+                self._cancel.wait(self.poll_interval)
+            if logger and not self.cancelled:
+                logger.info("Crawl resumed at iteration %s.", iteration)
+        if self.cancelled:
+            if logger:
+                logger.info("Crawl cancelled before iteration %s.", iteration)
+            raise CrawlCancelled(f"Crawl cancelled before iteration {iteration}")
@@ -12,23 +12,28 @@ All existing functionality is preserved while providing better maintainability
 and extensibility through SOLID principles.
 """
 
+import pickle
 from datetime import datetime
 from typing import Callable, Dict, Optional, List
 
 from .api import create_api_provider
 from .data import PaperRetrievalService, DataValidationService, DataCoordinator, FrameManager
+from .data.prefetcher import PaperPrefetcher
 from .config import (
     APIConfig, SamplingConfig, TextProcessingConfig, 
-    StorageAndLoggingConfig, GraphConfig, RetractionConfig, StoppingConfig
+    StorageAndLoggingConfig, GraphConfig, RetractionConfig, StoppingConfig, PipelineConfig
 )
 from .text_processing import TextAnalysisManager
 from .graph import GraphManager, GraphProcessing
 from ArticleCrawler.LogManager.crawler_logger import CrawlerLogger
+from ArticleCrawler.LogManager.crawl_metrics import CrawlMetrics
 from ArticleCrawler.DataManagement.data_storage import DataStorage
+from ArticleCrawler.DataManagement.background_writer import BackgroundWriter
 from ArticleCrawler.sampling.sampler import Sampler
 from ArticleCrawler.papervalidation.retraction_watch_manager import RetractionWatchManager
 from contextlib import contextmanager
 from ArticleCrawler.checkpoint import ResumeState
+from ArticleCrawler.crawl_control import CrawlCancelled, CrawlControl
 
 class Crawler:
     """
@@ -58,7 +63,9 @@ class Crawler:
                  md_generator=None,
                  progress_callback: Optional[Callable[[Dict], None]] = None,
                  checkpoint_manager=None,
-                 resume_state: Optional[ResumeState] = None):
+                 resume_state: Optional[ResumeState] = None,
+                 pipeline_config: Optional[PipelineConfig] = None,
+                 control: Optional[CrawlControl] = None):
         
         self._resolve_configurations(
             api_config, sampling_config, text_config, storage_config,
@@ -72,6 +79,8 @@ class Crawler:
         self.md_generator = md_generator
         self._progress_callback = progress_callback
         self.checkpoint_manager = checkpoint_manager
+        self.pipeline_config = pipeline_config or PipelineConfig()
+        self.control = control
         self._manual_frontier_ids: Optional[List[str]] = None
         self._initial_iteration = 0
         self._previous_total_papers = None
@@ -83,6 +92,8 @@ class Crawler:
             logger=self.logger
         )
 
+        self.metrics = CrawlMetrics(self.storage_config.log_folder / 'crawl_metrics.jsonl')
+
         self._create_services()
         self._initialize_resume_state(resume_state)
         
@@ -108,6 +119,7 @@ class Crawler:
                 continue
             if hasattr(store, attr):
                 setattr(store, attr, df)
+        store.store.intern_frames()
 
         try:
             self.graph_manager.DG.clear()
@@ -187,7 +199,8 @@ class Crawler:
         elif graph_options:
             self.graph_config = GraphConfig(
                 ignored_venues=getattr(graph_options, 'ignored_venues', []),
-                include_author_nodes=getattr(graph_options, 'include_author_nodes', False)
+                include_author_nodes=getattr(graph_options, 'include_author_nodes', False),
+                backend=getattr(graph_options, 'backend', 'networkx')
             )
         else:
             self.graph_config = GraphConfig()
@@ -234,7 +247,8 @@ class Crawler:
         self.frame_manager = FrameManager(
             reporting_options=None,
             data_storage_options=self.storage_config,
-            logger=self.logger
+            logger=self.logger,
+            metrics=self.metrics
         )
         
         self.retraction_manager = RetractionWatchManager(
@@ -258,7 +272,8 @@ class Crawler:
             graph_manager=self.graph_manager,
             graph_processing=None,
             crawl_initial_condition=self.crawl_initial_condition,
-            logger=self.logger
+            logger=self.logger,
+            metrics=self.metrics
         )
         
         self.graph_processing = GraphProcessing(data_manager=self.data_coordinator, logger=self.logger)
@@ -277,7 +292,8 @@ class Crawler:
             sampling_options=self.sampling_config,
             logger=self.logger,
             data_storage_options=self.storage_config,
-            retraction_watch_manager=self.retraction_manager
+            retraction_watch_manager=self.retraction_manager,
+            metrics=self.metrics
         )
 
     def add_seed_papers(self, paper_ids: list):
@@ -294,10 +310,52 @@ class Crawler:
         
         This method maintains the exact same behavior as the original
         but uses the new service-oriented architecture internally.
+
+        With ``PipelineConfig(enabled=True)`` the selected papers are fetched
+        by a background worker and parsed chunk by chunk as they arrive, and
+        intermediate files and checkpoints are written by a background writer
+        while the next iteration runs. The next sample still waits for the
+        current iteration's frames, so runs stay deterministic for a fixed seed.
+
+        A ``CrawlControl`` passed as ``control`` is checked before every
+        iteration; cancelling it raises ``CrawlCancelled`` without finalizing,
+        leaving the checkpoint of the last finished iteration on disk.
         """
         self.logger.info(f"Keywords and expressions to filter titles {self.crawl_initial_condition.keywords}")
         self.logger.info(f"Using {self.api_config.provider_type} API provider for crawling")
 
+        pipeline = self.pipeline_config
+        prefetcher = None
+        writer = None
+        if pipeline.enabled:
+            self.logger.info('Pipelined crawl loop enabled.')
+            prefetcher = PaperPrefetcher(
+                self.retrieval_service,
+                chunk_size=pipeline.chunk_size,
+                queue_size=pipeline.queue_size,
+                batch_size=pipeline.parse_batch_size,
+                logger=self.logger,
+            )
+            if pipeline.background_persistence:
+                writer = BackgroundWriter(logger=self.logger)
+
+        try:
+            iteration = self._run_iterations(prefetcher, writer)
+        except CrawlCancelled:
+            self.logger.shutdown()
+            raise
+        finally:
+            if writer is not None:
+                writer.close()
+
+        self._finalize_crawling()
+        self._emit_progress(
+            iterations_completed=min(iteration, self.stopping_config.max_iter),
+            papers_added=0,
+        )
+
+    def _run_iterations(self, prefetcher=None, writer=None) -> int:
+        """Run crawl iterations until a stopping condition is met; returns the next iteration index."""
         iteration = self._initial_iteration
         previous_total_papers = self._previous_total_papers or self.data_coordinator.frames.df_paper_metadata.shape[0]
         self.logger.info('Enhanced crawling started with dependency injection architecture.')
@@ -305,6 +363,9 @@ class Crawler:
             self.logger.info('Resuming crawl from iteration %d', iteration)
 
         while self._should_continue_crawling(iteration):
+            if self.control is not None:
+                self.control.checkpoint(self.logger, iteration)
+            self.metrics.start_iteration(iteration, api_stats=self.retrieval_service.get_call_stats())
             self.logger.set_iteration(iteration)
             self.logger.info(f'Starting iteration {iteration} with enhanced architecture')
 
@@ -319,7 +380,8 @@ class Crawler:
                     )
             else:
                 self.logger.info('Sampling started with enhanced service architecture.')
-                self.sampler.sample_papers()
+                with self.metrics.stage('sampling'):
+                    self.sampler.sample_papers()
                 selected_paperIds = self.sampler.sampled_papers
             
             if selected_paperIds is not None and len(selected_paperIds) > 0:
@@ -330,7 +392,9 @@ class Crawler:
                 
                 self.logger.info('Retrieving and processing papers using enhanced DataCoordinator.')
                 
-                self.data_coordinator.retrieve_and_process_papers(paper_ids, paperIDs_are_sampled=True)
+                self.data_coordinator.retrieve_and_process_papers(
+                    paper_ids, paperIDs_are_sampled=True, prefetcher=prefetcher
+                )
 
                 if self.data_coordinator.no_papers_retrieved:
                     self.logger.info('No papers retrieved after API call. Stopping the crawl')
@@ -338,7 +402,13 @@ class Crawler:
                     self.logger.info('Papers retrieved and processed successfully with enhanced architecture.')
 
                 self.logger.info('Saving intermediate files.')
-                self.data_storage.save_intermediate_file(self, iteration)
+                with self.metrics.stage('persistence'):
+                    if writer is not None:
+                        # Pickling is the snapshot, so it has to happen here before the
+                        # next iteration mutates the crawler; only the file write overlaps.
+                        writer.submit(self.data_storage.write_intermediate_file, pickle.dumps(self), iteration)
+                    else:
+                        self.data_storage.save_intermediate_file(self, iteration)
             else:
                 self.sampler.no_papers_available = True
                 self.logger.info('No papers returned by the enhanced sampler. Stopping.')
@@ -351,15 +421,22 @@ class Crawler:
             previous_total_papers = current_total_papers
 
             iteration += 1
-            self._emit_progress(iterations_completed=iteration, papers_added=papers_added)
             if self.checkpoint_manager:
-                self.checkpoint_manager.save(self, iteration_idx=iteration, total_papers=current_total_papers)
+                with self.metrics.stage('persistence'):
+                    self.checkpoint_manager.save(
+                        self, iteration_idx=iteration, total_papers=current_total_papers, writer=writer
+                    )
+            record = self.metrics.finish_iteration(
+                frames=self.data_coordinator.frames, api_stats=self.retrieval_service.get_call_stats()
+            )
+            if record is not None:
+                self.logger.info(
+                    'Iteration %d took %.2fs (%s)', record['iteration'], record['total_seconds'],
+                    ', '.join(f'{name} {seconds:.2f}s' for name, seconds in record['stages'].items())
+                )
+            self._emit_progress(iterations_completed=iteration, papers_added=papers_added)
 
-        self._finalize_crawling()
-        self._emit_progress(
-            iterations_completed=min(iteration, self.stopping_config.max_iter),
-            papers_added=0,
-        )
+        return iteration
 
     def _should_continue_crawling(self, iteration):
         """
@@ -487,6 +564,11 @@ class Crawler:
                 "papers_added_this_iteration": max(papers_added, 0),
                 "timestamp": datetime.utcnow(),
             }
+            last_metrics = self.metrics.last
+            if last_metrics is not None:
+                payload["stage_timings"] = dict(last_metrics["stages"])
+                payload["iteration_seconds"] = last_metrics["total_seconds"]
+                payload["peak_rss_mb"] = last_metrics["peak_rss_mb"]
 
             self._progress_callback(payload)
         except Exception:
@@ -496,6 +578,7 @@ class Crawler:
         """Drop non-picklable runtime-only references before serialization."""
         state = self.__dict__.copy()
         state["_progress_callback"] = None
+        state["control"] = None
         return state
 
     # Backward compatibility properties
@@ -1,11 +1,16 @@
-from .retrieval_service import PaperRetrievalService
-from .validation_service import DataValidationService
-from .data_coordinator import DataCoordinator
-from .frame_manager import FrameManager
-from .data_manager import DataManager
-from .data_frame_store import DataFrameStore
-from .metadata_parser import MetadataParser
-from .paper_validator import PaperValidator
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(__name__, {
+    'PaperRetrievalService': '.retrieval_service',
+    'DataValidationService': '.validation_service',
+    'DataCoordinator': '.data_coordinator',
+    'FrameManager': '.frame_manager',
+    'DataManager': '.data_manager',
+    'DataFrameStore': '.data_frame_store',
+    'MetadataParser': '.metadata_parser',
+    'PaperValidator': '.paper_validator',
+    'PaperPrefetcher': '.prefetcher',
+})
 
 __all__ = [
     'PaperRetrievalService',
@@ -16,4 +21,5 @@ __all__ = [
     'DataFrameStore',
     'MetadataParser',
     'PaperValidator',
-]
\ No newline at end of file
+    'PaperPrefetcher',
+]
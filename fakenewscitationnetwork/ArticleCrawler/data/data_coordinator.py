@@ -3,6 +3,7 @@ import pandas as pd
 from .retrieval_service import PaperRetrievalService
 from .validation_service import DataValidationService
 from .frame_manager import FrameManager
+from ..LogManager.crawl_metrics import CrawlMetrics
 from ArticleCrawler.papervalidation.retraction_watch_manager import RetractionWatchManager
 
 class DataCoordinator:
@@ -21,7 +22,8 @@ class DataCoordinator:
                  graph_manager,
                  graph_processing,
                  crawl_initial_condition=None,
-                 logger=None):
+                 logger=None,
+                 metrics=None):
         self.retrieval = retrieval_service
         self.validation = validation_service
         self.frames = frame_manager
@@ -29,6 +31,7 @@ class DataCoordinator:
         self.graph = graph_manager
         self.graph_processing = graph_processing
         self.logger = logger or logging.getLogger(__name__)
+        self.metrics = metrics if metrics is not None else CrawlMetrics()
         
         self.crawl_initial_condition = crawl_initial_condition
         self.no_papers_retrieved = True
@@ -48,7 +51,7 @@ class DataCoordinator:
         if hasattr(self.frames, 'mark_papers_selected'):
             self.frames.mark_papers_selected(list(paper_ids))
 
-    def retrieve_and_process_papers(self, paper_ids, paperIDs_are_sampled=False):
+    def retrieve_and_process_papers(self, paper_ids, paperIDs_are_sampled=False, prefetcher=None):
         """
         Main orchestration method for retrieving and processing papers.
         
@@ -58,12 +61,18 @@ class DataCoordinator:
         Args:
             paper_ids: List of paper IDs to retrieve
             paperIDs_are_sampled: Whether the paper IDs were selected by sampler
+            prefetcher: Optional PaperPrefetcher; papers are then parsed chunk by chunk
+                while the remaining chunks download, and features are computed once at the end
         """
         if not paper_ids:
             self.logger.info("No paper IDs provided for retrieval.")
             return
 
-        papers = self.retrieval.retrieve_papers(paper_ids)
+        if prefetcher is not None:
+            papers = self._retrieve_and_parse_streaming(paper_ids, prefetcher)
+        else:
+            with self.metrics.stage('api_fetch'):
+                papers = self.retrieval.retrieve_papers(paper_ids)
         
         failed_papers = self.retrieval.get_failed_papers()
         self.frames.update_failed_papers(failed_papers)
@@ -85,9 +94,13 @@ class DataCoordinator:
         )
 
         self.logger.info("Data processing started.")
-        self.frames.process_data(papers)
+        if prefetcher is not None:
+            self.frames.compute_features()
+        else:
+            self.frames.process_data(papers)
         
-        self.mark_retracted_papers()
+        with self.metrics.stage('retraction_check'):
+            self.mark_retracted_papers()
 
         self.validation.validate_processed_status(retrieved_ids, self.frames.df_paper_metadata)
             
@@ -97,6 +110,27 @@ class DataCoordinator:
 
         self.logger.info("Data processing completed.")
 
+    def _retrieve_and_parse_streaming(self, paper_ids, prefetcher):
+        """Parse fetched papers in batches while the rest download; returns all fetched papers."""
+        papers = []
+        stream = iter(prefetcher.batches(paper_ids))
+        try:
+            while True:
+                # Only the time spent waiting for a chunk counts as fetching.
+                with self.metrics.stage('api_fetch'):
+                    item = next(stream, None)
+                if item is None:
+                    break
+                _, chunk_papers = item
+                papers.extend(chunk_papers)
+                fetched = [paper for paper in chunk_papers if paper is not None]
+                if fetched:
+                    self.frames.parse_papers(fetched)
+        finally:
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()
+        return papers
     
     def add_seed_papers(self, paper_ids):
         if not paper_ids:
@@ -124,8 +158,10 @@ class DataCoordinator:
 
     def update_graph_and_calculate_centrality(self):
         """Update graph and calculate centralities."""
-        self.graph.update_graph_with_new_nodes(self.frames)
-        self.graph_processing.calculate_centrality()
+        with self.metrics.stage('graph_update'):
+            self.graph.update_graph_with_new_nodes(self.frames)
+        with self.metrics.stage('centrality'):
+            self.graph_processing.calculate_centrality()
 
     def extract_text(self):
         """Extract text data (abstracts and titles) for all papers."""
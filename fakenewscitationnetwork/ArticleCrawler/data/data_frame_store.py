@@ -8,6 +8,8 @@ and basic access to all DataFrames used in the crawler.
 import pandas as pd
 import logging
 
+from .id_interner import IdInterner
+
 
 class DataFrameStore:
     """
@@ -15,7 +17,30 @@ class DataFrameStore:
     
     This class is responsible only for DataFrame initialization and storage.
     All business logic (parsing, validation, computation) is handled elsewhere.
+
+    IDs and names written to the frames are interned through ``ids`` and
+    ``names``: each distinct value is one shared string object with a dense
+    integer code, and the crawl-state flags are kept as real ``bool`` columns.
     """
+
+    ID_COLUMNS = {
+        'df_paper_metadata': ('paperId',),
+        'df_paper_author': ('paperId', 'authorId'),
+        'df_author': ('authorId',),
+        'df_paper_citations': ('paperId', 'citedPaperId'),
+        'df_paper_references': ('paperId', 'referencePaperId'),
+        'df_citations': ('paperId', 'referencePaperId'),
+        'df_abstract': ('paperId',),
+        'df_forbidden_entries': ('paperId',),
+    }
+    NAME_COLUMNS = {
+        'df_paper_metadata': ('venue',),
+        'df_author': ('authorName',),
+    }
+    BOOL_COLUMNS = {
+        'df_paper_metadata': ('processed', 'isSeed', 'isKeyAuthor', 'selected', 'retracted'),
+        'df_forbidden_entries': ('sampler', 'textProcessing'),
+    }
     
     def __init__(self, logger=None):
         """
@@ -25,6 +50,8 @@ class DataFrameStore:
             logger: Optional logger instance
         """
         self.logger = logger or logging.getLogger(__name__)
+        self.ids = IdInterner()
+        self.names = IdInterner()
         
         self.df_paper_metadata = pd.DataFrame({
             'paperId': pd.Series(dtype='str'),
@@ -67,6 +94,30 @@ class DataFrameStore:
             'textProcessing': pd.Series(dtype='bool'),
         })
     
+    def intern_frames(self) -> None:
+        """
+        Intern the ID and name columns of every frame and coerce flag columns to ``bool``.
+
+        Used for frames that did not come through the parser, e.g. frames
+        restored from a checkpoint.
+        """
+        for attr, columns in self.ID_COLUMNS.items():
+            self._intern_columns(attr, columns, self.ids)
+        for attr, columns in self.NAME_COLUMNS.items():
+            self._intern_columns(attr, columns, self.names)
+        for attr, columns in self.BOOL_COLUMNS.items():
+            frame = getattr(self, attr)
+            present = [column for column in columns if column in frame.columns]
+            if present:
+                flags = frame[present]
+                frame[present] = flags.where(flags.notna(), False).astype(bool)
+
+    def _intern_columns(self, attr, columns, interner) -> None:
+        frame = getattr(self, attr)
+        for column in columns:
+            if column in frame.columns and not frame.empty:
+                frame[column] = pd.Series(interner.intern(frame[column]), index=frame.index, dtype=object)
+
     def get_dataframes_shapes(self) -> pd.DataFrame:
         """
         Get shapes of all DataFrames for debugging/monitoring.
@@ -16,6 +16,7 @@ import logging
 from .data_frame_store import DataFrameStore
 from .metadata_parser import MetadataParser
 from .paper_validator import PaperValidator
+from ..LogManager.crawl_metrics import CrawlMetrics
 
 
 class FrameManager:
@@ -26,7 +27,8 @@ class FrameManager:
     responsibilities to focused components.
     """
     
-    def __init__(self, reporting_options=None, graph_options=None, data_storage_options=None, logger=None):
+    def __init__(self, reporting_options=None, graph_options=None, data_storage_options=None, logger=None,
+                 metrics=None):
         """
         Initialize Frame Manager.
         
@@ -35,8 +37,10 @@ class FrameManager:
             graph_options: Legacy parameter (kept for compatibility)
             data_storage_options: Storage configuration
             logger: Logger instance
+            metrics: CrawlMetrics timing the 'parsing' and 'features' stages
         """
         self.logger = logger or logging.getLogger(__name__)
+        self.metrics = metrics or CrawlMetrics()
 
         self.store = DataFrameStore(logger=self.logger)
         self.feature_computer = AcademicFeatureComputer()
@@ -198,6 +202,25 @@ class FrameManager:
             papers: List of paper objects from API
             processed: Whether papers are fully processed
         """
+        self.parse_papers(papers, processed)
+        self.compute_features()
+
+    def parse_papers(self, papers, processed=True):
+        """
+        Parse papers into the frames without recomputing derived features.
+
+        ``process_data`` is ``parse_papers`` followed by ``compute_features``;
+        the pipelined crawl loop parses fetched chunks one by one and computes
+        features once per iteration.
+
+        Args:
+            papers: List of paper objects from API
+            processed: Whether papers are fully processed
+        """
+        with self.metrics.stage('parsing'):
+            self._parse_papers(papers, processed)
+
+    def _parse_papers(self, papers, processed):
         papers = self.validator.checkPapersOpenAlex(papers, processed)
 
         self.parser.parse_metadata(papers, processed)
@@ -217,7 +240,10 @@ class FrameManager:
 
         self.parser.parse_abstracts(papers)
 
-        self.parser.compute_features()
+    def compute_features(self):
+        """Recompute paper, author and venue features from the current frames."""
+        with self.metrics.stage('features'):
+            self.parser.compute_features()
     
     def update_failed_papers(self, failed_paper_ids):
         """Update the processed status for failed paper IDs."""
@@ -0,0 +1,75 @@
+"""
+Shared ID space for the crawler frames.
+
+OpenAlex IDs (``W…``, ``A…``) and venue names are repeated across the metadata,
+author and edge frames. ``IdInterner`` maps every distinct value to one dense
+integer code and one canonical string object, so the frames share a single
+copy of each ID (and its cached hash) and graph code can work on int codes.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class IdInterner:
+    """
+    Bidirectional map between string IDs and dense ``int32`` codes.
+
+    Codes are assigned in first-seen order and never change, so they can be
+    stored alongside (or instead of) the strings and decoded at the edges.
+    """
+
+    def __init__(self, ids: Optional[Iterable[str]] = None):
+        self._codes: Dict[str, int] = {}
+        self._values: List[str] = []
+        if ids is not None:
+            self.encode(ids)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value) -> bool:
+        return value in self._codes
+
+    def encode(self, ids: Iterable[str]) -> np.ndarray:
+        """Codes for ``ids``, registering values not seen before."""
+        codes = self._codes
+        values = self._values
+        out = []
+        for value in ids:
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(values)
+                values.append(value)
+            out.append(code)
+        return np.asarray(out, dtype=np.int32)
+
+    def lookup(self, ids: Iterable[str]) -> np.ndarray:
+        """Codes for ``ids`` without registering anything (-1 for unknown values)."""
+        get = self._codes.get
+        return np.asarray([get(value, -1) for value in ids], dtype=np.int32)
+
+    def decode(self, codes: Iterable[int]) -> List[str]:
+        """Canonical strings for ``codes``."""
+        values = self._values
+        return [values[code] for code in codes]
+
+    def intern(self, ids: Iterable[str]) -> List:
+        """
+        Replace each string in ``ids`` by its canonical object.
+
+        Non-string values (``None``, ``NaN``) are passed through untouched.
+        """
+        codes = self._codes
+        values = self._values
+        out = []
+        for value in ids:
+            if isinstance(value, str):
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(values)
+                    values.append(value)
+                value = values[code]
+            out.append(value)
+        return out
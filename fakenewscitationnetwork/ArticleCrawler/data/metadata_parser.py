@@ -12,6 +12,8 @@ import logging
 from itertools import chain
 import warnings
 
+from ..api.paper_records import AuthorRecord, PaperRecord
+
 warnings.filterwarnings(
     "ignore",
     category=FutureWarning,
@@ -26,6 +28,9 @@ class MetadataParser:
     This class handles all parsing operations including metadata extraction,
     author processing, citation/reference parsing, and feature computation.
     """
+
+    # Crawl state owned by the crawler, never taken from API responses on refresh.
+    STATE_COLUMNS = ('isSeed', 'isKeyAuthor', 'selected', 'retracted')
     
     def __init__(self, store, feature_computer, logger=None):
         """
@@ -39,69 +44,120 @@ class MetadataParser:
         self.store = store
         self.feature_computer = feature_computer
         self.logger = logger or logging.getLogger(__name__)
+
     def _coerce_value_for_column(self, column, value):
-        series = self.store.df_paper_metadata[column]
-        if pd_types.is_object_dtype(series.dtype):
-            return value if value is not None else ""
-        if pd_types.is_bool_dtype(series.dtype):
-            if isinstance(value, str):
-                normalized = value.strip().lower()
-                if normalized in ('', '0', 'false', 'no', 'n', 'none'):
+        return self._coercer(self.store.df_paper_metadata[column].dtype)(value)
+
+    @staticmethod
+    def _coercer(dtype):
+        """Return a function coercing API values to ``dtype`` (resolved once per column)."""
+        if pd_types.is_object_dtype(dtype):
+            return lambda value: value if value is not None else ""
+        if pd_types.is_bool_dtype(dtype):
+            def coerce_bool(value):
+                if isinstance(value, str):
+                    normalized = value.strip().lower()
+                    if normalized in ('', '0', 'false', 'no', 'n', 'none'):
+                        return False
+                    if normalized in ('true', '1', 'yes', 'y'):
+                        return True
+                if pd.isna(value) or value in (None, '', 0):
                     return False
-                if normalized in ('true', '1', 'yes', 'y'):
-                    return True
-            if pd.isna(value) or value in (None, '', 0):
-                return False
-            return bool(value)
-        if pd_types.is_numeric_dtype(series.dtype):
-            if value in (None, '') or (isinstance(value, str) and value.strip() == ''):
-                return 0 if pd_types.is_integer_dtype(series.dtype) else np.nan
-            try:
-                return int(value) if pd_types.is_integer_dtype(series.dtype) else float(value)
-            except (TypeError, ValueError):
-                return 0 if pd_types.is_integer_dtype(series.dtype) else np.nan
-        return value
+                return bool(value)
+            return coerce_bool
+        if pd_types.is_numeric_dtype(dtype):
+            is_integer = pd_types.is_integer_dtype(dtype)
+            missing = 0 if is_integer else np.nan
+            cast = int if is_integer else float
+            def coerce_number(value):
+                if value in (None, '') or (isinstance(value, str) and value.strip() == ''):
+                    return missing
+                try:
+                    return cast(value)
+                except (TypeError, ValueError):
+                    return missing
+            return coerce_number
+        return lambda value: value
     
     def parse_metadata(self, papers, processed=True):
         """
-        Parse paper metadata and add to DataFrame.
+        Parse paper metadata and upsert it into the metadata DataFrame.
+
+        The batch is deduplicated and split against a paperId -> row index:
+        unknown papers are appended in one concat (first occurrence wins) and
+        known papers are refreshed column by column (last occurrence wins).
+        Crawl-state flags (``isSeed``, ``selected``, ...) of known papers are
+        kept, and ``processed`` is only ever raised, so a crawled paper seen
+        again as a citation stub stays processed.
         
         Args:
             papers: List of paper objects from API
             processed: Whether papers are fully processed
         """
-        existing_paper_ids = set(self.store.df_paper_metadata['paperId'].values)
-        data = []
+        frame = self.store.df_paper_metadata
+        columns = list(frame.columns)
+        known_ids = set(frame['paperId'].values)
 
+        inserts, updates = {}, {}
         for paper in papers:
             paper_id = paper.paperId
-            paper_dict = paper2dict(paper, processed=processed, columns=self.store.df_paper_metadata.columns)
-
-            if paper_id not in existing_paper_ids:
-                data.append(paper_dict)
-                existing_paper_ids.add(paper_id)
-            else:
-                # update existing row with refreshed metadata
-                mask = self.store.df_paper_metadata['paperId'] == paper_id
-                target_index = self.store.df_paper_metadata.index[mask]
-                if target_index.empty:
-                    continue
-                for column, value in paper_dict.items():
-                    if column == 'paperId':
-                        continue
-                    coerced_value = self._coerce_value_for_column(column, value)
-                    if len(target_index) == 1:
-                        self.store.df_paper_metadata.at[target_index[0], column] = coerced_value
-                    else:
-                        self.store.df_paper_metadata.loc[mask, column] = [coerced_value] * len(target_index)
+            if paper_id in known_ids:
+                updates[paper_id] = paper
+            elif paper_id not in inserts:
+                inserts[paper_id] = paper
 
-        if data:
-            df = pd.DataFrame(data)
+        if updates:
+            self._update_rows(updates, processed, columns)
+
+        if inserts:
+            new_rows = {column: [] for column in columns}
+            for paper in inserts.values():
+                paper_dict = paper2dict(paper, processed=processed, columns=columns)
+                for column in columns:
+                    new_rows[column].append(paper_dict[column])
+            self._intern_rows(new_rows, 'df_paper_metadata')
+            flags = [column for column in self.store.BOOL_COLUMNS['df_paper_metadata'] if column in new_rows]
+            coerce_bool = self._coercer(np.dtype(bool))
+            for column in flags:
+                new_rows[column] = [coerce_bool(value) for value in new_rows[column]]
             self.store.df_paper_metadata = pd.concat(
-                [self.store.df_paper_metadata, df], ignore_index=True
+                [self.store.df_paper_metadata, pd.DataFrame(new_rows, columns=columns)], ignore_index=True
             )
-            self.store.df_paper_metadata = self.store.df_paper_metadata.astype({'processed': bool})
-    
+            self.store.df_paper_metadata = self.store.df_paper_metadata.astype(dict.fromkeys(flags, bool))
+
+    def _intern_rows(self, rows, frame_name):
+        """Swap the ID and name columns of ``rows`` (column -> list) for the store's shared objects."""
+        for column in self.store.ID_COLUMNS.get(frame_name, ()):
+            if column in rows:
+                rows[column] = self.store.ids.intern(rows[column])
+        for column in self.store.NAME_COLUMNS.get(frame_name, ()):
+            if column in rows:
+                rows[column] = self.store.names.intern(rows[column])
+
+    def _update_rows(self, updates, processed, columns):
+        """Refresh the metadata columns of already known papers in one pass per column."""
+        frame = self.store.df_paper_metadata
+        mask = frame['paperId'].isin(updates.keys()).to_numpy()
+        row_ids = frame['paperId'].to_numpy()[mask]
+        refreshed = {paper_id: paper2dict(paper, processed=processed, columns=columns)
+                     for paper_id, paper in updates.items()}
+
+        for column in columns:
+            if column == 'paperId' or column in self.STATE_COLUMNS:
+                continue
+            if column == 'processed':
+                if processed:
+                    frame.loc[mask, 'processed'] = True
+                continue
+            dtype = frame[column].dtype
+            coerce = self._coercer(dtype)
+            values = np.empty(len(row_ids), dtype=object)
+            for i, paper_id in enumerate(row_ids):
+                values[i] = coerce(refreshed[paper_id][column])
+            if not pd_types.is_object_dtype(dtype):
+                values = values.astype(dtype)
+            frame.loc[mask, column] = values
+
     def parse_author(self, papers):
         """
         Parse author information from papers.
@@ -109,42 +165,31 @@ class MetadataParser:
         Args:
             papers: List of paper objects from API
         """
-        def _process_authors(paper_id, authors):
-            return [{'paperId': paper_id, 'authorId': author.authorId} 
-                   for author in authors if author.authorId]
-        
         self.logger.info('Parsing authors')
 
-        data_paper_author = []
-
+        paper_ids, author_ids, author_names = [], [], []
         for paper in papers:
-            data_paper_author.extend(_process_authors(paper_id=paper.paperId, authors=paper.authors))
-
-            for citation in paper.citations:
-                data_paper_author = data_paper_author + _process_authors(
-                    paper_id=citation.paperId, authors=citation.authors
-                )
-            
-            for reference in paper.references:
-                data_paper_author = data_paper_author + _process_authors(
-                    paper_id=reference.paperId, authors=reference.authors
-                )
-
-        data_author = [
-            {'authorId': author.authorId, 'authorName': author.name}
-            for paper in papers
-            for author in chain(paper.authors, *(c.authors for c in chain(paper.references, paper.citations)))
-            if author.authorId
-        ]
+            for entry in chain((paper,), paper.citations, paper.references):
+                for author in entry.authors:
+                    if author.authorId:
+                        paper_ids.append(entry.paperId)
+                        author_ids.append(author.authorId)
+                        author_names.append(author.name)
+
+        paper_ids = self.store.ids.intern(paper_ids)
+        author_ids = self.store.ids.intern(author_ids)
+        author_names = self.store.names.intern(author_names)
+        data_paper_author = pd.DataFrame({'paperId': paper_ids, 'authorId': author_ids})
+        data_author = pd.DataFrame({'authorId': author_ids, 'authorName': author_names})
 
         self.store.df_paper_author = pd.concat(
-            [self.store.df_paper_author, pd.DataFrame(data_paper_author)], ignore_index=True
+            [self.store.df_paper_author, data_paper_author], ignore_index=True
         )
         self.store.df_paper_author.drop_duplicates(inplace=True)
         self.store.df_paper_author.reset_index(drop=True, inplace=True)
 
         self.store.df_author = pd.concat(
-            [self.store.df_author, pd.DataFrame(data_author)], ignore_index=True
+            [self.store.df_author, data_author], ignore_index=True
         )
         self.store.df_author.drop_duplicates(inplace=True)
         self.store.df_author.reset_index(drop=True, inplace=True)
@@ -159,22 +204,21 @@ class MetadataParser:
         """
         self.logger.info('Parsing citations')
 
-        data = []
+        citing_ids, cited_ids, stubs = [], [], []
         for paper in papers:
-            paperId = paper.paperId
-
             citations = validator.checkPapersOpenAlex(paper.citations, processed=False)
+            citing_ids.extend([paper.paperId] * len(citations))
+            cited_ids.extend(c.paperId for c in citations)
+            stubs.extend(citations)
 
-            for c in citations:
-                data.append({
-                    'paperId': paperId,
-                    'citedPaperId': c.paperId
-                })
-
-            self.parse_metadata(citations, processed=False)
+        self.parse_metadata(stubs, processed=False)
 
         self.store.df_paper_citations = pd.concat(
-            [self.store.df_paper_citations, pd.DataFrame(data)], ignore_index=True
+            [self.store.df_paper_citations, pd.DataFrame({
+                'paperId': self.store.ids.intern(citing_ids),
+                'citedPaperId': self.store.ids.intern(cited_ids),
+            })],
+            ignore_index=True
         )
         self.store.df_paper_citations.drop_duplicates(inplace=True)
         self.store.df_paper_citations.reset_index(drop=True, inplace=True)
@@ -188,22 +232,22 @@ class MetadataParser:
             validator: PaperValidator instance for validation
         """
         self.logger.info('Parsing references')
-        data = []
-        for paper in papers:
-            paperId = paper.paperId
 
+        citing_ids, referenced_ids, stubs = [], [], []
+        for paper in papers:
             references = validator.checkPapersOpenAlex(paper.references, processed=False)
+            citing_ids.extend([paper.paperId] * len(references))
+            referenced_ids.extend(r.paperId for r in references)
+            stubs.extend(references)
 
-            for c in references:
-                data.append({
-                    'paperId': paperId,
-                    'referencePaperId': c.paperId
-                })
-
-            self.parse_metadata(references, processed=False)
+        self.parse_metadata(stubs, processed=False)
 
         self.store.df_paper_references = pd.concat(
-            [self.store.df_paper_references, pd.DataFrame(data)], ignore_index=True
+            [self.store.df_paper_references, pd.DataFrame({
+                'paperId': self.store.ids.intern(citing_ids),
+                'referencePaperId': self.store.ids.intern(referenced_ids),
+            })],
+            ignore_index=True
         )
         self.store.df_paper_references.drop_duplicates(inplace=True)
         self.store.df_paper_references.reset_index(drop=True, inplace=True)
@@ -223,7 +267,7 @@ class MetadataParser:
         for paper in papers:
             abstract = paper.abstract if hasattr(paper, 'abstract') else None
             if abstract is not None and abstract.strip():
-                data.append({'paperId': paper.paperId, 'abstract': abstract})
+                data.append({'paperId': self.store.ids.intern((paper.paperId,))[0], 'abstract': abstract})
     
         if data:
             self.store.df_abstract = pd.concat(
@@ -278,6 +322,10 @@ def paper2dict(paper, processed, columns):
     Returns:
         Dictionary with paper data
     """
+    if isinstance(paper, PaperRecord):
+        # Record fields already hold plain values; no normalization needed.
+        return {col: processed if col == 'processed' else getattr(paper, col, '') for col in columns}
+
     paper_dict = dict(paper.__dict__)
     paper_dict['processed'] = processed
     
@@ -286,10 +334,12 @@ def paper2dict(paper, processed, columns):
 
 def _normalize_paper_value(value):
     """
-    Convert nested PaperObject/list structures into plain Python types.
+    Convert nested record/object/list structures into plain Python types.
     """
     if isinstance(value, list):
         return [_normalize_paper_value(item) for item in value]
+    if isinstance(value, (PaperRecord, AuthorRecord)):
+        return value.to_dict()
     if hasattr(value, '__dict__'):
         return {key: _normalize_paper_value(val) for key, val in value.__dict__.items()}
     return value
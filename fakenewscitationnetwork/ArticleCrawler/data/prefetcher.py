@@ -0,0 +1,112 @@
+"""
+Background paper retrieval for the pipelined crawl loop.
+
+``PaperPrefetcher`` downloads the papers of an iteration on a worker thread, in
+request order and in fixed-size chunks, and hands each chunk over through a
+bounded queue so the caller can parse it while the next chunk downloads.
+``batches`` groups the chunks so each parse covers enough papers to amortize
+its per-call cost over the frames.
+"""
+
+import logging
+import queue
+import threading
+from typing import Iterator, List, Tuple
+
+_DONE = object()
+
+
+class PaperPrefetcher:
+    """
+    Streams ``PaperRetrievalService.retrieve_papers`` results chunk by chunk.
+
+    A single worker performs all API calls, so the provider's rate limiting and
+    the order of the results are the same as for one sequential call.
+    """
+
+    def __init__(self, retrieval_service, chunk_size: int = 1, queue_size: int = 4,
+                 batch_size: int = 1, logger=None):
+        """
+        Args:
+            retrieval_service: PaperRetrievalService used for the API calls
+            chunk_size: Paper IDs per ``retrieve_papers`` call
+            queue_size: Maximum fetched chunks waiting to be consumed
+            batch_size: Minimum fetched papers per item yielded by ``batches``
+            logger: Optional logger instance
+        """
+        self.retrieval = retrieval_service
+        self.chunk_size = chunk_size
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.logger = logger or logging.getLogger(__name__)
+
+    def stream(self, paper_ids: List[str]) -> Iterator[Tuple[List[str], list]]:
+        """
+        Yield ``(chunk_ids, papers)`` pairs in the order of ``paper_ids``.
+
+        Errors raised by the worker are re-raised in the consumer. Leaving the
+        loop early stops the worker after its current request.
+        """
+        chunks = [paper_ids[i:i + self.chunk_size] for i in range(0, len(paper_ids), self.chunk_size)]
+        results: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+
+        def fetch():
+            try:
+                for chunk in chunks:
+                    if stop.is_set():
+                        return
+                    papers = self.retrieval.retrieve_papers(chunk)
+                    self._put(results, (chunk, papers or []), stop)
+            except BaseException as exc:  # surfaced in the consumer
+                self._put(results, exc, stop)
+            finally:
+                self._put(results, _DONE, stop)
+
+        worker = threading.Thread(target=fetch, name="paper-prefetch", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            worker.join()
+
+    def batches(self, paper_ids: List[str]) -> Iterator[Tuple[List[str], list]]:
+        """
+        Like ``stream``, but merges consecutive chunks until they hold at least
+        ``batch_size`` fetched papers (the last batch may be smaller).
+
+        The worker keeps downloading while a batch fills up, since the queue is
+        drained as chunks arrive.
+        """
+        batch_ids: List[str] = []
+        batch_papers: list = []
+        fetched = 0
+        stream = self.stream(paper_ids)
+        try:
+            for chunk_ids, papers in stream:
+                batch_ids.extend(chunk_ids)
+                batch_papers.extend(papers)
+                fetched += sum(paper is not None for paper in papers)
+                if fetched >= self.batch_size:
+                    yield batch_ids, batch_papers
+                    batch_ids, batch_papers, fetched = [], [], 0
+            if batch_ids:
+                yield batch_ids, batch_papers
+        finally:
+            stream.close()
+
+    @staticmethod
+    def _put(results: queue.Queue, item, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
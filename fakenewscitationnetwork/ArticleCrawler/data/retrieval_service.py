@@ -1,6 +1,7 @@
 import logging
 from typing import List
 from ..api.base_api import BaseAPIProvider
+from ..LogManager.crawl_metrics import ApiCallStats
 
 class PaperRetrievalService:
     """
@@ -47,6 +48,16 @@ class PaperRetrievalService:
             
         return papers
     
+    def get_call_stats(self):
+        """
+        Get the request, retry and byte counters of the API provider.
+
+        Returns:
+            ApiCallStats or None if the provider does not keep counters
+        """
+        stats = getattr(self.api, 'call_stats', None)
+        return stats if isinstance(stats, ApiCallStats) else None
+
     def retrieve_author_papers(self, author_id: str, *, page: int = 1, page_size: int = 20):
         """
         Retrieve papers for a specific author.
@@ -1,4 +1,5 @@
+from .compact_graph import CompactDiGraph
 from .graph_manager import GraphManager
 from .graph_processing import GraphProcessing
 
-__all__ = ['GraphManager', 'GraphProcessing']
\ No newline at end of file
+__all__ = ['CompactDiGraph', 'GraphManager', 'GraphProcessing']
\ No newline at end of file
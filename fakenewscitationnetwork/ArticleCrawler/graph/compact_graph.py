@@ -0,0 +1,259 @@
+"""
+Compact Graph Backend
+
+Array-backed directed graph used by ``GraphManager`` when ``GraphConfig.backend``
+is ``'compact'``. Node IDs are interned to dense integer codes; node types and
+numeric node attributes live in numpy arrays and edges in ``int32`` source /
+target arrays, deduplicated and turned into a sparse (CSR) matrix only when a
+computation needs them. A ``networkx.DiGraph`` export is available for code that
+needs the full networkx API.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from ..data.id_interner import IdInterner
+
+
+class _NodeView:
+    """Read-only, networkx-style view over the nodes of a ``CompactDiGraph``."""
+
+    def __init__(self, graph: 'CompactDiGraph'):
+        self._graph = graph
+
+    def __call__(self, data: bool = False):
+        ids = self._graph._ids.decode(range(self._graph.number_of_nodes()))
+        if not data:
+            return ids
+        return [(node, self._graph._node_data(code)) for code, node in enumerate(ids)]
+
+    def __getitem__(self, node) -> Dict:
+        code = self._graph._ids.lookup((node,))[0]
+        if code < 0:
+            raise KeyError(node)
+        return self._graph._node_data(code)
+
+    def __contains__(self, node) -> bool:
+        return node in self._graph._ids
+
+    def __iter__(self):
+        return iter(self())
+
+    def __len__(self) -> int:
+        return self._graph.number_of_nodes()
+
+
+class CompactDiGraph:
+    """
+    Directed graph over interned integer node IDs.
+
+    Implements the operations the crawler uses: bulk node and edge insertion,
+    node-type queries, eigenvector centrality, a reversed view and export to
+    networkx. As in ``networkx.DiGraph``, parallel edges collapse into one (the
+    last edge type wins) and edge endpoints are added as untyped nodes.
+    """
+
+    NODE_TYPES = ('paper', 'author', 'venue')
+    EDGE_TYPES = ('citation', 'reference', 'author', 'venue')
+
+    def __init__(self):
+        self._ids = IdInterner()
+        self._ntype = np.zeros(0, dtype=np.int8)
+        self._attributes: Dict[str, np.ndarray] = {}
+        self._edge_chunks: List[tuple] = []
+        self._src = np.zeros(0, dtype=np.int32)
+        self._dst = np.zeros(0, dtype=np.int32)
+        self._etype = np.zeros(0, dtype=np.int8)
+        self._matrix = None
+
+    @property
+    def nodes(self) -> _NodeView:
+        return _NodeView(self)
+
+    def number_of_nodes(self) -> int:
+        return len(self._ids)
+
+    def number_of_edges(self) -> int:
+        self._consolidate()
+        return len(self._src)
+
+    def __len__(self) -> int:
+        return self.number_of_nodes()
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def add_nodes_from(self, nodes: Iterable[str], ntype: Optional[str] = None) -> None:
+        """Add nodes (existing nodes keep their code; ``ntype`` overwrites the type)."""
+        codes = self._ids.encode(nodes)
+        self._grow()
+        if ntype is not None:
+            self._ntype[codes] = self._type_code(ntype, self.NODE_TYPES)
+
+    def add_edges_from(self, edges: Iterable[Sequence[str]], etype: Optional[str] = None) -> None:
+        """networkx-compatible edge insertion from ``(source, target)`` pairs."""
+        pairs = list(edges)
+        self.add_edge_arrays([u for u, _ in pairs], [v for _, v in pairs], etype)
+
+    def add_edge_arrays(self, sources: Iterable[str], targets: Iterable[str], etype: Optional[str] = None) -> None:
+        """Add edges given as two aligned ID sequences (e.g. two frame columns)."""
+        src = self._ids.encode(sources)
+        dst = self._ids.encode(targets)
+        if len(src) != len(dst):
+            raise ValueError("sources and targets must have the same length")
+        self._grow()
+        if len(src):
+            code = self._type_code(etype, self.EDGE_TYPES) if etype is not None else 0
+            self._edge_chunks.append((src, dst, np.full(len(src), code, dtype=np.int8)))
+            self._matrix = None
+
+    def edges(self, data: bool = False):
+        self._consolidate()
+        ids = self._ids.decode
+        pairs = zip(ids(self._src), ids(self._dst))
+        if not data:
+            return list(pairs)
+        return [(u, v, self._edge_data(code)) for (u, v), code in zip(pairs, self._etype)]
+
+    def nodes_of_type(self, ntype: str) -> List[str]:
+        """IDs of the nodes with type ``ntype``, in insertion order."""
+        codes = np.flatnonzero(self._ntype == self._type_code(ntype, self.NODE_TYPES))
+        return self._ids.decode(codes)
+
+    def node_type_counts(self) -> Dict[str, int]:
+        """Number of nodes per node type."""
+        counts = np.bincount(self._ntype, minlength=len(self.NODE_TYPES) + 1)
+        return {name: int(counts[i + 1]) for i, name in enumerate(self.NODE_TYPES)}
+
+    def set_node_values(self, name: str, values: np.ndarray) -> None:
+        """Store a numeric node attribute, aligned with the node codes (NaN = unset)."""
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) != self.number_of_nodes():
+            raise ValueError(f"expected {self.number_of_nodes()} values, got {len(values)}")
+        self._attributes[name] = values.copy()
+
+    def node_frame(self, ntype: str, attributes: Sequence[str], nodes: Optional[Iterable[str]] = None,
+                   id_column: str = 'nodeId') -> pd.DataFrame:
+        """
+        Attributes of the nodes of one type as a DataFrame (empty when no node matches).
+
+        Args:
+            ntype: Node type to select
+            attributes: Node attributes to include as columns
+            nodes: Optional node IDs to restrict the selection to
+            id_column: Name of the ID column
+        """
+        mask = self._ntype == self._type_code(ntype, self.NODE_TYPES)
+        if nodes is not None:
+            codes = self._ids.lookup(nodes)
+            wanted = np.zeros(len(mask), dtype=bool)
+            wanted[codes[codes >= 0]] = True
+            mask &= wanted
+        codes = np.flatnonzero(mask)
+        if not len(codes):
+            return pd.DataFrame()
+        data = {id_column: self._ids.decode(codes)}
+        for name in attributes:
+            values = self._attributes.get(name)
+            data[name] = values[codes] if values is not None else np.full(len(codes), np.nan)
+        return pd.DataFrame(data)
+
+    def reverse(self) -> 'CompactDiGraph':
+        """Graph with every edge flipped; node arrays are shared, not copied."""
+        self._consolidate()
+        reversed_graph = CompactDiGraph.__new__(CompactDiGraph)
+        reversed_graph._ids = self._ids
+        reversed_graph._ntype = self._ntype
+        reversed_graph._attributes = self._attributes
+        reversed_graph._edge_chunks = []
+        reversed_graph._src, reversed_graph._dst = self._dst, self._src
+        reversed_graph._etype = self._etype
+        reversed_graph._matrix = None
+        return reversed_graph
+
+    def eigenvector_centrality(self, max_iter: int = 100, tol: float = 1.0e-6) -> np.ndarray:
+        """
+        In-edge eigenvector centrality, aligned with the node codes.
+
+        Same iteration as ``networkx.eigenvector_centrality`` (power iteration
+        on ``A.T + I`` from a uniform start, L2-normalised, stopping when the
+        L1 change drops below ``n * tol``) on a sparse matrix.
+
+        Raises:
+            networkx.PowerIterationFailedConvergence: if ``max_iter`` is reached
+            networkx.NetworkXPointlessConcept: for an empty graph
+        """
+        n = self.number_of_nodes()
+        if n == 0:
+            raise nx.NetworkXPointlessConcept("cannot compute centrality for the null graph")
+        matrix = self._in_matrix()
+        x = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            x_last = x
+            x = x_last + matrix @ x_last
+            norm = np.linalg.norm(x) or 1.0
+            x = x / norm
+            if np.abs(x - x_last).sum() < n * tol:
+                return x
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Export to a ``networkx.DiGraph`` with the same node and edge attributes."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.nodes(data=True))
+        graph.add_edges_from(self.edges(data=True))
+        return graph
+
+    def _grow(self) -> None:
+        missing = self.number_of_nodes() - len(self._ntype)
+        if missing > 0:
+            self._ntype = np.concatenate([self._ntype, np.zeros(missing, dtype=np.int8)])
+            for name, values in self._attributes.items():
+                self._attributes[name] = np.concatenate([values, np.full(missing, np.nan)])
+
+    def _consolidate(self) -> None:
+        """Merge pending edge chunks into the edge arrays, dropping parallel edges."""
+        if not self._edge_chunks:
+            return
+        src = np.concatenate([self._src] + [chunk[0] for chunk in self._edge_chunks])
+        dst = np.concatenate([self._dst] + [chunk[1] for chunk in self._edge_chunks])
+        etype = np.concatenate([self._etype] + [chunk[2] for chunk in self._edge_chunks])
+        self._edge_chunks = []
+        keys = (src.astype(np.int64) << 32) | dst.astype(np.int64)
+        # Last occurrence wins, like re-adding an edge with new attributes in networkx.
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = np.sort(len(keys) - 1 - last)
+        self._src, self._dst, self._etype = src[keep], dst[keep], etype[keep]
+
+    def _in_matrix(self):
+        """Sparse ``A.T`` (CSR): row ``v`` holds the sources of the edges into ``v``."""
+        from scipy import sparse
+
+        self._consolidate()
+        n = self.number_of_nodes()
+        if self._matrix is None or self._matrix.shape[0] != n:
+            data = np.ones(len(self._src), dtype=np.float64)
+            self._matrix = sparse.csr_matrix((data, (self._dst, self._src)), shape=(n, n))
+        return self._matrix
+
+    def _node_data(self, code: int) -> Dict:
+        data = {}
+        if self._ntype[code]:
+            data['ntype'] = self.NODE_TYPES[self._ntype[code] - 1]
+        for name, values in self._attributes.items():
+            if not np.isnan(values[code]):
+                data[name] = float(values[code])
+        return data
+
+    def _edge_data(self, code: int) -> Dict:
+        return {'etype': self.EDGE_TYPES[code - 1]} if code else {}
+
+    @staticmethod
+    def _type_code(name: str, names: Sequence[str]) -> int:
+        try:
+            return names.index(name) + 1
+        except ValueError:
+            raise ValueError(f"unknown type {name!r}; expected one of {names}") from None
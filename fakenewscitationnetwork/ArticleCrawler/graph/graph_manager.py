@@ -9,6 +9,8 @@ import networkx as nx
 import pandas as pd
 import logging
 
+from .compact_graph import CompactDiGraph
+
 class GraphManager:
     """
     Responsible for generating and managing the graph based on input frames.
@@ -20,18 +22,43 @@ class GraphManager:
     Attributes:
         graph_options (object): Options for configuring the graph generation.
         reporting_options (object): Options for reporting and analysis.
-        DG (networkx.DiGraph): Directed graph to store the generated graph.
+        DG (networkx.DiGraph or CompactDiGraph): Directed graph to store the generated graph,
+            chosen by ``graph_options.backend`` ('networkx' by default, or 'compact').
 
     """
         
     def __init__(self, graph_options=None, reporting_options=None,logger=None):
         self.graph_options = graph_options
         self.reporting_options = reporting_options
-        self.DG = nx.DiGraph()
         self.logger = logger or logging.getLogger(__name__)
+        self.DG = self._create_graph(getattr(graph_options, 'backend', 'networkx'))
         if self.graph_options is None:
             self.logger.info("No graph options provided.")
 
+    @staticmethod
+    def _create_graph(backend):
+        if backend == 'compact':
+            return CompactDiGraph()
+        return nx.DiGraph()
+
+    @property
+    def is_compact(self):
+        return isinstance(self.DG, CompactDiGraph)
+
+    def to_networkx(self):
+        """Return the graph as a networkx.DiGraph (exported when the compact backend is used)."""
+        return self.DG.to_networkx() if self.is_compact else self.DG
+
+    def get_node_type_counts(self):
+        """Number of paper, author and venue nodes in the graph."""
+        if self.is_compact:
+            return self.DG.node_type_counts()
+        counts = {'paper': 0, 'author': 0, 'venue': 0}
+        for _, ntype in self.DG.nodes(data='ntype'):
+            if ntype in counts:
+                counts[ntype] += 1
+        return counts
+
     def extract_graph_data(self):
         """
         Extracts the set of papers, authors, and venues from the graph.
@@ -42,6 +69,8 @@ class GraphManager:
             venues (list): List of venues.
 
         """
+        if self.is_compact:
+            return tuple(self.DG.nodes_of_type(ntype) for ntype in ('paper', 'author', 'venue'))
         paper_ids = [node for node, data in self.DG.nodes(data=True) if data.get('ntype') == 'paper']
         author_ids = [node for node, data in self.DG.nodes(data=True) if data.get('ntype') == 'author']
         venues = [node for node, data in self.DG.nodes(data=True) if data.get('ntype') == 'venue']
@@ -94,8 +123,7 @@ class GraphManager:
 
         # Add new author nodes to the graph and create edges from new authors to their corresponding papers
         new_author_papers = frames.df_paper_author[frames.df_paper_author.authorId.isin(new_author_ids)][['paperId', 'authorId']]
-        author_paper_edges = list(zip(new_author_papers['authorId'], new_author_papers['paperId']))
-        self.DG.add_edges_from(author_paper_edges, etype='author')
+        self._add_edges(new_author_papers['authorId'], new_author_papers['paperId'], etype='author')
 
         # Filter out ignored venues and add new venue nodes to the graph
         new_venues_filtered = [venue for venue in new_venues if venue not in self.graph_options.ignored_venues]
@@ -103,30 +131,35 @@ class GraphManager:
 
         # Create edges from new venues to their corresponding papers
         new_venue_papers = frames.df_paper_metadata[frames.df_paper_metadata.venue.isin(new_venues_filtered)][['venue', 'paperId']]
-        venue_paper_edges = list(zip(new_venue_papers['venue'], new_venue_papers['paperId']))
-        self.DG.add_edges_from(venue_paper_edges, etype='venue')
+        self._add_edges(new_venue_papers['venue'], new_venue_papers['paperId'], etype='venue')
 
         # Create edges for new papers based on citation links
         new_paper_citations = frames.df_paper_citations[frames.df_paper_citations.paperId.isin(new_paper_ids)][['paperId', 'citedPaperId']]
-        citation_edges = list(zip(new_paper_citations['paperId'], new_paper_citations['citedPaperId']))
-        self.DG.add_edges_from(citation_edges, etype='citation')
+        self._add_edges(new_paper_citations['paperId'], new_paper_citations['citedPaperId'], etype='citation')
 
         # Create edges for new papers based on reference links
         new_paper_references = frames.df_paper_references[frames.df_paper_references.paperId.isin(new_paper_ids)][['referencePaperId', 'paperId']]
-        reference_edges = list(zip(new_paper_references['referencePaperId'], new_paper_references['paperId']))
-        self.DG.add_edges_from(reference_edges, etype='reference')
+        self._add_edges(new_paper_references['referencePaperId'], new_paper_references['paperId'], etype='reference')
 
         return None
+
+    def _add_edges(self, sources, targets, etype):
+        if self.is_compact:
+            self.DG.add_edge_arrays(sources, targets, etype=etype)
+        else:
+            self.DG.add_edges_from(zip(sources, targets), etype=etype)
     
     def get_graph_info(self):
-        num_nodes = len(self.DG.nodes())
-        num_edges = len(self.DG.edges())
+        num_nodes = self.DG.number_of_nodes()
+        num_edges = self.DG.number_of_edges()
         return num_nodes, num_edges
     
     def get_paper_centralities(self, paperIds):
         """
         extract centralities
         """
+        if self.is_compact:
+            return self.DG.node_frame('paper', ['centrality (in)', 'centrality (out)'], nodes=paperIds, id_column='paperId')
         paper_id_set = set(paperIds)
 
         centralities = [(node, data.get('centrality (in)'), data.get('centrality (out)')) 
@@ -152,6 +185,8 @@ class GraphManager:
         extract centralities
         """
 
+        if self.is_compact:
+            return self.DG.node_frame('author', ['centrality (in)', 'centrality (out)'], id_column='paperId')
         centralities = [(node, data.get('centrality (in)'), data.get('centrality (out)')) 
                         for node, data in self.DG.nodes(data=True) 
                         if data.get('ntype') == 'author' ]
@@ -167,6 +202,8 @@ class GraphManager:
         extract centralities
         """
 
+        if self.is_compact:
+            return self.DG.node_frame('venue', ['centrality (in)', 'centrality (out)'], id_column='paperId')
         centralities = [(node, data.get('centrality (in)'), data.get('centrality (out)')) 
                         for node, data in self.DG.nodes(data=True) 
                         if data.get('ntype') == 'venue' ]
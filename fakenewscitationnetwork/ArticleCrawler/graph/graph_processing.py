@@ -4,6 +4,8 @@ import pandas as pd
 import logging
 import os
 
+from .compact_graph import CompactDiGraph
+
 # Set the environment variable
 os.environ['PYDEVD_WARN_EVALUATION_TIMEOUT'] = '15'
 
@@ -49,6 +51,9 @@ class GraphProcessing:
         The centrality measures to be calculated include Eigenvector Centrality for the directed graph DG and its reverse version DG.reverse().
         """
         DG = self.data_manager.graph.DG
+        if isinstance(DG, CompactDiGraph):
+            self._calculate_compact_centrality(DG)
+            return
         try:
             self.logger.info('Centralities calculation (in) starts')
             eigenvector_centrality = nx.eigenvector_centrality(DG, max_iter=1000)
@@ -89,4 +94,19 @@ class GraphProcessing:
        
         except Exception as e:
             error_message = f"An error occurred: {str(e)}"
-            self.logger.info(error_message)
\ No newline at end of file
+            self.logger.info(error_message)
+
+    def _calculate_compact_centrality(self, DG):
+        """Same centralities as above, computed on the sparse matrix of a CompactDiGraph."""
+        for direction, graph in (('in', DG), ('out', DG.reverse())):
+            try:
+                self.logger.info(f'Centralities calculation ({direction}) starts')
+                values = graph.eigenvector_centrality(max_iter=1000)
+                self.logger.info(f'Centralities ({direction}) calculation ended')
+                missing = np.isnan(values)
+                if missing.any():
+                    self.logger.info(f'NaN centrality ({direction}) for {int(missing.sum())} nodes')
+                DG.set_node_values(f'centrality ({direction})', values)
+            except Exception as e:
+                error_message = f"An error occurred: {str(e)}"
+                self.logger.info(error_message)
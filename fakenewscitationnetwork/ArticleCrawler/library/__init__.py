@@ -1,7 +1,16 @@
-from .library_manager import LibraryManager
-from .models import LibraryConfig, PaperData, TopicCluster
-from .paper_file_reader import PaperFileReader
-from .topic_overview_writer import TopicOverviewWriter
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(__name__, {
+    'LibraryManager': '.library_manager',
+    'LibraryConfig': '.models',
+    'PaperData': '.models',
+    'TopicCluster': '.models',
+    'PaperFileReader': '.paper_file_reader',
+    'PaperManifest': '.paper_manifest',
+    'LibraryWriter': '.library_writer',
+    'TopicOverviewWriter': '.topic_overview_writer',
+    'LocalTitleIndex': '.title_index',
+})
 
 __all__ = [
     'LibraryManager',
@@ -9,5 +18,8 @@ __all__ = [
     'PaperData',
     'TopicCluster',
     'PaperFileReader',
-    'TopicOverviewWriter'
-]
\ No newline at end of file
+    'PaperManifest',
+    'LibraryWriter',
+    'TopicOverviewWriter',
+    'LocalTitleIndex',
+]
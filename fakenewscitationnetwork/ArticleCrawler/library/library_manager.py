@@ -6,6 +6,8 @@ from typing import Optional, List
 import logging
 
 from .models import LibraryConfig
+from .paper_file_reader import PaperFileReader
+from .paper_manifest import PaperManifest
 
 
 class LibraryManager:
@@ -16,6 +18,7 @@ class LibraryManager:
     - Create library folder structure
     - Save/load library configuration
     - Query library structure
+    - Keep the papers directory's Parquet manifest in sync
     
     Does NOT:
     - Create markdown files (delegates to MarkdownFileGenerator)
@@ -108,6 +111,25 @@ class LibraryManager:
         papers_dir = self.get_papers_directory(library_path)
         return list(papers_dir.glob("*.md"))
     
+    def get_manifest_path(self, library_path: Path) -> Path:
+        """Get path to the Parquet manifest of parsed paper metadata."""
+        return self.get_papers_directory(library_path) / PaperManifest.FILENAME
+    
+    def refresh_manifest(self, library_path: Path) -> int:
+        """
+        Bring the paper manifest up to date, re-parsing only changed notes.
+        
+        Args:
+            library_path: Path to library root
+            
+        Returns:
+            Number of papers in the manifest
+        """
+        papers_dir = self.get_papers_directory(library_path)
+        if not papers_dir.exists():
+            return 0
+        return len(PaperFileReader(logger=self.logger).read_papers_from_directory(papers_dir))
+    
     def library_exists(self, library_path: Path) -> bool:
         """
         Check if a library exists at given path.
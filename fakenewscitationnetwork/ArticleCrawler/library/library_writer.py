@@ -0,0 +1,123 @@
+
+
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from .models import PaperData
+
+
+class LibraryWriter:
+    """
+    Writes many paper notes and topic-folder entries concurrently.
+
+    Responsibilities:
+    - Render and write PaperData notes on a thread pool (unchanged notes are skipped)
+    - Place existing notes into topic folders as hard links, symlinks or copies
+
+    Does NOT:
+    - Render markdown itself (delegates to MarkdownFileGenerator)
+    - Decide file names or folder layout (callers pass target paths)
+    """
+
+    LINK_MODES = ('hardlink', 'symlink', 'copy')
+
+    def __init__(
+        self,
+        markdown_writer,
+        max_workers: int = 8,
+        link_mode: str = 'hardlink',
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize library writer.
+
+        Args:
+            markdown_writer: MarkdownFileGenerator used to render/write notes
+            max_workers: Maximum concurrent file operations
+            link_mode: How topic folders reference notes ('hardlink', 'symlink' or 'copy');
+                links fall back to copies where the filesystem refuses them
+            logger: Optional logger instance
+        """
+        if link_mode not in self.LINK_MODES:
+            raise ValueError(f"link_mode must be one of {self.LINK_MODES}, got {link_mode!r}")
+        self.markdown_writer = markdown_writer
+        self.max_workers = max(1, max_workers)
+        self.link_mode = link_mode
+        self.logger = logger or logging.getLogger(__name__)
+
+    def write_papers(self, items: Sequence[Tuple[PaperData, Path]]) -> List[Path]:
+        """
+        Write each paper to its output path.
+
+        Args:
+            items: (paper, output_path) pairs
+
+        Returns:
+            Paths that were written or already up to date (failures are logged and left out)
+        """
+        def write(item: Tuple[PaperData, Path]) -> Optional[Path]:
+            paper, output_path = item
+            try:
+                self.markdown_writer.create_paper_markdown_with_openalex_metadata(
+                    paper_data=paper,
+                    output_path=output_path
+                )
+                return Path(output_path)
+            except Exception as e:
+                self.logger.error(f"Failed to save paper {paper.paper_id}: {e}")
+                return None
+
+        return [path for path in self._map(write, items) if path is not None]
+
+    def link_papers(self, items: Sequence[Tuple[Path, Path]]) -> List[Path]:
+        """
+        Make each target reference its source note.
+
+        Args:
+            items: (source_path, target_path) pairs
+
+        Returns:
+            Target paths now holding the note (failures are logged and left out)
+        """
+        def link(item: Tuple[Path, Path]) -> Optional[Path]:
+            source, target = Path(item[0]), Path(item[1])
+            try:
+                self._link(source, target)
+                return target
+            except Exception as e:
+                self.logger.error(f"Failed to place {source.name} in {target.parent}: {e}")
+                return None
+
+        return [path for path in self._map(link, items) if path is not None]
+
+    def _link(self, source: Path, target: Path) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists() or target.is_symlink():
+            if self.link_mode != 'copy' and target.exists() and os.path.samefile(source, target):
+                return
+            target.unlink()
+
+        if self.link_mode == 'hardlink':
+            try:
+                os.link(source, target)
+                return
+            except OSError as e:
+                self.logger.debug(f"Hard link failed for {target}, copying instead: {e}")
+        elif self.link_mode == 'symlink':
+            try:
+                target.symlink_to(os.path.relpath(source, target.parent))
+                return
+            except OSError as e:
+                self.logger.debug(f"Symlink failed for {target}, copying instead: {e}")
+        shutil.copyfile(source, target)
+
+    def _map(self, func, items: Sequence) -> List:
+        items = list(items)
+        if len(items) <= 1 or self.max_workers == 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(func, items))
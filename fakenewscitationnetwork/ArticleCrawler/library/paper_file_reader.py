@@ -6,8 +6,12 @@ from typing import Optional
 import logging
 
 from .models import PaperData
+from .paper_manifest import PaperManifest
 from ..normalization import normalize_venue
 
+# libyaml's C loader parses frontmatter several times faster when available.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class PaperFileReader:
     """
@@ -17,6 +21,7 @@ class PaperFileReader:
     - Read markdown files with YAML frontmatter
     - Parse frontmatter into PaperData
     - Handle file I/O errors gracefully
+    - Reuse the directory's PaperManifest so unchanged notes are not re-parsed
     
     Does NOT:
     - Create markdown files (that's MarkdownFileGenerator's job)
@@ -24,14 +29,16 @@ class PaperFileReader:
     - Organize files into folders (that's LibraryManager's job)
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(self, logger: Optional[logging.Logger] = None, use_manifest: bool = True):
         """
         Initialize paper file reader.
         
         Args:
             logger: Optional logger instance
+            use_manifest: Load directories through their Parquet paper manifest
         """
         self.logger = logger or logging.getLogger(__name__)
+        self.use_manifest = use_manifest
     
     def read_paper_from_markdown(self, file_path: Path) -> Optional[PaperData]:
         """
@@ -59,7 +66,7 @@ class PaperFileReader:
             frontmatter_text = parts[1]
             body_text = parts[2]
             
-            metadata = yaml.safe_load(frontmatter_text)
+            metadata = yaml.load(frontmatter_text, Loader=_YAML_LOADER)
             
             if not metadata:
                 self.logger.warning(f"Empty frontmatter in {file_path}")
@@ -125,6 +132,9 @@ class PaperFileReader:
         """
         Read all paper markdown files from a directory.
         
+        With ``use_manifest`` only notes changed since the last read are parsed;
+        the rest come from the directory's Parquet manifest.
+        
         Args:
             directory_path: Path to directory containing markdown files
             
@@ -138,6 +148,11 @@ class PaperFileReader:
             self.logger.error(f"Directory does not exist: {directory_path}")
             return papers
         
+        if self.use_manifest:
+            papers = PaperManifest(directory_path, logger=self.logger).load(self.read_paper_from_markdown)
+            self.logger.info(f"Loaded {len(papers)} papers from {directory_path}")
+            return papers
+        
         markdown_files = list(directory_path.glob("*.md"))
         self.logger.info(f"Found {len(markdown_files)} markdown files in {directory_path}")
         
@@ -0,0 +1,183 @@
+
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .models import PaperData
+
+
+_SCALAR_FIELDS = ('paper_id', 'title', 'venue', 'venue_raw', 'venue_id', 'doi', 'abstract', 'url', 'topic_label')
+_INT_FIELDS = ('year', 'assigned_topic')
+_LIST_FIELDS = ('authors', 'concepts', 'topics', 'subfields', 'fields', 'domains')
+
+
+class PaperManifest:
+    """
+    Columnar (Parquet) manifest of the ``PaperData`` parsed from a papers directory.
+
+    Responsibilities:
+    - Keep one row per markdown file with its mtime, size and content hash
+    - Re-parse only notes whose mtime/size changed and whose content hash differs
+    - Drop rows for deleted notes and persist the result atomically
+
+    Does NOT:
+    - Parse markdown itself (the ``parse`` callable passed to ``load`` does)
+    - Create or modify markdown files
+    """
+
+    FILENAME = ".paper_manifest.parquet"
+    VERSION = "1"
+
+    def __init__(self, directory_path: Path, logger: Optional[logging.Logger] = None):
+        """
+        Initialize manifest for a papers directory.
+
+        Args:
+            directory_path: Directory holding the paper markdown files
+            logger: Optional logger instance
+        """
+        self.directory_path = Path(directory_path)
+        self.path = self.directory_path / self.FILENAME
+        self.logger = logger or logging.getLogger(__name__)
+
+    def load(self, parse: Callable[[Path], Optional[PaperData]]) -> List[PaperData]:
+        """
+        Return the papers in the directory, re-parsing only changed notes.
+
+        Args:
+            parse: Parses one markdown file into PaperData (None on failure)
+
+        Returns:
+            List of PaperData objects in directory listing order
+        """
+        cached = self._read()
+        rows: Dict[str, Dict] = {}
+        papers: List[PaperData] = []
+        reparsed = 0
+
+        for file_path in self.directory_path.glob("*.md"):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            name = file_path.name
+            row = cached.get(name)
+            if row is not None and (row['mtime_ns'], row['size']) != (stat.st_mtime_ns, stat.st_size):
+                content_hash = self._hash(file_path)
+                row = dict(row, mtime_ns=stat.st_mtime_ns, size=stat.st_size) if row['content_hash'] == content_hash else None
+            else:
+                content_hash = None
+
+            if row is None:
+                reparsed += 1
+                paper = parse(file_path)
+                if paper is None:
+                    continue
+                row = self._to_row(paper)
+                row.update(
+                    file=name,
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    content_hash=content_hash or self._hash(file_path),
+                )
+            rows[name] = row
+            # Fresh and cached papers both go through the row so results never
+            # depend on whether the manifest was warm.
+            papers.append(self._from_row(row))
+
+        if rows != cached:
+            self._write(list(rows.values()))
+        self.logger.debug(
+            f"Paper manifest for {self.directory_path}: {len(rows)} papers, {reparsed} re-parsed"
+        )
+        return papers
+
+    def invalidate(self) -> None:
+        """Delete the manifest so the next load re-parses every note."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read(self) -> Dict[str, Dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(self.path)
+            metadata = table.schema.metadata or {}
+            if metadata.get(b'version') != self.VERSION.encode():
+                return {}
+            return {row['file']: row for row in table.to_pylist()}
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable paper manifest {self.path}: {e}")
+            return {}
+
+    def _write(self, rows: List[Dict]) -> None:
+        # Unique per write, so threads and processes saving the same manifest
+        # never share a temp file; the last os.replace wins.
+        tmp_path = self.path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pylist(rows, schema=self._schema())
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            # A read-only library still loads; it just re-parses next time.
+            self.logger.debug(f"Could not write paper manifest {self.path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _schema(self):
+        import pyarrow as pa
+
+        columns = [
+            pa.field('file', pa.string()),
+            pa.field('mtime_ns', pa.int64()),
+            pa.field('size', pa.int64()),
+            pa.field('content_hash', pa.string()),
+        ]
+        columns += [pa.field(name, pa.string()) for name in _SCALAR_FIELDS]
+        columns += [pa.field(name, pa.int64()) for name in _INT_FIELDS]
+        columns += [pa.field(name, pa.string()) for name in _LIST_FIELDS]
+        return pa.schema(columns, metadata={'version': self.VERSION})
+
+    @staticmethod
+    def _to_row(paper: PaperData) -> Dict:
+        data = asdict(paper)
+        row = {name: None if data[name] is None else str(data[name]) for name in _SCALAR_FIELDS}
+        row.update({name: _as_int(data[name]) for name in _INT_FIELDS})
+        row.update({name: json.dumps(data[name] or [], default=str) for name in _LIST_FIELDS})
+        return row
+
+    @staticmethod
+    def _from_row(row: Dict) -> PaperData:
+        values = {name: row.get(name) for name in _SCALAR_FIELDS + _INT_FIELDS}
+        values.update({name: json.loads(row.get(name) or '[]') for name in _LIST_FIELDS})
+        values['paper_id'] = values['paper_id'] or ''
+        values['title'] = values['title'] or ''
+        return PaperData(**{f.name: values[f.name] for f in fields(PaperData)})
+
+    @staticmethod
+    def _hash(file_path: Path) -> str:
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def _as_int(value) -> Optional[int]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,249 @@
+"""
+Local title index over papers we already have on disk.
+
+Matching consults this index before issuing remote title searches, so
+re-importing papers that already appear in a crawl catalog or library is
+resolved without network calls.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from ..api.zotero.matching.strategies import TitleSimilarityCalculator
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - exact-title lookups still work without it
+    fuzz = None
+    process = None
+
+
+_CATALOG_COLUMNS = {
+    'paperId': 'paper_id',
+    'title': 'title',
+    'year': 'year',
+    'venue': 'venue',
+    'doi': 'doi',
+}
+
+
+class LocalTitleIndex:
+    """
+    Normalized-title index built from crawl ``papers.parquet`` catalogs and
+    library markdown frontmatter.
+
+    Exact normalized titles are answered from a dict; otherwise candidates are
+    scored in one vectorized RapidFuzz pass with a score cutoff, which lets it
+    skip titles whose length alone rules them out. Sources are re-read only
+    when their modification time changes.
+    """
+
+    CATALOG_GLOB = "**/vault/parquet/papers.parquet"
+    LIBRARY_CONFIG = "library_config.yaml"
+
+    def __init__(
+        self,
+        experiments_roots: Optional[Iterable[Path]] = None,
+        library_roots: Optional[Iterable[Path]] = None,
+        min_similarity: float = 0.6,
+        id_prefix: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            experiments_roots: Directories scanned for crawl catalogs
+            library_roots: Directories scanned (3 levels deep) for libraries
+            min_similarity: Candidates scoring below this are never returned
+            id_prefix: Only index papers whose ID starts with this (e.g. ``"W"``
+                for OpenAlex), so results match the provider being queried
+            logger: Optional logger instance
+        """
+        self.experiments_roots = [Path(p) for p in experiments_roots or []]
+        self.library_roots = [Path(p) for p in library_roots or []]
+        self.min_similarity = min_similarity
+        self.id_prefix = id_prefix
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._sources: Dict[Path, Tuple[int, List[Dict]]] = {}
+        self._entries: List[Dict] = []
+        self._normalized: List[str] = []
+        self._exact: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add_entries(self, entries: Iterable[Dict], source: str = "<memory>") -> None:
+        """Index ``entries`` (dicts with at least ``paper_id`` and ``title``) under ``source``."""
+        with self._lock:
+            self._sources[Path(source)] = (0, [e for e in entries if e.get('paper_id') and e.get('title')])
+            self._rebuild()
+
+    def refresh(self) -> int:
+        """Re-scan the configured roots, reloading changed sources. Returns the entry count."""
+        with self._lock:
+            found: Dict[Path, int] = {}
+            for path in self._catalog_paths():
+                found[path] = self._mtime(path)
+            for path in self._library_paper_files():
+                found[path] = self._mtime(path)
+
+            changed = False
+            for path in [p for p in self._sources if p not in found and self._is_scanned(p)]:
+                del self._sources[path]
+                changed = True
+            for path, mtime in found.items():
+                cached = self._sources.get(path)
+                if cached is not None and cached[0] == mtime:
+                    continue
+                self._sources[path] = (mtime, self._load(path))
+                changed = True
+
+            if changed:
+                self._rebuild()
+                self.logger.info(f"Local title index holds {len(self._entries)} papers from {len(self._sources)} sources")
+            return len(self._entries)
+
+    def search(self, title: str, max_results: int = 10) -> List[Dict]:
+        """
+        Return up to ``max_results`` local papers resembling ``title``, best first.
+
+        Each result carries ``paper_id``, ``title``, ``year``, ``venue``, ``doi``
+        and the ``similarity`` (0-1) it was ranked by.
+        """
+        query = TitleSimilarityCalculator._normalize(title or "")
+        if not query:
+            return []
+        with self._lock:
+            exact = self._exact.get(query)
+            if exact is not None:
+                return [self._result(exact, 1.0)]
+            if process is None or not self._normalized:
+                return []
+            matches = process.extract(
+                query,
+                self._normalized,
+                scorer=fuzz.ratio,
+                limit=max_results,
+                score_cutoff=self.min_similarity * 100,
+            )
+            return [self._result(index, score / 100.0) for _, score, index in matches]
+
+    def _result(self, index: int, similarity: float) -> Dict:
+        entry = self._entries[index]
+        return {
+            'paper_id': entry['paper_id'],
+            'title': entry['title'],
+            'year': entry.get('year'),
+            'venue': entry.get('venue'),
+            'doi': entry.get('doi'),
+            'similarity': similarity,
+            'source': 'local',
+        }
+
+    def _rebuild(self) -> None:
+        seen = set()
+        entries: List[Dict] = []
+        for _, source_entries in self._sources.values():
+            for entry in source_entries:
+                if self.id_prefix and not str(entry['paper_id']).startswith(self.id_prefix):
+                    continue
+                if entry['paper_id'] in seen:
+                    continue
+                seen.add(entry['paper_id'])
+                entries.append(entry)
+        self._entries = entries
+        self._normalized = [TitleSimilarityCalculator._normalize(e['title']) for e in entries]
+        self._exact = {}
+        for index, normalized in enumerate(self._normalized):
+            self._exact.setdefault(normalized, index)
+
+    def _catalog_paths(self) -> List[Path]:
+        paths: List[Path] = []
+        for root in self.experiments_roots:
+            if root.exists():
+                paths.extend(sorted(root.glob(self.CATALOG_GLOB)))
+        return paths
+
+    def _library_paper_files(self) -> List[Path]:
+        files: List[Path] = []
+        for root in self.library_roots:
+            for library in self._find_libraries(root, max_depth=3):
+                files.extend(sorted((library / "papers").glob("*.md")))
+        return files
+
+    def _find_libraries(self, directory: Path, max_depth: int) -> List[Path]:
+        if not directory.is_dir():
+            return []
+        if (directory / self.LIBRARY_CONFIG).exists():
+            return [directory]
+        if max_depth <= 0:
+            return []
+        libraries: List[Path] = []
+        try:
+            for child in directory.iterdir():
+                if child.is_dir() and not child.name.startswith('.'):
+                    libraries.extend(self._find_libraries(child, max_depth - 1))
+        except PermissionError:
+            self.logger.debug(f"Permission denied: {directory}")
+        return libraries
+
+    def _is_scanned(self, path: Path) -> bool:
+        """Whether ``path`` came from a scan (in-memory sources survive refreshes)."""
+        return path.suffix in ('.parquet', '.md')
+
+    def _load(self, path: Path) -> List[Dict]:
+        try:
+            if path.suffix == '.parquet':
+                return self._load_catalog(path)
+            entry = self._load_frontmatter(path)
+            return [entry] if entry else []
+        except Exception as e:
+            self.logger.warning(f"Skipping {path} in local title index: {e}")
+            return []
+
+    def _load_catalog(self, path: Path) -> List[Dict]:
+        import pyarrow.parquet as pq
+
+        available = set(pq.read_schema(path).names)
+        columns = [c for c in _CATALOG_COLUMNS if c in available]
+        if 'paperId' not in columns or 'title' not in columns:
+            return []
+        table = pq.read_table(path, columns=columns).to_pydict()
+        rows = zip(*(table[c] for c in columns))
+        entries = []
+        for row in rows:
+            entry = {_CATALOG_COLUMNS[c]: value for c, value in zip(columns, row)}
+            if entry.get('paper_id') and entry.get('title'):
+                entries.append(entry)
+        return entries
+
+    def _load_frontmatter(self, path: Path) -> Optional[Dict]:
+        lines: List[str] = []
+        with open(path, 'r', encoding='utf-8') as handle:
+            if handle.readline().strip() != '---':
+                return None
+            for line in handle:
+                if line.strip() == '---':
+                    break
+                lines.append(line)
+        metadata = yaml.safe_load(''.join(lines)) or {}
+        if not metadata.get('paper_id') or not metadata.get('title'):
+            return None
+        return {
+            'paper_id': str(metadata['paper_id']),
+            'title': str(metadata['title']),
+            'year': metadata.get('year'),
+            'venue': metadata.get('venue'),
+            'doi': metadata.get('doi'),
+        }
+
+    @staticmethod
+    def _mtime(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return -1
@@ -1,8 +1,12 @@
 """Unified metadata extraction package supporting multiple file formats."""
 
-from .models import PaperMetadata
-from .dispatcher import MetadataDispatcher
-from .factory import ExtractorFactory
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(__name__, {
+    "PaperMetadata": ".models",
+    "MetadataDispatcher": ".dispatcher",
+    "ExtractorFactory": ".factory",
+})
 
 __all__ = [
     "PaperMetadata",
@@ -11,7 +15,9 @@ __all__ = [
 ]
 
 
-def extract_metadata(file_path: str) -> PaperMetadata:
+def extract_metadata(file_path: str) -> "PaperMetadata":
     """Convenience helper for one-off metadata extraction."""
+    from .dispatcher import MetadataDispatcher
+
     dispatcher = MetadataDispatcher()
     return dispatcher.extract(file_path)
@@ -1,5 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 import logging
 
 import magic
@@ -33,6 +34,56 @@ class MetadataDispatcher:
         metadata = extractor.extract(str(path_obj))
         return metadata
 
+    def extract_many(
+        self,
+        file_paths: Iterable[str],
+        max_workers: int = 4,
+    ) -> Iterator[Tuple[str, Optional[PaperMetadata], Optional[Exception]]]:
+        """Extract metadata for many files, yielding results as they complete.
+
+        Each item is ``(file_path, metadata, error)`` where exactly one of
+        ``metadata`` and ``error`` is set. Extractors exposing ``extract_many``
+        (PDF/GROBID) receive their files as one batch; the rest run on a pool
+        of ``max_workers`` threads.
+        """
+        batches = {}
+        singles: List[Tuple[str, object]] = []
+        for file_path in file_paths:
+            try:
+                path_obj = Path(file_path)
+                if not path_obj.exists():
+                    raise FileNotFoundError(f"File not found: {file_path}")
+                extractor = self._factory.create(self._detect_mime(path_obj))
+            except Exception as exc:
+                yield file_path, None, exc
+                continue
+            if hasattr(extractor, "extract_many"):
+                batches.setdefault(id(extractor), (extractor, []))[1].append(file_path)
+            else:
+                singles.append((file_path, extractor))
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="metadata") as pool:
+            futures = {
+                pool.submit(extractor.extract, str(file_path)): file_path
+                for file_path, extractor in singles
+            }
+            for extractor, paths in batches.values():
+                pending = dict.fromkeys(paths)
+                try:
+                    for file_path, metadata in extractor.extract_many(paths, max_workers=max_workers):
+                        pending.pop(file_path, None)
+                        yield file_path, metadata, None
+                except Exception as exc:
+                    self._logger.error("Batch extraction with %s failed: %s", extractor.__class__.__name__, exc)
+                    for file_path in pending:
+                        yield file_path, None, exc
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    yield file_path, future.result(), None
+                except Exception as exc:
+                    yield file_path, None, exc
+
     def can_extract(self, file_path: str) -> bool:
         """Return True when a file type is supported."""
         try:
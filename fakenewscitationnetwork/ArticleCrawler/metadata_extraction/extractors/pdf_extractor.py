@@ -1,10 +1,12 @@
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 
 from ArticleCrawler.pdf_processing.docker_manager import DockerManager
 from ArticleCrawler.pdf_processing.grobid_client import GrobidClientWrapper
 from ArticleCrawler.pdf_processing.metadata_extractor import PDFMetadataExtractor
+from ArticleCrawler.pdf_processing.models import PDFMetadata
+from ArticleCrawler.pdf_processing.result_cache import GrobidResultCache
 
 from .base import BaseExtractor
 from ..models import PaperMetadata
@@ -20,10 +22,16 @@ class PdfExtractor(BaseExtractor):
         docker_manager: Optional[DockerManager] = None,
         grobid_client: Optional[GrobidClientWrapper] = None,
         metadata_extractor: Optional[PDFMetadataExtractor] = None,
+        result_cache: Optional[GrobidResultCache] = None,
     ) -> None:
         self._logger = logger or logging.getLogger(__name__)
         self._docker_manager = docker_manager or DockerManager(logger=self._logger)
-        self._grobid_client = grobid_client or GrobidClientWrapper(logger=self._logger)
+        self._result_cache = (
+            result_cache if result_cache is not None else GrobidResultCache.from_env(logger=self._logger)
+        )
+        self._grobid_client = grobid_client or GrobidClientWrapper(
+            logger=self._logger, cache=self._result_cache
+        )
         self._metadata_extractor = metadata_extractor or PDFMetadataExtractor(
             logger=self._logger
         )
@@ -34,26 +42,83 @@ class PdfExtractor(BaseExtractor):
             self._logger.error("PDF not found: %s", path)
             return PaperMetadata()
 
+        cached = self._cached_metadata(path_obj)
+        if cached is not None:
+            return cached
+
         if not self._docker_manager.is_grobid_running():
             self._logger.error("GROBID service is not running.")
             return PaperMetadata()
 
         try:
-            xml_results = self._grobid_client.process_pdfs([path_obj])
+            xml_content = self._grobid_client.process_pdf(path_obj)
         except Exception as exc:
             self._logger.error("Failed to process %s via GROBID: %s", path, exc)
             return PaperMetadata()
 
-        if path_obj not in xml_results:
-            self._logger.warning("No XML output for %s", path)
+        return self._to_paper_metadata(path_obj, xml_content)
+
+    def extract_many(
+        self,
+        paths: Iterable[str],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[str, PaperMetadata]]:
+        """Yield ``(path, metadata)`` for each PDF in completion order.
+
+        Cached files are returned first; GROBID availability is then checked
+        once for the remaining batch and header requests run concurrently,
+        bounded by ``max_workers``.
+        """
+        existing: Dict[Path, str] = {}
+        for path in paths:
+            path_obj = Path(path)
+            if not path_obj.exists():
+                self._logger.error("PDF not found: %s", path)
+                yield path, PaperMetadata()
+                continue
+            cached = self._cached_metadata(path_obj)
+            if cached is not None:
+                yield path, cached
+            else:
+                existing[path_obj] = path
+
+        if not existing:
+            return
+
+        if not self._docker_manager.is_grobid_running():
+            self._logger.error("GROBID service is not running.")
+            for path in existing.values():
+                yield path, PaperMetadata()
+            return
+
+        for path_obj, xml_content in self._grobid_client.iter_process_pdfs(
+            list(existing), max_workers=max_workers
+        ):
+            yield existing[path_obj], self._to_paper_metadata(path_obj, xml_content)
+
+    def _to_paper_metadata(self, path_obj: Path, xml_content: Optional[str]) -> PaperMetadata:
+        if not xml_content:
+            self._logger.warning("No XML output for %s", path_obj)
             return PaperMetadata()
 
-        xml_content = xml_results[path_obj]
-        pdf_metadata = self._metadata_extractor.extract(xml_content, path_obj.name)
+        if self._result_cache is not None:
+            pdf_metadata = self._result_cache.parse_metadata(path_obj, xml_content, self._metadata_extractor)
+        else:
+            pdf_metadata = self._metadata_extractor.extract(xml_content, path_obj.name)
         if not pdf_metadata:
-            self._logger.warning("Metadata extractor returned nothing for %s", path)
+            self._logger.warning("Metadata extractor returned nothing for %s", path_obj)
             return PaperMetadata()
 
+        return self._from_pdf_metadata(pdf_metadata)
+
+    def _cached_metadata(self, path_obj: Path) -> Optional[PaperMetadata]:
+        if self._result_cache is None:
+            return None
+        pdf_metadata = self._result_cache.get_metadata(path_obj)
+        return self._from_pdf_metadata(pdf_metadata) if pdf_metadata else None
+
+    @staticmethod
+    def _from_pdf_metadata(pdf_metadata: PDFMetadata) -> PaperMetadata:
         authors = parse_author_list(pdf_metadata.authors or "")
 
         return PaperMetadata(
@@ -1,4 +1,4 @@
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from .extractors.base import BaseExtractor
 from .extractors import (
@@ -13,7 +13,8 @@ from .extractors import (
 class ExtractorFactory:
     """Factory responsible for returning extractor instances."""
 
-    def __init__(self) -> None:
+    def __init__(self, extractors: Optional[Dict[str, BaseExtractor]] = None) -> None:
+        """``extractors`` pre-registers configured instances for specific MIME types."""
         self._creators: Dict[str, Type[BaseExtractor]] = {
             # PDF
             "application/pdf": PdfExtractor,
@@ -29,7 +30,7 @@ class ExtractorFactory:
             "text/x-tex": LatexExtractor,
             "application/x-tex": LatexExtractor,
         }
-        self._instances: Dict[str, BaseExtractor] = {}
+        self._instances: Dict[str, BaseExtractor] = dict(extractors or {})
 
     def create(self, mime_type: str) -> BaseExtractor:
         """Return extractor for the MIME type, caching instances."""
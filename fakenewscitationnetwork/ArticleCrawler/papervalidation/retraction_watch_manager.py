@@ -4,6 +4,8 @@ import pandas as pd
 
 import logging
 
+from ..api.http_transport import http_session
+
 
 def _normalize_doi(value):
     """Normalize DOI strings for consistent comparisons."""
@@ -98,14 +100,16 @@ class RetractionWatchFetcher:
             tuple: (file_content as bytes, latest_commit_sha as str)
         """
         try:
+            session = http_session()
             self.logger.info("Fetching latest commit SHA from GitLab...")
-            commit_response = requests.get(self.commits_api_url)
+            commit_response = session.get(self.commits_api_url)
             commit_response.raise_for_status()
             latest_commit_sha = commit_response.json()[0]["id"]
             self.logger.info(f"Latest commit SHA: {latest_commit_sha}")
 
             self.logger.info(f"Downloading latest retraction data CSV from GitLab from {self.raw_url}...")
-            file_response = requests.get(self.raw_url)
+            # The CSV is tens of megabytes; allow longer than the default read timeout.
+            file_response = session.get(self.raw_url, timeout=(10, 300))
             file_response.raise_for_status()
             
             self.logger.info("File fetched successfully from GitLab.")
@@ -1,10 +1,17 @@
 
-from .grobid_client import GrobidClientWrapper
-from .metadata_extractor import PDFMetadataExtractor
-from .pdf_processor import PDFProcessor
-from .docker_manager import DockerManager
-from .api_matcher import APIMetadataMatcher
-from .models import PDFMetadata, PDFProcessingResult, APIMatchResult
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(__name__, {
+    'GrobidClientWrapper': '.grobid_client',
+    'PDFMetadataExtractor': '.metadata_extractor',
+    'PDFProcessor': '.pdf_processor',
+    'DockerManager': '.docker_manager',
+    'APIMetadataMatcher': '.api_matcher',
+    'PDFMetadata': '.models',
+    'PDFProcessingResult': '.models',
+    'APIMatchResult': '.models',
+    'GrobidResultCache': '.result_cache',
+})
 
 __all__ = [
     'GrobidClientWrapper',
@@ -15,4 +22,5 @@ __all__ = [
     'PDFMetadata',
     'PDFProcessingResult',
     'APIMatchResult',
-]
\ No newline at end of file
+    'GrobidResultCache',
+]
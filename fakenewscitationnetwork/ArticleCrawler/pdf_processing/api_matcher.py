@@ -1,35 +1,108 @@
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import logging
+import threading
 import time
-from difflib import SequenceMatcher
+from ..api.doi_resolver import OpenAlexDOIResolver, normalize_doi
+from ..api.zotero.matching.strategies import TitleSimilarityCalculator
 from .models import PDFMetadata, APIMatchResult
 
 
 class APIMetadataMatcher:
     
-    def __init__(self, api_provider, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        api_provider,
+        logger: Optional[logging.Logger] = None,
+        doi_resolver: Optional[OpenAlexDOIResolver] = None,
+        max_workers: int = 4,
+        local_index=None,
+    ):
         self.api_provider = api_provider
         self.logger = logger or logging.getLogger(__name__)
         self.request_delay = 0.5
         self.max_retries = 3
+        self.max_workers = max(1, max_workers)
+        self.doi_resolver = doi_resolver or OpenAlexDOIResolver(logger=self.logger)
+        self.local_index = local_index
+        self.min_title_similarity = 0.85
+        self._last_request_time = 0.0
+        self._rate_lock = threading.Lock()
     
     def match_metadata(self, metadata_list: List[PDFMetadata]) -> List[APIMatchResult]:
-        results = []
+        """
+        Match PDF metadata to OpenAlex works, preserving input order.
         
-        for i, metadata in enumerate(metadata_list, 1):
-            self.logger.info(f"Matching paper {i}/{len(metadata_list)}: {metadata.filename}")
-            
-            result = self._match_single(metadata)
-            results.append(result)
-            
-            if i < len(metadata_list):
-                time.sleep(self.request_delay)
+        DOIs are resolved together in batched requests first; the remaining
+        papers are matched individually on a bounded thread pool, with request
+        starts spaced by ``request_delay``.
+        """
+        if not metadata_list:
+            return []
+        
+        results: List[Optional[APIMatchResult]] = [None] * len(metadata_list)
+        resolved = self._resolve_dois(metadata_list)
+        
+        leftovers = []
+        for index, metadata in enumerate(metadata_list):
+            doi_key = normalize_doi(metadata.doi)
+            if doi_key in resolved:
+                work = resolved[doi_key]
+                if work:
+                    results[index] = APIMatchResult(
+                        metadata=metadata,
+                        matched=True,
+                        paper_id=self._extract_paper_id(work),
+                        confidence=1.0,
+                        match_method="DOI"
+                    )
+                    continue
+                leftovers.append((index, False))
+            else:
+                leftovers.append((index, True))
+        
+        if leftovers:
+            self.logger.info(f"Matching {len(leftovers)}/{len(metadata_list)} papers individually")
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(leftovers))) as pool:
+                futures = [
+                    (index, pool.submit(self._match_leftover, metadata_list[index], try_doi))
+                    for index, try_doi in leftovers
+                ]
+                for index, future in futures:
+                    results[index] = future.result()
         
         return results
     
-    def _match_single(self, metadata: PDFMetadata) -> APIMatchResult:
-        if metadata.doi:
+    def _resolve_dois(self, metadata_list: List[PDFMetadata]) -> Dict[str, Optional[Dict]]:
+        dois = [metadata.doi for metadata in metadata_list if metadata.doi]
+        if not dois:
+            return {}
+        try:
+            return self.doi_resolver.resolve(dois)
+        except Exception as e:
+            self.logger.warning(f"Batch DOI resolution failed, falling back to per-paper lookups: {e}")
+            return {}
+    
+    def _match_leftover(self, metadata: PDFMetadata, try_doi: bool) -> APIMatchResult:
+        if not try_doi or not metadata.doi:
+            local = self._match_locally(metadata)
+            if local is not None:
+                return local
+        self._throttle()
+        self.logger.info(f"Matching paper individually: {metadata.filename}")
+        return self._match_single(metadata, try_doi=try_doi)
+    
+    def _throttle(self):
+        with self._rate_lock:
+            now = time.time()
+            wait = self._last_request_time + self.request_delay - now
+            self._last_request_time = now + max(wait, 0.0)
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _match_single(self, metadata: PDFMetadata, try_doi: bool = True) -> APIMatchResult:
+        if try_doi and metadata.doi:
             result = self._match_by_doi(metadata)
             if result.matched:
                 return result
@@ -77,6 +150,22 @@ class APIMetadataMatcher:
         
         return APIMatchResult(metadata=metadata, matched=False)
     
+    def _match_locally(self, metadata: PDFMetadata) -> Optional[APIMatchResult]:
+        """Match against papers already in local catalogs/libraries, skipping the API."""
+        if self.local_index is None or not metadata.title:
+            return None
+        hits = self.local_index.search(metadata.title, max_results=1)
+        if not hits or hits[0]['similarity'] < self.min_title_similarity:
+            return None
+        self.logger.info(f"Local title match: {metadata.filename} -> {hits[0]['paper_id']}")
+        return APIMatchResult(
+            metadata=metadata,
+            matched=True,
+            paper_id=hits[0]['paper_id'],
+            confidence=hits[0]['similarity'],
+            match_method="Title"
+        )
+    
     def _match_by_title(self, metadata: PDFMetadata) -> APIMatchResult:
         for attempt in range(self.max_retries):
             try:
@@ -90,15 +179,16 @@ class APIMetadataMatcher:
                 best_match = None
                 best_similarity = 0.0
                 
-                for work in search_results[:5]:
-                    title = work.get('title', '').lower()
-                    similarity = self._calculate_similarity(metadata.title.lower(), title)
-                    
+                top_results = search_results[:5]
+                similarities = TitleSimilarityCalculator.calculate_many(
+                    metadata.title, [work.get('title') or '' for work in top_results]
+                )
+                for work, similarity in zip(top_results, similarities):
                     if similarity > best_similarity:
                         best_similarity = similarity
                         best_match = work
                 
-                if best_similarity >= 0.85:
+                if best_similarity >= self.min_title_similarity:
                     paper_id = self._extract_paper_id(best_match)
                     
                     return APIMatchResult(
@@ -125,9 +215,6 @@ class APIMetadataMatcher:
         
         return APIMatchResult(metadata=metadata, matched=False)
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        return SequenceMatcher(None, str1, str2).ratio()
-    
     def _extract_paper_id(self, work: dict) -> str:
         work_id = work.get('id', '')
         return work_id.split('/')[-1] if '/' in work_id else work_id
\ No newline at end of file
@@ -1,83 +1,86 @@
 import os
-import tempfile
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import logging
 from grobid_client.grobid_client import GrobidClient
 
+from .result_cache import GrobidResultCache
+
 
 class GrobidClientWrapper:
+
+    DEFAULT_MAX_WORKERS = 10
     
     def __init__(
         self,
         server_url: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
+        cache: Optional[GrobidResultCache] = None,
     ):
         resolved_url = server_url or os.getenv("GROBID_URL") or os.getenv("GROBID_BASE_URL") or "http://localhost:8070"
         self.server_url = resolved_url
         self.logger = logger or logging.getLogger(__name__)
         self.client = GrobidClient(grobid_server=resolved_url, check_server=False)
+        self.cache = cache if cache is not None else GrobidResultCache.from_env(logger=self.logger)
     
-    def process_pdfs(self, pdf_paths: List[Path]) -> dict:
+    def process_pdf(self, pdf_path: Path) -> Optional[str]:
+        """Send one PDF to GROBID's header service and return the TEI XML.
+
+        The file is streamed straight from ``pdf_path``; nothing is copied.
+        Results are served from and written to ``cache`` when one is configured.
+        """
+        if self.cache is not None:
+            cached = self.cache.get_tei(pdf_path)
+            if cached is not None:
+                return cached
+
+        _, status, text = self.client.process_pdf(
+            "processHeaderDocument",
+            str(pdf_path),
+            False,  # generate ids
+            True,  # consolidate header
+            False,  # consolidate citations
+            False,  # raw citations
+            False,  # raw affiliations
+            False,  # tei coordinates
+            False,  # segment sentences
+        )
+        if status != 200 or not text:
+            self.logger.warning(f"GROBID returned status {status} for {Path(pdf_path).name}")
+            return None
+        if self.cache is not None:
+            self.cache.put_tei(pdf_path, text)
+        return text
+
+    def iter_process_pdfs(
+        self,
+        pdf_paths: List[Path],
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[Path, Optional[str]]]:
+        """Yield ``(pdf_path, xml_or_None)`` pairs as GROBID finishes each file.
+
+        At most ``max_workers`` requests are in flight at once.
+        """
         if not pdf_paths:
-            return {}
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            input_dir = Path(temp_dir) / "input"
-            output_dir = Path(temp_dir) / "output"
-            input_dir.mkdir()
-            output_dir.mkdir()
-            
-            pdf_mapping = {}
-            for pdf_path in pdf_paths:
-                filename = pdf_path.name
-                temp_pdf_path = input_dir / filename
-                shutil.copy2(pdf_path, temp_pdf_path)
-                pdf_mapping[filename] = pdf_path
-                self.logger.info(f"Added: {filename}")
-            
-            self.logger.info(f"Processing {len(pdf_paths)} files with GROBID...")
-            
-            try:
-                self.client.process(
-                    service="processHeaderDocument",
-                    input_path=str(input_dir),
-                    output=str(output_dir),
-                    n=min(10, len(pdf_paths)),
-                    consolidate_header=True
-                )
-            except Exception as e:
-                self.logger.error(f"GROBID processing error: {e}")
-                return {}
-            
-            results = {}
-            xml_files = list(output_dir.glob("*.xml"))
-            self.logger.info(f"Found {len(xml_files)} XML output files")
-            
-            pdf_to_xml = self._match_pdfs_to_xml(list(pdf_mapping.keys()), xml_files)
-            
-            for pdf_filename, xml_file in pdf_to_xml.items():
+            return
+        workers = max(1, min(max_workers or self.DEFAULT_MAX_WORKERS, len(pdf_paths)))
+        self.logger.info(f"Processing {len(pdf_paths)} files with GROBID ({workers} parallel requests)...")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grobid") as pool:
+            futures = {pool.submit(self.process_pdf, Path(path)): path for path in pdf_paths}
+            for future in as_completed(futures):
+                pdf_path = futures[future]
                 try:
-                    with open(xml_file, 'r', encoding='utf-8') as f:
-                        xml_content = f.read()
-                    results[pdf_mapping[pdf_filename]] = xml_content
+                    xml_content = future.result()
                 except Exception as e:
-                    self.logger.error(f"Error reading {xml_file}: {e}")
-            
-            return results
-    
-    def _match_pdfs_to_xml(self, pdf_filenames: List[str], xml_files: List[Path]) -> dict:
-        pdf_to_xml = {}
-        
-        for xml_file in xml_files:
-            xml_base = xml_file.stem.replace('.tei', '').replace('.xml', '')
-            
-            for pdf_file in pdf_filenames:
-                pdf_base = Path(pdf_file).stem
-                
-                if xml_base == pdf_base or xml_base in pdf_base or pdf_base in xml_base:
-                    pdf_to_xml[pdf_file] = xml_file
-                    break
-        
-        return pdf_to_xml
+                    self.logger.error(f"GROBID processing error for {Path(pdf_path).name}: {e}")
+                    xml_content = None
+                yield pdf_path, xml_content
+
+    def process_pdfs(self, pdf_paths: List[Path], max_workers: Optional[int] = None) -> dict:
+        """Return ``{pdf_path: xml}`` for every PDF GROBID processed successfully."""
+        return {
+            pdf_path: xml_content
+            for pdf_path, xml_content in self.iter_process_pdfs(pdf_paths, max_workers=max_workers)
+            if xml_content is not None
+        }
@@ -1,10 +1,11 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 import logging
 from .docker_manager import DockerManager
 from .grobid_client import GrobidClientWrapper
 from .metadata_extractor import PDFMetadataExtractor
-from .models import PDFProcessingResult
+from .models import PDFMetadata, PDFProcessingResult
+from .result_cache import GrobidResultCache
 
 
 class PDFProcessor:
@@ -13,10 +14,12 @@ class PDFProcessor:
                  docker_manager: Optional[DockerManager] = None,
                  grobid_client: Optional[GrobidClientWrapper] = None,
                  metadata_extractor: Optional[PDFMetadataExtractor] = None,
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None,
+                 result_cache: Optional[GrobidResultCache] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.docker_manager = docker_manager or DockerManager(logger=self.logger)
-        self.grobid_client = grobid_client or GrobidClientWrapper(logger=self.logger)
+        self.result_cache = result_cache if result_cache is not None else GrobidResultCache.from_env(logger=self.logger)
+        self.grobid_client = grobid_client or GrobidClientWrapper(logger=self.logger, cache=self.result_cache)
         self.metadata_extractor = metadata_extractor or PDFMetadataExtractor(logger=self.logger)
     
     def ensure_grobid_running(self) -> bool:
@@ -29,11 +32,17 @@ class PDFProcessor:
     def process_pdfs(self, pdf_paths: List[Path]) -> List[PDFProcessingResult]:
         if not pdf_paths:
             return []
+
+        cached = self._cached_metadata(pdf_paths)
+        if len(cached) == len(pdf_paths):
+            return [PDFProcessingResult(pdf_path=path, metadata=cached[path], success=True) for path in pdf_paths]
         
         if not self.ensure_grobid_running():
             self.logger.error("GROBID service not available. Start it with: docker run -d -p 8070:8070 lfoppiano/grobid:0.8.2")
             return [
-                PDFProcessingResult(
+                PDFProcessingResult(pdf_path=path, metadata=cached[path], success=True)
+                if path in cached
+                else PDFProcessingResult(
                     pdf_path=path,
                     success=False,
                     error_message="GROBID service unavailable"
@@ -41,13 +50,15 @@ class PDFProcessor:
                 for path in pdf_paths
             ]
         
-        xml_results = self.grobid_client.process_pdfs(pdf_paths)
+        xml_results = self.grobid_client.process_pdfs([path for path in pdf_paths if path not in cached])
         
         results = []
         for pdf_path in pdf_paths:
-            if pdf_path in xml_results:
+            if pdf_path in cached:
+                results.append(PDFProcessingResult(pdf_path=pdf_path, metadata=cached[pdf_path], success=True))
+            elif pdf_path in xml_results:
                 xml_content = xml_results[pdf_path]
-                metadata = self.metadata_extractor.extract(xml_content, pdf_path.name)
+                metadata = self._parse_metadata(pdf_path, xml_content)
                 
                 if metadata:
                     results.append(PDFProcessingResult(
@@ -68,4 +79,19 @@ class PDFProcessor:
                     error_message="GROBID did not produce XML output"
                 ))
         
-        return results
\ No newline at end of file
+        return results
+
+    def _cached_metadata(self, pdf_paths: List[Path]) -> Dict[Path, PDFMetadata]:
+        if self.result_cache is None:
+            return {}
+        cached = {}
+        for pdf_path in pdf_paths:
+            metadata = self.result_cache.get_metadata(pdf_path)
+            if metadata is not None:
+                cached[pdf_path] = metadata
+        return cached
+
+    def _parse_metadata(self, pdf_path: Path, xml_content: str) -> Optional[PDFMetadata]:
+        if self.result_cache is None:
+            return self.metadata_extractor.extract(xml_content, pdf_path.name)
+        return self.result_cache.parse_metadata(pdf_path, xml_content, self.metadata_extractor)
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .models import PDFMetadata
+
+
+class GrobidResultCache:
+    """SQLite cache of GROBID header output keyed by the SHA-256 of the PDF bytes.
+
+    Each entry holds the TEI XML and, once parsed, the ``PDFMetadata`` fields,
+    so re-uploaded files skip both GROBID and XML parsing. When the stored
+    payload exceeds ``max_bytes`` the least recently used entries are dropped.
+    """
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    _METADATA_FIELDS = ("title", "doi", "year", "authors", "venue", "venue_raw")
+
+    def __init__(
+        self,
+        db_path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS grobid_results (
+                digest TEXT PRIMARY KEY,
+                tei TEXT NOT NULL,
+                metadata TEXT,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_grobid_results_last_used ON grobid_results (last_used)"
+        )
+
+    @classmethod
+    def from_env(cls, logger: Optional[logging.Logger] = None) -> Optional["GrobidResultCache"]:
+        """Build a cache from ``GROBID_CACHE_PATH``/``GROBID_CACHE_MAX_MB``, or return None."""
+        db_path = os.getenv("GROBID_CACHE_PATH")
+        if not db_path:
+            return None
+        max_mb = os.getenv("GROBID_CACHE_MAX_MB")
+        max_bytes = int(max_mb) * 1024 * 1024 if max_mb else cls.DEFAULT_MAX_BYTES
+        return cls(db_path, max_bytes=max_bytes, logger=logger)
+
+    def digest(self, pdf_path: Path) -> str:
+        """Return the SHA-256 of the file, memoized on (path, size, mtime)."""
+        pdf_path = Path(pdf_path)
+        stat = pdf_path.stat()
+        key = (str(pdf_path.resolve()), stat.st_size, stat.st_mtime_ns)
+        cached = self._digests.get(key)
+        if cached:
+            return cached
+        hasher = hashlib.sha256()
+        with open(pdf_path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        if len(self._digests) > 4096:
+            self._digests.clear()
+        self._digests[key] = digest
+        return digest
+
+    def contains(self, pdf_path: Path) -> bool:
+        return self._fetch(pdf_path) is not None
+
+    def get_tei(self, pdf_path: Path) -> Optional[str]:
+        row = self._fetch(pdf_path)
+        return row[0] if row else None
+
+    def put_tei(self, pdf_path: Path, tei: str) -> None:
+        digest = self.digest(pdf_path)
+        size = len(tei.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO grobid_results (digest, tei, metadata, size, last_used)
+                VALUES (?, ?, NULL, ?, ?)
+                ON CONFLICT(digest) DO UPDATE SET
+                    tei = excluded.tei,
+                    metadata = NULL,
+                    size = excluded.size,
+                    last_used = excluded.last_used
+                """,
+                (digest, tei, size, time.time()),
+            )
+            self._enforce_size_cap()
+
+    def get_metadata(self, pdf_path: Path) -> Optional[PDFMetadata]:
+        """Return cached metadata renamed to ``pdf_path``'s filename, if parsed before."""
+        row = self._fetch(pdf_path)
+        if not row or row[1] is None:
+            return None
+        try:
+            fields = json.loads(row[1])
+        except ValueError:
+            return None
+        return PDFMetadata(filename=Path(pdf_path).name, **fields)
+
+    def put_metadata(self, pdf_path: Path, metadata: PDFMetadata) -> None:
+        digest = self.digest(pdf_path)
+        payload = json.dumps({name: getattr(metadata, name) for name in self._METADATA_FIELDS})
+        with self._lock:
+            self._conn.execute(
+                "UPDATE grobid_results SET metadata = ? WHERE digest = ?",
+                (payload, digest),
+            )
+
+    def parse_metadata(self, pdf_path: Path, xml_content: str, extractor) -> Optional[PDFMetadata]:
+        """Return cached metadata for ``pdf_path`` or parse ``xml_content`` and store it."""
+        cached = self.get_metadata(pdf_path)
+        if cached is not None:
+            return cached
+        metadata = extractor.extract(xml_content, Path(pdf_path).name)
+        if metadata is not None:
+            self.put_metadata(pdf_path, metadata)
+        return metadata
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _fetch(self, pdf_path: Path) -> Optional[Tuple[str, Optional[str]]]:
+        try:
+            digest = self.digest(pdf_path)
+        except OSError:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tei, metadata FROM grobid_results WHERE digest = ?",
+                (digest,),
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE grobid_results SET last_used = ? WHERE digest = ?",
+                    (time.time(), digest),
+                )
+        return row
+
+    def _enforce_size_cap(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM grobid_results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for digest, size in self._conn.execute(
+            "SELECT digest, size FROM grobid_results ORDER BY last_used"
+        ).fetchall():
+            if total <= target:
+                break
+            self._conn.execute("DELETE FROM grobid_results WHERE digest = ?", (digest,))
+            total -= size
+            evicted += 1
+        self.logger.info(f"GROBID cache over {self.max_bytes} bytes; evicted {evicted} entries")
@@ -0,0 +1,131 @@
+"""
+Embedding-based relevance scoring for the crawl frontier.
+
+Candidates are scored by the cosine similarity between their title + abstract
+embedding and the centroid of the seed papers' embeddings. Embeddings are
+computed in batches on CPU and cached per paper ID, so every paper is encoded
+once per crawl (or once overall when an ``EmbeddingStore`` directory is set).
+"""
+
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..text_processing.embedding_store import EmbeddingStore, normalize_rows
+
+
+class EmbeddingRelevanceScorer:
+    """
+    Scores candidate papers by similarity to the seed set.
+
+    The model is loaded lazily on first use; pass ``encode`` to use a different
+    embedding function (it maps a list of texts to a 2-D array).
+    """
+
+    def __init__(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        store_dir: Optional[Path] = None,
+        batch_size: int = 64,
+        encode: Optional[Callable[[List[str]], np.ndarray]] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            model_name: SentenceTransformer model used for titles and abstracts
+            store_dir: Optional EmbeddingStore root to persist embeddings across crawls
+            batch_size: Texts per encoding batch
+            encode: Optional embedding function replacing the SentenceTransformer model
+            logger: Optional logger instance
+        """
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.logger = logger or logging.getLogger(__name__)
+        self._encode_fn = encode
+        self._model = None
+        # Title + abstract embeddings are keyed apart from the title-only stores.
+        self.store = EmbeddingStore(store_dir, f"{model_name}-title-abstract", logger=self.logger) if store_dir else None
+        self._cache: Dict[str, np.ndarray] = {}
+
+    def __getstate__(self):
+        # The Sampler holds the scorer, so it is pickled with the Crawler on
+        # every intermediate write; the model (and the encode function, which
+        # may not be picklable) is left out and the model reloaded on first use.
+        state = self.__dict__.copy()
+        state['_model'] = None
+        state['_encode_fn'] = None
+        return state
+
+    def score(self, df_metadata: pd.DataFrame, df_abstract: Optional[pd.DataFrame],
+              candidate_ids: Sequence[str], seed_ids: Sequence[str]) -> np.ndarray:
+        """
+        Cosine similarity of each candidate to the seed centroid.
+
+        Args:
+            df_metadata: Paper metadata with ``paperId`` and ``title`` columns
+            df_abstract: Optional frame with ``paperId`` and ``abstract`` columns
+            candidate_ids: Papers to score
+            seed_ids: Papers defining the centroid
+
+        Returns:
+            Array aligned with ``candidate_ids`` (0 for papers without text);
+            all ones when no seed paper has text to embed.
+        """
+        candidate_ids = list(candidate_ids)
+        texts = self._texts(df_metadata, df_abstract, set(candidate_ids) | set(seed_ids))
+        self._embed(texts)
+
+        seed_vectors = [self._cache[pid] for pid in seed_ids if pid in self._cache]
+        if not seed_vectors:
+            self.logger.info("No seed embeddings available; relevance scores left neutral.")
+            return np.ones(len(candidate_ids))
+        centroid = normalize_rows(np.mean(seed_vectors, axis=0, keepdims=True))[0]
+
+        scores = np.zeros(len(candidate_ids))
+        rows = [i for i, pid in enumerate(candidate_ids) if pid in self._cache]
+        if rows:
+            matrix = np.vstack([self._cache[candidate_ids[i]] for i in rows])
+            scores[rows] = matrix @ centroid
+        return scores
+
+    def _texts(self, df_metadata: pd.DataFrame, df_abstract: Optional[pd.DataFrame], paper_ids) -> Dict[str, str]:
+        """Title and abstract text for the requested papers that are not cached yet."""
+        wanted = paper_ids - self._cache.keys()
+        if not wanted:
+            return {}
+        titles = df_metadata.loc[df_metadata['paperId'].isin(wanted), ['paperId', 'title']]
+        texts = {pid: title for pid, title in zip(titles['paperId'], titles['title']) if isinstance(title, str)}
+        if df_abstract is not None and not df_abstract.empty:
+            abstracts = df_abstract.loc[df_abstract['paperId'].isin(wanted), ['paperId', 'abstract']]
+            for pid, abstract in zip(abstracts['paperId'], abstracts['abstract']):
+                if isinstance(abstract, str) and abstract.strip() and abstract != 'None':
+                    texts[pid] = '. '.join(filter(None, [texts.get(pid), abstract]))
+        return {pid: text for pid, text in texts.items() if text.strip()}
+
+    def _embed(self, texts: Dict[str, str]) -> None:
+        if not texts:
+            return
+        ids = list(texts)
+        if self.store is not None:
+            self.store.add(ids, [texts[pid] for pid in ids], self._encode, batch_size=self.batch_size)
+            known = [pid for pid in ids if pid in self.store]
+            vectors = self.store.get(known)
+        else:
+            known = ids
+            vectors = np.vstack([
+                self._encode([texts[pid] for pid in ids[i:i + self.batch_size]])
+                for i in range(0, len(ids), self.batch_size)
+            ])
+        self._cache.update(zip(known, normalize_rows(np.asarray(vectors, dtype=np.float32))))
+        self.logger.debug(f"Embedded {len(known)} papers for relevance scoring")
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        if self._encode_fn is not None:
+            return np.asarray(self._encode_fn(texts), dtype=np.float32)
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name, device='cpu')
+        return self._model.encode(texts, batch_size=self.batch_size, show_progress_bar=False, convert_to_numpy=True)
@@ -25,6 +25,8 @@ import numpy as np
 import logging
 from typing import List
 
+from ArticleCrawler.LogManager.crawl_metrics import CrawlMetrics
+
 # For type hinting compatibility with both old and new architecture
 try:
     from ArticleCrawler.config import SamplingConfig
@@ -60,7 +62,7 @@ class Sampler:
     """
     
     def __init__(self, keywords, data_manager, sampling_options=None, logger=None, 
-                 data_storage_options=None, retraction_watch_manager=None):
+                 data_storage_options=None, retraction_watch_manager=None, metrics=None):
         """
         Initialize the Sampler instance.
         
@@ -74,6 +76,7 @@ class Sampler:
             logger: Logger instance for logging events.
             data_storage_options: Storage configuration (for logger creation if needed)
             retraction_watch_manager: Manager for retraction checking
+            metrics: CrawlMetrics timing the 'keyword_filter' stage
         """
         # Set up logger
         if logger is not None:
@@ -86,6 +89,7 @@ class Sampler:
             logging.basicConfig(level=logging.INFO)
 
         self.keywords = keywords
+        self.metrics = metrics if metrics is not None else CrawlMetrics()
         
         # MINIMAL CHANGE: Use data_coordinator internally but accept any name for compatibility
         # This works with both DataManager and DataCoordinator through duck typing
@@ -113,6 +117,16 @@ class Sampler:
         self.existing_ids = []
         self.sampled_papers = []
 
+        self.relevance_mode = getattr(self.sampling_options, 'relevance_mode', 'keywords')
+        self.relevance_scorer = None
+        if self.relevance_mode == 'embedding':
+            from ArticleCrawler.sampling.relevance import EmbeddingRelevanceScorer
+            self.relevance_scorer = EmbeddingRelevanceScorer(
+                model_name=self.sampling_options.embedding_model,
+                store_dir=self.sampling_options.embedding_store_dir,
+                logger=self.logger
+            )
+
     def calculate_centrality_threshold(self):
         """
         Calculate threshold values based on centrality scores for the potential sample IDs.
@@ -181,7 +195,8 @@ class Sampler:
         self.logger.info(f'Bypassed keywords for {len(self.selected_by_centrality_ids)} papers.')
 
         # Apply stochastic filter by keyword
-        self.filter_by_keywords()        
+        with self.metrics.stage('keyword_filter'):
+            self.filter_by_keywords()
         self.potential_future_sample_ids = pd.concat([self.potential_future_sample_ids, self.selected_by_centrality_ids])
 
         self.logger.info(f"Count of potential papers after keyword filtering: {len(self.potential_future_sample_ids)}")
@@ -317,21 +332,49 @@ class Sampler:
         centrality_column_names = [col for col in merged_df.columns if 'centrality' in col]
         centrality_values = merged_df[centrality_column_names].values
 
-        probabilities = self._compute_paper_probability(year=year, centrality_values=centrality_values)
+        relevance = self._compute_relevance(merged_df['paperId'].tolist())
+
+        probabilities = self._compute_paper_probability(year=year, centrality_values=centrality_values,
+                                                        relevance=relevance)
         self.potential_future_sample_ids = merged_df.paperId
         self.probabilities = probabilities
 
-    def _compute_paper_probability(self, year, centrality_values):
+    def _compute_paper_probability(self, year, centrality_values, relevance=None):
         """
-        Compute the final probabilities for papers based on year and centrality values.
-
-        ALL LOGIC UNCHANGED
+        Compute the final probabilities for papers based on year and centrality values,
+        weighted by seed similarity when ``relevance`` is given.
         """
         year_prob = self._compute_year_probability(year)
         centrality_prob = self._compute_centrality_probability(centrality_values)
         probabilities = year_prob * centrality_prob
+        if relevance is not None:
+            probabilities = probabilities * self._compute_relevance_probability(relevance)
         return self.normalize_probabilities(probabilities)
 
+    def _compute_relevance(self, paper_ids):
+        """
+        Cosine similarity of each candidate to the seed centroid, or None outside 'embedding' mode.
+        """
+        if self.relevance_scorer is None or not paper_ids:
+            return None
+        frames = self.data_coordinator.frames
+        papers = frames.df_paper_metadata
+        seed_ids = papers.loc[papers['isSeed'] == True, 'paperId'].tolist() if 'isSeed' in papers.columns else []
+        relevance = self.relevance_scorer.score(
+            papers, getattr(frames, 'df_abstract', None), paper_ids, seed_ids
+        )
+        self.logger.info(f"Computed seed similarity for {len(paper_ids)} candidates (mean {np.mean(relevance):.3f})")
+        return relevance
+
+    def _compute_relevance_probability(self, relevance):
+        """
+        Compute the probability based on similarity to the seed papers.
+
+        Decays exponentially with cosine distance, like the year term with age.
+        """
+        weight = self.hyper_params.get('relevance', 5.0)
+        return np.exp(-weight * (1.0 - np.asarray(relevance, dtype=float)))
+
     def _compute_year_probability(self, year):
         """
         Compute the probability based on publication year.
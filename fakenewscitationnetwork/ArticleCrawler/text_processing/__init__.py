@@ -1,13 +1,23 @@
-from .preprocessing import TextPreProcessing
-from .vectorization import TextTransformation
-from .topic_strategies import TopicModelStrategy, NMFTopicStrategy, LDATopicStrategy, TopicStrategyFactory
-from .topic_modeling import TopicModeling
-from .topic_companion_writer import TopicCompanionWriter, TopicVisualizationMetadata
-from .visualization import TopicVisualization
-from .text_analyzer import TextAnalysisManager
-from .topic_labeler import TopicLabeler
-from .topic_labeling_strategy import TopicLabelingStrategy
-from .refined_method_b_strategy import RefinedMethodBStrategy
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(__name__, {
+    'TextPreProcessing': '.preprocessing',
+    'TextTransformation': '.vectorization',
+    'TopicModelStrategy': '.topic_strategies',
+    'NMFTopicStrategy': '.topic_strategies',
+    'LDATopicStrategy': '.topic_strategies',
+    'TopicStrategyFactory': '.topic_strategies',
+    'TopicModeling': '.topic_modeling',
+    'TopicCompanionWriter': '.topic_companion_writer',
+    'TopicVisualizationMetadata': '.topic_companion_writer',
+    'TopicVisualization': '.visualization',
+    'TextAnalysisManager': '.text_analyzer',
+    'TopicLabeler': '.topic_labeler',
+    'TopicLabelingStrategy': '.topic_labeling_strategy',
+    'RefinedMethodBStrategy': '.refined_method_b_strategy',
+    'EmbeddingStore': '.embedding_store',
+    'NearestNeighborIndex': '.embedding_store',
+})
 
 __all__ = [
     'TextPreProcessing',
@@ -23,5 +33,7 @@ __all__ = [
     'TextAnalysisManager',
     'TopicLabeler',
     'TopicLabelingStrategy',
-    'RefinedMethodBStrategy'
+    'RefinedMethodBStrategy',
+    'EmbeddingStore',
+    'NearestNeighborIndex',
 ]
@@ -0,0 +1,328 @@
+"""
+Persistent sentence-embedding store and nearest-neighbour index.
+
+Embeddings are kept per model as an L2-normalised float16 ``.npy`` matrix
+(opened memory-mapped) with a text file of the paper ID of each row, so
+cosine similarity is a dot product and only papers not seen before have to
+be encoded.
+"""
+
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+try:
+    import hnswlib
+except ImportError:  # pragma: no cover - optional ANN backend
+    hnswlib = None
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - optional ANN backend
+    faiss = None
+
+
+EncodeFn = Callable[[List[str]], np.ndarray]
+
+
+class EmbeddingStore:
+    """
+    Embeddings keyed by paper ID for one model, persisted under ``root``.
+
+    Layout: ``<root>/<model>/embeddings.npy`` (float16, unit rows) and
+    ``<root>/<model>/ids.txt`` (one paper ID per line). Rows are only ever
+    appended: the matrix is preallocated and grows by ``GROWTH_FACTOR`` when
+    full, so adding papers costs time in the number of new rows, not the
+    stored ones. Rows are written before their IDs, and rows past the last
+    ID are unused capacity. Writers in several processes are serialised with
+    a lock file (POSIX only).
+    """
+
+    VECTORS_FILE = "embeddings.npy"
+    IDS_FILE = "ids.txt"
+    LOCK_FILE = ".lock"
+    GROWTH_FACTOR = 2.0
+    MIN_CAPACITY = 1024
+
+    def __init__(self, root: Path, model_name: str, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            root: Directory holding one sub-folder per model
+            model_name: Embedding model name (part of the storage key)
+            logger: Optional logger instance
+        """
+        self.model_name = model_name
+        self.path = Path(root) / re.sub(r'[^\w.-]+', '_', model_name)
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._reset()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, paper_id: str) -> bool:
+        return paper_id in self._positions
+
+    @property
+    def ids(self) -> List[str]:
+        return list(self._ids)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """All stored vectors (memory-mapped float16, one unit row per ID)."""
+        if self._vectors is None and self._ids:
+            # Unpickled stores re-map the matrix on first use.
+            self._vectors = np.load(self.path / self.VECTORS_FILE, mmap_mode='r')
+        if self._vectors is None:
+            return np.zeros((0, 0), dtype=np.float16)
+        return self._vectors[:len(self._ids)]
+
+    def positions(self, paper_ids: Iterable[str]) -> List[Optional[int]]:
+        """Row index of each ID, or None when it has no embedding."""
+        return [self._positions.get(pid) for pid in paper_ids]
+
+    def get(self, paper_ids: Sequence[str]) -> np.ndarray:
+        """Vectors for ``paper_ids`` as float32 (raises KeyError for unknown IDs)."""
+        rows = [self._positions[pid] for pid in paper_ids]
+        return np.asarray(self.vectors[rows], dtype=np.float32)
+
+    def add(self, paper_ids: Sequence[str], texts: Sequence[str], encode: EncodeFn, batch_size: int = 256) -> int:
+        """
+        Encode and append the papers that are not stored yet.
+
+        Args:
+            paper_ids: Paper IDs, aligned with ``texts``
+            texts: Text embedded for each paper (typically its title)
+            encode: Maps a list of texts to a 2-D array of embeddings
+            batch_size: Texts per ``encode`` call
+
+        Returns:
+            Number of newly stored papers
+        """
+        pending: Dict[str, str] = {}
+        for pid, text in zip(paper_ids, texts):
+            if (pid is not None and pid not in self._positions and pid not in pending
+                    and isinstance(text, str) and text.strip()):
+                pending[pid] = text
+        if not pending:
+            return 0
+
+        new_ids = list(pending)
+        new_texts = list(pending.values())
+        chunks = [
+            np.asarray(encode(new_texts[i:i + batch_size]), dtype=np.float32)
+            for i in range(0, len(new_texts), batch_size)
+        ]
+        new_vectors = normalize_rows(np.vstack(chunks)).astype(np.float16)
+
+        with self._lock, self._file_lock():
+            # Pick up rows another process appended since we last looked.
+            self._load()
+            keep = [i for i, pid in enumerate(new_ids) if pid not in self._positions]
+            if not keep:
+                return 0
+            new_ids = [new_ids[i] for i in keep]
+            self._append(new_ids, new_vectors[keep])
+            self._load()
+        self.logger.info(f"Encoded {len(new_ids)} new papers ({len(self._ids)} stored for {self.model_name})")
+        return len(new_ids)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_lock', None)
+        state['_vectors'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _reset(self) -> None:
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._vectors: Optional[np.ndarray] = None
+        self._ids_read = 0  # bytes of the IDs file already parsed
+
+    def _load(self) -> None:
+        """Read the IDs appended since the last call and re-map the vectors."""
+        ids_path = self.path / self.IDS_FILE
+        vectors_path = self.path / self.VECTORS_FILE
+        if not ids_path.exists() or not vectors_path.exists():
+            self._reset()
+            return
+        with open(ids_path, 'rb') as f:
+            f.seek(self._ids_read)
+            tail = f.read()
+        # A line without its newline is an interrupted append; leave it out.
+        complete = tail.rfind(b'\n') + 1
+        new_ids = tail[:complete].decode('utf-8').splitlines()
+        vectors = np.load(vectors_path, mmap_mode='r')
+        count = len(self._ids) + len(new_ids)
+        if vectors.ndim != 2 or count > vectors.shape[0]:
+            self.logger.warning(f"Embedding store at {self.path} is inconsistent; ignoring it")
+            self._reset()
+            return
+        for row, pid in enumerate(new_ids, start=len(self._ids)):
+            self._positions[pid] = row
+        self._ids.extend(new_ids)
+        self._ids_read += complete
+        self._vectors = vectors
+
+    def _append(self, ids: List[str], vectors: np.ndarray) -> None:
+        count = len(self._ids)
+        if self._vectors is not None and self._vectors.shape[1] != vectors.shape[1]:
+            raise ValueError(
+                f"Embedding size {vectors.shape[1]} does not match stored size {self._vectors.shape[1]}"
+            )
+        capacity = 0 if self._vectors is None else self._vectors.shape[0]
+        if count + len(ids) > capacity:
+            self._grow(max(count + len(ids), int(capacity * self.GROWTH_FACTOR), self.MIN_CAPACITY),
+                       vectors.shape[1])
+
+        rows = np.lib.format.open_memmap(self.path / self.VECTORS_FILE, mode='r+')
+        rows[count:count + len(ids)] = vectors
+        rows.flush()
+        del rows
+
+        ids_path = self.path / self.IDS_FILE
+        with open(ids_path, 'ab') as f:
+            # Drop the tail of an interrupted append before writing after it.
+            f.truncate(self._ids_read)
+            f.write(''.join(f"{pid}\n" for pid in ids).encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _grow(self, capacity: int, dim: int) -> None:
+        """Copy the stored rows into a new matrix with room for ``capacity`` rows."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_vectors = self.path / f"{self.VECTORS_FILE}.{os.getpid()}.tmp"
+        grown = np.lib.format.open_memmap(tmp_vectors, mode='w+', dtype=np.float16, shape=(capacity, dim))
+        if self._ids:
+            grown[:len(self._ids)] = self.vectors
+        grown.flush()
+        del grown
+        # Drop the old memory map before replacing the file it points at.
+        self._vectors = None
+        os.replace(tmp_vectors, self.path / self.VECTORS_FILE)
+        (self.path / self.IDS_FILE).touch()
+        self.logger.debug(f"Grew embedding store for {self.model_name} to {capacity} rows")
+
+    @contextmanager
+    def _file_lock(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / self.LOCK_FILE, 'a') as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            yield
+
+
+class NearestNeighborIndex:
+    """
+    Cosine-similarity search over unit vectors.
+
+    Uses an HNSW graph (hnswlib, else faiss) once there are at least
+    ``ann_threshold`` vectors and one of them is installed; otherwise, or with
+    ``backend='brute'``, a single matrix-vector product.
+    """
+
+    BACKENDS = ('auto', 'hnswlib', 'faiss', 'brute')
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        backend: str = 'auto',
+        ann_threshold: int = 5000,
+        ef_search: int = 64,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Args:
+            vectors: Unit-normalised rows to search
+            backend: 'auto', 'hnswlib', 'faiss' or 'brute'
+            ann_threshold: Minimum rows before 'auto' builds an ANN index
+            ef_search: HNSW search breadth (higher is more accurate, slower)
+            logger: Optional logger instance
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}, got {backend!r}")
+        self.logger = logger or logging.getLogger(__name__)
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.backend = self._choose_backend(backend, ann_threshold)
+        self._index = None
+        if self.backend == 'hnswlib':
+            self._index = self._build_hnswlib(ef_search)
+        elif self.backend == 'faiss':
+            self._index = self._build_faiss(ef_search)
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def search(self, query: np.ndarray, top_k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (row indices, cosine similarities) of the ``top_k`` nearest rows, best first.
+        """
+        n = len(self)
+        k = min(top_k, n)
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        query = normalize_rows(np.asarray(query, dtype=np.float32).reshape(1, -1))
+
+        if self.backend == 'hnswlib':
+            labels, distances = self._index.knn_query(query, k=k)
+            return labels[0].astype(np.int64), 1.0 - distances[0]
+        if self.backend == 'faiss':
+            scores, labels = self._index.search(query, k)
+            return labels[0].astype(np.int64), scores[0]
+
+        scores = self.vectors @ query[0]
+        top = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+        top = top[np.argsort(-scores[top])]
+        return top.astype(np.int64), scores[top]
+
+    def _choose_backend(self, backend: str, ann_threshold: int) -> str:
+        if backend == 'hnswlib' and hnswlib is None:
+            raise ImportError("hnswlib is not installed")
+        if backend == 'faiss' and faiss is None:
+            raise ImportError("faiss is not installed")
+        if backend != 'auto':
+            return backend
+        if len(self) >= ann_threshold:
+            if hnswlib is not None:
+                return 'hnswlib'
+            if faiss is not None:
+                return 'faiss'
+        return 'brute'
+
+    def _build_hnswlib(self, ef_search: int):
+        index = hnswlib.Index(space='cosine', dim=self.vectors.shape[1])
+        index.init_index(max_elements=len(self), ef_construction=200, M=16)
+        index.add_items(self.vectors, np.arange(len(self)))
+        index.set_ef(max(ef_search, 1))
+        self.logger.debug(f"Built hnswlib index over {len(self)} vectors")
+        return index
+
+    def _build_faiss(self, ef_search: int):
+        index = faiss.IndexHNSWFlat(self.vectors.shape[1], 16, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efSearch = max(ef_search, 1)
+        index.add(self.vectors)
+        self.logger.debug(f"Built faiss HNSW index over {len(self)} vectors")
+        return index
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length (zero rows are left as they are)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
@@ -1,7 +1,11 @@
-from .library_creation import LibraryCreationOrchestrator
-from .topic_modeling_usecase import TopicModelingOrchestrator
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(__name__, {
+    'LibraryCreationOrchestrator': '.library_creation',
+    'TopicModelingOrchestrator': '.topic_modeling_usecase',
+})
 
 __all__ = [
     'LibraryCreationOrchestrator',
     'TopicModelingOrchestrator'
-]
\ No newline at end of file
+]
@@ -11,6 +11,7 @@ from ArticleCrawler.library.models import (
 )
 from ArticleCrawler.library.author_search_service import AuthorSearchService
 from ArticleCrawler.library.library_manager import LibraryManager
+from ArticleCrawler.library.library_writer import LibraryWriter
 from ArticleCrawler.DataManagement.markdown_writer import MarkdownFileGenerator
 from ArticleCrawler.usecases.topic_modeling_usecase import TopicModelingOrchestrator
 from ArticleCrawler.library.temporal_analysis_service import TemporalAnalysisService
@@ -230,21 +231,17 @@ class AuthorTopicEvolutionUseCase:
             api_provider_type='openalex'
         )
         
+        items = []
         for paper in papers:
             try:
                 safe_title = self.library_manager.sanitize_filename(paper.title)
                 filename = f"{paper.paper_id}_{safe_title}.md"
-                output_path = papers_dir / filename
-                
-                markdown_writer.create_paper_markdown_with_openalex_metadata(
-                    paper_data=paper,
-                    output_path=output_path
-                )
-                
+                items.append((paper, papers_dir / filename))
             except Exception as e:
                 self.logger.error(f"Failed to save paper {paper.paper_id}: {e}")
+        written = LibraryWriter(markdown_writer, logger=self.logger).write_papers(items)
         
-        self.logger.info(f"Saved {len(papers)} papers to {papers_dir}")
+        self.logger.info(f"Saved {len(written)} papers to {papers_dir}")
 
 
     def _create_storage_config(self, library_path: Path):
@@ -8,6 +8,7 @@ from typing import List, Optional
 import logging
 
 from ..library.library_manager import LibraryManager
+from ..library.library_writer import LibraryWriter
 from ..library.models import LibraryConfig, PaperData
 from ..DataManagement.markdown_writer import MarkdownFileGenerator
 from ..api import create_api_provider
@@ -20,7 +21,7 @@ class LibraryCreationOrchestrator:
     Responsibilities:
     - Coordinate library creation process
     - Fetch papers via API (delegates to API provider)
-    - Save papers (delegates to MarkdownFileGenerator)
+    - Save papers (delegates to LibraryWriter / MarkdownFileGenerator)
     
     Does NOT:
     - Transform API responses (API provider does this now)
@@ -77,6 +78,7 @@ class LibraryCreationOrchestrator:
         self.library_manager.save_library_config(config)
         
         papers_saved = self._fetch_and_save_papers(paper_ids, library_path)
+        self.library_manager.refresh_manifest(library_path)
         
         self.logger.info(
             f"Library created successfully at {library_path}. "
@@ -101,7 +103,6 @@ class LibraryCreationOrchestrator:
             Number of papers successfully saved
         """
         papers_dir = self.library_manager.get_papers_directory(library_path)
-        saved_count = 0
         
         storage_config = self._create_storage_config(library_path)
         markdown_writer = MarkdownFileGenerator(
@@ -109,6 +110,7 @@ class LibraryCreationOrchestrator:
             api_provider_type=self.api_provider
         )
         
+        to_write = []
         for i, paper_id in enumerate(paper_ids, 1):
             try:
                 self.logger.info(f"Fetching paper {i}/{len(paper_ids)}: {paper_id}")
@@ -118,15 +120,7 @@ class LibraryCreationOrchestrator:
                 if paper_data:
                     safe_title = self.library_manager.sanitize_filename(paper_data.title)
                     filename = f"{paper_data.paper_id}_{safe_title}.md"
-                    output_path = papers_dir / filename
-                    
-                    markdown_writer.create_paper_markdown_with_openalex_metadata(
-                        paper_data=paper_data,
-                        output_path=output_path
-                    )
-                    
-                    saved_count += 1
-                    self.logger.debug(f"Saved paper: {filename}")
+                    to_write.append((paper_data, papers_dir / filename))
                 else:
                     self.logger.warning(f"No data returned for paper {paper_id}")
                 
@@ -134,7 +128,9 @@ class LibraryCreationOrchestrator:
                 self.logger.error(f"Failed to process paper {paper_id}: {e}")
                 continue
         
-        return saved_count
+        written = LibraryWriter(markdown_writer, logger=self.logger).write_papers(to_write)
+        self.logger.debug(f"Saved {len(written)} paper files to {papers_dir}")
+        return len(written)
     
     def _create_storage_config(self, library_path: Path):
         """
@@ -1,24 +1,27 @@
 # Linear contextual bandit + LinUCB
 # Embeds paper text + future metadata
-# Loads papers from crawler and caches embeddings
-# Stores feedback and maintains A matrix with efficient Cholesky updates
-# Scores papers using cosine similarity + UCB
+# Loads papers from crawler and caches embeddings (optionally in an EmbeddingStore)
+# Stores feedback and maintains A matrix with rank-1 Cholesky updates
+# Scores papers using cosine similarity + UCB, updating exploration bonuses incrementally
 # Interactive CLI for feedback collection
 # Orchestrates modules and runs recommendation loop
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from scipy.linalg import cho_factor, cho_solve
+from scipy.linalg import cho_solve, solve_triangular
 import os
 from datetime import datetime
 import pickle
 
+from ..text_processing.embedding_store import EmbeddingStore
+
 
 class PaperRecommender:
-    def __init__(self, crawler, lambda_reg=1.0, ucb_weight=0.1, UseSeed= True):
+    def __init__(self, crawler, lambda_reg=1.0, ucb_weight=0.1, UseSeed= True, store_dir=None):
         df = crawler.data_manager.frames.df_paper_metadata[['title', 'paperId', 'isSeed']]
         self.embedding_model = RecommenderEmbeddingModel()
-        self.db = PaperDatabase(df, self.embedding_model)
+        store = EmbeddingStore(store_dir, self.embedding_model.model_name) if store_dir else None
+        self.db = PaperDatabase(df, self.embedding_model, store=store)
         self.feedback = FeedbackStore(dim=self.embedding_model.dim, lambda_reg=lambda_reg)
 
         if UseSeed:        # Add seed feedback here
@@ -26,7 +29,7 @@ class PaperRecommender:
             for _, row in df_seed.iterrows():
                 idx = self.db.df.index.get_loc(row.name)
                 emb = self.db.embeddings[idx]
-                self.feedback.add_feedback(emb, label=1)
+                self.feedback.add_feedback(emb, label=1, index=idx)
 
         self.scorer = PaperScorer(self.feedback, ucb_weight=ucb_weight)
         self.cli = RecommenderCLI(self.db, self.scorer, self.feedback)
@@ -40,10 +43,11 @@ class PaperRecommender:
         save_path = path or f"recommender_session_{timestamp}.pkl"
 
         save_data = {
-            'A': self.fb.A,
-            'b': self.fb.b,
-            'feedback_count': self.fb._feedback_count,
-            'model_dim': self.model.dim,
+            'A': self.feedback.A,
+            'b': self.feedback.b,
+            'feedback_count': self.feedback._feedback_count,
+            'explored': sorted(self.feedback.explored),
+            'model_dim': self.embedding_model.dim,
         }
 
         with open(save_path, 'wb') as f:
@@ -55,6 +59,7 @@ class PaperRecommender:
 # === RecommenderEmbeddingModel ===
 class RecommenderEmbeddingModel:
     def __init__(self, model_name='all-MiniLM-L6-v2'):
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name)
         self.dim = self.model.get_sentence_embedding_dimension()
 
@@ -70,17 +75,30 @@ class RecommenderEmbeddingModel:
 
 # === PaperDatabase ===
 class PaperDatabase:
-    def __init__(self, df, embedding_model):
+    def __init__(self, df, embedding_model, store=None):
         self.df = df
         self.embedding_model = embedding_model
+        self.store = store
         self.papers = []
         self.embeddings = []
         self._prepare()
 
     def _prepare(self):
         titles = self.df['title'].tolist()
-        self.papers = [{'paperId': pid, 'title': title} for pid, title in zip(self.df['paperId'], titles)]
-        self.embeddings = self.embedding_model.encode_batch(titles)
+        paper_ids = self.df['paperId'].tolist()
+        self.papers = [{'paperId': pid, 'title': title} for pid, title in zip(paper_ids, titles)]
+        if self.store is None:
+            self.embeddings = np.asarray(self.embedding_model.encode_batch(titles), dtype=np.float32)
+            return
+        # Only papers missing from the store are encoded; titles that could not
+        # be embedded (empty) get a zero vector so row i still matches paper i.
+        self.store.add(paper_ids, titles, self.embedding_model.encode_batch)
+        embeddings = np.zeros((len(paper_ids), self.embedding_model.dim), dtype=np.float32)
+        rows = self.store.positions(paper_ids)
+        present = [i for i, row in enumerate(rows) if row is not None]
+        if present:
+            embeddings[present] = self.store.vectors[[rows[i] for i in present]]
+        self.embeddings = embeddings
 
 
     def get_all(self):
@@ -95,60 +113,105 @@ class FeedbackStore:
         self.A = lambda_reg * np.eye(dim)
         self.b = np.zeros(dim)
         self._feedback_count = 0
-        self._cho = None
-        self._dirty = True
-        self._update_every = update_every
-        self.explored = set()  # <-- add this to track explored embeddings
-
+        # Lower Cholesky factor of A, kept exact with a rank-1 update per feedback.
+        self._L = np.sqrt(lambda_reg) * np.eye(dim)
+        # (A^-1 x, 1 + x^T A^-1 x) before each update, so cached exploration
+        # bonuses can be brought up to date with Sherman-Morrison.
+        self.updates = []
+        self._update_every = update_every  # kept for compatibility; updates are exact now
+        self.explored = set()  # indices of papers that received feedback
+
+    @property
+    def version(self) -> int:
+        return len(self.updates)
+
+    def add_feedback(self, x: np.ndarray, label: int, index=None):
+        x = np.asarray(x, dtype=np.float64)
+        u = cho_solve((self._L, True), x)
+        self.updates.append((u, 1.0 + x @ u))
 
-    def add_feedback(self, x: np.ndarray, label: int):
         self.A += np.outer(x, x)
         self.b += label * x
+        _cholesky_rank1_update(self._L, x)
         self._feedback_count += 1
-        if self._feedback_count % self._update_every == 0:
-            self._dirty = True
-
-        self.explored.add(tuple(x))
-
 
-    def _update_cholesky(self):
-        if self._dirty or self._cho is None:
-            self._cho = cho_factor(self.A, lower=True)
-            self._dirty = False
+        if index is not None:
+            self.explored.add(int(index))
 
     def get_query(self) -> np.ndarray:
-        self._update_cholesky()
-        return cho_solve(self._cho, self.b)
+        return cho_solve((self._L, True), self.b)
 
     def mahalanobis(self, x: np.ndarray) -> float:
-        self._update_cholesky()
-        z = cho_solve(self._cho, x)
+        z = cho_solve((self._L, True), x)
         return np.dot(x, z)
 
+    def mahalanobis_batch(self, X: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+        """x^T A^-1 x for every row of X: ||L^-1 x||^2 from one triangular solve per chunk."""
+        out = np.empty(len(X))
+        for start in range(0, len(X), chunk_size):
+            chunk = np.asarray(X[start:start + chunk_size], dtype=np.float64).T
+            V = solve_triangular(self._L, chunk, lower=True, check_finite=False)
+            out[start:start + chunk_size] = np.einsum('ij,ij->j', V, V)
+        return out
+
+
+def _cholesky_rank1_update(L: np.ndarray, x: np.ndarray) -> None:
+    """In place: turn L (A = L L^T, lower) into the factor of A + x x^T in O(d^2)."""
+    x = x.copy()
+    n = len(x)
+    for k in range(n):
+        r = np.hypot(L[k, k], x[k])
+        c = r / L[k, k]
+        s = x[k] / L[k, k]
+        L[k, k] = r
+        if k + 1 < n:
+            L[k + 1:, k] = (L[k + 1:, k] + s * x[k + 1:]) / c
+            x[k + 1:] = c * x[k + 1:] - s * L[k + 1:, k]
+
 
 # === PaperScorer ===
 class PaperScorer:
+    # Beyond this many pending feedback updates a fresh batch solve is cheaper
+    # (and avoids accumulating rounding error).
+    MAX_INCREMENTAL_UPDATES = 32
+
     def __init__(self, feedback_store, ucb_weight=0.1):
         self.fb = feedback_store
         self.alpha = ucb_weight
+        self._cache_X = None
+        self._cache_version = 0
+        self._cache_exploration = None
 
     def score_batch(self, X: np.ndarray) -> np.ndarray:
         w = self.fb.get_query()
         if np.linalg.norm(w) == 0:
             return np.zeros(len(X))  # no feedback yet
 
-        sims = X @ w
+        sims = X @ w.astype(X.dtype, copy=False)
         if self.alpha > 0:
-            exploration = np.array([self.fb.mahalanobis(x) for x in X])
-            scores = sims + self.alpha * np.sqrt(exploration)
+            exploration = self._exploration(X)
+            scores = sims + self.alpha * np.sqrt(np.maximum(exploration, 0.0))
         else:
             scores = sims
         
         # === Mask explored items ===
-        explored_mask = np.array([tuple(x) in self.fb.explored for x in X])
-        scores[explored_mask] = -np.inf
+        explored = [i for i in self.fb.explored if i < len(X)]
+        scores[explored] = -np.inf
         return scores
 
+    def _exploration(self, X: np.ndarray) -> np.ndarray:
+        """x^T A^-1 x per row; for the same X only feedback added since the last call is folded in."""
+        pending = self.fb.version - self._cache_version
+        if self._cache_X is not X or pending < 0 or pending > self.MAX_INCREMENTAL_UPDATES:
+            self._cache_exploration = self.fb.mahalanobis_batch(X)
+        else:
+            for u, denom in self.fb.updates[self._cache_version:]:
+                projected = X @ u.astype(X.dtype, copy=False)
+                self._cache_exploration = self._cache_exploration - projected * projected / denom
+        self._cache_X = X
+        self._cache_version = self.fb.version
+        return self._cache_exploration
+
 
 # === RecommenderCLI ===
 class RecommenderCLI:
@@ -175,14 +238,14 @@ class RecommenderCLI:
                 print(f"\nTitle: {paper['title']}")
                 ans = input("Relevant? (y/n/q, anything else = skip): ").strip().lower()
                 if ans == 'y':
-                    self.fb.add_feedback(X[idx], label=1)
+                    self.fb.add_feedback(X[idx], label=1, index=idx)
                 elif ans == 'n':
-                    self.fb.add_feedback(X[idx], label=-1)
+                    self.fb.add_feedback(X[idx], label=-1, index=idx)
                 elif ans == 'q':
                     print("Exiting...")
                     return
                 else:
-                    self.fb.add_feedback(X[idx], label=0)  # if you want zero feedback
+                    self.fb.add_feedback(X[idx], label=0, index=idx)  # if you want zero feedback
 
                 # skip just continues the loop silently
             print("\n--- Next batch ---")
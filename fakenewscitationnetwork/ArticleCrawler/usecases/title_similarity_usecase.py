@@ -1,4 +1,5 @@
 import os
+import json
 import logging
 import pickle
 import time
@@ -7,83 +8,171 @@ import torch
 
 from pathlib import Path
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from ..text_processing.embedding_store import EmbeddingStore, NearestNeighborIndex, normalize_rows
 
 
 class TitleSimilarityEngine:
-    def __init__(self, model_name = 'all-MiniLM-L6-v2', device = None, crawler= None):
+    def __init__(self, model_name = 'all-MiniLM-L6-v2', device = None, crawler= None, store_dir = None, index_backend = 'auto'):
+        """
+        Args:
+            model_name: SentenceTransformer model used for titles and queries
+            device: Torch device (defaults to CUDA when available)
+            crawler: Optional crawler whose titles are loaded immediately
+            store_dir: Optional directory of a persistent EmbeddingStore; when
+                set, only papers without a stored embedding are encoded
+            index_backend: NearestNeighborIndex backend ('auto', 'hnswlib', 'faiss' or 'brute')
+        """
+        self.model_name = model_name
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
-        self.model = SentenceTransformer(model_name, device=self.device)
-        
+        self._model = None
+        self.store = EmbeddingStore(store_dir, model_name) if store_dir else None
+        self.index_backend = index_backend
+        self._index = None
+        self.embeddings = None
+
         if crawler:
-            self.titles = crawler.data_manager.frames.df_paper_metadata['title'].tolist()
+            frame = crawler.data_manager.frames.df_paper_metadata
+            self.titles = frame['title'].tolist()
+            self.paper_ids = frame['paperId'].tolist() if 'paperId' in frame else [str(i) for i in range(len(self.titles))]
             self.source_pickle_path= crawler.storage_and_logging_options.folders_all['pkl_folder'] / 'perm'
         else:
-            self.embeddings = None
             self.titles = None
+            self.paper_ids = None
             self.source_pickle_path = None
 
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model
+
     def load_crawler(self, file_path: str):
         with open(file_path, "rb") as f:
             crawler = pickle.load(f)
-        self.titles = crawler.data_manager.frames.df_paper_metadata['title'].tolist()
+        frame = crawler.data_manager.frames.df_paper_metadata
+        self.titles = frame['title'].tolist()
+        self.paper_ids = frame['paperId'].tolist()
         self.source_pickle_path = file_path
         logging.info(f"Crawler loaded with {len(self.titles)} titles from: {file_path}")
 
+    def load_experiments(self, *experiment_paths):
+        """
+        Load titles from the ``papers.parquet`` catalogs of one or more experiments.
+
+        Each path may be an experiment folder (containing ``vault/parquet/papers.parquet``)
+        or a catalog file. Papers appearing in several experiments are kept once.
+        """
+        import pyarrow.parquet as pq
+
+        paper_ids, titles, seen = [], [], set()
+        for path in experiment_paths:
+            path = Path(path)
+            catalog = path if path.suffix == '.parquet' else path / 'vault' / 'parquet' / 'papers.parquet'
+            table = pq.read_table(catalog, columns=['paperId', 'title']).to_pydict()
+            for paper_id, title in zip(table['paperId'], table['title']):
+                if paper_id and paper_id not in seen:
+                    seen.add(paper_id)
+                    paper_ids.append(paper_id)
+                    titles.append(title)
+        self.paper_ids = paper_ids
+        self.titles = titles
+        self.source_pickle_path = None
+        self.embeddings = None
+        self._index = None
+        logging.info(f"Loaded {len(titles)} titles from {len(experiment_paths)} experiment(s)")
+
     def compute_embeddings(self):
         if not self.titles:
             raise ValueError("Titles are not loaded.")
         start_time = time.time()
-        self.embeddings = self.model.encode(self.titles, show_progress_bar=True, convert_to_numpy=True)
+        if self.store is not None:
+            self.store.add(self.paper_ids, self.titles, self._encode)
+            keep = [i for i, pos in enumerate(self.store.positions(self.paper_ids)) if pos is not None]
+            self.paper_ids = [self.paper_ids[i] for i in keep]
+            self.titles = [self.titles[i] for i in keep]
+            self.embeddings = self.store.get(self.paper_ids)
+        else:
+            self.embeddings = self._encode(self.titles, show_progress_bar=True)
+        self._index = None
         elapsed = time.time() - start_time
         logging.info(f"Embeddings computed in {elapsed:.2f} seconds")
 
-    def find_similar_titles(self, query: str, top_k: int = 5):
+    def search(self, query: str, top_k: int = 5):
+        """Return the ``top_k`` most similar titles as dicts with paper_id, title and similarity."""
         if self.embeddings is None or self.titles is None:
             raise ValueError("Embeddings or titles not available. Run `compute_embeddings()` first.")
 
-        query_embedding = self.model.encode(query, convert_to_numpy=True)
-        similarities = cosine_similarity([query_embedding], self.embeddings)[0]
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        if self._index is None:
+            self._index = NearestNeighborIndex(self.embeddings, backend=self.index_backend)
+        query_embedding = self._encode([query])[0]
+        indices, similarities = self._index.search(query_embedding, top_k=top_k)
+        paper_ids = self.paper_ids or [None] * len(self.titles)
+        return [
+            {'paper_id': paper_ids[idx], 'title': self.titles[idx], 'similarity': float(score)}
+            for idx, score in zip(indices, similarities)
+        ]
+
+    def find_similar_titles(self, query: str, top_k: int = 5):
+        results = self.search(query, top_k=top_k)
 
         print(f"\n🔍 Query: {query}\n")
         print("📚 Top most similar titles:")
-        for idx in top_indices:
-            print(f"- ({similarities[idx]:.4f}) {self.titles[idx]}")
+        for result in results:
+            print(f"- ({result['similarity']:.4f}) {result['title']}")
+        return results
 
     def save(self, save_path: str):
+        """Save embeddings, titles and IDs as an ``.npz`` bundle (no pickle)."""
         if self.embeddings is None or self.titles is None:
             raise ValueError("Nothing to save. Ensure embeddings and titles are set.")
 
-        data = {
-            'embeddings': self.embeddings,
+        meta = {
             'titles': self.titles,
-            'source_pickle_path': self.source_pickle_path
+            'paper_ids': self.paper_ids,
+            'source_pickle_path': str(self.source_pickle_path) if self.source_pickle_path else None,
+            'model_name': self.model_name,
         }
         with open(save_path, 'wb') as f:
-            pickle.dump(data, f)
+            np.savez(f, embeddings=np.asarray(self.embeddings, dtype=np.float16), meta=np.array(json.dumps(meta)))
         logging.info(f"Embedding data saved to: {save_path}")
 
     def load(self, load_path: str):
-        with open(load_path, 'rb') as f:
-            data = pickle.load(f)
-        self.embeddings = data['embeddings']
-        self.titles = data['titles']
-        self.source_pickle_path = data['source_pickle_path']
+        if str(load_path).endswith('.pkl'):
+            # Bundles written before the .npz format were pickled dicts.
+            with open(load_path, 'rb') as f:
+                data = pickle.load(f)
+            self.embeddings = normalize_rows(np.asarray(data['embeddings'], dtype=np.float32))
+            self.titles = data['titles']
+            self.paper_ids = data.get('paper_ids')
+            self.source_pickle_path = data['source_pickle_path']
+        else:
+            with np.load(load_path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                self.embeddings = np.asarray(data['embeddings'], dtype=np.float32)
+            self.titles = meta['titles']
+            self.paper_ids = meta.get('paper_ids')
+            self.source_pickle_path = meta.get('source_pickle_path')
+        self._index = None
         logging.info(f"Embedding data loaded from: {load_path}")
 
+    def _encode(self, texts, show_progress_bar=False):
+        vectors = self.model.encode(list(texts), show_progress_bar=show_progress_bar, convert_to_numpy=True)
+        return normalize_rows(np.asarray(vectors, dtype=np.float32))
+
 
 def main():
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
     # === CONFIGURATION ===
-    pickle_path = r'C:\Users\imanm\OneDrive - Office 365 Fontys\Documenten\myCode\fakenews\refactor\Experiments\data\crawler_experiments\chess_post_rw\pkl\perm\chess_post_rw_20250416221521.pkl'
+    experiments = [
+        r'C:\Users\imanm\OneDrive - Office 365 Fontys\Documenten\myCode\fakenews\refactor\Experiments\data\crawler_experiments\chess_post_rw',
+    ]
     query = "evolution of behavioral tendencies"
-    save_path = os.path.join(os.path.dirname(pickle_path), 'title_embeddings_bundle.pkl')
+    store_dir = os.path.join(os.path.dirname(experiments[0]), 'embedding_store')
 
     # === EXECUTION ===
-    engine = TitleSimilarityEngine() # alternatively, if you have a crawler object, you can feed it into this class. 
-    engine.load_crawler(pickle_path) # 
+    engine = TitleSimilarityEngine(store_dir=store_dir) # only papers not in the store are encoded
+    engine.load_experiments(*experiments) # alternatively load_crawler(pickle_path) or pass a crawler object
     engine.compute_embeddings()
     engine.find_similar_titles(query)
-    engine.save(save_path)
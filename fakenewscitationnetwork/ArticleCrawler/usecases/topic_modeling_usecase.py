@@ -3,6 +3,7 @@ from typing import List, Dict, Optional, TYPE_CHECKING
 import logging
 
 from ..library.library_manager import LibraryManager
+from ..library.library_writer import LibraryWriter
 from ..library.paper_file_reader import PaperFileReader
 from ..library.models import LibraryConfig, PaperData, TopicCluster
 from ..text_processing.topic_labeler import TopicLabeler
@@ -254,27 +255,9 @@ class TopicModelingOrchestrator:
             library_path: Library path
             papers: List of all papers (some may have topic assignments)
         """
-        from ArticleCrawler.DataManagement.markdown_writer import MarkdownFileGenerator
-        
         papers_dir = self.library_manager.get_papers_directory(library_path)
-        storage_config = self._create_storage_config(library_path)
-        markdown_writer = MarkdownFileGenerator(
-            storage_and_logging_options=storage_config,
-            api_provider_type='openalex'
-        )
-        
-        for paper in papers:
-            try:
-                safe_title = self._sanitize_filename(paper.title)
-                filename = f"{paper.paper_id}_{safe_title}.md"
-                output_path = papers_dir / filename
-                
-                markdown_writer.create_paper_markdown_with_openalex_metadata(
-                    paper_data=paper,
-                    output_path=output_path
-                )
-            except Exception as e:
-                self.logger.warning(f"Failed to save paper {paper.paper_id}: {e}")
+        items = [(paper, papers_dir / self._paper_filename(paper)) for paper in papers]
+        self._create_library_writer(library_path).write_papers(items)
     
     def _group_papers_by_cluster(
         self,
@@ -316,11 +299,8 @@ class TopicModelingOrchestrator:
         """
         self.logger.info("Organizing papers into topic folders")
         
-        storage_config = self._create_storage_config(library_path)
-        markdown_writer = MarkdownFileGenerator(
-            storage_and_logging_options=storage_config,
-            api_provider_type='openalex'
-        )
+        library_writer = self._create_library_writer(library_path)
+        papers_dir = self.library_manager.get_papers_directory(library_path)
         
         for cluster in labeled_clusters:
             topic_folder = self.library_manager.create_topic_folder(
@@ -332,24 +312,33 @@ class TopicModelingOrchestrator:
             
             cluster_papers = [p for p in papers if p.assigned_topic == cluster.cluster_id]
             
+            # Topic folders reference the notes just saved to papers/; notes
+            # that are missing there are written out in full instead.
+            to_link, to_write = [], []
             for paper in cluster_papers:
-                try:
-                    safe_title = self._sanitize_filename(paper.title)
-                    filename = f"{paper.paper_id}_{safe_title}.md"
-                    output_path = topic_folder / filename
-                    
-                    markdown_writer.create_paper_markdown_with_openalex_metadata(
-                        paper_data=paper,
-                        output_path=output_path
-                    )
-                    
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to save paper {paper.paper_id} to topic folder: {e}"
-                    )
+                filename = self._paper_filename(paper)
+                source = papers_dir / filename
+                if source.exists():
+                    to_link.append((source, topic_folder / filename))
+                else:
+                    to_write.append((paper, topic_folder / filename))
+            library_writer.link_papers(to_link)
+            library_writer.write_papers(to_write)
             
             self.logger.debug(f"Added {len(cluster_papers)} papers to topic '{cluster.label}'")
     
+    def _paper_filename(self, paper: PaperData) -> str:
+        """Markdown file name used for ``paper`` in papers/ and topic folders."""
+        return f"{paper.paper_id}_{self._sanitize_filename(paper.title or '')}.md"
+    
+    def _create_library_writer(self, library_path: Path) -> LibraryWriter:
+        """Create a LibraryWriter backed by a MarkdownFileGenerator for this library."""
+        markdown_writer = MarkdownFileGenerator(
+            storage_and_logging_options=self._create_storage_config(library_path),
+            api_provider_type='openalex'
+        )
+        return LibraryWriter(markdown_writer, logger=self.logger)
+    
     def _create_storage_config(self, library_path: Path):
         """
         Create minimal storage config for markdown writer.
@@ -1,11 +1,13 @@
 
-from .topic_evolution_visualizer import (
-    TopicEvolutionVisualizer,
-    LineChartVisualizer,
-    HeatmapVisualizer,
-    StackedAreaVisualizer
-)
-from .visualization_config import VisualizationConfig
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(__name__, {
+    'TopicEvolutionVisualizer': '.topic_evolution_visualizer',
+    'LineChartVisualizer': '.topic_evolution_visualizer',
+    'HeatmapVisualizer': '.topic_evolution_visualizer',
+    'StackedAreaVisualizer': '.topic_evolution_visualizer',
+    'VisualizationConfig': '.visualization_config',
+})
 
 __all__ = [
     'TopicEvolutionVisualizer',
@@ -13,4 +15,4 @@ __all__ = [
     'HeatmapVisualizer',
     'StackedAreaVisualizer',
     'VisualizationConfig'
-]
\ No newline at end of file
+]
@@ -0,0 +1,214 @@
+"""
+End-to-end crawl benchmark against the offline OpenAlex stand-in.
+
+Runs ``Crawler.crawl`` on a synthetic citation graph with request pacing
+disabled and reports the wall time, per-stage times (from ``CrawlMetrics``),
+request counts and memory. ``--baseline`` compares the result with a JSON
+baseline and exits with status 1 on a regression; ``--update-baseline``
+rewrites the baseline instead.
+
+    python -m benchmarks.crawl_benchmark --baseline benchmarks/baselines/crawl_small.json
+
+Times depend on the machine, so baselines are only comparable with runs on
+the machine that recorded them; refresh them there with ``--update-baseline``
+when a change is expected to move the numbers. Counts (requests, papers,
+edges) are deterministic for a given workload and must match exactly.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.openalex_stub import OfflineOpenAlex, SyntheticCitationGraph, SyntheticOpenAlex
+
+KEYWORDS = ['fake news', 'misinformation', 'machine learning']
+TIMING_FIELDS = ('init_seconds', 'crawl_seconds')
+COUNT_FIELDS = ('papers_collected', 'citations_collected', 'references_collected', 'requests')
+# Stages faster than this are too noisy to compare.
+MIN_COMPARED_SECONDS = 0.05
+
+
+def run_crawl_benchmark(works: int = 2000, iterations: int = 4, papers_per_iteration: int = 5,
+                        seeds: int = 3, mean_references: float = 15.0, seed: int = 0,
+                        pipelined: bool = False, graph_backend: str = 'networkx',
+                        workdir: Optional[Path] = None) -> Dict:
+    """
+    Crawl a synthetic corpus offline and return the measurements.
+
+    Args:
+        works: Size of the synthetic corpus
+        iterations: Crawl iterations (``StoppingConfig.max_iter``)
+        papers_per_iteration: Papers sampled per iteration
+        seeds: Number of seed papers (the most cited works)
+        mean_references: Mean references per work
+        seed: Seed of the corpus and of the sampler
+        pipelined: Use the pipelined crawl loop
+        graph_backend: ``GraphConfig.backend``
+        workdir: Experiment root folder (default: a temporary directory)
+    """
+    from ArticleCrawler import Crawler
+    from ArticleCrawler.config import (
+        APIConfig, GraphConfig, PipelineConfig, RetractionConfig, SamplingConfig,
+        StorageAndLoggingConfig, StoppingConfig, TextProcessingConfig,
+    )
+    from ArticleCrawler.config.crawler_initialization import CrawlerParameters
+
+    graph = SyntheticCitationGraph(works, mean_references=mean_references, seed=seed)
+    api = SyntheticOpenAlex(graph)
+    params = {
+        'works': works,
+        'edges': graph.num_edges,
+        'iterations': iterations,
+        'papers_per_iteration': papers_per_iteration,
+        'seeds': seeds,
+        'mean_references': mean_references,
+        'seed': seed,
+        'pipelined': pipelined,
+        'graph_backend': graph_backend,
+    }
+
+    with tempfile.TemporaryDirectory(prefix='crawl-benchmark-') as scratch:
+        root = Path(workdir) if workdir else Path(scratch)
+        np.random.seed(seed)
+        with OfflineOpenAlex(api):
+            started = time.perf_counter()
+            crawler = Crawler(
+                crawl_initial_condition=CrawlerParameters(seed_paperid=graph.most_cited(seeds), keywords=KEYWORDS),
+                stopping_criteria_config=StoppingConfig(max_iter=iterations),
+                api_config=APIConfig(provider_type='openalex', retries=1,
+                                     email='benchmark@example.org', requests_per_second=0),
+                sampling_config=SamplingConfig(num_papers=papers_per_iteration),
+                # An explicit stopword list keeps the run independent of NLTK corpora.
+                text_config=TextProcessingConfig(stopwords=[]),
+                storage_config=StorageAndLoggingConfig(experiment_file_name='benchmark', root_folder=root),
+                graph_config=GraphConfig(backend=graph_backend),
+                retraction_config=RetractionConfig(enable_retraction_watch=False),
+                pipeline_config=PipelineConfig(enabled=pipelined),
+            )
+            initialized = time.perf_counter()
+            crawler.crawl()
+            finished = time.perf_counter()
+
+    frames = crawler.data_coordinator.frames
+    records = crawler.metrics.records
+    return {
+        'benchmark': 'crawl',
+        'params': params,
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'init_seconds': round(initialized - started, 4),
+        'crawl_seconds': round(finished - initialized, 4),
+        'stages': crawler.metrics.summary(),
+        'papers_collected': int(frames.df_paper_metadata.shape[0]),
+        'citations_collected': int(frames.df_paper_citations.shape[0]),
+        'references_collected': int(frames.df_paper_references.shape[0]),
+        'requests': api.stats()['requests'],
+        'bytes_received': api.stats()['bytes'],
+        'peak_rss_mb': records[-1]['peak_rss_mb'] if records else None,
+        'frame_memory_mb': records[-1]['frame_memory_mb'] if records else {},
+        'per_iteration': [
+            {'iteration': r['iteration'], 'total_seconds': r['total_seconds'], 'stages': r['stages'], 'api': r['api']}
+            for r in records
+        ],
+    }
+
+
+def compare_to_baseline(result: Dict, baseline: Dict, tolerance: float = 0.3) -> List[str]:
+    """
+    Regressions of ``result`` against ``baseline``, as readable lines.
+
+    Times and peak memory may exceed the baseline by ``tolerance`` (a
+    fraction); counts must match exactly because the workload is
+    deterministic.
+    """
+    if result['params'] != baseline.get('params'):
+        return [f"workload differs from baseline: {result['params']} != {baseline.get('params')}"]
+
+    problems = []
+    limit = 1.0 + tolerance
+    timings = {name: (result[name], baseline.get(name)) for name in TIMING_FIELDS}
+    for stage, seconds in result['stages'].items():
+        timings[f'stages.{stage}'] = (seconds, baseline.get('stages', {}).get(stage))
+    for name, (current, expected) in timings.items():
+        if expected is None or expected < MIN_COMPARED_SECONDS:
+            continue
+        if current > expected * limit:
+            problems.append(f'{name}: {current:.3f}s vs baseline {expected:.3f}s (+{current / expected - 1:.0%})')
+
+    for name in COUNT_FIELDS:
+        if result[name] != baseline.get(name):
+            problems.append(f'{name}: {result[name]} vs baseline {baseline.get(name)}')
+
+    current_rss, expected_rss = result.get('peak_rss_mb'), baseline.get('peak_rss_mb')
+    if current_rss and expected_rss and current_rss > expected_rss * limit:
+        problems.append(f'peak_rss_mb: {current_rss} vs baseline {expected_rss}')
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if os.environ.get('PYTHONHASHSEED') != '0':
+        # The sampler walks sets of paper IDs, so the crawl path (and every
+        # count) only repeats between runs with a fixed hash seed.
+        env = dict(os.environ, PYTHONHASHSEED='0')
+        return subprocess.call([sys.executable, '-m', 'benchmarks.crawl_benchmark', *argv], env=env,
+                               cwd=Path(__file__).resolve().parents[1])
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--works', type=int, default=2000)
+    parser.add_argument('--iterations', type=int, default=4)
+    parser.add_argument('--papers', type=int, default=5, help='papers sampled per iteration')
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--mean-references', type=float, default=15.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--pipelined', action='store_true')
+    parser.add_argument('--graph-backend', default='networkx')
+    parser.add_argument('--baseline', type=Path, help='JSON baseline to compare with (or to write)')
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.3, help='allowed slowdown as a fraction')
+    parser.add_argument('--output', type=Path, help='write the result JSON here')
+    args = parser.parse_args(argv)
+
+    result = run_crawl_benchmark(
+        works=args.works, iterations=args.iterations, papers_per_iteration=args.papers,
+        seeds=args.seeds, mean_references=args.mean_references, seed=args.seed,
+        pipelined=args.pipelined, graph_backend=args.graph_backend,
+    )
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + '\n', encoding='utf-8')
+    print(f"crawl {result['crawl_seconds']:.2f}s, init {result['init_seconds']:.2f}s, "
+          f"{result['requests']} requests, {result['papers_collected']} papers, "
+          f"peak RSS {result['peak_rss_mb']} MB")
+    for stage, seconds in sorted(result['stages'].items(), key=lambda item: -item[1]):
+        print(f'  {stage:<18}{seconds:8.3f}s')
+
+    if args.baseline is None:
+        return 0
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(text + '\n', encoding='utf-8')
+        print(f'Baseline written to {args.baseline}')
+        return 0
+    problems = compare_to_baseline(result, json.loads(args.baseline.read_text(encoding='utf-8')), args.tolerance)
+    for problem in problems:
+        print(f'REGRESSION {problem}')
+    if not problems:
+        print(f'Within {args.tolerance:.0%} of {args.baseline}')
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,497 @@
+"""
+Offline OpenAlex stand-in backed by a synthetic citation graph.
+
+``SyntheticCitationGraph`` generates a reproducible graph of works, authors
+and venues. Reference counts follow a log-normal distribution and citations
+are drawn by preferential attachment, so a few works collect most citations
+as in real corpora. ``SyntheticOpenAlex`` answers the OpenAlex ``/works``,
+``/authors`` and ``/sources`` requests the crawler makes with payloads shaped
+(and sized) like real ones. ``OfflineOpenAlex`` routes every ``requests`` call
+to ``api.openalex.org`` (pyalex and the provider's direct calls) to the
+stand-in for the duration of a ``with`` block.
+
+pyalex hard-codes the OpenAlex host, so the stand-in swaps the transport
+instead of running a server on another address.
+"""
+
+import json
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httpx
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+OPENALEX_HOST = 'api.openalex.org'
+WORK_ID_BASE = 3_000_000_000
+AUTHOR_ID_BASE = 5_000_000_000
+SOURCE_ID_BASE = 4_200_000_000
+
+TOPICS = (
+    'fake news', 'misinformation', 'machine learning', 'deep learning', 'neural networks',
+    'social media', 'fact checking', 'citation network', 'rumor detection', 'knowledge graphs',
+    'natural language processing', 'information retrieval',
+)
+VOCABULARY = (
+    'analysis', 'approach', 'benchmark', 'classification', 'corpus', 'dataset', 'detection',
+    'embedding', 'evaluation', 'framework', 'graph', 'inference', 'learning', 'model', 'network',
+    'news', 'online', 'prediction', 'propagation', 'representation', 'semantic', 'signal',
+    'spread', 'study', 'survey', 'system', 'temporal', 'text', 'transformer', 'trust', 'user',
+    'verification', 'veracity', 'credibility', 'attention', 'community', 'diffusion', 'features',
+    'language', 'sources', 'claims', 'evidence', 'platform', 'behavior', 'content', 'robust',
+)
+FIRST_NAMES = ('Ana', 'Bram', 'Chen', 'Daria', 'Elif', 'Femi', 'Greta', 'Hiro', 'Iman', 'Joost',
+               'Kavya', 'Lars', 'Maya', 'Nico', 'Omar', 'Priya', 'Quinn', 'Rosa', 'Sven', 'Tara')
+LAST_NAMES = ('Alvarez', 'Bakker', 'Chen', 'Dubois', 'Evans', 'Fischer', 'Garcia', 'Hoppe',
+              'Ito', 'Jansen', 'Kowalski', 'Lindqvist', 'Mossavat', 'Nakamura', 'Okafor',
+              'Petrov', 'Rossi', 'Silva', 'Tanaka', 'Visser')
+VENUE_WORDS = ('Computational', 'Social', 'Information', 'Language', 'Network', 'Data', 'Media',
+               'Intelligent', 'Web', 'Knowledge')
+
+
+class SyntheticCitationGraph:
+    """A reproducible synthetic corpus of works, authors and venues."""
+
+    def __init__(self, num_works: int = 2000, mean_references: float = 15.0,
+                 reference_sigma: float = 0.8, attachment_exponent: float = 2.5,
+                 num_authors: Optional[int] = None, num_venues: int = 60,
+                 abstract_words: int = 150, start_year: int = 1995, end_year: int = 2024,
+                 seed: int = 0):
+        """
+        Args:
+            num_works: Number of works in the corpus
+            mean_references: Mean number of references per work
+            reference_sigma: Spread of the log-normal reference counts (0: every work has the mean)
+            attachment_exponent: Tail exponent of the work "fitness" that drives citations;
+                lower values concentrate citations on fewer works
+            num_authors: Size of the author pool (default: half the number of works)
+            num_venues: Size of the venue pool
+            abstract_words: Abstract length in words
+            start_year: Publication year of the oldest works
+            end_year: Publication year of the newest works
+            seed: Random seed; equal parameters and seed give an identical corpus
+        """
+        if num_works < 2:
+            raise ValueError("num_works must be at least 2")
+        self.num_works = num_works
+        self.num_authors = num_authors or max(num_works // 2, 1)
+        self.num_venues = num_venues
+        self.abstract_words = abstract_words
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        # Works are ordered by year, so a work only cites works before it.
+        self.years = np.sort(rng.integers(start_year, end_year + 1, num_works))
+        self.topics = rng.integers(0, len(TOPICS), num_works)
+        self.venues = rng.integers(0, num_venues, num_works)
+
+        if reference_sigma > 0:
+            mu = np.log(max(mean_references, 1e-9)) - reference_sigma ** 2 / 2
+            counts = np.rint(rng.lognormal(mu, reference_sigma, num_works)).astype(np.int64)
+        else:
+            counts = np.full(num_works, int(round(mean_references)), dtype=np.int64)
+        counts = np.minimum(counts, np.arange(num_works))
+
+        fitness = rng.pareto(max(attachment_exponent - 1.0, 0.1), num_works) + 1.0
+        cumulative = np.cumsum(fitness)
+        sources = np.repeat(np.arange(num_works), counts)
+        draws = rng.random(sources.size) * cumulative[np.maximum(sources - 1, 0)]
+        targets = np.minimum(np.searchsorted(cumulative, draws, side='right'), np.maximum(sources - 1, 0))
+        edges = np.unique(sources.astype(np.int64) * num_works + targets)
+        self._ref_src = edges // num_works
+        self._ref_dst = edges % num_works
+        self._ref_offsets = np.searchsorted(self._ref_src, np.arange(num_works + 1))
+
+        order = np.argsort(self._ref_dst, kind='stable')
+        self._cite_src = self._ref_src[order]
+        self._cite_offsets = np.searchsorted(self._ref_dst[order], np.arange(num_works + 1))
+
+        author_weights = rng.pareto(1.5, self.num_authors) + 1.0
+        author_cumulative = np.cumsum(author_weights)
+        author_counts = rng.integers(1, 7, num_works)
+        author_draws = rng.random(int(author_counts.sum())) * author_cumulative[-1]
+        self._authors = np.searchsorted(author_cumulative, author_draws, side='right')
+        self._author_offsets = np.concatenate(([0], np.cumsum(author_counts)))
+
+    @property
+    def num_edges(self) -> int:
+        return int(self._ref_src.size)
+
+    def work_id(self, index: int) -> str:
+        return f'W{WORK_ID_BASE + int(index)}'
+
+    def author_id(self, index: int) -> str:
+        return f'A{AUTHOR_ID_BASE + int(index)}'
+
+    def source_id(self, index: int) -> str:
+        return f'S{SOURCE_ID_BASE + int(index)}'
+
+    def work_index(self, work_id: str) -> Optional[int]:
+        """Index of a work given its ID or URL; None for IDs outside the corpus."""
+        token = work_id.rstrip('/').split('/')[-1].upper()
+        if not token.startswith('W') or not token[1:].isdigit():
+            return None
+        index = int(token[1:]) - WORK_ID_BASE
+        return index if 0 <= index < self.num_works else None
+
+    def author_index(self, author_id: str) -> Optional[int]:
+        token = author_id.rstrip('/').split('/')[-1].upper()
+        if not token.startswith('A') or not token[1:].isdigit():
+            return None
+        index = int(token[1:]) - AUTHOR_ID_BASE
+        return index if 0 <= index < self.num_authors else None
+
+    def source_index(self, source_id: str) -> Optional[int]:
+        token = source_id.rstrip('/').split('/')[-1].upper()
+        if not token.startswith('S') or not token[1:].isdigit():
+            return None
+        index = int(token[1:]) - SOURCE_ID_BASE
+        return index if 0 <= index < self.num_venues else None
+
+    def references(self, index: int) -> np.ndarray:
+        return self._ref_dst[self._ref_offsets[index]:self._ref_offsets[index + 1]]
+
+    def citing(self, index: int) -> np.ndarray:
+        return self._cite_src[self._cite_offsets[index]:self._cite_offsets[index + 1]]
+
+    def authors_of(self, index: int) -> np.ndarray:
+        return self._authors[self._author_offsets[index]:self._author_offsets[index + 1]]
+
+    def works_by_author(self, author_index: int) -> np.ndarray:
+        return np.unique(np.searchsorted(self._author_offsets, np.flatnonzero(self._authors == author_index),
+                                         side='right') - 1)
+
+    def works_in_venue(self, source_index: int) -> np.ndarray:
+        return np.flatnonzero(self.venues == source_index)
+
+    def most_cited(self, count: int) -> List[str]:
+        """IDs of the ``count`` most cited works, e.g. as crawl seeds."""
+        citations = np.diff(self._cite_offsets)
+        order = np.argsort(-citations, kind='stable')[:count]
+        return [self.work_id(index) for index in order]
+
+    def author_name(self, index: int) -> str:
+        return f'{FIRST_NAMES[index % len(FIRST_NAMES)]} {LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]}'
+
+    def venue_name(self, index: int) -> str:
+        first = VENUE_WORDS[index % len(VENUE_WORDS)]
+        second = VENUE_WORDS[(index // len(VENUE_WORDS) + 3) % len(VENUE_WORDS)]
+        return f'Journal of {first} {second} Studies {index}'
+
+    def work(self, index: int) -> Dict:
+        """The OpenAlex work payload of ``index``; rebuilt on every call, identical each time."""
+        rng = random.Random(self.seed * 1_000_003 + index)
+        topic = TOPICS[self.topics[index]]
+        title_words = rng.sample(VOCABULARY, 4)
+        title = f'{title_words[0].capitalize()} {title_words[1]} of {topic} with {title_words[2]} {title_words[3]}'
+        abstract = [rng.choice(VOCABULARY) for _ in range(self.abstract_words)]
+        inverted: Dict[str, List[int]] = {}
+        for position, word in enumerate(abstract):
+            inverted.setdefault(word, []).append(position)
+
+        work_id = self.work_id(index)
+        year = int(self.years[index])
+        venue = int(self.venues[index])
+        source = {
+            'id': f'https://openalex.org/{self.source_id(venue)}',
+            'display_name': self.venue_name(venue),
+            'issn_l': f'{1000 + venue:04d}-{venue % 10000:04d}',
+            'is_oa': venue % 3 == 0,
+            'host_organization_name': 'Synthetic Press',
+            'type': 'journal',
+        }
+        location = {
+            'is_oa': source['is_oa'],
+            'landing_page_url': f'https://doi.org/10.5555/{work_id.lower()}',
+            'pdf_url': None,
+            'source': source,
+            'license': None,
+            'version': 'publishedVersion',
+        }
+        authorships = []
+        for position, author in enumerate(self.authors_of(index)):
+            author = int(author)
+            authorships.append({
+                'author_position': 'first' if position == 0 else 'middle',
+                'author': {
+                    'id': f'https://openalex.org/{self.author_id(author)}',
+                    'display_name': self.author_name(author),
+                    'orcid': None,
+                },
+                'institutions': [{
+                    'id': f'https://openalex.org/I{100000 + author % 500}',
+                    'display_name': f'University {author % 500}',
+                    'country_code': 'NL',
+                    'type': 'education',
+                }],
+                'countries': ['NL'],
+                'is_corresponding': position == 0,
+                'raw_author_name': self.author_name(author),
+            })
+        concepts = [
+            {
+                'id': f'https://openalex.org/C{41008148 + self.topics[index]}',
+                'wikidata': f'https://www.wikidata.org/wiki/Q{21198 + self.topics[index]}',
+                'display_name': topic.title(),
+                'level': 2,
+                'score': round(rng.uniform(0.4, 0.9), 6),
+            },
+            {
+                'id': 'https://openalex.org/C41008148',
+                'wikidata': 'https://www.wikidata.org/wiki/Q21198',
+                'display_name': 'Computer science',
+                'level': 0,
+                'score': round(rng.uniform(0.3, 0.6), 6),
+            },
+        ]
+        cited_by = int(self._cite_offsets[index + 1] - self._cite_offsets[index])
+        return {
+            'id': f'https://openalex.org/{work_id}',
+            'doi': f'https://doi.org/10.5555/{work_id.lower()}',
+            'title': title,
+            'display_name': title,
+            'publication_year': year,
+            'publication_date': f'{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'ids': {'openalex': f'https://openalex.org/{work_id}', 'doi': f'https://doi.org/10.5555/{work_id.lower()}'},
+            'language': 'en',
+            'primary_location': location,
+            'locations': [location],
+            'best_oa_location': location if source['is_oa'] else None,
+            'type': 'article',
+            'open_access': {'is_oa': source['is_oa'], 'oa_status': 'gold' if source['is_oa'] else 'closed'},
+            'authorships': authorships,
+            'cited_by_count': cited_by,
+            'concepts': concepts,
+            'referenced_works': [f'https://openalex.org/{self.work_id(ref)}' for ref in self.references(index)],
+            'related_works': [f'https://openalex.org/{self.work_id(rng.randrange(self.num_works))}' for _ in range(10)],
+            'abstract_inverted_index': inverted,
+            'counts_by_year': [{'year': year + offset, 'cited_by_count': rng.randint(0, 5)} for offset in range(3)],
+            'updated_date': '2025-01-01T00:00:00.000000',
+            'created_date': f'{year}-01-01',
+        }
+
+    def author(self, index: int) -> Dict:
+        works = self.works_by_author(index)
+        return {
+            'id': f'https://openalex.org/{self.author_id(index)}',
+            'display_name': self.author_name(index),
+            'works_count': int(works.size),
+            'cited_by_count': int(sum(self._cite_offsets[w + 1] - self._cite_offsets[w] for w in works)),
+            'last_known_institutions': [{'display_name': f'University {index % 500}'}],
+        }
+
+    def source(self, index: int) -> Dict:
+        return {
+            'id': f'https://openalex.org/{self.source_id(index)}',
+            'display_name': self.venue_name(index),
+            'type': 'journal',
+            'works_count': int(np.count_nonzero(self.venues == index)),
+        }
+
+
+class SyntheticOpenAlex:
+    """Answers OpenAlex API requests from a ``SyntheticCitationGraph``.
+
+    ``latency`` adds a fixed delay per request and ``error_rate`` answers that
+    share of requests with 429 (drawn from a seeded generator), to exercise
+    the provider's pacing and retries. The counters are safe to read while
+    other threads issue requests.
+    """
+
+    def __init__(self, graph: SyntheticCitationGraph, latency: float = 0.0, error_rate: float = 0.0,
+                 seed: int = 0):
+        self.graph = graph
+        self.latency = latency
+        self.error_rate = error_rate
+        self._errors = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests_served = 0
+        self.bytes_served = 0
+        self.errors_served = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'requests': self.requests_served,
+                'bytes': self.bytes_served,
+                'errors': self.errors_served,
+            }
+
+    def handle(self, url: str) -> Tuple[int, bytes]:
+        """Status code and JSON body of the response to a GET of ``url``."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            fail = self.error_rate and self._errors.random() < self.error_rate
+        if fail:
+            status, payload = 429, {'error': 'Too Many Requests', 'message': 'synthetic rate limit'}
+        else:
+            status, payload = self._route(urlsplit(url))
+        body = json.dumps(payload).encode('utf-8')
+        with self._lock:
+            self.requests_served += 1
+            self.bytes_served += len(body)
+            self.errors_served += status >= 400
+        return status, body
+
+    def _route(self, parts) -> Tuple[int, Dict]:
+        segments = [unquote(segment) for segment in parts.path.strip('/').split('/', 1)]
+        entity = segments[0]
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        if len(segments) == 2:
+            return self._single(entity, segments[1])
+        if entity == 'works':
+            return self._list_works(query)
+        if entity in ('authors', 'sources'):
+            return self._search(entity, query.get('search', ''), query)
+        return 404, {'error': 'Not Found', 'message': f'Unsupported endpoint {parts.path}'}
+
+    def _single(self, entity: str, identifier: str) -> Tuple[int, Dict]:
+        graph = self.graph
+        lookups = {'works': (graph.work_index, graph.work), 'authors': (graph.author_index, graph.author),
+                   'sources': (graph.source_index, graph.source)}
+        if entity not in lookups:
+            return 404, {'error': 'Not Found', 'message': f'Unsupported endpoint /{entity}'}
+        index_of, build = lookups[entity]
+        index = index_of(identifier)
+        if index is None:
+            return 404, {'error': 'Not Found', 'message': f'{identifier} does not exist'}
+        return 200, build(index)
+
+    def _list_works(self, query: Dict[str, str]) -> Tuple[int, Dict]:
+        graph = self.graph
+        matches: Optional[np.ndarray] = None
+        for clause in filter(None, query.get('filter', '').split(',')):
+            key, _, value = clause.partition(':')
+            values = value.split('|')
+            if key == 'openalex_id':
+                indices = [graph.work_index(item) for item in values]
+                selected = np.array(sorted({i for i in indices if i is not None}), dtype=np.int64)
+            elif key == 'cites':
+                selected = _union(graph.citing(i) for i in map(graph.work_index, values) if i is not None)
+            elif key == 'cited_by':
+                selected = _union(graph.references(i) for i in map(graph.work_index, values) if i is not None)
+            elif key == 'authorships.author.id':
+                selected = _union(graph.works_by_author(i) for i in map(graph.author_index, values) if i is not None)
+            elif key in ('primary_location.source.id', 'locations.source.id'):
+                selected = _union(graph.works_in_venue(i) for i in map(graph.source_index, values) if i is not None)
+            else:
+                return 403, {'error': 'Invalid query parameters error.',
+                             'message': f'{key} is not a valid filter of the stand-in'}
+            matches = selected if matches is None else np.intersect1d(matches, selected)
+        if matches is None:
+            matches = np.arange(graph.num_works)
+        return 200, self._page(matches, query, graph.work)
+
+    def _search(self, entity: str, term: str, query: Dict[str, str]) -> Tuple[int, Dict]:
+        graph = self.graph
+        term = term.lower()
+        if entity == 'authors':
+            names = (graph.author_name(i) for i in range(graph.num_authors))
+            build = graph.author
+        else:
+            names = (graph.venue_name(i) for i in range(graph.num_venues))
+            build = graph.source
+        matches = np.array([i for i, name in enumerate(names) if term in name.lower()], dtype=np.int64)
+        return 200, self._page(matches, query, build)
+
+    def _page(self, matches: np.ndarray, query: Dict[str, str], build) -> Dict:
+        per_page = max(1, min(int(query.get('per-page', 25)), 200))
+        cursor = query.get('cursor')
+        if cursor is not None:
+            offset = 0 if cursor == '*' else int(cursor)
+            page = None
+        else:
+            page = max(1, int(query.get('page', 1)))
+            offset = (page - 1) * per_page
+        window = matches[offset:offset + per_page]
+        next_offset = offset + per_page
+        return {
+            'meta': {
+                'count': int(matches.size),
+                'db_response_time_ms': 1,
+                'page': page,
+                'per_page': per_page,
+                'next_cursor': str(next_offset) if cursor is not None and next_offset < matches.size else None,
+                'groups_count': None,
+            },
+            'results': [build(int(index)) for index in window],
+            'group_by': [],
+        }
+
+
+def _union(arrays) -> np.ndarray:
+    arrays = list(arrays)
+    if not arrays:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(arrays))
+
+
+class OfflineOpenAlex:
+    """Route HTTP traffic for api.openalex.org to a ``SyntheticOpenAlex``.
+
+    Used as a context manager. Both plain ``requests`` sessions and the shared
+    httpx transport are intercepted. Requests to other hosts fail with a
+    connection error unless ``allow_network`` is set, so a benchmark never
+    silently reaches the network.
+    """
+
+    def __init__(self, api: SyntheticOpenAlex, allow_network: bool = False):
+        self.api = api
+        self.allow_network = allow_network
+        self._original_send = None
+        self._original_handle = None
+
+    def __enter__(self) -> SyntheticOpenAlex:
+        if self._original_send is not None:
+            raise RuntimeError("OfflineOpenAlex is already active")
+        original_send = self._original_send = HTTPAdapter.send
+        original_handle = self._original_handle = httpx.HTTPTransport.handle_request
+        stand_in = self
+
+        def send(adapter, request, *args, **kwargs):
+            host = urlsplit(request.url).hostname
+            if host == OPENALEX_HOST:
+                return stand_in._respond(adapter, request)
+            if stand_in.allow_network:
+                return original_send(adapter, request, *args, **kwargs)
+            raise requests.ConnectionError(f"Offline OpenAlex stand-in blocked a request to {request.url}")
+
+        def handle_request(transport, request):
+            if request.url.host == OPENALEX_HOST:
+                status, body = stand_in.api.handle(str(request.url))
+                return httpx.Response(status, headers={'Content-Type': 'application/json'},
+                                      content=body, request=request)
+            if stand_in.allow_network:
+                return original_handle(transport, request)
+            raise httpx.ConnectError(f"Offline OpenAlex stand-in blocked a request to {request.url}",
+                                     request=request)
+
+        HTTPAdapter.send = send
+        httpx.HTTPTransport.handle_request = handle_request
+        return self.api
+
+    def __exit__(self, exc_type, exc, tb):
+        HTTPAdapter.send = self._original_send
+        httpx.HTTPTransport.handle_request = self._original_handle
+        self._original_send = None
+        self._original_handle = None
+        return False
+
+    def _respond(self, adapter, request) -> requests.Response:
+        status, body = self.api.handle(request.url)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'OK' if status < 400 else 'Error'
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json', 'Content-Length': str(len(body))})
+        response._content = body
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = adapter
+        return response
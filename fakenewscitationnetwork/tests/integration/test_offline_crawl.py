@@ -0,0 +1,92 @@
+import json
+import logging
+
+import pytest
+import requests
+
+from ArticleCrawler.api.http_transport import http_session
+from ArticleCrawler.api.openalex_api import OpenAlexAPIProvider
+from benchmarks.crawl_benchmark import compare_to_baseline, run_crawl_benchmark
+from benchmarks.openalex_stub import OfflineOpenAlex, SyntheticCitationGraph, SyntheticOpenAlex
+
+
+@pytest.fixture
+def synthetic_graph():
+    return SyntheticCitationGraph(num_works=300, mean_references=8, seed=3)
+
+
+@pytest.mark.integration
+class TestOfflineOpenAlex:
+
+    def test_graph_is_reproducible(self, synthetic_graph):
+        again = SyntheticCitationGraph(num_works=300, mean_references=8, seed=3)
+        assert again.num_edges == synthetic_graph.num_edges
+        assert again.work(42) == synthetic_graph.work(42)
+        for index in range(1, 300):
+            assert all(ref < index for ref in synthetic_graph.references(index))
+
+    def test_provider_fetches_paper_with_references_and_citations(self, synthetic_graph):
+        api = SyntheticOpenAlex(synthetic_graph)
+        seed_id = synthetic_graph.most_cited(1)[0]
+        index = synthetic_graph.work_index(seed_id)
+
+        with OfflineOpenAlex(api):
+            provider = OpenAlexAPIProvider(retries=0, email='test@example.org', requests_per_second=0,
+                                           logger=logging.getLogger('test'))
+            paper = provider.get_paper(seed_id)
+
+        assert paper.paperId == seed_id
+        assert paper.abstract
+        assert len(paper.references) == len(synthetic_graph.references(index))
+        assert len(paper.citations) == len(synthetic_graph.citing(index))
+        assert provider.call_stats.as_dict()['requests'] >= api.stats()['requests']
+
+    def test_cursor_pagination_covers_all_citations(self, synthetic_graph):
+        api = SyntheticOpenAlex(synthetic_graph)
+        seed_id = synthetic_graph.most_cited(1)[0]
+        seen, cursor = [], '*'
+        while cursor:
+            status, body = api.handle(f'https://api.openalex.org/works?filter=cites:{seed_id}&per-page=5&cursor={cursor}')
+            assert status == 200
+            payload = json.loads(body)
+            seen.extend(work['id'] for work in payload['results'])
+            cursor = payload['meta']['next_cursor']
+        assert len(seen) == len(set(seen)) == len(synthetic_graph.citing(synthetic_graph.work_index(seed_id)))
+
+    def test_other_hosts_are_blocked(self, synthetic_graph):
+        with OfflineOpenAlex(SyntheticOpenAlex(synthetic_graph)):
+            with pytest.raises(requests.ConnectionError):
+                requests.get('https://example.org/')
+            with pytest.raises(requests.ConnectionError):
+                http_session().get('https://example.org/')
+
+    def test_unknown_work_is_not_found(self, synthetic_graph):
+        status, _ = SyntheticOpenAlex(synthetic_graph).handle('https://api.openalex.org/works/W1')
+        assert status == 404
+
+
+@pytest.mark.integration
+class TestCrawlBenchmark:
+
+    def test_short_crawl_reports_stages_and_counts(self, temp_dir):
+        result = run_crawl_benchmark(works=300, iterations=2, papers_per_iteration=3, seeds=2,
+                                     mean_references=8, workdir=temp_dir)
+
+        assert result['papers_collected'] > 2
+        assert result['requests'] > 0
+        assert len(result['per_iteration']) == 2
+        assert {'sampling', 'api_fetch', 'parsing', 'centrality'} <= set(result['stages'])
+        assert (temp_dir / 'benchmark' / 'log' / 'crawl_metrics.jsonl').exists()
+        assert compare_to_baseline(result, result) == []
+
+    def test_compare_flags_slower_stages_and_changed_counts(self):
+        baseline = {
+            'params': {'works': 10}, 'init_seconds': 1.0, 'crawl_seconds': 10.0,
+            'stages': {'centrality': 4.0, 'parsing': 0.01}, 'papers_collected': 50,
+            'citations_collected': 10, 'references_collected': 10, 'requests': 20, 'peak_rss_mb': 100.0,
+        }
+        result = dict(baseline, crawl_seconds=12.0, stages={'centrality': 6.0, 'parsing': 0.04}, requests=21)
+
+        problems = compare_to_baseline(result, baseline, tolerance=0.3)
+
+        assert [problem.split(':')[0] for problem in problems] == ['stages.centrality', 'requests']
@@ -0,0 +1,97 @@
+import pytest
+from unittest.mock import Mock, patch
+from ArticleCrawler.api.doi_resolver import OpenAlexDOIResolver, normalize_doi
+
+
+def _works_mock(responses):
+    """Build a pyalex ``Works`` stand-in whose ``get`` answers from ``responses(dois)``."""
+    filters = []
+
+    def make_query():
+        query = Mock()
+
+        def filter_(doi):
+            filters.append(doi.split('|'))
+            query.select.return_value.get.side_effect = lambda per_page=None: responses(doi.split('|'))
+            return query
+
+        query.filter.side_effect = filter_
+        return query
+
+    works_class = Mock(side_effect=make_query)
+    return works_class, filters
+
+
+@pytest.mark.unit
+class TestNormalizeDoi:
+
+    @pytest.mark.parametrize("raw", [
+        "10.1234/ABC",
+        "https://doi.org/10.1234/abc",
+        "http://dx.doi.org/10.1234/abc",
+        "doi:10.1234/abc",
+        "  10.1234/abc ",
+    ])
+    def test_normalizes_prefixes_and_case(self, raw):
+        assert normalize_doi(raw) == "10.1234/abc"
+
+    def test_empty_values(self):
+        assert normalize_doi(None) is None
+        assert normalize_doi("") is None
+
+
+@pytest.mark.unit
+class TestOpenAlexDOIResolver:
+
+    @pytest.fixture
+    def resolver(self, mock_logger):
+        return OpenAlexDOIResolver(min_delay=0, logger=mock_logger)
+
+    def test_resolves_in_batches_of_fifty(self, resolver):
+        dois = [f"10.1/{i}" for i in range(120)]
+        works_class, filters = _works_mock(
+            lambda batch: [{'id': f"https://openalex.org/W{d.split('/')[-1]}", 'doi': f"https://doi.org/{d}"} for d in batch]
+        )
+
+        with patch('pyalex.Works', works_class):
+            resolved = resolver.resolve(dois)
+
+        assert sorted(len(batch) for batch in filters) == [20, 50, 50]
+        assert len(resolved) == 120
+        assert resolved["10.1/7"]['id'] == "https://openalex.org/W7"
+
+    def test_missing_dois_map_to_none(self, resolver):
+        works_class, _ = _works_mock(lambda batch: [{'id': 'https://openalex.org/W1', 'doi': 'https://doi.org/10.1/a'}])
+
+        with patch('pyalex.Works', works_class):
+            resolved = resolver.resolve(["10.1/A", "10.1/b", "https://doi.org/10.1/a"])
+
+        assert resolved == {
+            "10.1/a": {'id': 'https://openalex.org/W1', 'doi': 'https://doi.org/10.1/a'},
+            "10.1/b": None,
+        }
+
+    def test_unbatchable_dois_are_left_out(self, resolver):
+        works_class, filters = _works_mock(lambda batch: [])
+
+        with patch('pyalex.Works', works_class):
+            resolved = resolver.resolve(["10.1/a,b", "10.1/c"])
+
+        assert filters == [["10.1/c"]]
+        assert resolved == {"10.1/c": None}
+
+    def test_failed_batch_is_omitted(self, resolver):
+        works_class = Mock(side_effect=Exception("boom"))
+
+        with patch('pyalex.Works', works_class):
+            resolved = resolver.resolve(["10.1/a"])
+
+        assert resolved == {}
+
+    def test_no_dois_makes_no_requests(self, resolver):
+        works_class = Mock()
+
+        with patch('pyalex.Works', works_class):
+            assert resolver.resolve([None, ""]) == {}
+
+        works_class.assert_not_called()
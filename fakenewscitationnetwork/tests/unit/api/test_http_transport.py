@@ -0,0 +1,176 @@
+import pickle
+
+import httpx
+import pytest
+import requests
+
+from ArticleCrawler.api import http_transport
+from ArticleCrawler.api.http_transport import (
+    HttpTransport,
+    HttpTransportConfig,
+    HttpxAdapter,
+    configure_http_transport,
+    close_http_transport,
+    get_http_transport,
+    http_session,
+    install_pyalex_session,
+)
+
+
+def _transport(handler, mock_logger, **config):
+    config.setdefault('backoff_factor', 0)
+    return HttpTransport(HttpTransportConfig(http2=False, **config),
+                         transport=httpx.MockTransport(handler), logger=mock_logger)
+
+
+@pytest.mark.unit
+class TestHttpTransportConfig:
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv('HTTP_TIMEOUT', '5')
+        monkeypatch.setenv('HTTP_MAX_CONNECTIONS_PER_HOST', '3')
+        monkeypatch.setenv('HTTP_HTTP2', 'false')
+
+        config = HttpTransportConfig.from_env()
+
+        assert config.timeout == 5.0
+        assert config.max_connections_per_host == 3
+        assert config.retries == 2
+        assert config.use_http2 is False
+
+    def test_http2_falls_back_without_h2(self, mock_logger, monkeypatch):
+        monkeypatch.setattr(http_transport.importlib.util, 'find_spec', lambda name: None)
+
+        transport = HttpTransport(HttpTransportConfig(http2=True), logger=mock_logger)
+
+        assert transport.http2 is False
+        mock_logger.warning.assert_called_once()
+        transport.close()
+
+
+@pytest.mark.unit
+class TestHttpxAdapter:
+
+    def test_session_sends_through_pool(self, mock_logger):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={'ok': True})
+
+        transport = _transport(handler, mock_logger)
+        response = transport.session().get('https://api.example.org/works', params={'filter': 'cites:W1'})
+
+        assert response.status_code == 200
+        assert response.json() == {'ok': True}
+        assert seen[0].url.params['filter'] == 'cites:W1'
+        assert transport.stats()['api.example.org']['requests'] == 1
+        assert transport.stats()['api.example.org']['bytes_received'] == len(response.content)
+
+    def test_retries_retryable_status(self, mock_logger):
+        statuses = iter([503, 429, 200])
+
+        def handler(request):
+            return httpx.Response(next(statuses), headers={'Retry-After': '0'})
+
+        transport = _transport(handler, mock_logger, retries=2)
+        response = transport.session().get('https://api.example.org/')
+
+        assert response.status_code == 200
+        stats = transport.stats()['api.example.org']
+        assert stats['requests'] == 3
+        assert stats['retries'] == 2
+
+    def test_returns_last_response_when_retries_run_out(self, mock_logger):
+        transport = _transport(lambda request: httpx.Response(503), mock_logger, retries=1)
+
+        response = transport.session().get('https://api.example.org/')
+
+        assert response.status_code == 503
+        assert transport.stats()['api.example.org']['requests'] == 2
+
+    def test_does_not_retry_post(self, mock_logger):
+        transport = _transport(lambda request: httpx.Response(503), mock_logger, retries=3)
+
+        response = transport.session().post('https://api.example.org/', data='payload')
+
+        assert response.status_code == 503
+        assert transport.stats()['api.example.org']['requests'] == 1
+
+    def test_redirects_are_followed_by_requests(self, mock_logger):
+        def handler(request):
+            if request.url.path == '/old':
+                return httpx.Response(301, headers={'Location': 'https://api.example.org/new'})
+            return httpx.Response(200, text='moved')
+
+        transport = _transport(handler, mock_logger)
+        response = transport.session().get('https://api.example.org/old')
+
+        assert response.text == 'moved'
+        assert response.url == 'https://api.example.org/new'
+        assert len(response.history) == 1
+
+    def test_connection_errors_map_to_requests_exceptions(self, mock_logger):
+        def handler(request):
+            raise httpx.ConnectError('refused', request=request)
+
+        transport = _transport(handler, mock_logger, retries=1)
+
+        with pytest.raises(requests.ConnectionError):
+            transport.session().get('https://api.example.org/')
+        assert transport.stats()['api.example.org']['retries'] == 1
+
+    def test_timeouts_map_to_requests_exceptions(self, mock_logger):
+        def handler(request):
+            raise httpx.ReadTimeout('slow', request=request)
+
+        transport = _transport(handler, mock_logger, retries=0)
+
+        with pytest.raises(requests.ReadTimeout):
+            transport.session().get('https://api.example.org/', timeout=(1, 2))
+
+
+@pytest.mark.unit
+class TestSharedTransport:
+
+    @pytest.fixture(autouse=True)
+    def reset_transport(self):
+        yield
+        close_http_transport()
+
+    def test_transport_is_shared_until_reconfigured(self, mock_logger):
+        first = get_http_transport()
+        assert get_http_transport() is first
+
+        second = configure_http_transport(HttpTransportConfig(retries=0, http2=False))
+
+        assert second is not first
+        assert get_http_transport() is second
+        assert first.client.is_closed
+
+    def test_pickled_session_reattaches_to_shared_transport(self):
+        session = pickle.loads(pickle.dumps(http_session()))
+
+        assert isinstance(session.get_adapter('https://api.openalex.org/'), HttpxAdapter)
+        assert session.get_adapter('https://api.openalex.org/') is get_http_transport().adapter
+
+    def test_install_pyalex_session(self, monkeypatch):
+        import pyalex.api
+
+        monkeypatch.setattr(pyalex.api, '_get_requests_session', pyalex.api._get_requests_session)
+        install_pyalex_session()
+
+        session = pyalex.api._get_requests_session()
+        assert session.get_adapter('https://api.openalex.org/') is get_http_transport().adapter
+
+    def test_install_pyalex_session_without_hook(self, monkeypatch):
+        import pyalex.api
+
+        monkeypatch.delattr(pyalex.api, '_get_requests_session')
+        monkeypatch.setattr(http_transport, '_pyalex_hook_missing', False)
+
+        install_pyalex_session()
+        install_pyalex_session()
+
+        assert not hasattr(pyalex.api, '_get_requests_session')
+        assert http_transport._pyalex_hook_missing
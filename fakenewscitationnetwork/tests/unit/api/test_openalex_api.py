@@ -1,6 +1,13 @@
+import logging
+import pickle
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from ArticleCrawler.api.openalex_api import OpenAlexAPIProvider
+from ArticleCrawler.api.paper_records import AuthorRecord, PaperRecord
+from ArticleCrawler.api import openalex_api
+from ArticleCrawler.api.openalex_api import OpenAlexAPIProvider, reconstruct_abstract, reconstruct_abstracts
 
 
 @pytest.mark.unit
@@ -57,6 +64,49 @@ class TestOpenAlexAPI:
         result = openalex_provider._reconstruct_abstract_from_inverted_index(None)
         assert result is None
     
+    def test_reconstruct_abstract_repeated_words(self):
+        assert reconstruct_abstract({'a': [0, 2], 'b': [1], 'c': [3]}) == 'a b a c'
+
+    def test_reconstruct_abstract_skips_position_gaps(self):
+        assert reconstruct_abstract({'first': [0], 'last': [7]}) == 'first last'
+
+    def test_reconstruct_abstracts_prefers_plain_abstract(self):
+        works = [{'abstract': 'given'}, {'abstract_inverted_index': {'x': [0]}}, {}]
+        assert reconstruct_abstracts(works) == ['given', 'x', None]
+
+    def test_citation_stubs_skip_abstract_reconstruction(self, openalex_provider):
+        work = {'id': 'https://openalex.org/W1', 'abstract_inverted_index': {'x': [0]}}
+        with patch('ArticleCrawler.api.openalex_api.reconstruct_abstract') as reconstruct:
+            stub = openalex_provider._convert_openalex_to_s2_format(work, include_abstract=False)
+        reconstruct.assert_not_called()
+        assert stub['abstract'] is None
+        assert openalex_provider._convert_openalex_to_s2_format(work)['abstract'] == 'x'
+
+    def test_converts_work_to_slotted_record(self, openalex_provider):
+        work = {
+            'id': 'https://openalex.org/W1',
+            'title': 'A title',
+            'publication_year': 2021,
+            'authorships': [{'author': {'id': 'https://openalex.org/A9', 'display_name': 'Ada'}}],
+        }
+
+        record = openalex_provider._convert_openalex_to_record(work)
+
+        assert isinstance(record, PaperRecord)
+        assert not hasattr(record, '__dict__')
+        assert record.authors == [AuthorRecord('A9', 'Ada')]
+        assert openalex_provider._convert_openalex_to_s2_format(work)['authors'] == [{'authorId': 'A9', 'name': 'Ada'}]
+
+    def test_dict_to_object_builds_nested_records(self, openalex_provider):
+        paper = openalex_provider._dict_to_object({
+            'paperId': 'W1', 'authors': [{'authorId': 'A1', 'name': 'Ada'}],
+            'citations': [{'paperId': 'W2'}], 'unknown': 1,
+        })
+
+        assert paper.citations[0].paperId == 'W2'
+        assert paper.authors[0].name == 'Ada'
+        assert PaperRecord.from_dict(paper.to_dict()) == paper
+
     @patch('ArticleCrawler.api.openalex_api.Works')
     def test_get_paper_success(self, mock_works, openalex_provider, mock_openalex_response):
         mock_works_instance = MagicMock()
@@ -81,4 +131,43 @@ class TestOpenAlexAPI:
         with patch.object(openalex_provider, 'get_paper', return_value=None) as mock_get_paper:
             paper_ids = ['W1', 'W2', 'W3']
             openalex_provider.get_papers(paper_ids)
-            assert mock_get_paper.call_count == 3
\ No newline at end of file
+            assert mock_get_paper.call_count == 3
+
+    def test_rate_limit_spaces_concurrent_callers(self, mock_logger, monkeypatch):
+        monkeypatch.setenv('OPENALEX_EMAIL', 'test@example.com')
+        provider = OpenAlexAPIProvider(requests_per_second=20, logger=mock_logger)
+        start = time.time()
+
+        threads = [threading.Thread(target=provider._rate_limit) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Six calls 50ms apart: the last may not start before 250ms.
+        assert time.time() - start >= 0.24
+        assert provider.call_stats.as_dict()['requests'] == 6
+
+    def test_tracked_ids_and_venue_cache_are_bounded(self, openalex_provider, monkeypatch):
+        monkeypatch.setattr(openalex_api, 'MAX_TRACKED_PAPER_IDS', 3)
+        monkeypatch.setattr(openalex_api, 'VENUE_LOOKUP_CACHE_SIZE', 2)
+
+        for index in range(5):
+            openalex_provider._record_failed(f'W{index}')
+            openalex_provider._record_inconsistent(f'W{index}', f'W{index + 10}')
+        for name in ('a', 'b', 'c'):
+            openalex_provider._cache_venue(name, None)
+
+        assert openalex_provider.failed_paper_ids == ['W2', 'W3', 'W4']
+        assert len(openalex_provider.inconsistent_api_response_paper_ids) == 3
+        assert list(openalex_provider._venue_lookup_cache) == ['b', 'c']
+
+    def test_provider_survives_pickling(self, monkeypatch):
+        monkeypatch.setenv('OPENALEX_EMAIL', 'test@example.com')
+        provider = OpenAlexAPIProvider(requests_per_second=0, logger=logging.getLogger('test'))
+        provider._cache_venue('nature', 'https://openalex.org/S1')
+
+        restored = pickle.loads(pickle.dumps(provider))
+
+        restored._rate_limit()
+        assert restored._venue_lookup_cache['nature'] == 'https://openalex.org/S1'
@@ -252,7 +252,7 @@ class TestZoteroMatcher:
         assert result.matched is False
         assert 'DOI not found' in result.error
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_match_by_doi_semantic_scholar_success(self, mock_get, mock_title_strategy, mock_logger):
         """Test DOI matching with Semantic Scholar succeeds."""
         api = Mock()
@@ -297,7 +297,7 @@ class TestZoteroMatcher:
         matcher = ZoteroMatcher(mock_api_provider, title_strategy=mock_title_strategy, logger=mock_logger)
         matcher.min_delay = 0
         matcher.similarity_calculator = Mock()
-        matcher.similarity_calculator.calculate.return_value = 0.90
+        matcher.similarity_calculator.calculate_many.return_value = [0.90]
         
         metadata = {
             'zotero_key': 'ZKEY123',
@@ -321,7 +321,7 @@ class TestZoteroMatcher:
         matcher = ZoteroMatcher(mock_api_provider, title_strategy=mock_title_strategy, logger=mock_logger)
         matcher.min_delay = 0
         matcher.similarity_calculator = Mock()
-        matcher.similarity_calculator.calculate.side_effect = [0.75, 0.70]
+        matcher.similarity_calculator.calculate_many.return_value = [0.75, 0.70]
         
         metadata = {
             'zotero_key': 'ZKEY123',
@@ -345,7 +345,7 @@ class TestZoteroMatcher:
         matcher = ZoteroMatcher(mock_api_provider, title_strategy=mock_title_strategy, logger=mock_logger)
         matcher.min_delay = 0
         matcher.similarity_calculator = Mock()
-        matcher.similarity_calculator.calculate.return_value = 0.50
+        matcher.similarity_calculator.calculate_many.return_value = [0.50]
         
         metadata = {
             'zotero_key': 'ZKEY123',
@@ -475,4 +475,40 @@ class TestZoteroMatcher:
             result = matcher.match_single_item(metadata)
             
             mock_doi.assert_not_called()
-            mock_title.assert_called_once()
\ No newline at end of file
+            mock_title.assert_called_once()
+    
+    def test_match_items_resolves_dois_in_batch(self, mock_api_provider, mock_title_strategy, mock_logger):
+        """Test that DOIs are resolved together and only misses fall back to title search."""
+        resolver = Mock()
+        resolver.resolve.return_value = {
+            '10.1/found': {'id': 'https://openalex.org/W1', 'doi': 'https://doi.org/10.1/found'},
+            '10.1/missing': None,
+        }
+        mock_title_strategy.search.return_value = []
+        
+        matcher = ZoteroMatcher(
+            mock_api_provider,
+            title_strategy=mock_title_strategy,
+            logger=mock_logger,
+            doi_resolver=resolver
+        )
+        matcher.min_delay = 0
+        
+        items = [
+            {'zotero_key': 'Z1', 'title': 'Found', 'doi': 'https://doi.org/10.1/FOUND'},
+            {'zotero_key': 'Z2', 'title': 'Missing', 'doi': '10.1/missing'},
+            {'zotero_key': 'Z3', 'title': 'No DOI', 'doi': ''},
+        ]
+        
+        with patch.object(ZoteroMatcher, '_match_by_doi') as mock_doi:
+            results = matcher.match_items(items)
+        
+        resolver.resolve.assert_called_once_with(['https://doi.org/10.1/FOUND', '10.1/missing'])
+        mock_doi.assert_not_called()
+        assert [r.zotero_key for r in results] == ['Z1', 'Z2', 'Z3']
+        assert results[0].matched is True
+        assert results[0].paper_id == 'W1'
+        assert results[0].match_method == 'doi'
+        assert results[1].matched is False
+        assert results[2].matched is False
+        assert mock_title_strategy.search.call_count == 2
@@ -5,7 +5,8 @@ from unittest.mock import Mock, patch
 from ArticleCrawler.api.zotero.matching.strategies import (
     TitleSimilarityCalculator,
     OpenAlexTitleMatchStrategy,
-    SemanticScholarTitleMatchStrategy
+    SemanticScholarTitleMatchStrategy,
+    LocalFirstTitleMatchStrategy
 )
 
 
@@ -252,7 +253,7 @@ class TestSemanticScholarTitleMatchStrategy:
     def strategy(self):
         return SemanticScholarTitleMatchStrategy()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_success(self, mock_get, strategy):
         """Test successful search with results."""
         mock_response = Mock()
@@ -288,7 +289,7 @@ class TestSemanticScholarTitleMatchStrategy:
         assert results[1]['paper_id'] == 'def456'
         assert results[1]['venue'] == 'Test Journal'
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_no_results(self, mock_get, strategy):
         """Test search with no results."""
         mock_response = Mock()
@@ -301,7 +302,7 @@ class TestSemanticScholarTitleMatchStrategy:
         
         assert results == []
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_filters_no_title(self, mock_get, strategy):
         """Test search filters out results without titles."""
         mock_response = Mock()
@@ -320,7 +321,7 @@ class TestSemanticScholarTitleMatchStrategy:
         assert len(results) == 1
         assert results[0]['title'] == 'Valid Paper'
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_api_error(self, mock_get, strategy):
         """Test search handles API errors."""
         mock_get.side_effect = Exception("API Error")
@@ -330,7 +331,7 @@ class TestSemanticScholarTitleMatchStrategy:
         with pytest.raises(Exception, match="API Error"):
             strategy.search("test query")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_calls_api_correctly(self, mock_get, strategy):
         """Test that search calls API with correct parameters."""
         mock_response = Mock()
@@ -360,4 +361,47 @@ class TestSemanticScholarTitleMatchStrategy:
         strategy._rate_limit()
         elapsed = time.time() - start
         
-        assert elapsed >= 0.1
\ No newline at end of file
+        assert elapsed >= 0.1
+
+
+@pytest.mark.unit
+class TestCalculateMany:
+    
+    def test_matches_pairwise_scores(self):
+        candidates = ["Machine Learning for NLP", None, "Quantum Computing"]
+        
+        scores = TitleSimilarityCalculator.calculate_many("Machine Learning for NLP", candidates)
+        
+        assert scores[0] == 1.0
+        assert scores[1] == 0.0
+        assert scores[2] == pytest.approx(
+            TitleSimilarityCalculator.calculate("Machine Learning for NLP", "Quantum Computing")
+        )
+    
+    def test_empty_title(self):
+        assert TitleSimilarityCalculator.calculate_many("", ["a", "b"]) == [0.0, 0.0]
+
+
+@pytest.mark.unit
+class TestLocalFirstTitleMatchStrategy:
+    
+    def test_good_local_hit_skips_remote(self):
+        local_index = Mock()
+        local_index.search.return_value = [{'paper_id': 'W1', 'title': 'T', 'similarity': 0.97}]
+        remote = Mock()
+        strategy = LocalFirstTitleMatchStrategy(local_index, remote, min_local_similarity=0.95)
+        
+        results = strategy.search("T", max_results=5)
+        
+        assert results[0]['paper_id'] == 'W1'
+        remote.search.assert_not_called()
+    
+    def test_weak_local_hit_falls_back_to_remote(self):
+        local_index = Mock()
+        local_index.search.return_value = [{'paper_id': 'W1', 'title': 'T', 'similarity': 0.7}]
+        remote = Mock()
+        remote.search.return_value = [{'paper_id': 'W2', 'title': 'T'}]
+        strategy = LocalFirstTitleMatchStrategy(local_index, remote, min_local_similarity=0.95)
+        
+        assert strategy.search("T", max_results=5) == [{'paper_id': 'W2', 'title': 'T'}]
+        remote.search.assert_called_once_with("T", max_results=5)
@@ -0,0 +1,82 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+HEAVY_MODULES = ("torch", "sentence_transformers", "sklearn")
+
+# Cold-import budgets in seconds; override on slow machines with
+# ARTICLECRAWLER_IMPORT_BUDGET_SCALE (e.g. "2" doubles every budget).
+IMPORT_BUDGETS = {
+    "ArticleCrawler": 0.5,
+    "ArticleCrawler.cli.main": 1.5,
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _cold_import(module: str) -> dict:
+    """Import ``module`` in a fresh interpreter and report time and heavy modules loaded."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.unit
+class TestStartupTime:
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+    def test_import_skips_heavy_dependencies(self, module):
+        result = _cold_import(module)
+
+        assert result["loaded"] == []
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS))
+    def test_cold_import_within_budget(self, module):
+        scale = float(os.getenv("ARTICLECRAWLER_IMPORT_BUDGET_SCALE", "1"))
+        budget = IMPORT_BUDGETS[module] * scale
+
+        best = min(_cold_import(module)["elapsed"] for _ in range(3))
+
+        assert best <= budget, f"import {module} took {best:.2f}s (budget {budget:.2f}s)"
+
+
+@pytest.mark.unit
+class TestLazyExports:
+
+    def test_exports_resolve_to_defining_module(self):
+        import ArticleCrawler
+        from ArticleCrawler.text_processing.text_analyzer import TextAnalysisManager
+
+        assert ArticleCrawler.TextAnalysisManager is TextAnalysisManager
+        assert "TextAnalysisManager" in vars(ArticleCrawler)
+
+    def test_all_exports_are_listed_in_dir(self):
+        import ArticleCrawler
+
+        assert set(ArticleCrawler.__all__) <= set(dir(ArticleCrawler))
+
+    def test_unknown_attribute_raises(self):
+        import ArticleCrawler
+
+        with pytest.raises(AttributeError):
+            ArticleCrawler.DoesNotExist
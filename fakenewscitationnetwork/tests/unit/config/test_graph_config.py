@@ -11,6 +11,7 @@ class TestGraphConfig:
         assert config.include_author_nodes == False
         assert config.include_venue_nodes == True
         assert config.max_centrality_iterations == 1000
+        assert config.backend == 'networkx'
     
     def test_custom_initialization(self):
         config = GraphConfig(
@@ -26,6 +27,10 @@ class TestGraphConfig:
         with pytest.raises(ValueError, match="max_centrality_iterations must be positive"):
             GraphConfig(max_centrality_iterations=0)
     
+    def test_invalid_backend_raises_error(self):
+        with pytest.raises(ValueError, match="backend must be one of"):
+            GraphConfig(backend='igraph')
+    
     def test_copy_creates_independent_instance(self):
         config1 = GraphConfig(ignored_venues=['ArXiv'])
         config2 = config1.copy()
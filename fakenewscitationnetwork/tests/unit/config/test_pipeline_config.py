@@ -0,0 +1,30 @@
+import pytest
+from ArticleCrawler.config import PipelineConfig
+
+
+@pytest.mark.unit
+class TestPipelineConfig:
+    
+    def test_default_initialization(self):
+        config = PipelineConfig()
+        assert config.enabled is False
+        assert config.chunk_size == 1
+        assert config.queue_size == 4
+        assert config.background_persistence is True
+        assert config.parse_batch_size == 25
+    
+    def test_invalid_sizes_raise_error(self):
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            PipelineConfig(chunk_size=0)
+        with pytest.raises(ValueError, match="queue_size must be positive"):
+            PipelineConfig(queue_size=0)
+        with pytest.raises(ValueError, match="parse_batch_size must be positive"):
+            PipelineConfig(parse_batch_size=0)
+    
+    def test_copy_creates_independent_instance(self):
+        config1 = PipelineConfig(enabled=True, chunk_size=5, parse_batch_size=40)
+        config2 = config1.copy()
+        config2.chunk_size = 10
+        assert config1.chunk_size == 5
+        assert config2.enabled is True
+        assert config2.parse_batch_size == 40
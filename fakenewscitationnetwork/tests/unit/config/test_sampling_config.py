@@ -38,4 +38,18 @@ class TestSamplingConfig:
         config2 = config1.copy()
         config2.ignored_venues.append('WWW')
         assert len(config1.ignored_venues) == 1
-        assert len(config2.ignored_venues) == 2
\ No newline at end of file
+        assert len(config2.ignored_venues) == 2
+    def test_relevance_mode_defaults_to_keywords(self):
+        config = SamplingConfig(num_papers=1)
+        assert config.relevance_mode == 'keywords'
+        assert config.embedding_store_dir is None
+
+    def test_invalid_relevance_mode_raises_error(self):
+        with pytest.raises(ValueError, match="relevance_mode must be one of"):
+            SamplingConfig(num_papers=1, relevance_mode='random')
+
+    def test_copy_keeps_relevance_settings(self, temp_dir):
+        config = SamplingConfig(num_papers=1, relevance_mode='embedding', embedding_store_dir=temp_dir)
+        copied = config.copy()
+        assert copied.relevance_mode == 'embedding'
+        assert copied.embedding_store_dir == temp_dir
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ArticleCrawler.data.data_frame_store import DataFrameStore
+from ArticleCrawler.data.id_interner import IdInterner
+
+
+@pytest.mark.unit
+class TestIdInterner:
+
+    def test_encode_assigns_dense_codes_in_first_seen_order(self):
+        interner = IdInterner()
+
+        codes = interner.encode(['W2', 'W1', 'W2', 'W3'])
+
+        assert codes.dtype == np.int32
+        assert codes.tolist() == [0, 1, 0, 2]
+        assert len(interner) == 3
+        assert interner.decode(codes) == ['W2', 'W1', 'W2', 'W3']
+
+    def test_lookup_does_not_register(self):
+        interner = IdInterner(['W1'])
+
+        assert interner.lookup(['W1', 'W9']).tolist() == [0, -1]
+        assert 'W9' not in interner
+
+    def test_intern_returns_canonical_objects(self):
+        interner = IdInterner()
+        first = ''.join(['W', '42'])
+        second = ''.join(['W', '42'])
+
+        interned = interner.intern([first, second, None])
+
+        assert interned[0] is first and interned[1] is first
+        assert interned[2] is None
+
+
+@pytest.mark.unit
+class TestDataFrameStoreInterning:
+
+    def test_intern_frames_shares_ids_and_coerces_flags(self, mock_logger):
+        store = DataFrameStore(logger=mock_logger)
+        store.df_paper_metadata = pd.DataFrame({
+            'paperId': [''.join(['W', '1'])],
+            'venue': ['Venue'],
+            'processed': [None],
+            'isSeed': ['True'],
+        })
+        store.df_paper_references = pd.DataFrame({'paperId': ['W2'], 'referencePaperId': [''.join(['W', '1'])]})
+
+        store.intern_frames()
+
+        assert store.df_paper_references['referencePaperId'].iloc[0] is store.df_paper_metadata['paperId'].iloc[0]
+        assert store.df_paper_metadata['processed'].dtype == bool
+        assert store.df_paper_metadata['processed'].tolist() == [False]
+        assert store.df_paper_metadata['isSeed'].tolist() == [True]
+        assert len(store.ids) == 2
@@ -1,5 +1,6 @@
 # tests/unit/data/test_markdown_writer_extensions.py (COMPLETE FIX)
 
+import os
 import pytest
 from pathlib import Path
 from ArticleCrawler.DataManagement.markdown_writer import MarkdownFileGenerator
@@ -68,6 +69,19 @@ class TestMarkdownWriterExtensions:
         assert "Test Paper Title" in content
         assert "John Doe" in content
     
+    def test_create_paper_markdown_skips_unchanged_file(self, markdown_writer, sample_paper_data, temp_dir):
+        output_path = temp_dir / "test_paper.md"
+        markdown_writer.create_paper_markdown_with_openalex_metadata(sample_paper_data, output_path)
+        os.utime(output_path, ns=(0, 0))
+        
+        markdown_writer.create_paper_markdown_with_openalex_metadata(sample_paper_data, output_path)
+        assert output_path.stat().st_mtime_ns == 0
+        
+        sample_paper_data.topic_label = "New Topic"
+        markdown_writer.create_paper_markdown_with_openalex_metadata(sample_paper_data, output_path)
+        assert output_path.stat().st_mtime_ns != 0
+        assert "topic_label: New Topic" in output_path.read_text(encoding='utf-8')
+    
     def test_create_openalex_frontmatter(self, markdown_writer, sample_paper_data):
         frontmatter = markdown_writer._create_openalex_frontmatter(sample_paper_data)
         
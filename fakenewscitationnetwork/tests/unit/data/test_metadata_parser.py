@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 from unittest.mock import Mock
+from ArticleCrawler.api.paper_records import AuthorRecord, PaperRecord
 from ArticleCrawler.data.metadata_parser import MetadataParser, paper2dict
 from ArticleCrawler.data.data_frame_store import DataFrameStore
 from ArticleCrawler.data.frame_manager import AcademicFeatureComputer
@@ -67,6 +68,75 @@ class TestMetadataParser:
         parser.parse_references([sample_paper_object], paper_validator)
         assert len(parser.store.df_paper_references) > 0
     
+    def test_parse_records_from_provider(self, parser, paper_validator):
+        stubs = [PaperRecord(paperId=f'W{i}', title=f'Citing {i}', authors=[AuthorRecord('A1', 'Ada')])
+                 for i in range(3)]
+        paper = PaperRecord(paperId='W100', title='Main', year=2020, authors=[AuthorRecord('A2', 'Bob')],
+                            citations=stubs, references=stubs[:1])
+
+        parser.parse_metadata([paper], processed=True)
+        parser.parse_author([paper])
+        parser.parse_citations([paper], paper_validator)
+        parser.parse_references([paper], paper_validator)
+
+        metadata = parser.store.df_paper_metadata.set_index('paperId')
+        assert list(metadata.index) == ['W100', 'W0', 'W1', 'W2']
+        assert metadata.loc['W100', 'processed'] and not metadata.loc['W1', 'processed']
+        assert list(parser.store.df_paper_citations['citedPaperId']) == ['W0', 'W1', 'W2']
+        assert list(parser.store.df_paper_references['referencePaperId']) == ['W0']
+        assert set(parser.store.df_author['authorId']) == {'A1', 'A2'}
+        assert len(parser.store.df_paper_author) == 4
+
+    def test_parse_metadata_upserts_batch(self, parser):
+        parser.parse_metadata([PaperRecord(paperId='W1', title='Old', year=2000)], processed=True)
+
+        parser.parse_metadata([
+            PaperRecord(paperId='W2', title='First'),
+            PaperRecord(paperId='W1', title='Refreshed', year=2001),
+            PaperRecord(paperId='W2', title='Duplicate'),
+        ], processed=False)
+
+        metadata = parser.store.df_paper_metadata.set_index('paperId')
+        assert list(metadata.index) == ['W1', 'W2']
+        assert metadata.loc['W1', 'title'] == 'Refreshed'
+        assert metadata.loc['W1', 'year'] == 2001
+        assert metadata.loc['W2', 'title'] == 'First'
+
+    def test_refresh_keeps_crawl_state(self, parser):
+        parser.parse_metadata([PaperRecord(paperId='W1', title='Seed')], processed=True)
+        parser.store.df_paper_metadata.loc[0, ['isSeed', 'selected']] = True
+
+        parser.parse_metadata([PaperRecord(paperId='W1', title='Seed as citation stub')], processed=False)
+
+        row = parser.store.df_paper_metadata.iloc[0]
+        assert row['processed'] and row['isSeed'] and row['selected']
+        assert row['title'] == 'Seed as citation stub'
+
+    def test_refresh_marks_stub_processed(self, parser):
+        parser.parse_metadata([PaperRecord(paperId='W1')], processed=False)
+        parser.parse_metadata([PaperRecord(paperId='W1')], processed=True)
+
+        assert parser.store.df_paper_metadata['processed'].tolist() == [True]
+
+    def test_ids_are_shared_across_frames(self, parser, paper_validator):
+        stub = PaperRecord(paperId=''.join(['W', '1']), venue=''.join(['Ven', 'ue']))
+        paper = PaperRecord(paperId='W100', venue='Venue', citations=[stub])
+
+        parser.parse_metadata([paper], processed=True)
+        parser.parse_citations([paper], paper_validator)
+
+        metadata = parser.store.df_paper_metadata
+        citations = parser.store.df_paper_citations
+        assert citations['citedPaperId'].iloc[0] is metadata['paperId'].iloc[1]
+        assert metadata['venue'].iloc[0] is metadata['venue'].iloc[1]
+        assert parser.store.ids.decode(parser.store.ids.lookup(['W1', 'W100'])) == ['W1', 'W100']
+
+    def test_flags_stay_bool_for_stubs(self, parser):
+        parser.parse_metadata([PaperRecord(paperId='W1')], processed=False)
+
+        flags = list(parser.store.BOOL_COLUMNS['df_paper_metadata'])
+        assert (parser.store.df_paper_metadata[flags].dtypes == bool).all()
+
     def test_parse_abstracts_adds_non_empty_abstracts(self, parser, sample_paper_object):
         parser.parse_abstracts([sample_paper_object])
         assert len(parser.store.df_abstract) > 0
@@ -92,6 +162,11 @@ class TestPaper2Dict:
         assert result['paperId'] == sample_paper_object.paperId
         assert result['processed'] == True
     
+    def test_paper2dict_reads_slotted_records(self):
+        record = PaperRecord(paperId='W1', title='T', concepts=[{'id': 'C1'}])
+        result = paper2dict(record, processed=False, columns=['paperId', 'title', 'concepts', 'isSeed'])
+        assert result == {'paperId': 'W1', 'title': 'T', 'concepts': [{'id': 'C1'}], 'isSeed': ''}
+
     def test_paper2dict_handles_missing_columns(self, sample_paper_object):
         columns = ['paperId', 'title', 'nonexistent_field']
         result = paper2dict(sample_paper_object, processed=False, columns=columns)
@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from ArticleCrawler.DataManagement.background_writer import BackgroundWriter
+from ArticleCrawler.data.data_coordinator import DataCoordinator
+from ArticleCrawler.data.prefetcher import PaperPrefetcher
+
+
+def _paper(paper_id):
+    paper = Mock()
+    paper.paperId = paper_id
+    return paper
+
+
+@pytest.mark.unit
+class TestPaperPrefetcher:
+
+    def test_streams_chunks_in_request_order(self, mock_logger):
+        retrieval = Mock()
+        retrieval.retrieve_papers.side_effect = lambda ids: [_paper(pid) for pid in ids]
+
+        chunks = list(PaperPrefetcher(retrieval, chunk_size=2, logger=mock_logger).stream(['W1', 'W2', 'W3']))
+
+        assert [ids for ids, _ in chunks] == [['W1', 'W2'], ['W3']]
+        assert [p.paperId for _, papers in chunks for p in papers] == ['W1', 'W2', 'W3']
+
+    def test_next_chunk_downloads_while_consumer_works(self, mock_logger):
+        first_consumed = threading.Event()
+
+        def retrieve(ids):
+            if ids == ['W2']:
+                # Only completes if the consumer got W1 before W2 was fetched.
+                assert first_consumed.wait(timeout=5)
+            return [_paper(pid) for pid in ids]
+
+        retrieval = Mock()
+        retrieval.retrieve_papers.side_effect = retrieve
+        prefetcher = PaperPrefetcher(retrieval, chunk_size=1, logger=mock_logger)
+
+        seen = []
+        for ids, _ in prefetcher.stream(['W1', 'W2']):
+            seen.extend(ids)
+            first_consumed.set()
+
+        assert seen == ['W1', 'W2']
+
+    def test_worker_errors_are_raised_in_consumer(self, mock_logger):
+        retrieval = Mock()
+        retrieval.retrieve_papers.side_effect = [[_paper('W1')], RuntimeError("API down")]
+
+        with pytest.raises(RuntimeError, match="API down"):
+            list(PaperPrefetcher(retrieval, logger=mock_logger).stream(['W1', 'W2']))
+
+    def test_leaving_early_stops_worker(self, mock_logger):
+        retrieval = Mock()
+        retrieval.retrieve_papers.side_effect = lambda ids: [_paper(pid) for pid in ids]
+        stream = PaperPrefetcher(retrieval, queue_size=1, logger=mock_logger).stream([f'W{i}' for i in range(50)])
+
+        next(stream)
+        stream.close()
+
+        assert retrieval.retrieve_papers.call_count < 50
+
+    def test_batches_merge_chunks_until_enough_papers(self, mock_logger):
+        retrieval = Mock()
+        retrieval.retrieve_papers.side_effect = lambda ids: [None if pid == 'W2' else _paper(pid) for pid in ids]
+        prefetcher = PaperPrefetcher(retrieval, chunk_size=1, batch_size=3, logger=mock_logger)
+
+        batches = list(prefetcher.batches([f'W{i}' for i in range(1, 7)]))
+
+        # W2 failed, so the first batch needs four chunks to hold three papers.
+        assert [ids for ids, _ in batches] == [['W1', 'W2', 'W3', 'W4'], ['W5', 'W6']]
+        assert retrieval.retrieve_papers.call_count == 6
+
+
+@pytest.mark.unit
+class TestStreamingRetrieval:
+
+    def test_parses_chunks_then_computes_features_once(
+        self, mock_retrieval_service, mock_validation_service, mock_frame_manager,
+        mock_graph_manager, mock_retraction_manager, mock_logger
+    ):
+        coordinator = DataCoordinator(
+            retrieval_service=mock_retrieval_service,
+            validation_service=mock_validation_service,
+            frame_manager=mock_frame_manager,
+            retraction_manager=mock_retraction_manager,
+            graph_manager=mock_graph_manager,
+            graph_processing=Mock(),
+            logger=mock_logger,
+        )
+        mock_retrieval_service.retrieve_papers.side_effect = lambda ids: [_paper(pid) for pid in ids]
+        prefetcher = PaperPrefetcher(mock_retrieval_service, chunk_size=2, logger=mock_logger)
+
+        coordinator.retrieve_and_process_papers(['W1', 'W2', 'W3'], prefetcher=prefetcher)
+
+        parsed = [[p.paperId for p in call.args[0]] for call in mock_frame_manager.parse_papers.call_args_list]
+        assert parsed == [['W1', 'W2'], ['W3']]
+        mock_frame_manager.compute_features.assert_called_once()
+        mock_frame_manager.process_data.assert_not_called()
+        assert coordinator.no_papers_retrieved is False
+
+
+@pytest.mark.unit
+class TestBackgroundWriter:
+
+    def test_runs_jobs_in_order(self, mock_logger):
+        done = []
+        with BackgroundWriter(max_pending=2, logger=mock_logger) as writer:
+            for i in range(5):
+                writer.submit(lambda i=i: (time.sleep(0.01), done.append(i)))
+
+        assert done == [0, 1, 2, 3, 4]
+
+    def test_bounds_pending_jobs(self, mock_logger):
+        release = threading.Event()
+        writer = BackgroundWriter(max_pending=1, logger=mock_logger)
+        writer.submit(release.wait)
+        submitted = threading.Event()
+
+        thread = threading.Thread(target=lambda: (writer.submit(lambda: None), submitted.set()))
+        thread.start()
+        assert not submitted.wait(timeout=0.1)
+        release.set()
+        thread.join(timeout=5)
+
+        assert submitted.is_set()
+        writer.close()
+
+    def test_job_errors_are_raised_on_wait(self, mock_logger):
+        writer = BackgroundWriter(logger=mock_logger)
+        writer.submit(lambda: 1 / 0)
+
+        with pytest.raises(ZeroDivisionError):
+            writer.close()
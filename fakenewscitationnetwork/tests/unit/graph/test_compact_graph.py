@@ -0,0 +1,101 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+
+from ArticleCrawler.config import GraphConfig
+from ArticleCrawler.graph.compact_graph import CompactDiGraph
+from ArticleCrawler.graph.graph_manager import GraphManager
+from ArticleCrawler.graph.graph_processing import GraphProcessing
+
+
+def _frames():
+    return SimpleNamespace(
+        df_paper_metadata=pd.DataFrame({
+            'paperId': ['W1', 'W2', 'W3', 'W4'],
+            'venue': ['Venue A', 'Venue A', 'WWW', 'Venue B'],
+        }),
+        df_paper_author=pd.DataFrame({'paperId': ['W1', 'W2', 'W3'], 'authorId': ['A1', 'A1', 'A2']}),
+        df_paper_citations=pd.DataFrame({'paperId': ['W1', 'W1', 'W2'], 'citedPaperId': ['W2', 'W3', 'W3']}),
+        df_paper_references=pd.DataFrame({'paperId': ['W4', 'W3'], 'referencePaperId': ['W1', 'W2']}),
+    )
+
+
+def _manager(backend, mock_logger):
+    config = GraphConfig(ignored_venues=['WWW'], include_author_nodes=True, backend=backend)
+    manager = GraphManager(graph_options=config, logger=mock_logger)
+    manager.update_graph_with_new_nodes(_frames())
+    return manager
+
+
+@pytest.mark.unit
+class TestCompactDiGraph:
+
+    def test_parallel_edges_collapse_and_last_type_wins(self):
+        graph = CompactDiGraph()
+        graph.add_nodes_from(['W1', 'W2'], ntype='paper')
+        graph.add_edge_arrays(['W1', 'W1'], ['W2', 'W2'], etype='citation')
+        graph.add_edges_from([('W1', 'W2'), ('W2', 'W3')], etype='reference')
+
+        assert graph.number_of_nodes() == 3
+        assert sorted(graph.edges(data=True)) == [
+            ('W1', 'W2', {'etype': 'reference'}),
+            ('W2', 'W3', {'etype': 'reference'}),
+        ]
+        assert graph.nodes['W3'] == {}
+        assert graph.node_type_counts() == {'paper': 2, 'author': 0, 'venue': 0}
+
+    def test_reverse_flips_edges(self):
+        graph = CompactDiGraph()
+        graph.add_edge_arrays(['W1'], ['W2'])
+
+        assert graph.reverse().edges() == [('W2', 'W1')]
+        assert graph.edges() == [('W1', 'W2')]
+
+    def test_eigenvector_centrality_matches_networkx(self):
+        rng = np.random.default_rng(0)
+        edges = [(f'W{u}', f'W{v}') for u, v in rng.integers(0, 60, size=(400, 2))]
+        graph = CompactDiGraph()
+        graph.add_edges_from(edges)
+        reference = nx.eigenvector_centrality(graph.to_networkx(), max_iter=1000)
+
+        values = graph.eigenvector_centrality(max_iter=1000)
+
+        expected = [reference[node] for node in graph.nodes()]
+        np.testing.assert_allclose(values, expected, atol=1e-9)
+
+    def test_unknown_node_type_raises(self):
+        with pytest.raises(ValueError):
+            CompactDiGraph().add_nodes_from(['X1'], ntype='institution')
+
+
+@pytest.mark.unit
+class TestCompactGraphManager:
+
+    def test_matches_networkx_backend(self, mock_logger):
+        compact = _manager('compact', mock_logger)
+        reference = _manager('networkx', mock_logger)
+
+        exported = compact.to_networkx()
+        assert dict(exported.nodes(data=True)) == dict(reference.DG.nodes(data=True))
+        assert sorted(exported.edges(data=True)) == sorted(reference.DG.edges(data=True))
+        assert compact.get_graph_info() == reference.get_graph_info()
+        assert compact.get_node_type_counts() == reference.get_node_type_counts() == {
+            'paper': 4, 'author': 2, 'venue': 2}
+        assert [sorted(ids) for ids in compact.extract_graph_data()] == \
+            [sorted(ids) for ids in reference.extract_graph_data()]
+
+    def test_centralities_match_networkx_backend(self, mock_logger):
+        managers = [_manager(backend, mock_logger) for backend in ('compact', 'networkx')]
+        for manager in managers:
+            GraphProcessing(SimpleNamespace(graph=manager), logger=mock_logger).calculate_centrality()
+
+        compact, reference = (m.get_paper_centralities(['W2', 'W3', 'W9']) for m in managers)
+
+        pd.testing.assert_frame_equal(
+            compact.sort_values('paperId').reset_index(drop=True),
+            reference.sort_values('paperId').reset_index(drop=True),
+            check_exact=False, atol=1e-9,
+        )
+        assert sorted(compact['paperId']) == ['W2', 'W3']
@@ -13,7 +13,7 @@ class TestLibraryCreateCommand:
         return CliRunner()
     
     @patch('ArticleCrawler.cli.commands.library_create._get_papers_from_sources')
-    @patch('ArticleCrawler.cli.commands.library_create.LibraryCreationOrchestrator')
+    @patch('ArticleCrawler.usecases.library_creation.LibraryCreationOrchestrator')
     @patch('ArticleCrawler.cli.commands.library_create.RichPrompter')
     @patch('rich.prompt.Confirm.ask')
     @patch('rich.prompt.Prompt.ask')
@@ -35,7 +35,7 @@ class TestLibraryCreateCommand:
         assert result.exit_code == 0
     
     @patch('ArticleCrawler.cli.commands.library_create._get_papers_from_sources')
-    @patch('ArticleCrawler.cli.commands.library_create.LibraryCreationOrchestrator')
+    @patch('ArticleCrawler.usecases.library_creation.LibraryCreationOrchestrator')
     @patch('rich.prompt.Confirm.ask')
     @patch('rich.prompt.Prompt.ask')
     def test_library_create_validation_fails(self, mock_prompt, mock_confirm, 
@@ -50,7 +50,7 @@ class TestLibraryCreateCommand:
         mock_orchestrator.return_value.create_library.assert_not_called()
         
     @patch('ArticleCrawler.cli.commands.library_create._get_papers_from_sources')
-    @patch('ArticleCrawler.cli.commands.library_create.LibraryCreationOrchestrator')
+    @patch('ArticleCrawler.usecases.library_creation.LibraryCreationOrchestrator')
     @patch('rich.prompt.Prompt.ask')
     def test_library_create_no_papers_found(self, mock_prompt, mock_orchestrator, 
                                            mock_get_papers, runner):
@@ -0,0 +1,107 @@
+import os
+
+import pytest
+from unittest.mock import Mock
+from ArticleCrawler.library.library_writer import LibraryWriter
+from ArticleCrawler.library.models import PaperData
+
+
+def _paper(paper_id):
+    return PaperData(paper_id=paper_id, title=f"Paper {paper_id}", authors=[])
+
+
+@pytest.mark.unit
+class TestLibraryWriter:
+
+    @pytest.fixture
+    def markdown_writer(self):
+        writer = Mock()
+
+        def create(paper_data, output_path):
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(f"# {paper_data.title}\n", encoding="utf-8")
+            return output_path
+
+        writer.create_paper_markdown_with_openalex_metadata.side_effect = create
+        return writer
+
+    def test_write_papers_writes_all_items(self, markdown_writer, mock_logger, temp_dir):
+        writer = LibraryWriter(markdown_writer, max_workers=4, logger=mock_logger)
+        items = [(_paper(f"W{i}"), temp_dir / "papers" / f"W{i}.md") for i in range(10)]
+
+        written = writer.write_papers(items)
+
+        assert written == [path for _, path in items]
+        assert (temp_dir / "papers" / "W7.md").read_text(encoding="utf-8") == "# Paper W7\n"
+
+    def test_write_failures_are_left_out(self, markdown_writer, mock_logger, temp_dir):
+        original = markdown_writer.create_paper_markdown_with_openalex_metadata.side_effect
+
+        def flaky(paper_data, output_path):
+            if paper_data.paper_id == "W2":
+                raise OSError("disk full")
+            return original(paper_data, output_path)
+
+        markdown_writer.create_paper_markdown_with_openalex_metadata.side_effect = flaky
+        writer = LibraryWriter(markdown_writer, logger=mock_logger)
+        items = [(_paper(f"W{i}"), temp_dir / f"W{i}.md") for i in range(1, 4)]
+
+        written = writer.write_papers(items)
+
+        assert [p.name for p in written] == ["W1.md", "W3.md"]
+        mock_logger.error.assert_called_once()
+
+    def test_hardlinks_topic_entries(self, markdown_writer, mock_logger, temp_dir):
+        source = temp_dir / "papers" / "W1.md"
+        LibraryWriter(markdown_writer, logger=mock_logger).write_papers([(_paper("W1"), source)])
+        target = temp_dir / "topics" / "Graphs" / "W1.md"
+
+        linked = LibraryWriter(markdown_writer, logger=mock_logger).link_papers([(source, target)])
+
+        assert linked == [target]
+        assert os.path.samefile(source, target)
+
+    def test_relinking_existing_target(self, markdown_writer, mock_logger, temp_dir):
+        source = temp_dir / "papers" / "W1.md"
+        writer = LibraryWriter(markdown_writer, logger=mock_logger)
+        writer.write_papers([(_paper("W1"), source)])
+        target = temp_dir / "topics" / "Graphs" / "W1.md"
+        target.parent.mkdir(parents=True)
+        target.write_text("stale copy", encoding="utf-8")
+
+        writer.link_papers([(source, target)])
+        writer.link_papers([(source, target)])
+
+        assert os.path.samefile(source, target)
+
+    def test_symlink_mode(self, markdown_writer, mock_logger, temp_dir):
+        source = temp_dir / "papers" / "W1.md"
+        writer = LibraryWriter(markdown_writer, link_mode='symlink', logger=mock_logger)
+        writer.write_papers([(_paper("W1"), source)])
+        target = temp_dir / "topics" / "Graphs" / "W1.md"
+
+        writer.link_papers([(source, target)])
+
+        assert target.read_text(encoding="utf-8") == "# Paper W1\n"
+        assert target.is_symlink() or not hasattr(os, "symlink")
+
+    def test_copy_mode(self, markdown_writer, mock_logger, temp_dir):
+        source = temp_dir / "papers" / "W1.md"
+        writer = LibraryWriter(markdown_writer, link_mode='copy', logger=mock_logger)
+        writer.write_papers([(_paper("W1"), source)])
+        target = temp_dir / "topics" / "W1.md"
+
+        writer.link_papers([(source, target)])
+
+        assert target.read_text(encoding="utf-8") == "# Paper W1\n"
+        assert not os.path.samefile(source, target)
+
+    def test_missing_source_is_logged(self, markdown_writer, mock_logger, temp_dir):
+        writer = LibraryWriter(markdown_writer, logger=mock_logger)
+
+        assert writer.link_papers([(temp_dir / "missing.md", temp_dir / "topics" / "missing.md")]) == []
+        mock_logger.error.assert_called_once()
+
+    def test_invalid_link_mode(self, markdown_writer):
+        with pytest.raises(ValueError):
+            LibraryWriter(markdown_writer, link_mode='reflink')
@@ -0,0 +1,141 @@
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+from ArticleCrawler.library.paper_file_reader import PaperFileReader
+from ArticleCrawler.library.paper_manifest import PaperManifest
+
+
+def _write_note(directory, paper_id, title, year=2021):
+    path = directory / f"{paper_id}.md"
+    path.write_text(
+        f"---\npaper_id: {paper_id}\ntitle: {title}\nyear: {year}\n"
+        f"authors:\n- name: Ada\n  id: A1\nconcepts:\n- display_name: Graphs\n  score: 0.9\n---\n\n# {title}\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.mark.unit
+class TestPaperManifest:
+
+    @pytest.fixture
+    def papers_dir(self, temp_dir):
+        directory = temp_dir / "papers"
+        directory.mkdir()
+        _write_note(directory, "W1", "First Paper")
+        _write_note(directory, "W2", "Second Paper", year=2019)
+        return directory
+
+    @pytest.fixture
+    def counting_reader(self, mock_logger):
+        reader = PaperFileReader(logger=mock_logger)
+        parsed = []
+        original = reader.read_paper_from_markdown
+        reader.read_paper_from_markdown = lambda path: parsed.append(path.name) or original(path)
+        return reader, parsed
+
+    def test_second_read_uses_manifest(self, papers_dir, counting_reader):
+        reader, parsed = counting_reader
+
+        first = reader.read_papers_from_directory(papers_dir)
+        parsed.clear()
+        second = reader.read_papers_from_directory(papers_dir)
+
+        assert parsed == []
+        assert (papers_dir / PaperManifest.FILENAME).exists()
+        assert sorted(p.paper_id for p in second) == ["W1", "W2"]
+        assert sorted(first, key=lambda p: p.paper_id) == sorted(second, key=lambda p: p.paper_id)
+
+    def test_round_trips_nested_fields(self, papers_dir, counting_reader):
+        reader, _ = counting_reader
+        reader.read_papers_from_directory(papers_dir)
+
+        papers = {p.paper_id: p for p in reader.read_papers_from_directory(papers_dir)}
+
+        assert papers["W2"].year == 2019
+        assert papers["W1"].authors == [{'name': 'Ada', 'id': 'A1'}]
+        assert papers["W1"].concepts == [{'display_name': 'Graphs', 'score': 0.9}]
+
+    def test_only_changed_notes_are_reparsed(self, papers_dir, counting_reader):
+        reader, parsed = counting_reader
+        reader.read_papers_from_directory(papers_dir)
+        parsed.clear()
+
+        path = _write_note(papers_dir, "W2", "Second Paper Revised", year=2019)
+        _bump_mtime(path)
+        papers = {p.paper_id: p for p in reader.read_papers_from_directory(papers_dir)}
+
+        assert parsed == ["W2.md"]
+        assert papers["W2"].title == "Second Paper Revised"
+
+    def test_touched_but_unchanged_note_is_not_reparsed(self, papers_dir, counting_reader):
+        reader, parsed = counting_reader
+        reader.read_papers_from_directory(papers_dir)
+        parsed.clear()
+
+        _bump_mtime(papers_dir / "W1.md")
+        reader.read_papers_from_directory(papers_dir)
+
+        assert parsed == []
+
+    def test_added_and_deleted_notes(self, papers_dir, counting_reader):
+        reader, parsed = counting_reader
+        reader.read_papers_from_directory(papers_dir)
+        parsed.clear()
+
+        (papers_dir / "W1.md").unlink()
+        _write_note(papers_dir, "W3", "Third Paper")
+        papers = reader.read_papers_from_directory(papers_dir)
+
+        assert parsed == ["W3.md"]
+        assert sorted(p.paper_id for p in papers) == ["W2", "W3"]
+
+    def test_corrupt_manifest_is_rebuilt(self, papers_dir, counting_reader):
+        reader, parsed = counting_reader
+        (papers_dir / PaperManifest.FILENAME).write_bytes(b"not parquet")
+
+        papers = reader.read_papers_from_directory(papers_dir)
+
+        assert len(papers) == 2
+        assert sorted(parsed) == ["W1.md", "W2.md"]
+
+    def test_manifest_can_be_disabled(self, papers_dir, mock_logger):
+        PaperFileReader(logger=mock_logger, use_manifest=False).read_papers_from_directory(papers_dir)
+
+        assert not (papers_dir / PaperManifest.FILENAME).exists()
+
+    def test_concurrent_writes_use_separate_temp_files(self, papers_dir, counting_reader, mock_logger):
+        import pyarrow.parquet as pq
+
+        reader, _ = counting_reader
+        reader.read_papers_from_directory(papers_dir)
+        manifest = PaperManifest(papers_dir, logger=mock_logger)
+        rows = list(manifest._read().values())
+        mock_logger.reset_mock()
+        barrier = threading.Barrier(4)
+        tmp_paths = []
+        write_table = pq.write_table
+
+        def _write_table(table, path):
+            tmp_paths.append(path)
+            barrier.wait(timeout=5)
+            write_table(table, path)
+
+        with patch.object(pq, 'write_table', _write_table):
+            threads = [threading.Thread(target=manifest._write, args=(rows,)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(set(tmp_paths)) == 4
+        mock_logger.debug.assert_not_called()
+        assert list(papers_dir.glob("*.tmp")) == []
+        assert sorted(manifest._read()) == ["W1.md", "W2.md"]
@@ -0,0 +1,111 @@
+import os
+
+import pandas as pd
+import pytest
+from ArticleCrawler.library.title_index import LocalTitleIndex
+
+
+def _write_catalog(root, rows):
+    path = root / "job_1" / "vault" / "parquet"
+    path.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_parquet(path / "papers.parquet")
+    return path / "papers.parquet"
+
+
+def _write_library(root, papers):
+    library = root / "my_library"
+    (library / "papers").mkdir(parents=True, exist_ok=True)
+    (library / "library_config.yaml").write_text("name: my_library\n", encoding="utf-8")
+    for paper_id, title in papers:
+        (library / "papers" / f"{paper_id}.md").write_text(
+            f"---\npaper_id: {paper_id}\ntitle: {title}\nyear: 2020\n---\n\n# {title}\n",
+            encoding="utf-8",
+        )
+    return library
+
+
+@pytest.mark.unit
+class TestLocalTitleIndex:
+
+    def test_indexes_catalogs_and_libraries(self, temp_dir, mock_logger):
+        experiments = temp_dir / "experiments"
+        libraries = temp_dir / "libraries"
+        _write_catalog(experiments, [
+            {'paperId': 'W1', 'title': 'Deep Learning for Graphs', 'year': 2019, 'venue': 'NeurIPS', 'abstract': 'x'},
+        ])
+        _write_library(libraries, [('W2', 'Fake News Detection on Social Media')])
+        index = LocalTitleIndex([experiments], [libraries], logger=mock_logger)
+
+        assert index.refresh() == 2
+        assert index.search("deep learning for graphs!")[0]['paper_id'] == 'W1'
+        assert index.search("Fake news detection on social media")[0]['year'] == 2020
+
+    def test_exact_match_has_full_similarity(self, mock_logger):
+        index = LocalTitleIndex(logger=mock_logger)
+        index.add_entries([{'paper_id': 'W1', 'title': 'A Study of Things'}])
+
+        results = index.search("A study of things.")
+
+        assert results == [{
+            'paper_id': 'W1', 'title': 'A Study of Things', 'year': None, 'venue': None,
+            'doi': None, 'similarity': 1.0, 'source': 'local',
+        }]
+
+    def test_fuzzy_search_ranks_and_applies_cutoff(self, mock_logger):
+        index = LocalTitleIndex(min_similarity=0.6, logger=mock_logger)
+        index.add_entries([
+            {'paper_id': 'W1', 'title': 'Machine learning for natural language processing'},
+            {'paper_id': 'W2', 'title': 'Machine learning for natural language understanding'},
+            {'paper_id': 'W3', 'title': 'Quantum computing fundamentals'},
+        ])
+
+        results = index.search("Machine learning for natural language processes")
+
+        assert [r['paper_id'] for r in results] == ['W1', 'W2']
+        assert results[0]['similarity'] > results[1]['similarity']
+
+    def test_id_prefix_filters_other_providers(self, mock_logger):
+        index = LocalTitleIndex(id_prefix="W", logger=mock_logger)
+        index.add_entries([
+            {'paper_id': 'abc123', 'title': 'Shared Title'},
+            {'paper_id': 'W9', 'title': 'Shared Title'},
+        ])
+
+        assert [r['paper_id'] for r in index.search("Shared Title")] == ['W9']
+
+    def test_refresh_reloads_only_changed_sources(self, temp_dir, mock_logger, monkeypatch):
+        experiments = temp_dir / "experiments"
+        catalog = _write_catalog(experiments, [{'paperId': 'W1', 'title': 'First Title'}])
+        index = LocalTitleIndex([experiments], logger=mock_logger)
+        index.refresh()
+
+        loads = []
+        original = index._load
+        monkeypatch.setattr(index, "_load", lambda path: loads.append(path) or original(path))
+        index.refresh()
+        assert loads == []
+
+        _write_catalog(experiments, [{'paperId': 'W1', 'title': 'First Title'}, {'paperId': 'W2', 'title': 'Second Title'}])
+        stat = catalog.stat()
+        os.utime(catalog, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert index.refresh() == 2
+        assert loads == [catalog]
+
+    def test_removed_sources_are_dropped(self, temp_dir, mock_logger):
+        experiments = temp_dir / "experiments"
+        catalog = _write_catalog(experiments, [{'paperId': 'W1', 'title': 'First Title'}])
+        index = LocalTitleIndex([experiments], logger=mock_logger)
+        index.add_entries([{'paper_id': 'W5', 'title': 'In Memory'}])
+        index.refresh()
+
+        catalog.unlink()
+
+        assert index.refresh() == 1
+        assert index.search("In Memory")[0]['paper_id'] == 'W5'
+
+    def test_empty_query_returns_nothing(self, mock_logger):
+        index = LocalTitleIndex(logger=mock_logger)
+        index.add_entries([{'paper_id': 'W1', 'title': 'Title'}])
+
+        assert index.search("") == []
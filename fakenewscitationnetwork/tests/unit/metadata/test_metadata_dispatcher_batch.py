@@ -0,0 +1,59 @@
+import pytest
+
+from ArticleCrawler.metadata_extraction import MetadataDispatcher, PaperMetadata
+
+
+class _SingleExtractor:
+    def extract(self, path):
+        if path.endswith("broken.html"):
+            raise ValueError("unparseable")
+        return PaperMetadata(title=f"single:{path.rsplit('/', 1)[-1]}")
+
+
+class _BatchExtractor:
+    def __init__(self):
+        self.batches = []
+
+    def extract(self, path):
+        raise AssertionError("batch extractor should not be called per file")
+
+    def extract_many(self, paths, max_workers=None):
+        self.batches.append(list(paths))
+        for path in reversed(paths):
+            yield path, PaperMetadata(title=f"batch:{path.rsplit('/', 1)[-1]}")
+
+
+class _Factory:
+    def __init__(self):
+        self.batch = _BatchExtractor()
+        self.single = _SingleExtractor()
+
+    def create(self, mime_type):
+        return self.batch if mime_type == "application/pdf" else self.single
+
+
+@pytest.mark.unit
+def test_extract_many_batches_pdfs_and_reports_errors(tmp_path, monkeypatch):
+    files = []
+    for name in ["a.pdf", "b.pdf", "c.html", "broken.html"]:
+        path = tmp_path / name
+        path.write_bytes(b"x")
+        files.append(str(path))
+    missing = str(tmp_path / "missing.pdf")
+
+    factory = _Factory()
+    dispatcher = MetadataDispatcher(factory=factory)
+    monkeypatch.setattr(
+        dispatcher,
+        "_detect_mime",
+        lambda path: "application/pdf" if path.suffix == ".pdf" else "text/html",
+    )
+
+    results = {path: (metadata, error) for path, metadata, error in dispatcher.extract_many(files + [missing])}
+
+    assert set(results) == set(files + [missing])
+    assert factory.batch.batches == [files[:2]]
+    assert results[files[0]][0].title == "batch:a.pdf"
+    assert results[files[2]][0].title == "single:c.html"
+    assert isinstance(results[files[3]][1], ValueError)
+    assert isinstance(results[missing][1], FileNotFoundError)
@@ -49,16 +49,50 @@ class TestAPIMetadataMatcher:
     
     @patch('time.sleep')
     def test_match_metadata_multiple_papers(self, mock_sleep, matcher, sample_metadata_with_doi, sample_metadata_no_doi):
+        matcher.doi_resolver = Mock()
+        matcher.doi_resolver.resolve.return_value = {}
+        outcomes = {
+            "test.pdf": APIMatchResult(metadata=sample_metadata_with_doi, matched=True, paper_id="W123"),
+            "test2.pdf": APIMatchResult(metadata=sample_metadata_no_doi, matched=False),
+        }
         with patch.object(matcher, '_match_single') as mock_match:
-            mock_match.side_effect = [
-                APIMatchResult(metadata=sample_metadata_with_doi, matched=True, paper_id="W123"),
-                APIMatchResult(metadata=sample_metadata_no_doi, matched=False)
-            ]
+            mock_match.side_effect = lambda metadata, try_doi=True: outcomes[metadata.filename]
             results = matcher.match_metadata([sample_metadata_with_doi, sample_metadata_no_doi])
             assert len(results) == 2
             assert results[0].matched is True
             assert results[1].matched is False
-            assert mock_sleep.call_count == 1
+            assert mock_match.call_count == 2
+    
+    def test_match_metadata_uses_batched_doi_results(self, matcher, sample_metadata_with_doi, sample_metadata_no_doi):
+        missing_doi = PDFMetadata(filename="missing.pdf", title="Missing Paper", doi="10.1234/missing")
+        matcher.doi_resolver = Mock()
+        matcher.doi_resolver.resolve.return_value = {
+            "10.1234/test.2024.001": {'id': 'https://openalex.org/W42', 'doi': 'https://doi.org/10.1234/test.2024.001'},
+            "10.1234/missing": None,
+        }
+        with patch.object(matcher, '_match_single') as mock_match:
+            mock_match.side_effect = lambda metadata, try_doi=True: APIMatchResult(metadata=metadata, matched=False)
+            results = matcher.match_metadata([sample_metadata_with_doi, missing_doi, sample_metadata_no_doi])
+        
+        assert results[0].matched is True
+        assert results[0].paper_id == "W42"
+        assert results[0].match_method == "DOI"
+        assert [r.metadata.filename for r in results] == ["test.pdf", "missing.pdf", "test2.pdf"]
+        calls = {c.args[0].filename: c.kwargs["try_doi"] for c in mock_match.call_args_list}
+        assert calls == {"missing.pdf": False, "test2.pdf": True}
+    
+    def test_match_metadata_prefers_local_title_index(self, matcher, sample_metadata_no_doi):
+        matcher.doi_resolver = Mock()
+        matcher.doi_resolver.resolve.return_value = {}
+        matcher.local_index = Mock()
+        matcher.local_index.search.return_value = [{'paper_id': 'W7', 'title': 'T', 'similarity': 0.96}]
+        with patch.object(matcher, '_match_single') as mock_match:
+            results = matcher.match_metadata([sample_metadata_no_doi])
+        
+        assert results[0].matched is True
+        assert results[0].paper_id == "W7"
+        assert results[0].confidence == 0.96
+        mock_match.assert_not_called()
     
     @patch('pyalex.Works')
     def test_match_by_doi_success(self, mock_works_class, matcher, sample_metadata_with_doi):
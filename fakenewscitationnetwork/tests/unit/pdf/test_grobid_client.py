@@ -39,42 +39,34 @@ class TestGrobidClientWrapper:
         result = grobid_client.process_pdfs([])
         assert result == {}
     
-    @patch('tempfile.TemporaryDirectory')
-    def test_process_pdfs_grobid_error(self, mock_temp_dir, grobid_client, temp_pdf_files, mock_logger):
-        temp_path = temp_pdf_files[0].parent.parent / "temp"
-        temp_path.mkdir(exist_ok=True)
-        mock_temp_dir.return_value.__enter__.return_value = str(temp_path)
-        grobid_client.client.process.side_effect = Exception("GROBID failed")
+    def test_process_pdfs_maps_each_file_to_its_own_output(self, grobid_client, temp_pdf_files):
+        def fake_process(service, pdf_file, *args):
+            return pdf_file, 200, f"<TEI>{Path(pdf_file).name}</TEI>"
+
+        grobid_client.client.process_pdf.side_effect = fake_process
+        result = grobid_client.process_pdfs(temp_pdf_files, max_workers=2)
+        assert result == {
+            temp_pdf_files[0]: "<TEI>paper1.pdf</TEI>",
+            temp_pdf_files[1]: "<TEI>paper2.pdf</TEI>",
+        }
+        assert grobid_client.client.process_pdf.call_count == 2
+        service, pdf_file, generate_ids, consolidate_header = grobid_client.client.process_pdf.call_args[0][:4]
+        assert service == "processHeaderDocument"
+        assert consolidate_header is True
+
+    def test_process_pdfs_skips_failed_files(self, grobid_client, temp_pdf_files, mock_logger):
+        def fake_process(service, pdf_file, *args):
+            if Path(pdf_file).name == "paper1.pdf":
+                raise Exception("GROBID failed")
+            return pdf_file, 503, None
+
+        grobid_client.client.process_pdf.side_effect = fake_process
         result = grobid_client.process_pdfs(temp_pdf_files)
         assert result == {}
         assert mock_logger.error.called
-    
-    def test_match_pdfs_to_xml_exact_match(self, grobid_client, temp_dir):
-        xml_file1 = temp_dir / "paper1.tei.xml"
-        xml_file2 = temp_dir / "paper2.tei.xml"
-        xml_file1.touch()
-        xml_file2.touch()
-        pdf_filenames = ["paper1.pdf", "paper2.pdf"]
-        xml_files = [xml_file1, xml_file2]
-        result = grobid_client._match_pdfs_to_xml(pdf_filenames, xml_files)
-        assert "paper1.pdf" in result
-        assert "paper2.pdf" in result
-        assert result["paper1.pdf"] == xml_file1
-        assert result["paper2.pdf"] == xml_file2
-    
-    def test_match_pdfs_to_xml_partial_match(self, grobid_client, temp_dir):
-        xml_file = temp_dir / "paper_long_name.tei.xml"
-        xml_file.touch()
-        pdf_filenames = ["paper.pdf"]
-        xml_files = [xml_file]
-        result = grobid_client._match_pdfs_to_xml(pdf_filenames, xml_files)
-        assert "paper.pdf" in result
-        assert result["paper.pdf"] == xml_file
-    
-    def test_match_pdfs_to_xml_no_match(self, grobid_client, temp_dir):
-        xml_file = temp_dir / "different.tei.xml"
-        xml_file.touch()
-        pdf_filenames = ["paper.pdf"]
-        xml_files = [xml_file]
-        result = grobid_client._match_pdfs_to_xml(pdf_filenames, xml_files)
-        assert len(result) == 0
\ No newline at end of file
+        assert mock_logger.warning.called
+
+    def test_iter_process_pdfs_yields_every_file(self, grobid_client, temp_pdf_files):
+        grobid_client.client.process_pdf.return_value = ("x", 200, "<TEI/>")
+        yielded = dict(grobid_client.iter_process_pdfs(temp_pdf_files, max_workers=1))
+        assert set(yielded) == set(temp_pdf_files)
@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from ArticleCrawler.pdf_processing.grobid_client import GrobidClientWrapper
+from ArticleCrawler.pdf_processing.models import PDFMetadata
+from ArticleCrawler.pdf_processing.pdf_processor import PDFProcessor
+from ArticleCrawler.pdf_processing.result_cache import GrobidResultCache
+
+
+@pytest.mark.unit
+class TestGrobidResultCache:
+
+    @pytest.fixture
+    def cache(self, temp_dir):
+        return GrobidResultCache(str(temp_dir / "cache" / "grobid.db"))
+
+    @pytest.fixture
+    def pdfs(self, temp_dir):
+        first = temp_dir / "first.pdf"
+        duplicate = temp_dir / "renamed_copy.pdf"
+        first.write_bytes(b"same bytes")
+        duplicate.write_bytes(b"same bytes")
+        return first, duplicate
+
+    def test_duplicate_bytes_share_tei_and_metadata(self, cache, pdfs):
+        first, duplicate = pdfs
+        cache.put_tei(first, "<TEI/>")
+        cache.put_metadata(first, PDFMetadata(filename="first.pdf", title="Shared", year="2020"))
+
+        assert cache.get_tei(duplicate) == "<TEI/>"
+        metadata = cache.get_metadata(duplicate)
+        assert metadata.title == "Shared"
+        assert metadata.filename == "renamed_copy.pdf"
+
+    def test_parse_metadata_only_parses_once(self, cache, pdfs):
+        first, duplicate = pdfs
+        cache.put_tei(first, "<TEI/>")
+        extractor = Mock()
+        extractor.extract.return_value = PDFMetadata(filename="first.pdf", title="Parsed")
+
+        cache.parse_metadata(first, "<TEI/>", extractor)
+        cache.parse_metadata(duplicate, "<TEI/>", extractor)
+
+        assert extractor.extract.call_count == 1
+
+    def test_size_cap_evicts_least_recently_used(self, temp_dir):
+        cache = GrobidResultCache(str(temp_dir / "small.db"), max_bytes=150)
+        paths = []
+        for index in range(3):
+            path = temp_dir / f"p{index}.pdf"
+            path.write_bytes(f"pdf {index}".encode())
+            paths.append(path)
+            cache.put_tei(path, "x" * 60)
+
+        assert cache.get_tei(paths[0]) is None
+        assert cache.get_tei(paths[2]) is not None
+
+    def test_grobid_client_skips_request_on_hit(self, cache, pdfs):
+        first, duplicate = pdfs
+        with patch('ArticleCrawler.pdf_processing.grobid_client.GrobidClient'):
+            client = GrobidClientWrapper(logger=Mock(), cache=cache)
+        client.client.process_pdf.return_value = (str(first), 200, "<TEI>fresh</TEI>")
+
+        assert client.process_pdf(first) == "<TEI>fresh</TEI>"
+        assert client.process_pdf(duplicate) == "<TEI>fresh</TEI>"
+        assert client.client.process_pdf.call_count == 1
+
+    def test_pdf_processor_serves_cached_files_without_grobid(self, cache, pdfs, mock_logger):
+        first, duplicate = pdfs
+        cache.put_tei(first, "<TEI/>")
+        cache.put_metadata(first, PDFMetadata(filename="first.pdf", title="Shared"))
+        docker_manager = Mock()
+        grobid_client = Mock()
+
+        processor = PDFProcessor(
+            docker_manager=docker_manager,
+            grobid_client=grobid_client,
+            metadata_extractor=Mock(),
+            logger=mock_logger,
+            result_cache=cache,
+        )
+        results = processor.process_pdfs([duplicate])
+
+        assert results[0].success
+        assert results[0].metadata.title == "Shared"
+        docker_manager.is_grobid_running.assert_not_called()
+        grobid_client.process_pdfs.assert_not_called()
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+
+from ArticleCrawler.sampling.relevance import EmbeddingRelevanceScorer
+
+
+VOCAB = ['graph', 'network', 'news', 'fake', 'chess', 'opening']
+
+
+def _bag_of_words(texts):
+    return np.array([[text.lower().count(word) for word in VOCAB] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def metadata():
+    return pd.DataFrame({
+        'paperId': ['S1', 'S2', 'W1', 'W2', 'W3'],
+        'title': ['fake news spread', 'fake news on a graph', 'news network', 'chess opening', None],
+    })
+
+
+@pytest.mark.unit
+class TestEmbeddingRelevanceScorer:
+
+    def test_candidates_ranked_by_similarity_to_seed_centroid(self, metadata, mock_logger):
+        scorer = EmbeddingRelevanceScorer(encode=_bag_of_words, logger=mock_logger)
+
+        scores = scorer.score(metadata, None, ['W1', 'W2', 'W3'], ['S1', 'S2'])
+
+        assert scores[0] > scores[1]
+        assert scores[1] == pytest.approx(0.0)
+        assert scores[2] == 0.0
+
+    def test_abstracts_are_embedded_with_titles(self, metadata, mock_logger):
+        encode = Mock(side_effect=_bag_of_words)
+        abstracts = pd.DataFrame({'paperId': ['W2'], 'abstract': ['about fake news']})
+
+        scores = EmbeddingRelevanceScorer(encode=encode, logger=mock_logger).score(
+            metadata, abstracts, ['W2'], ['S1']
+        )
+
+        assert 'chess opening. about fake news' in encode.call_args[0][0]
+        assert scores[0] > 0
+
+    def test_embeddings_are_cached_between_calls(self, metadata, mock_logger):
+        encode = Mock(side_effect=_bag_of_words)
+        scorer = EmbeddingRelevanceScorer(encode=encode, batch_size=2, logger=mock_logger)
+
+        scorer.score(metadata, None, ['W1', 'W2'], ['S1'])
+        calls = encode.call_count
+        scorer.score(metadata, None, ['W1', 'W2'], ['S1'])
+
+        assert calls == 2
+        assert encode.call_count == calls
+
+    def test_store_persists_embeddings(self, metadata, temp_dir, mock_logger):
+        EmbeddingRelevanceScorer(store_dir=temp_dir, encode=_bag_of_words, logger=mock_logger).score(
+            metadata, None, ['W1'], ['S1']
+        )
+        encode = Mock(side_effect=_bag_of_words)
+
+        scores = EmbeddingRelevanceScorer(store_dir=temp_dir, encode=encode, logger=mock_logger).score(
+            metadata, None, ['W1'], ['S1']
+        )
+
+        encode.assert_not_called()
+        assert scores[0] > 0
+
+    def test_no_seed_text_gives_neutral_scores(self, metadata, mock_logger):
+        scorer = EmbeddingRelevanceScorer(encode=_bag_of_words, logger=mock_logger)
+
+        scores = scorer.score(metadata, None, ['W1', 'W2'], ['W3'])
+
+        assert list(scores) == [1.0, 1.0]
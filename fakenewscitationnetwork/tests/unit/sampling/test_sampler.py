@@ -1,3 +1,6 @@
+import logging
+import pickle
+
 import pytest
 import numpy as np
 import pandas as pd
@@ -82,4 +85,57 @@ class TestSampler:
     def test_filter_papers_by_venues(self, sampler, sample_paper_metadata_df):
         sampler.data_coordinator.frames.df_paper_metadata = sample_paper_metadata_df.copy()
         sampler.potential_future_sample_ids = sample_paper_metadata_df['paperId']
-        sampler._filter_papers_by_venues()
\ No newline at end of file
+        sampler._filter_papers_by_venues()
+    def test_keyword_mode_has_no_relevance_term(self, sampler):
+        assert sampler.relevance_scorer is None
+        assert sampler._compute_relevance(['W1']) is None
+
+    def test_embedding_mode_weights_probabilities_by_seed_similarity(
+        self, sample_keywords, mock_frame_manager, mock_logger
+    ):
+        from ArticleCrawler.config import SamplingConfig
+        config = SamplingConfig(num_papers=1, hyper_params={'year': 0.0, 'centrality': 1.0, 'relevance': 5.0},
+                                relevance_mode='embedding')
+        mock_frame_manager.df_paper_metadata = pd.DataFrame({
+            'paperId': ['S1', 'W1', 'W2'], 'title': ['fake news', 'fake news spread', 'chess'],
+            'year': [2020, 2020, 2020], 'isSeed': [True, False, False],
+        })
+        sampler = Sampler(keywords=sample_keywords, data_manager=Mock(frames=mock_frame_manager),
+                          sampling_options=config, logger=mock_logger)
+        sampler.relevance_scorer._encode_fn = lambda texts: np.array(
+            [[t.count('fake'), t.count('chess')] for t in texts], dtype=float
+        )
+        sampler.data_coordinator.graph.get_paper_centralities.return_value = pd.DataFrame({
+            'paperId': ['W1', 'W2'], 'centrality (in)': [0.5, 0.5], 'centrality (out)': [0.5, 0.5]
+        })
+        sampler.potential_future_sample_ids = pd.Series(['W1', 'W2'])
+
+        sampler._compute_probabilities()
+
+        assert sampler.probabilities[0] / sampler.probabilities[1] == pytest.approx(np.exp(5.0))
+
+    @pytest.mark.parametrize('with_store', [False, True])
+    def test_embedding_mode_sampler_pickles_without_model(self, sample_keywords, temp_dir, with_store):
+        from ArticleCrawler.config import SamplingConfig
+        config = SamplingConfig(num_papers=1, relevance_mode='embedding',
+                                embedding_store_dir=temp_dir if with_store else None)
+        sampler = Sampler(keywords=sample_keywords, data_manager=None,
+                          sampling_options=config, logger=logging.getLogger('test'))
+        scorer = sampler.relevance_scorer
+        scorer._encode_fn = lambda texts: np.ones((len(texts), 4))
+        scorer._model = object()
+        metadata = pd.DataFrame({'paperId': ['S1', 'W1'], 'title': ['fake news', 'fake news spread']})
+        scorer.score(metadata, None, ['W1'], ['S1'])
+
+        restored = pickle.loads(pickle.dumps(sampler)).relevance_scorer
+
+        assert restored._model is None
+        assert restored._encode_fn is None
+        assert set(restored._cache) == {'S1', 'W1'}
+        if with_store:
+            assert restored.store.ids == ['S1', 'W1']
+            np.testing.assert_allclose(restored.store.get(['W1']), scorer.store.get(['W1']))
+            restored._encode_fn = lambda texts: np.ones((len(texts), 4))
+            metadata = pd.DataFrame({'paperId': ['W2'], 'title': ['chess']})
+            restored.score(metadata, None, ['W2'], ['S1'])
+            assert restored.store.ids == ['S1', 'W1', 'W2']
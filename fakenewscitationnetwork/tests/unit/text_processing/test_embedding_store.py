@@ -0,0 +1,156 @@
+import logging
+import pickle
+
+import numpy as np
+import pytest
+from unittest.mock import Mock, patch
+
+from ArticleCrawler.text_processing import embedding_store
+from ArticleCrawler.text_processing.embedding_store import EmbeddingStore, NearestNeighborIndex, normalize_rows
+
+
+def _fake_encode(texts):
+    """Deterministic 8-d embeddings derived from character counts."""
+    vectors = np.zeros((len(texts), 8), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for char in text.lower():
+            vectors[row, ord(char) % 8] += 1.0
+    return vectors
+
+
+@pytest.mark.unit
+class TestEmbeddingStore:
+
+    def test_add_persists_unit_float16_rows(self, temp_dir, mock_logger):
+        store = EmbeddingStore(temp_dir, "all-MiniLM-L6-v2", logger=mock_logger)
+
+        added = store.add(["W1", "W2"], ["graph neural networks", "fake news"], _fake_encode)
+
+        assert added == 2
+        reopened = EmbeddingStore(temp_dir, "all-MiniLM-L6-v2", logger=mock_logger)
+        assert reopened.ids == ["W1", "W2"]
+        assert reopened.vectors.dtype == np.float16
+        assert isinstance(reopened.vectors, np.memmap)
+        np.testing.assert_allclose(np.linalg.norm(reopened.get(["W2"]), axis=1), 1.0, atol=1e-3)
+
+    def test_only_new_papers_are_encoded(self, temp_dir, mock_logger):
+        store = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        store.add(["W1"], ["first title"], _fake_encode)
+        encode = Mock(side_effect=_fake_encode)
+
+        added = store.add(["W1", "W2", "W2", "W3"], ["first title", "second", "second", None], encode)
+
+        assert added == 1
+        encode.assert_called_once_with(["second"])
+        assert store.ids == ["W1", "W2"]
+        assert store.positions(["W2", "W3"]) == [1, None]
+
+    def test_stores_are_keyed_by_model(self, temp_dir, mock_logger):
+        EmbeddingStore(temp_dir, "model/a", logger=mock_logger).add(["W1"], ["title"], _fake_encode)
+
+        assert len(EmbeddingStore(temp_dir, "model/b", logger=mock_logger)) == 0
+        assert len(EmbeddingStore(temp_dir, "model/a", logger=mock_logger)) == 1
+
+    def test_add_appends_into_preallocated_rows(self, temp_dir, mock_logger):
+        store = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        store.add(["W1"], ["first title"], _fake_encode)
+        vectors_file = store.path / EmbeddingStore.VECTORS_FILE
+        inode = vectors_file.stat().st_ino
+
+        store.add(["W2", "W3"], ["second", "third"], _fake_encode)
+
+        assert vectors_file.stat().st_ino == inode
+        assert store.vectors.shape == (3, 8)
+        np.testing.assert_allclose(store.get(["W3"]), normalize_rows(_fake_encode(["third"])), atol=1e-3)
+
+    def test_add_grows_capacity_geometrically(self, temp_dir, mock_logger):
+        store = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        store.MIN_CAPACITY = 2
+        capacities = []
+        for i in range(9):
+            store.add([f"W{i}"], [f"title {i}"], _fake_encode)
+            capacities.append(np.load(store.path / EmbeddingStore.VECTORS_FILE, mmap_mode='r').shape[0])
+
+        assert capacities == [2, 2, 4, 4, 8, 8, 8, 8, 16]
+        reopened = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        assert reopened.ids == [f"W{i}" for i in range(9)]
+        np.testing.assert_array_equal(reopened.vectors, store.vectors)
+
+    def test_sees_rows_added_by_another_store(self, temp_dir, mock_logger):
+        first = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        second = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        first.add(["W1"], ["first title"], _fake_encode)
+        encode = Mock(side_effect=_fake_encode)
+
+        added = second.add(["W1", "W2"], ["first title", "second"], encode)
+
+        assert added == 1
+        assert second.ids == ["W1", "W2"]
+        assert EmbeddingStore(temp_dir, "model", logger=mock_logger).ids == ["W1", "W2"]
+
+    def test_interrupted_id_append_is_ignored(self, temp_dir, mock_logger):
+        store = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        store.add(["W1"], ["first title"], _fake_encode)
+        with open(store.path / EmbeddingStore.IDS_FILE, 'a', encoding='utf-8') as f:
+            f.write("W-partial")
+
+        reopened = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        assert reopened.ids == ["W1"]
+        reopened.add(["W2"], ["second"], _fake_encode)
+
+        assert EmbeddingStore(temp_dir, "model", logger=mock_logger).ids == ["W1", "W2"]
+
+    def test_pickles_without_lock_or_memory_map(self, temp_dir):
+        store = EmbeddingStore(temp_dir, "model", logger=logging.getLogger('test'))
+        store.add(["W1"], ["first title"], _fake_encode)
+
+        restored = pickle.loads(pickle.dumps(store))
+
+        assert restored._vectors is None
+        np.testing.assert_array_equal(restored.get(["W1"]), store.get(["W1"]))
+        assert restored.add(["W2"], ["second"], _fake_encode) == 1
+        assert EmbeddingStore(temp_dir, "model").ids == ["W1", "W2"]
+
+    def test_dimension_mismatch_raises(self, temp_dir, mock_logger):
+        store = EmbeddingStore(temp_dir, "model", logger=mock_logger)
+        store.add(["W1"], ["title"], _fake_encode)
+
+        with pytest.raises(ValueError):
+            store.add(["W2"], ["other"], lambda texts: np.ones((len(texts), 4)))
+
+
+@pytest.mark.unit
+class TestNearestNeighborIndex:
+
+    @pytest.fixture
+    def vectors(self):
+        rng = np.random.default_rng(0)
+        return normalize_rows(rng.normal(size=(200, 16)).astype(np.float32))
+
+    def test_brute_force_matches_exact_ranking(self, vectors):
+        index = NearestNeighborIndex(vectors, backend='brute')
+        query = vectors[17] + 0.01
+
+        indices, scores = index.search(query, top_k=5)
+
+        expected = np.argsort(-(vectors @ normalize_rows(query.reshape(1, -1))[0]))[:5]
+        assert list(indices) == list(expected)
+        assert indices[0] == 17
+        assert list(scores) == sorted(scores, reverse=True)
+
+    def test_auto_uses_brute_force_below_threshold(self, vectors):
+        assert NearestNeighborIndex(vectors, ann_threshold=1000).backend == 'brute'
+
+    def test_top_k_larger_than_index(self, vectors):
+        indices, _ = NearestNeighborIndex(vectors[:3], backend='brute').search(vectors[0], top_k=10)
+
+        assert sorted(indices) == [0, 1, 2]
+
+    def test_missing_ann_backend_raises(self, vectors):
+        with patch.object(embedding_store, 'hnswlib', None):
+            with pytest.raises(ImportError):
+                NearestNeighborIndex(vectors, backend='hnswlib')
+
+    def test_invalid_backend(self, vectors):
+        with pytest.raises(ValueError):
+            NearestNeighborIndex(vectors, backend='annoy')
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import Mock
+
+from ArticleCrawler.text_processing.embedding_store import EmbeddingStore, normalize_rows
+from ArticleCrawler.usecases.recommender import FeedbackStore, PaperDatabase, PaperScorer
+
+
+DIM = 12
+
+
+@pytest.fixture
+def X():
+    rng = np.random.default_rng(42)
+    return normalize_rows(rng.normal(size=(300, DIM)).astype(np.float32))
+
+
+def _naive_scores(X, A, b, alpha, explored):
+    A_inv = np.linalg.inv(A)
+    w = A_inv @ b
+    scores = X @ w + alpha * np.sqrt(np.einsum('ij,jk,ik->i', X, A_inv, X))
+    scores[sorted(explored)] = -np.inf
+    return scores
+
+
+@pytest.mark.unit
+class TestFeedbackStore:
+
+    def test_rank1_updates_keep_exact_cholesky(self, X):
+        fb = FeedbackStore(dim=DIM, lambda_reg=0.5)
+        for i in range(25):
+            fb.add_feedback(X[i], label=1 if i % 2 else -1, index=i)
+
+        np.testing.assert_allclose(fb._L @ fb._L.T, fb.A, atol=1e-10)
+        np.testing.assert_allclose(fb.get_query(), np.linalg.solve(fb.A, fb.b), atol=1e-10)
+
+    def test_batch_mahalanobis_matches_single(self, X):
+        fb = FeedbackStore(dim=DIM)
+        for i in range(5):
+            fb.add_feedback(X[i], label=1, index=i)
+
+        batch = fb.mahalanobis_batch(X[:50])
+
+        np.testing.assert_allclose(batch, [fb.mahalanobis(x) for x in X[:50]], rtol=1e-8)
+
+    def test_explored_tracks_indices(self, X):
+        fb = FeedbackStore(dim=DIM)
+        fb.add_feedback(X[3], label=1, index=3)
+        fb.add_feedback(X[4], label=0)
+
+        assert fb.explored == {3}
+
+
+@pytest.mark.unit
+class TestPaperScorer:
+
+    def test_no_feedback_scores_zero(self, X):
+        assert not PaperScorer(FeedbackStore(dim=DIM)).score_batch(X).any()
+
+    def test_matches_naive_linucb(self, X):
+        fb = FeedbackStore(dim=DIM)
+        scorer = PaperScorer(fb, ucb_weight=0.3)
+        for i in range(4):
+            fb.add_feedback(X[i], label=1, index=i)
+
+        scores = scorer.score_batch(X)
+
+        np.testing.assert_allclose(scores, _naive_scores(X, fb.A, fb.b, 0.3, fb.explored), rtol=1e-5, atol=1e-5)
+
+    def test_incremental_exploration_matches_full_recompute(self, X):
+        fb = FeedbackStore(dim=DIM)
+        scorer = PaperScorer(fb, ucb_weight=0.3)
+        fb.add_feedback(X[0], label=1, index=0)
+        scorer.score_batch(X)
+        fb.mahalanobis_batch = Mock(side_effect=fb.mahalanobis_batch)
+
+        for i in range(1, 6):
+            fb.add_feedback(X[i], label=-1 if i % 2 else 1, index=i)
+            scores = scorer.score_batch(X)
+
+        fb.mahalanobis_batch.assert_not_called()
+        np.testing.assert_allclose(scores, _naive_scores(X, fb.A, fb.b, 0.3, fb.explored), rtol=1e-5, atol=1e-5)
+
+    def test_explored_papers_are_masked(self, X):
+        fb = FeedbackStore(dim=DIM)
+        fb.add_feedback(X[7], label=1, index=7)
+
+        scores = PaperScorer(fb).score_batch(X)
+
+        assert scores[7] == -np.inf
+        assert np.isfinite(np.delete(scores, 7)).all()
+
+
+@pytest.mark.unit
+class TestPaperDatabase:
+
+    def test_uses_embedding_store(self, temp_dir, mock_logger):
+        model = Mock(dim=4, model_name="fake")
+        model.encode_batch.side_effect = lambda texts: np.eye(4)[[len(t) % 4 for t in texts]]
+        df = pd.DataFrame({'paperId': ['W1', 'W2', 'W3'], 'title': ['a', 'bb', '']})
+        store = EmbeddingStore(temp_dir, "fake", logger=mock_logger)
+
+        db = PaperDatabase(df, model, store=store)
+        PaperDatabase(df, model, store=store)
+
+        assert model.encode_batch.call_count == 1
+        assert db.embeddings.shape == (3, 4)
+        np.testing.assert_allclose(db.embeddings[1], np.eye(4)[2])
+        assert not db.embeddings[2].any()
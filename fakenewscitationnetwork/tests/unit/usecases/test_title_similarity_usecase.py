@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from ArticleCrawler.usecases.title_similarity_usecase import TitleSimilarityEngine
+
+
+class _FakeModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, show_progress_bar=False, convert_to_numpy=True):
+        self.encoded.append(list(texts))
+        vectors = np.zeros((len(texts), 8), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, hash(word) % 8] += 1.0
+        return vectors
+
+
+def _write_experiment(root, name, rows):
+    folder = root / name / "vault" / "parquet"
+    folder.mkdir(parents=True)
+    pd.DataFrame(rows).to_parquet(folder / "papers.parquet")
+    return root / name
+
+
+@pytest.mark.unit
+class TestTitleSimilarityEngine:
+
+    @pytest.fixture
+    def model(self):
+        return _FakeModel()
+
+    @pytest.fixture
+    def experiments(self, temp_dir):
+        first = _write_experiment(temp_dir, "exp1", [
+            {'paperId': 'W1', 'title': 'graph neural networks'},
+            {'paperId': 'W2', 'title': 'fake news detection'},
+        ])
+        second = _write_experiment(temp_dir, "exp2", [
+            {'paperId': 'W2', 'title': 'fake news detection'},
+            {'paperId': 'W3', 'title': 'misinformation on social media'},
+        ])
+        return [first, second]
+
+    def _engine(self, model, **kwargs):
+        engine = TitleSimilarityEngine(device='cpu', **kwargs)
+        engine._model = model
+        return engine
+
+    def test_searches_across_experiments(self, model, experiments):
+        engine = self._engine(model)
+        engine.load_experiments(*experiments)
+        engine.compute_embeddings()
+
+        results = engine.search("fake news detection", top_k=2)
+
+        assert engine.paper_ids == ['W1', 'W2', 'W3']
+        assert results[0]['paper_id'] == 'W2'
+        assert results[0]['similarity'] == pytest.approx(1.0, abs=1e-5)
+
+    def test_store_encodes_only_new_papers(self, model, experiments, temp_dir):
+        store_dir = temp_dir / "store"
+        engine = self._engine(model, store_dir=store_dir)
+        engine.load_experiments(experiments[0])
+        engine.compute_embeddings()
+
+        model.encoded.clear()
+        engine = self._engine(model, store_dir=store_dir)
+        engine.load_experiments(*experiments)
+        engine.compute_embeddings()
+
+        assert model.encoded == [['misinformation on social media']]
+        assert engine.search("graph neural networks", top_k=1)[0]['paper_id'] == 'W1'
+
+    def test_crawler_without_paper_ids_keeps_every_title(self, model, temp_dir):
+        frame = pd.DataFrame({'title': ['graph neural networks', 'fake news detection']})
+        crawler = SimpleNamespace(
+            data_manager=SimpleNamespace(frames=SimpleNamespace(df_paper_metadata=frame)),
+            storage_and_logging_options=SimpleNamespace(folders_all={'pkl_folder': temp_dir}),
+        )
+        engine = self._engine(model, crawler=crawler, store_dir=temp_dir / "store")
+        engine.compute_embeddings()
+
+        assert engine.paper_ids == ['0', '1']
+        assert engine.search("graph neural networks", top_k=1)[0]['paper_id'] == '0'
+
+    def test_save_and_load_bundle_without_pickle(self, model, experiments, temp_dir):
+        engine = self._engine(model)
+        engine.load_experiments(*experiments)
+        engine.compute_embeddings()
+        bundle = temp_dir / "bundle.npz"
+        engine.save(bundle)
+
+        restored = self._engine(model)
+        with patch('pickle.load') as pickle_load:
+            restored.load(bundle)
+
+        pickle_load.assert_not_called()
+        assert restored.paper_ids == engine.paper_ids
+        assert restored.search("fake news detection", top_k=1)[0]['paper_id'] == 'W2'
+
+    def test_search_requires_embeddings(self, model):
+        with pytest.raises(ValueError):
+            self._engine(model).search("anything")
@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+from ArticleCrawler.crawl_control import CrawlCancelled, CrawlControl
+
+
+@pytest.mark.unit
+class TestCrawlControl:
+
+    def test_checkpoint_passes_when_idle(self):
+        control = CrawlControl()
+        control.checkpoint(iteration=0)
+        assert not control.cancelled
+        assert not control.paused
+
+    def test_cancel_raises_at_checkpoint(self, mock_logger):
+        control = CrawlControl()
+        control.cancel()
+        with pytest.raises(CrawlCancelled, match="iteration 3"):
+            control.checkpoint(mock_logger, iteration=3)
+
+    def test_pause_blocks_until_resumed(self):
+        control = CrawlControl(poll_interval=0.01)
+        control.pause()
+        passed = threading.Event()
+
+        def run():
+            control.checkpoint(iteration=1)
+            passed.set()
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        time.sleep(0.05)
+        assert not passed.is_set()
+        control.resume()
+        worker.join(timeout=2)
+        assert passed.is_set()
+
+    def test_cancel_while_paused_raises(self):
+        control = CrawlControl(poll_interval=0.01)
+        control.pause()
+        errors = []
+
+        def run():
+            try:
+                control.checkpoint(iteration=2)
+            except CrawlCancelled as exc:
+                errors.append(exc)
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        control.cancel()
+        worker.join(timeout=2)
+        assert len(errors) == 1
+
+    def test_accepts_multiprocessing_events(self):
+        import multiprocessing
+
+        context = multiprocessing.get_context("spawn")
+        control = CrawlControl(context.Event(), context.Event())
+        control.pause()
+        assert control.paused
+        control.resume()
+        control.cancel()
+        assert control.cancelled
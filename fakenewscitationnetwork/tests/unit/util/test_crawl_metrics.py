@@ -0,0 +1,104 @@
+import json
+import pickle
+
+import pandas as pd
+import pytest
+
+from ArticleCrawler.LogManager.crawl_metrics import ApiCallStats, CrawlMetrics
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.mark.unit
+class TestCrawlMetrics:
+
+    def test_nested_stages_are_exclusive(self):
+        clock = FakeClock()
+        metrics = CrawlMetrics(clock=clock)
+        metrics.start_iteration(0)
+        with metrics.stage('sampling'):
+            clock.advance(1.0)
+            with metrics.stage('centrality'):
+                clock.advance(3.0)
+            clock.advance(0.5)
+        clock.advance(0.25)
+
+        record = metrics.finish_iteration()
+
+        assert record['stages'] == {'centrality': 3.0, 'sampling': 1.5}
+        assert record['total_seconds'] == 4.75
+        assert record['other_seconds'] == 0.25
+
+    def test_repeated_stage_accumulates(self):
+        clock = FakeClock()
+        metrics = CrawlMetrics(clock=clock)
+        metrics.start_iteration(2)
+        for _ in range(3):
+            with metrics.stage('api_fetch'):
+                clock.advance(0.5)
+
+        assert metrics.finish_iteration()['stages'] == {'api_fetch': 1.5}
+
+    def test_record_appended_to_metrics_file(self, temp_dir):
+        metrics_file = temp_dir / 'log' / 'crawl_metrics.jsonl'
+        metrics = CrawlMetrics(metrics_file, clock=FakeClock())
+        for iteration in range(2):
+            metrics.start_iteration(iteration)
+            with metrics.stage('persistence'):
+                pass
+            metrics.finish_iteration()
+
+        lines = metrics_file.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line)['iteration'] for line in lines] == [0, 1]
+        assert metrics.last['iteration'] == 1
+        assert set(metrics.summary()) == {'persistence'}
+
+    def test_api_counters_reported_per_iteration(self):
+        stats = ApiCallStats()
+        stats.record_request()
+        metrics = CrawlMetrics(clock=FakeClock())
+        metrics.start_iteration(0, api_stats=stats)
+        stats.record_request()
+        stats.record_request()
+        stats.record_retry()
+        stats.record_bytes(2048)
+
+        record = metrics.finish_iteration(api_stats=stats)
+
+        assert record['api'] == {'requests': 2, 'retries': 1, 'bytes_received': 2048}
+
+    def test_frame_memory_measured(self, temp_dir):
+        class Store:
+            def __init__(self):
+                self.df_paper_metadata = pd.DataFrame({'paperId': ['W1', 'W2']})
+                self.not_a_frame = 'ignored'
+
+        class Frames:
+            store = Store()
+
+        metrics = CrawlMetrics(clock=FakeClock())
+        metrics.start_iteration(0)
+        record = metrics.finish_iteration(frames=Frames())
+
+        assert list(record['frame_memory_mb']) == ['df_paper_metadata']
+        assert record['frame_memory_mb']['df_paper_metadata'] >= 0
+
+    def test_finish_without_start_returns_none(self):
+        assert CrawlMetrics().finish_iteration() is None
+
+    def test_call_stats_survive_pickling(self):
+        stats = ApiCallStats()
+        stats.record_retry()
+        restored = pickle.loads(pickle.dumps(stats))
+        restored.record_retry()
+        assert restored.as_dict()['retries'] == 2
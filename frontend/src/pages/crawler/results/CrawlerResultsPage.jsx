@@ -718,9 +718,10 @@ export default function CrawlerResultsPage() {
     if (entityTotal > 0 && nextPage > entityMaxPage) return
     fetchEntityPapers(entityViewer.type, entityViewer.id, nextPage)
   }
-  const showProgressPanel = progress && (status?.status === 'running' || status?.status === 'saving')
+  const jobActive = ['queued', 'running', 'saving'].includes(status?.status)
+  const showProgressPanel = progress && jobActive
 
-  const stepperStep = status?.status === 'running' || status?.status === 'saving' ? 3 : 4
+  const stepperStep = jobActive ? 3 : 4
 
   return (
     <div className="min-h-[calc(100vh-160px)] bg-white">
@@ -793,12 +794,12 @@ export default function CrawlerResultsPage() {
 
         {showProgressPanel ? <ProgressPanel progress={progress} /> : null}
 
-        {!showProgressPanel && (status?.status === 'running' || status?.status === 'saving') ? (
+        {!showProgressPanel && jobActive ? (
           <div className="rounded-3xl border border-dashed border-gray-300 p-8 text-center text-gray-600">
             <div className="flex justify-center mb-3">
               <Loader2 className="w-5 h-5 animate-spin text-gray-500" />
             </div>
-            Crawler is {status?.status === 'saving' ? 'saving results' : 'running'}. Results will appear automatically once it completes.
+            Crawler is {status?.status === 'saving' ? 'saving results' : status?.status === 'queued' ? 'queued' : 'running'}. Results will appear automatically once it completes.
           </div>
         ) : status?.status === 'completed' && !results ? (
           <div className="rounded-3xl border border-dashed border-gray-300 p-8 text-center text-gray-600 space-y-3">
@@ -910,7 +911,7 @@ export default function CrawlerResultsPage() {
               )}
             </div>
           </>
-        ) : status?.status === 'running' || status?.status === 'saving' ? null : (
+        ) : jobActive ? null : (
           <div className="rounded-3xl border border-dashed border-gray-300 p-8 text-center text-gray-600">
             Start a crawler job to see results.
           </div>
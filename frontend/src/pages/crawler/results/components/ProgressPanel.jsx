@@ -28,9 +28,11 @@ export default function ProgressPanel({ progress }) {
       ? 'Failed'
       : status === 'saving'
       ? 'Saving'
+      : status === 'queued'
+      ? 'Queued'
       : 'Running'
 
-  const isActive = status === 'running' || status === 'saving'
+  const isActive = status === 'queued' || status === 'running' || status === 'saving'
   const [now, setNow] = useState(() => new Date())
 
   useEffect(() => {
@@ -63,7 +65,7 @@ export default function ProgressPanel({ progress }) {
           <p className="text-xs uppercase tracking-[0.4em] text-gray-500">Crawler progress</p>
           <div className="flex items-center gap-2">
             <h2 className="text-3xl font-semibold text-gray-900">{statusLabel}</h2>
-            {status === 'running' || status === 'saving' ? (
+            {isActive ? (
               <Loader2 className="w-5 h-5 text-gray-500 animate-spin" />
             ) : null}
           </div>